@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.database import engine as sync_engine
+from app.core.database import get_pool_status
+from app.core.database_async import engine as async_engine
+from app.features.assistant.orchestrator import get_llm_queue_stats
+from app.features.user.manager import current_active_user
+from app.features.user.models import User, UserRole
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +13,32 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 async def health():
     return {"status": "ok"}
+
+
+@router.get("/health/db-pool")
+async def db_pool_health(user: User = Depends(current_active_user)):  # noqa: B008
+    """Report connection pool occupancy and event counters (admins only)."""
+    _require_admin(user, "database pool status")
+
+    return {
+        "pools": [
+            get_pool_status(sync_engine, "sync"),
+            get_pool_status(async_engine.sync_engine, "async"),
+        ]
+    }
+
+
+@router.get("/health/llm-queue")
+async def llm_queue_health(user: User = Depends(current_active_user)):  # noqa: B008
+    """Report LLM concurrency, queue depth, and coalescing for this worker (admins only)."""
+    _require_admin(user, "LLM queue status")
+
+    return get_llm_queue_stats()
+
+
+def _require_admin(user: User, resource: str) -> None:
+    if user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only administrators can view {resource}",
+        )
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.common.schemas.base import CamelOutBaseModel
+from app.core.profiling import get_profile_path, list_profiles
+from app.features.user.manager import current_active_user
+from app.features.user.models import User, UserRole
+
+router = APIRouter(prefix="/profiles", tags=["profiling"])
+
+
+class ProfileOut(CamelOutBaseModel):
+    name: str
+    size_bytes: int
+    created_at: datetime
+
+
+@router.get("", response_model=list[ProfileOut])
+def get_profiles(user: User = Depends(current_active_user)):  # noqa: B008
+    """List stored request and ingestion profiles, newest first (admins only)."""
+    _require_admin(user)
+
+    return list_profiles()
+
+
+@router.get("/{name}")
+def download_profile(
+    name: str,
+    user: User = Depends(current_active_user),  # noqa: B008
+) -> FileResponse:
+    """Download a profile: speedscope JSON (requests) or pstats (ingestion)."""
+    _require_admin(user)
+
+    path = get_profile_path(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+
+    return FileResponse(path, filename=name, media_type="application/octet-stream")
+
+
+def _require_admin(user: User) -> None:
+    if user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can access profiles",
+        )
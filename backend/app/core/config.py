@@ -123,16 +123,76 @@ class Settings(BaseSettings):
     database_url: str
     test_database_url: str
 
+    # --- Connection pool config (applies to the sync and async engines) ---
+    # Each worker holds up to 2 * (pool_size + max_overflow) connections.
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    # Recycle connections older than this; -1 disables recycling.
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int | None = Field(default=None, ge=0)
+    # Disable server-side prepared statements for PgBouncer transaction pooling.
+    db_pgbouncer_mode: bool = False
+
+    # --- Logging ---
+    # "json" writes one JSON object per line with the request trace ID and
+    # extra fields. The queue moves formatting and writes to a background
+    # thread.
+    log_format: Literal["text", "json"] = "text"
+    log_queue_enabled: bool = True
+
+    # --- Per-request SQL statement tracking ---
+    # Adds a Server-Timing header and a log line with statement counts per
+    # request, and warns when one statement repeats this often (likely N+1).
+    query_stats_enabled: bool = True
+    query_repeat_warning_threshold: int = Field(default=10, ge=2)
+
+    # --- Profiling (profiles listed at /api/v1/profiles, admins only) ---
+    # When enabled, requests slower than the threshold are saved as
+    # speedscope JSON and every archive ingestion as a .pstats file.
+    # Admins can also profile a single request with the "X-Profile: 1" header.
+    profiling_enabled: bool = False
+    profiling_slow_request_ms: float = Field(default=1000.0, gt=0)
+    profiling_sample_interval_ms: float = Field(default=5.0, gt=0)
+    profiling_dir: str = ".profiles"
+    profiling_max_files: int = Field(default=50, ge=1)
+
+    # --- Prometheus metrics (/api/v1/metrics) ---
+    # With several uvicorn workers, also export PROMETHEUS_MULTIPROC_DIR (read
+    # by prometheus_client from the process environment, not from .env).
+    metrics_enabled: bool = True
+
+    # --- Ingestion ---
+    # Archives are parsed, validated, and persisted this many executions at a
+    # time, so memory use does not grow with archive size.
+    ingestion_chunk_size: int = Field(default=100, ge=1)
+
     # GitHub OAuth configuration (must be overridden in .env)
     # --------------------------------------------------------
     github_client_id: str
     github_client_secret: str
     github_redirect_url: str
     github_state_secret_key: str
+    # GitHub REST API root; point at a local stub server in development.
+    github_api_base_url: str = "https://api.github.com"
+    github_api_timeout_seconds: float = 10.0
+    # E3SM org membership is re-checked in the background once it is older
+    # than this; login never waits on GitHub.
+    github_org_membership_max_age_seconds: int = Field(default=86400, ge=0)
+    github_org_membership_refresh_batch_size: int = Field(default=50, ge=1)
+    github_org_membership_refresh_concurrency: int = Field(default=4, ge=1)
 
     # --- Token lifetimes ---
     lifetime_seconds: int = 3600
 
+    # --- API token verification cache ---
+    # Per-worker cache of verified API tokens; revocations are picked up
+    # from the shared generation counter every poll interval.
+    api_token_cache_ttl_seconds: float = 60.0
+    api_token_cache_max_entries: int = Field(default=1024, ge=0)
+    api_token_cache_generation_poll_seconds: float = 5.0
+
     # --- Cookie config ---
     cookie_name: str = "simboard_auth"
     cookie_secure: bool = False
@@ -153,12 +213,36 @@ class Settings(BaseSettings):
     assistant_llm_temperature: float = 0.2
     assistant_llm_max_tokens: int = 2048
     assistant_snapshot_max_chars: int = 12000
+    # Size budget for case and case-group aggregate snapshots.
+    assistant_case_snapshot_max_chars: int = 12000
+    # Cache successful LLM summaries in Postgres and an in-process LRU.
+    assistant_summary_cache_enabled: bool = True
+    assistant_summary_cache_max_entries: int = Field(default=512, ge=0)
+    # Max concurrent LLM calls per worker; further requests queue for a slot.
+    assistant_llm_max_concurrency: int = Field(default=4, ge=1)
+    # Precompute LLM summaries for newly ingested simulations in the background.
+    assistant_precompute_after_ingestion: bool = False
+
+    # --- PACE lookup config ---
+    pace_lookup_timeout_seconds: float = 5.0
+    # Per-worker LRU of execution ID -> experiment ID lookups.
+    pace_cache_max_entries: int = Field(default=4096, ge=0)
+    pace_cache_ttl_seconds: float = 86400.0
+    # Misses and upstream failures are retried sooner than resolved IDs.
+    pace_negative_cache_ttl_seconds: float = 60.0
+    # Max concurrent requests to PACE per worker.
+    pace_lookup_max_concurrency: int = Field(default=8, ge=1)
 
     @field_validator("assistant_livai_base_url", mode="before")
     @classmethod
     def _strip_livai_base_url(cls, value: str) -> str:
         return value.strip()
 
+    @field_validator("github_api_base_url", mode="before")
+    @classmethod
+    def _strip_github_api_base_url(cls, value: str) -> str:
+        return value.strip().rstrip("/")
+
     @field_validator("assistant_ollama_base_url", mode="before")
     @classmethod
     def _strip_ollama_base_url(cls, value: str) -> str:
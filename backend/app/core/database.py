@@ -1,14 +1,173 @@
 from contextlib import contextmanager
+from typing import Any
+from uuid import uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy import create_engine
+from prometheus_client import Counter, Gauge
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.config import settings
+from app.core.config import Settings, settings
+from app.core.query_stats import register_query_stats
+
+
+def build_engine_options(
+    config: Settings = settings, *, is_async: bool = False
+) -> dict[str, Any]:
+    """Build SQLAlchemy engine keyword arguments from the pool settings.
+
+    Parameters
+    ----------
+    config : Settings, optional
+        The settings to read pool options from, by default the app settings.
+    is_async : bool, optional
+        Whether the options are for the asyncpg engine (``True``) or the
+        psycopg engine (``False``), by default ``False``.
+
+    Returns
+    -------
+    dict[str, Any]
+        Keyword arguments for ``create_engine`` or ``create_async_engine``.
+
+    Notes
+    -----
+    In PgBouncer mode, server-side prepared statements are disabled because
+    transaction pooling may run consecutive statements on different server
+    connections. ``db_statement_timeout_ms`` is sent as a startup parameter,
+    so PgBouncer must list ``options`` in ``ignore_startup_parameters`` or
+    the timeout should be set on the database role instead.
+    """
+    connect_args: dict[str, Any] = {}
+    timeout_ms = config.db_statement_timeout_ms
+
+    if is_async:
+        if timeout_ms is not None:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+
+        if config.db_pgbouncer_mode:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = (
+                lambda: f"__asyncpg_{uuid4()}__"
+            )
+    else:
+        if timeout_ms is not None:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+
+        if config.db_pgbouncer_mode:
+            connect_args["prepare_threshold"] = None
+
+    return {
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout_seconds,
+        "pool_recycle": config.db_pool_recycle_seconds,
+        "pool_pre_ping": config.db_pool_pre_ping,
+        "connect_args": connect_args,
+    }
+
+
+# Pool event counters, keyed by engine label ("sync" or "async").
+_POOL_EVENT_COUNTS: dict[str, dict[str, int]] = {}
+
+POOL_EVENTS = Counter(
+    "db_pool_events_total",
+    "Connection pool connect, checkout, and invalidate events.",
+    ("engine", "event"),
+)
+# "livesum" adds up the workers that are still running in multiprocess mode.
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pooled connections by state (checked_in, checked_out, overflow).",
+    ("engine", "state"),
+    multiprocess_mode="livesum",
+)
+
+
+def register_pool_metrics(engine: Engine, label: str) -> None:
+    """Count connect, checkout, and invalidate events on an engine's pool.
+
+    Also exports the events on ``/metrics``, and the pool occupancy as of
+    the last checkout or checkin.
+    """
+    counts = _POOL_EVENT_COUNTS.setdefault(
+        label, {"connects": 0, "checkouts": 0, "invalidations": 0}
+    )
+
+    def _increment(key: str):
+        def listener(*_args: Any) -> None:
+            counts[key] += 1
+            POOL_EVENTS.labels(engine=label, event=key).inc()
+
+        return listener
+
+    def _update_occupancy(*, returning: bool) -> None:
+        status = get_pool_status(engine, label)
+        checked_in = status["checkedin"]
+        checked_out = status["checkedout"]
+        overflow = status["overflow"]
+        if None in (checked_in, checked_out, overflow):
+            return
+
+        # "checkin" fires before the pool takes the connection back; a full
+        # pool closes it and gives up the overflow slot instead.
+        if returning:
+            checked_out -= 1
+            if checked_in < status["size"]:
+                checked_in += 1
+            else:
+                overflow -= 1
+
+        for state, value in (
+            ("checked_in", checked_in),
+            ("checked_out", checked_out),
+            # QueuePool reports overflow as negative until the pool is full.
+            ("overflow", max(overflow, 0)),
+        ):
+            POOL_CONNECTIONS.labels(engine=label, state=state).set(value)
+
+    event.listen(engine, "connect", _increment("connects"))
+    event.listen(engine, "checkout", _increment("checkouts"))
+    event.listen(engine, "checkout", lambda *_args: _update_occupancy(returning=False))
+    event.listen(engine, "checkin", lambda *_args: _update_occupancy(returning=True))
+    event.listen(engine, "invalidate", _increment("invalidations"))
+    _update_occupancy(returning=False)
+
+
+def get_pool_status(engine: Engine, label: str) -> dict[str, Any]:
+    """Return a point-in-time snapshot of an engine's connection pool.
+
+    Parameters
+    ----------
+    engine : Engine
+        The (sync) engine whose pool to inspect. For an ``AsyncEngine`` pass
+        ``engine.sync_engine``.
+    label : str
+        The label the engine was registered under in ``register_pool_metrics``.
+
+    Returns
+    -------
+    dict[str, Any]
+        Pool occupancy (size, checked in/out, overflow) and event counters.
+    """
+    pool: Any = engine.pool
+    snapshot: dict[str, Any] = {"label": label}
+
+    for key in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, key, None)
+        snapshot[key] = method() if callable(method) else None
+
+    snapshot.update(_POOL_EVENT_COUNTS.get(label, {}))
+
+    return snapshot
+
 
 # SQLAlchemy 2.0-style engine (sync)
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(settings.database_url, **build_engine_options())
+register_pool_metrics(engine, "sync")
+register_query_stats(engine)
 
 
 # autoflush=False: Disables auto flushing of changes before a query for control.
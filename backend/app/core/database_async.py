@@ -3,6 +3,8 @@ from collections.abc import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.database import build_engine_options, register_pool_metrics
+from app.core.query_stats import register_query_stats
 
 
 def _make_async_url(url: str) -> str:
@@ -15,9 +17,11 @@ def _make_async_url(url: str) -> str:
 
 engine = create_async_engine(
     _make_async_url(settings.database_url),
-    pool_pre_ping=True,
     echo=False,  # optional: set True for SQL logging during development
+    **build_engine_options(is_async=True),
 )
+register_pool_metrics(engine.sync_engine, "async")
+register_query_stats(engine.sync_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
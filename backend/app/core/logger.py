@@ -1,6 +1,26 @@
-"""Logger module for setting up a logger."""
+"""Logger module for setting up a logger.
 
+``_setup_root_logger`` logs in a human-readable (``LOG_FORMAT=text``) or
+one-JSON-object-per-line (``LOG_FORMAT=json``) format. Every record carries
+the current request's ``trace_id`` (see ``app.core.tracing``), and ``extra``
+fields become JSON keys. With ``LOG_QUEUE_ENABLED``, records are queued
+with their message and traceback rendered, and laid out and written by a
+background thread, so request threads never block on log I/O. ``log_span`` logs the duration of a stage.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import queue
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from time import perf_counter
+
+from app.core.config import settings
+from app.core.tracing import get_trace_id
 
 # Logging module setup
 LOG_FORMAT = (
@@ -16,23 +36,132 @@ console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
 logging.getLogger().addHandler(console_handler)
 
 
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "taskName",
+    "trace_id",
+}
+
+
+class TraceIdFilter(logging.Filter):
+    """Attach the current request's trace ID to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        trace_id = get_trace_id()
+        record.trace_id = str(trace_id) if trace_id is not None else None
+
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "trace_id": getattr(record, "trace_id", None),
+        }
+        payload.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRS
+        )
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+
+        return json.dumps(payload, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue records with only the terminal formatting left to the listener.
+
+    Like ``QueueHandler.prepare``, the message is merged with its arguments
+    and the traceback rendered to ``exc_text`` on the logging thread, so later
+    mutation of the arguments cannot change the message and queued records do
+    not keep traceback frames alive. Unlike it, the handler's formatter is not
+    applied here: the listener lays out the text or JSON line.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+
+        return record
+
+
+class _LoggingState:
+    """Background listener writing queued records, if one is running."""
+
+    def __init__(self) -> None:
+        self.listener: QueueListener | None = None
+
+    def stop_listener(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+
+_logging_state = _LoggingState()
+atexit.register(_logging_state.stop_listener)
+
+
 def _setup_root_logger():
     """Configures the root logger.
 
-    This function sets up the root logger with a predefined format and log level.
-    It also enables capturing of warnings issued by the `warnings` module and
-    redirects them to the logging system.
+    This function sets up the root logger with the ``LOG_FORMAT`` setting's
+    format and a predefined log level, tagging every record with the current
+    trace ID. It also enables capturing of warnings issued by the `warnings`
+    module and redirects them to the logging system.
 
     Notes
     -----
     - The `force=True` parameter ensures that any existing logging configuration
       is overridden.
-    - The file handler is added dynamically to the root logger later in the
-      ``Run`` class once the log file path is known.
+    - With ``LOG_QUEUE_ENABLED``, the root logger only enqueues records; a
+      ``QueueListener`` thread formats and writes them, and is stopped (after
+      draining the queue) at exit or when this function runs again.
     """
+    _logging_state.stop_listener()
+
+    handler: logging.Handler = logging.StreamHandler()
+    handler.setFormatter(
+        JsonFormatter()
+        if settings.log_format == "json"
+        else logging.Formatter(LOG_FORMAT)
+    )
+
+    if settings.log_queue_enabled:
+        listener = QueueListener(queue.SimpleQueue(), handler)
+        listener.start()
+        _logging_state.listener = listener
+        handler = _DeferredQueueHandler(listener.queue)
+
+    handler.addFilter(TraceIdFilter())
+
     logging.basicConfig(
-        format=LOG_FORMAT,
         level=LOG_LEVEL,
+        handlers=[handler],
         force=True,
     )
 
@@ -85,3 +214,48 @@ def _setup_custom_logger(name, propagate=True) -> logging.Logger:
     logger.propagate = propagate
 
     return logger
+
+
+_span_logger = _setup_custom_logger("app.spans")
+
+
+@contextmanager
+def log_span(name: str, **fields: object) -> Iterator[None]:
+    """Log the duration of the block as a timing span.
+
+    Emits one INFO record on the ``app.spans`` logger with ``span``,
+    ``duration_ms``, ``outcome`` (``ok`` or ``error``), and ``fields`` as
+    ``extra`` fields. Nothing is timed when the logger is disabled.
+
+    Parameters
+    ----------
+    name : str
+        Dotted stage name, e.g. ``"ingestion.parse"``.
+    **fields : object
+        Additional fields for the record.
+    """
+    if not _span_logger.isEnabledFor(logging.INFO):
+        yield
+        return
+
+    outcome = "ok"
+    start = perf_counter()
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        duration_ms = (perf_counter() - start) * 1000
+        _span_logger.info(
+            "span %s %s in %.1f ms",
+            name,
+            outcome,
+            duration_ms,
+            extra={
+                **fields,
+                "span": name,
+                "duration_ms": round(duration_ms, 1),
+                "outcome": outcome,
+            },
+        )
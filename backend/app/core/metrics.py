@@ -0,0 +1,152 @@
+"""Prometheus metrics shared across uvicorn workers.
+
+Metrics are ``prometheus_client`` counters, gauges, and histograms on the
+default registry. With several workers, set ``PROMETHEUS_MULTIPROC_DIR`` in
+the environment before the server starts (``prometheus_client`` reads it on
+import): each worker then keeps its values in memory-mapped files in that
+directory and ``/metrics`` aggregates every file, so a scrape answered by any
+worker reports the whole server. Empty the directory before starting the
+server, as ``entrypoint.sh`` does, so counters from a previous run are not
+reported.
+
+Without the directory, ``/metrics`` reports the answering worker only.
+"""
+
+from __future__ import annotations
+
+import os
+from time import perf_counter
+from typing import Any
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request latency buckets, extended past the client default of 10 seconds for
+# slow endpoints and LLM calls.
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def render_latest() -> bytes:
+    """Render current metrics in the Prometheus text exposition format.
+
+    Returns
+    -------
+    bytes
+        Metrics of every worker when ``PROMETHEUS_MULTIPROC_DIR`` is set,
+        otherwise of this worker only.
+    """
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess directory, if set.
+
+    Call on shutdown so pool gauges stop counting connections of a worker
+    that has exited.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def sample_value(name: str, **labels: str) -> float:
+    """Return this worker's value of the sample ``name``, or 0 if unobserved.
+
+    Parameters
+    ----------
+    name : str
+        The sample name, e.g. ``"pace_lookups_total"`` or
+        ``"ingestion_stage_duration_seconds_count"``.
+    **labels : str
+        The sample's label values.
+
+    Returns
+    -------
+    float
+        The sample value.
+    """
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class MetricsMiddleware:
+    """Record request latency per route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._route_templates: dict[Any, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_SECONDS.labels(
+                method=scope["method"],
+                route=self._route_template(scope),
+                status=str(status_code),
+            ).observe(perf_counter() - start)
+
+    def _route_template(self, scope: Scope) -> str:
+        """Return the matched route's path template, bounding label values."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "<unmatched>"
+
+        if endpoint not in self._route_templates:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    self._route_templates[endpoint] = getattr(
+                        route, "path_format", route.path
+                    )
+                    break
+            else:
+                self._route_templates[endpoint] = "<unmatched>"
+
+        return self._route_templates[endpoint]
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+    buckets=LATENCY_BUCKETS,
+)
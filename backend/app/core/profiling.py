@@ -0,0 +1,391 @@
+"""Opt-in profiling of slow requests and ingestion runs.
+
+Two profilers cover the two shapes of work:
+
+- ``ProfilingMiddleware`` runs a ``SamplingProfiler`` for a request when
+  ``PROFILING_ENABLED`` is set, or when an administrator sends
+  ``X-Profile: 1``. The sampler reads every thread's stack from a background
+  thread, so it also sees sync endpoints running in the threadpool, which
+  ``cProfile`` (bound to one thread) would miss. Profiles of requests slower
+  than ``PROFILING_SLOW_REQUEST_MS`` (or all admin-requested ones) are saved
+  as speedscope JSON (https://www.speedscope.app). Only one request is
+  sampled at a time per worker, which bounds the overhead; samples can
+  include other requests running concurrently.
+- ``profile_ingestion`` runs ``cProfile`` around archive ingestion, which
+  runs on a single thread, and saves the result as a ``.pstats`` file.
+
+Profiles are written to ``PROFILING_DIR``. Only the newest
+``PROFILING_MAX_FILES`` are kept. Administrators list and download them
+through ``/api/v1/profiles``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import re
+import sys
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logger import _setup_custom_logger
+from app.core.tracing import get_trace_id
+
+logger = _setup_custom_logger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+
+# Leaf frames of threads that are waiting for work rather than doing it.
+_IDLE_FRAMES = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("selectors.py", "select"),
+        ("queue.py", "get"),
+        ("thread.py", "_worker"),
+    }
+)
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+Frame = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class ProfileFile:
+    """A stored profile."""
+
+    name: str
+    size_bytes: int
+    created_at: datetime
+
+
+class _ProfilerSlot:
+    """Allows one sampled request per worker at a time."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+
+
+_profiler_slot = _ProfilerSlot()
+
+
+class SamplingProfiler:
+    """Periodically sample the Python stacks of all other threads.
+
+    Parameters
+    ----------
+    interval_seconds : float
+        Time between samples.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        self.interval_seconds = interval_seconds
+        self.samples: dict[int, list[tuple[tuple[Frame, ...], float]]] = defaultdict(
+            list
+        )
+        self.duration_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="simboard-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._started = perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration_seconds = perf_counter() - self._started
+
+    def to_speedscope(self, name: str) -> dict:
+        """Return the samples as a speedscope "sampled" profile per thread."""
+        frame_index: dict[Frame, int] = {}
+        profiles = []
+
+        for thread_id, thread_samples in sorted(self.samples.items()):
+            stacks = []
+            for stack, _ in thread_samples:
+                stacks.append(
+                    [frame_index.setdefault(frame, len(frame_index)) for frame in stack]
+                )
+            weights = [weight for _, weight in thread_samples]
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": f"Thread {thread_id}",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": stacks,
+                    "weights": weights,
+                }
+            )
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "simboard",
+            "shared": {
+                "frames": [
+                    {"name": function, "file": filename, "line": line}
+                    for filename, function, line in frame_index
+                ]
+            },
+            "profiles": profiles,
+        }
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        last = perf_counter()
+
+        while not self._stop.wait(self.interval_seconds):
+            now = perf_counter()
+            weight, last = now - last, now
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                stack = _stack(frame)
+                leaf = stack[-1]
+                if (os.path.basename(leaf[0]), leaf[1]) in _IDLE_FRAMES:
+                    continue
+
+                self.samples[thread_id].append((stack, weight))
+
+
+class _RequestProfile:
+    """Profiling state of one request.
+
+    Parameters
+    ----------
+    header_requested : bool
+        Whether the request sent ``X-Profile: 1``. The header only takes
+        effect once ``authorize_profile_request`` confirms an administrator.
+    """
+
+    def __init__(self, header_requested: bool) -> None:
+        self.header_requested = header_requested
+        self.admin_requested = False
+        self.profiler: SamplingProfiler | None = None
+
+    def start(self) -> None:
+        """Start sampling unless already sampling or the worker's slot is taken."""
+        if self.profiler is not None:
+            return
+
+        if not _profiler_slot.lock.acquire(blocking=False):
+            return
+
+        self.profiler = SamplingProfiler(settings.profiling_sample_interval_ms / 1000)
+        self.profiler.start()
+
+    def stop(self) -> SamplingProfiler | None:
+        """Stop sampling and return the profiler, or ``None`` if never started."""
+        if self.profiler is None:
+            return None
+
+        self.profiler.stop()
+        _profiler_slot.lock.release()
+
+        return self.profiler
+
+
+_current_profile: ContextVar[_RequestProfile | None] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class ProfilingMiddleware:
+    """Sample slow requests when profiling is enabled or requested by an admin.
+
+    With ``PROFILING_ENABLED`` set, sampling starts with the request. A request
+    with ``X-Profile: 1`` is only sampled from the point where the auth
+    dependency calls ``authorize_profile_request`` for an administrator.
+
+    Must run inside ``TraceIdMiddleware`` so profiles are named after the
+    request's trace ID (its ``X-Request-ID`` response header).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = Headers(scope=scope).get(PROFILE_HEADER) == "1"
+        if not (settings.profiling_enabled or requested):
+            await self.app(scope, receive, send)
+            return
+
+        profile = _RequestProfile(header_requested=requested)
+        if settings.profiling_enabled:
+            profile.start()
+
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_profile.reset(token)
+            profiler = profile.stop()
+
+            if profiler is not None:
+                slow = (
+                    profiler.duration_seconds * 1000
+                    >= settings.profiling_slow_request_ms
+                )
+
+                if profile.admin_requested or (settings.profiling_enabled and slow):
+                    trace_id = get_trace_id()
+                    label = f"{scope['method']} {scope['path']}"
+                    # Serializing and writing the profile blocks; keep it off
+                    # the event loop.
+                    await run_in_threadpool(
+                        _save_request_profile,
+                        profiler,
+                        label,
+                        str(trace_id) if trace_id else label,
+                    )
+
+
+def authorize_profile_request(is_admin: bool) -> None:
+    """Honor the current request's ``X-Profile: 1`` header for administrators.
+
+    Called by the auth dependencies once the user is known, so the header
+    never starts the sampler, holds the worker's slot or writes a profile
+    for anyone else.
+
+    Parameters
+    ----------
+    is_admin : bool
+        Whether the request's authenticated user is an administrator.
+    """
+    profile = _current_profile.get()
+    if profile is None or not profile.header_requested or not is_admin:
+        return
+
+    profile.admin_requested = True
+    profile.start()
+
+
+@contextmanager
+def profile_ingestion(label: str) -> Iterator[None]:
+    """Profile the block with ``cProfile`` and save it as a ``.pstats`` file.
+
+    Runs when ``PROFILING_ENABLED`` is set or an administrator asked for a
+    profile of the current request (``X-Profile: 1``); otherwise the block
+    runs unprofiled.
+
+    Parameters
+    ----------
+    label : str
+        Included in the file name, e.g. the archive name.
+    """
+    profile = _current_profile.get()
+    requested = profile is not None and profile.admin_requested
+    if not (settings.profiling_enabled or requested):
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler (e.g. a debugger or coverage tool) owns the hook.
+        logger.warning("Skipping ingestion profile: another profiler is active.")
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path = _new_profile_path("ingestion", label, "pstats")
+        profiler.dump_stats(path)
+        _enforce_retention()
+        logger.info("Saved ingestion profile %s", path.name)
+
+
+def list_profiles() -> list[ProfileFile]:
+    """Return stored profiles, newest first."""
+    directory = Path(settings.profiling_dir)
+    if not directory.is_dir():
+        return []
+
+    files = []
+    for path in directory.iterdir():
+        if not path.is_file() or path.name.startswith("."):
+            continue
+
+        stat = path.stat()
+        files.append(
+            ProfileFile(
+                name=path.name,
+                size_bytes=stat.st_size,
+                created_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            )
+        )
+
+    return sorted(files, key=lambda file: (file.created_at, file.name), reverse=True)
+
+
+def get_profile_path(name: str) -> Path | None:
+    """Return the path of stored profile ``name``, or ``None`` if unknown."""
+    if name not in {profile.name for profile in list_profiles()}:
+        return None
+
+    return Path(settings.profiling_dir) / name
+
+
+def _save_request_profile(profiler: SamplingProfiler, label: str, name: str) -> None:
+    path = _new_profile_path("request", name, "speedscope.json")
+
+    path.write_text(json.dumps(profiler.to_speedscope(label)))
+    _enforce_retention()
+    logger.info(
+        "Saved request profile %s for %s (%.0f ms)",
+        path.name,
+        label,
+        profiler.duration_seconds * 1000,
+    )
+
+
+def _new_profile_path(kind: str, label: str, extension: str) -> Path:
+    directory = Path(settings.profiling_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    safe_label = _UNSAFE_NAME_CHARS_RE.sub("_", label).strip("_")[:80]
+
+    return directory / f"{timestamp}-{kind}-{safe_label}.{extension}"
+
+
+def _enforce_retention() -> None:
+    for profile in list_profiles()[settings.profiling_max_files :]:
+        (Path(settings.profiling_dir) / profile.name).unlink(missing_ok=True)
+
+
+def _stack(frame: FrameType | None) -> tuple[Frame, ...]:
+    """Return the frames of ``frame``'s stack, outermost first."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_name, code.co_firstlineno))
+        frame = frame.f_back
+
+    return tuple(reversed(stack))
@@ -0,0 +1,261 @@
+"""Per-request SQL statement counts, database time, and N+1 detection.
+
+``register_query_stats`` hooks ``before_cursor_execute`` and
+``after_cursor_execute`` on an engine. Statements are recorded into the
+``QueryStats`` of the current context (see ``track_queries``), which
+``QueryStatsMiddleware`` opens for every HTTP request; sync endpoints run in
+a copy of the request context, so they record into the same object. The
+middleware adds a ``Server-Timing`` header, logs the counts, and warns when
+one statement repeats ``QUERY_REPEAT_WARNING_THRESHOLD`` times, the usual
+sign of an N+1 pattern.
+
+Tests pin query budgets with ``assert_query_budget``, which captures
+statements from every thread, e.g. requests served by ``TestClient``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logger import _setup_custom_logger
+
+logger = _setup_custom_logger(__name__)
+
+# Collapse whitespace so the same statement rendered twice compares equal.
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed within one request or capture."""
+
+    statements: int = 0
+    db_seconds: float = 0.0
+    statement_counts: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.db_seconds += seconds
+        self.statement_counts[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Return statements executed at least ``threshold`` times, most first."""
+        return [
+            (statement, count)
+            for statement, count in self.statement_counts.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        """Render the stats as a ``Server-Timing`` header value."""
+        noun = "query" if self.statements == 1 else "queries"
+
+        return f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} {noun}"'
+
+
+class _QueryCaptures:
+    """Captures that receive statements from every context and thread."""
+
+    def __init__(self) -> None:
+        self.active: list[QueryStats] = []
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+_captures = _QueryCaptures()
+
+
+def register_query_stats(engine: Engine) -> None:
+    """Record every statement executed on ``engine`` into the active stats.
+
+    Parameters
+    ----------
+    engine : Engine
+        The (sync) engine to instrument. For an ``AsyncEngine`` pass
+        ``engine.sync_engine``.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the stats of the current request, if one is being tracked."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record statements executed in the current context into new stats."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Record every statement on instrumented engines, from any thread."""
+    stats = QueryStats()
+    _captures.active.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.active.remove(stats)
+
+
+@contextmanager
+def assert_query_budget(
+    max_statements: int, *, max_repeats: int | None = None
+) -> Iterator[QueryStats]:
+    """Fail when the block executes more SQL statements than budgeted.
+
+    Parameters
+    ----------
+    max_statements : int
+        Maximum number of statements the block may execute.
+    max_repeats : int | None, optional
+        Maximum number of times any single statement may execute (default:
+        no limit). Set this to catch N+1 patterns that stay within budget
+        on small test data.
+
+    Yields
+    ------
+    QueryStats
+        The statements captured so far.
+
+    Raises
+    ------
+    AssertionError
+        If either limit is exceeded; the message lists the statements.
+    """
+    with capture_queries() as stats:
+        yield stats
+
+    repeated = (
+        stats.repeated_statements(max_repeats + 1) if max_repeats is not None else []
+    )
+
+    if stats.statements <= max_statements and not repeated:
+        return
+
+    lines = [
+        f"Expected at most {max_statements} SQL statement(s)"
+        + (f" with at most {max_repeats} repeat(s)" if max_repeats is not None else "")
+        + f", got {stats.statements}:"
+    ]
+    lines.extend(
+        f"  {count}x {statement}"
+        for statement, count in stats.statement_counts.most_common()
+    )
+
+    raise AssertionError("\n".join(lines))
+
+
+class QueryStatsMiddleware:
+    """Track SQL statements per HTTP request and report them.
+
+    Adds a ``Server-Timing`` header with the database time and statement
+    count, logs both with the request, and warns about statements repeated
+    ``QUERY_REPEAT_WARNING_THRESHOLD`` or more times.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", stats.server_timing()
+                    )
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                _log_request(scope, status_code, stats)
+
+
+def _log_request(scope: Scope, status_code: int, stats: QueryStats) -> None:
+    db_ms = stats.db_seconds * 1000
+    fields = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status_code": status_code,
+        "sql_statements": stats.statements,
+        "db_ms": round(db_ms, 1),
+    }
+
+    logger.info(
+        "request_queries method=%s path=%s status=%d statements=%d db_ms=%.1f",
+        scope["method"],
+        scope["path"],
+        status_code,
+        stats.statements,
+        db_ms,
+        extra=fields,
+    )
+
+    for statement, count in stats.repeated_statements(
+        settings.query_repeat_warning_threshold
+    ):
+        logger.warning(
+            "Possible N+1 query: %d identical statements in %s %s: %.200s",
+            count,
+            scope["method"],
+            scope["path"],
+            statement,
+            extra={**fields, "repeated_statement": statement, "repeat_count": count},
+        )
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any
+) -> None:
+    if context is not None:
+        context._query_stats_started = perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any
+) -> None:
+    stats = _current_stats.get()
+    if stats is None and not _captures.active:
+        return
+
+    started = getattr(context, "_query_stats_started", None)
+    seconds = perf_counter() - started if started is not None else 0.0
+    statement = _WHITESPACE_RE.sub(" ", statement).strip()
+
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    for capture in _captures.active:
+        if capture is not stats:
+            capture.record(statement, seconds)
@@ -0,0 +1,86 @@
+"""Request-scoped trace IDs propagated through contextvars.
+
+``TraceIdMiddleware`` binds a trace ID to every HTTP request, taken from a
+UUID in the ``X-Request-ID`` header or freshly generated, and returns it in
+the response header. Sync endpoints, background tasks, and everything they
+call run in a copy of the request context, so ``get_trace_id`` returns the
+same ID there; ``app.core.logger`` attaches it to every log record.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uuid import UUID, uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_trace_id: ContextVar[UUID | None] = ContextVar("trace_id", default=None)
+
+
+def get_trace_id() -> UUID | None:
+    """Return the trace ID bound to the current context, if any."""
+    return _trace_id.get()
+
+
+@contextmanager
+def bind_trace_id(trace_id: UUID | None = None) -> Iterator[UUID]:
+    """Bind ``trace_id`` (or a new one) to the current context.
+
+    Parameters
+    ----------
+    trace_id : UUID | None, optional
+        The ID to bind; a random one is generated when omitted.
+
+    Yields
+    ------
+    UUID
+        The bound trace ID.
+    """
+    bound = trace_id or uuid4()
+    token = _trace_id.set(bound)
+    try:
+        yield bound
+    finally:
+        _trace_id.reset(token)
+
+
+class TraceIdMiddleware:
+    """Bind a trace ID to each HTTP request and echo it in the response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = _parse_trace_id(Headers(scope=scope).get(REQUEST_ID_HEADER))
+
+        with bind_trace_id(requested) as trace_id:
+
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(
+                        REQUEST_ID_HEADER, str(trace_id)
+                    )
+
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
+
+
+def _parse_trace_id(value: str | None) -> UUID | None:
+    # Only accept UUIDs so clients cannot inject arbitrary text into logs.
+    if not value:
+        return None
+
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
 from time import perf_counter
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
 
 from app.core.database_async import get_async_session
 from app.core.logger import _setup_custom_logger
-from app.features.assistant.orchestrator import generate_simulation_summary
-from app.features.assistant.schemas import SimulationSummaryResponse
-from app.features.simulation.models import Case, Simulation
+from app.core.tracing import get_trace_id
+from app.features.assistant.orchestrator import (
+    SummaryGenerationResult,
+    generate_case_group_summary,
+    generate_case_summary,
+    generate_simulation_summaries,
+    generate_simulation_summary,
+    stream_simulation_summary,
+)
+from app.features.assistant.schemas import (
+    SimulationSummaryBatchItem,
+    SimulationSummaryBatchRequest,
+    SimulationSummaryBatchResponse,
+    SimulationSummaryResponse,
+)
+from app.features.assistant.snapshot import snapshot_load_options
+from app.features.simulation.models import Simulation
 from app.features.user.manager import optional_current_user
 from app.features.user.models import User
 
 router = APIRouter(prefix="/simulations", tags=["Simulation Assistant"])
+case_router = APIRouter(prefix="/cases", tags=["Simulation Assistant"])
 logger = _setup_custom_logger(__name__)
 
 
@@ -31,22 +49,235 @@ logger = _setup_custom_logger(__name__)
 )
 async def summarize_simulation(
     sim_id: UUID,
+    refresh: Annotated[
+        bool,
+        Query(description="Regenerate instead of serving a cached LLM summary."),
+    ] = False,
     db: AsyncSession = Depends(get_async_session),
     user: User | None = Depends(optional_current_user),
 ) -> SimulationSummaryResponse:
     """Generate a metadata-grounded read-only summary for one simulation."""
 
     start = perf_counter()
-    trace_id = uuid4()
+    trace_id = get_trace_id() or uuid4()
+    simulation = await _load_simulation(db, sim_id, user, trace_id, start)
 
-    stmt = (
+    generation = await generate_simulation_summary(
+        simulation, allow_llm=user is not None, db=db, refresh=refresh
+    )
+
+    return _finalize_summary(generation, simulation, user, trace_id, start)
+
+
+@router.post(
+    "/{sim_id}/summary/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "Server-Sent Events: a `deterministic` summary, zero or more "
+                "`partial` LLM outputs, then the validated `final` summary."
+            ),
+            "content": {"text/event-stream": {}},
+        },
+        401: {"description": "Unauthorized."},
+        404: {"description": "Simulation not found."},
+    },
+)
+async def stream_simulation_summary_events(
+    sim_id: UUID,
+    refresh: Annotated[
+        bool,
+        Query(description="Regenerate instead of serving a cached LLM summary."),
+    ] = False,
+    db: AsyncSession = Depends(get_async_session),
+    user: User | None = Depends(optional_current_user),
+) -> StreamingResponse:
+    """Stream a simulation summary over Server-Sent Events.
+
+    The deterministic summary is sent first so clients can render it right
+    away; LLM output follows as it is generated. The ``final`` event carries
+    the same payload as ``POST /simulations/{sim_id}/summary``.
+    """
+
+    start = perf_counter()
+    trace_id = get_trace_id() or uuid4()
+    simulation = await _load_simulation(db, sim_id, user, trace_id, start)
+
+    async def events() -> AsyncIterator[str]:
+        async for item in stream_simulation_summary(
+            simulation, allow_llm=user is not None, db=db, refresh=refresh
+        ):
+            if item.event == "partial" and item.partial is not None:
+                yield _format_sse(
+                    "partial", item.partial.model_dump(mode="json", by_alias=True)
+                )
+                continue
+
+            if item.result is None:
+                continue
+
+            if item.event == "final":
+                summary = _finalize_summary(
+                    item.result, simulation, user, trace_id, start
+                )
+            else:
+                summary = item.result.summary.model_copy(update={"trace_id": trace_id})
+
+            yield _format_sse(
+                item.event, summary.model_dump(mode="json", by_alias=True)
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/summaries",
+    response_model=SimulationSummaryBatchResponse,
+    responses={
+        200: {"description": "Simulation summaries generated successfully."},
+        401: {"description": "Unauthorized."},
+        404: {"description": "One or more simulations not found."},
+    },
+)
+async def summarize_simulations(
+    payload: SimulationSummaryBatchRequest,
+    db: AsyncSession = Depends(get_async_session),
+    user: User | None = Depends(optional_current_user),
+) -> SimulationSummaryBatchResponse:
+    """Generate summaries for up to ``MAX_SUMMARY_BATCH_SIZE`` simulations.
+
+    Cached summaries are served with one lookup and the remaining LLM calls
+    run concurrently. Each summary gets its own trace ID and log line, as if
+    it had been requested individually.
+    """
+
+    start = perf_counter()
+    sim_ids = list(dict.fromkeys(payload.simulation_ids))
+
+    result = await db.execute(
         select(Simulation)
-        .options(
-            joinedload(Simulation.case).joinedload(Case.machine),
-            joinedload(Simulation.case).selectinload(Case.links),
-            selectinload(Simulation.artifacts),
-            selectinload(Simulation.links),
+        .options(*snapshot_load_options())
+        .where(Simulation.id.in_(sim_ids))
+    )
+    simulations_by_id = {sim.id: sim for sim in result.scalars().unique()}
+
+    missing = [str(sim_id) for sim_id in sim_ids if sim_id not in simulations_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Simulations not found: {', '.join(missing)}",
         )
+
+    simulations = [simulations_by_id[sim_id] for sim_id in sim_ids]
+    generations = await generate_simulation_summaries(
+        simulations, allow_llm=user is not None, db=db, refresh=payload.refresh
+    )
+
+    return SimulationSummaryBatchResponse(
+        summaries=[
+            SimulationSummaryBatchItem(
+                simulation_id=simulation.id,
+                summary=_finalize_summary(generation, simulation, user, uuid4(), start),
+            )
+            for simulation, generation in zip(simulations, generations, strict=True)
+        ]
+    )
+
+
+@case_router.post(
+    "/summary",
+    response_model=SimulationSummaryResponse,
+    responses={
+        200: {"description": "Case group summary generated successfully."},
+        401: {"description": "Unauthorized."},
+        404: {"description": "Case group not found."},
+    },
+)
+async def summarize_case_group(
+    case_group: Annotated[
+        str, Query(description="Exact case group to summarize.", min_length=1)
+    ],
+    refresh: Annotated[
+        bool,
+        Query(description="Regenerate instead of serving a cached LLM summary."),
+    ] = False,
+    db: AsyncSession = Depends(get_async_session),
+    user: User | None = Depends(optional_current_user),
+) -> SimulationSummaryResponse:
+    """Generate one summary covering every case and execution in a case group."""
+
+    start = perf_counter()
+    trace_id = get_trace_id() or uuid4()
+    generation = await generate_case_group_summary(
+        db, case_group, allow_llm=user is not None, refresh=refresh
+    )
+
+    return _finalize_case_summary(
+        generation,
+        f"case_group={case_group!r}",
+        user,
+        trace_id,
+        start,
+        not_found_detail="Case group not found",
+    )
+
+
+@case_router.post(
+    "/{case_id}/summary",
+    response_model=SimulationSummaryResponse,
+    responses={
+        200: {"description": "Case summary generated successfully."},
+        401: {"description": "Unauthorized."},
+        404: {"description": "Case not found."},
+    },
+)
+async def summarize_case(
+    case_id: UUID,
+    refresh: Annotated[
+        bool,
+        Query(description="Regenerate instead of serving a cached LLM summary."),
+    ] = False,
+    db: AsyncSession = Depends(get_async_session),
+    user: User | None = Depends(optional_current_user),
+) -> SimulationSummaryResponse:
+    """Generate one summary covering every execution of a case.
+
+    The summary is built from aggregates over the case's executions (status
+    counts, date coverage, configuration drift, and links), so it costs one
+    LLM call regardless of how many executions the case has.
+    """
+
+    start = perf_counter()
+    trace_id = get_trace_id() or uuid4()
+    generation = await generate_case_summary(
+        db, case_id, allow_llm=user is not None, refresh=refresh
+    )
+
+    return _finalize_case_summary(
+        generation,
+        f"case_id={case_id}",
+        user,
+        trace_id,
+        start,
+        not_found_detail="Case not found",
+    )
+
+
+async def _load_simulation(
+    db: AsyncSession,
+    sim_id: UUID,
+    user: User | None,
+    trace_id: UUID,
+    start: float,
+) -> Simulation:
+    stmt = (
+        select(Simulation)
+        .options(*snapshot_load_options())
         .where(Simulation.id == sim_id)
     )
     result = await db.execute(stmt)
@@ -59,7 +290,7 @@ async def summarize_simulation(
             "simulation_summary trace_id=%s simulation_id=%s user_id=%s success=false "
             "status=not_found llm_success=false fallback_used=false latency_ms=%.2f llm_latency_ms=%.2f generation_mode=%s "
             "generation_provider=%s generation_model=%s fallback_reason=%s "
-            "citation_count=0 caveat_count=0",
+            "citation_count=0 caveat_count=0 cache_hit=false",
             trace_id,
             sim_id,
             user_id,
@@ -72,9 +303,16 @@ async def summarize_simulation(
         )
         raise HTTPException(status_code=404, detail="Simulation not found")
 
-    generation = await generate_simulation_summary(
-        simulation, allow_llm=user is not None
-    )
+    return simulation
+
+
+def _finalize_summary(
+    generation: SummaryGenerationResult,
+    simulation: Simulation,
+    user: User | None,
+    trace_id: UUID,
+    start: float,
+) -> SimulationSummaryResponse:
     llm_success = generation.summary.generation_mode == "llm"
     fallback_used = (
         not llm_success
@@ -93,7 +331,8 @@ async def summarize_simulation(
     logger.info(
         "simulation_summary trace_id=%s simulation_id=%s user_id=%s success=true "
         "llm_success=%s fallback_used=%s latency_ms=%.2f llm_latency_ms=%.2f generation_mode=%s "
-        "generation_provider=%s generation_model=%s fallback_reason=%s citation_count=%d caveat_count=%d",
+        "generation_provider=%s generation_model=%s fallback_reason=%s citation_count=%d caveat_count=%d "
+        "cache_hit=%s",
         trace_id,
         simulation.id,
         user_id,
@@ -107,6 +346,68 @@ async def summarize_simulation(
         generation.fallback_reason or "null",
         len(summary.citations),
         len(summary.caveats),
+        str(generation.cache_hit).lower(),
     )
 
     return summary
+
+
+def _finalize_case_summary(
+    generation: SummaryGenerationResult | None,
+    subject: str,
+    user: User | None,
+    trace_id: UUID,
+    start: float,
+    *,
+    not_found_detail: str,
+) -> SimulationSummaryResponse:
+    duration_ms = (perf_counter() - start) * 1000
+    user_id = user.id if user is not None else "null"
+
+    if generation is None:
+        logger.info(
+            "case_summary trace_id=%s %s user_id=%s success=false status=not_found "
+            "latency_ms=%.2f",
+            trace_id,
+            subject,
+            user_id,
+            duration_ms,
+        )
+        raise HTTPException(status_code=404, detail=not_found_detail)
+
+    llm_success = generation.summary.generation_mode == "llm"
+    fallback_used = (
+        not llm_success
+        and generation.fallback_reason is not None
+        and generation.fallback_reason != "llm_disabled"
+    )
+    summary = generation.summary.model_copy(
+        update={"trace_id": trace_id, "fallback_used": fallback_used}
+    )
+
+    logger.info(
+        "case_summary trace_id=%s %s user_id=%s success=true llm_success=%s "
+        "fallback_used=%s latency_ms=%.2f llm_latency_ms=%.2f generation_mode=%s "
+        "generation_provider=%s generation_model=%s fallback_reason=%s "
+        "citation_count=%d caveat_count=%d cache_hit=%s",
+        trace_id,
+        subject,
+        user_id,
+        str(llm_success).lower(),
+        str(fallback_used).lower(),
+        duration_ms,
+        generation.llm_latency_ms,
+        summary.generation_mode,
+        generation.attempted_provider or "null",
+        generation.attempted_model or "null",
+        generation.fallback_reason or "null",
+        len(summary.citations),
+        len(summary.caveats),
+        str(generation.cache_hit).lower(),
+    )
+
+    return summary
+
+
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -0,0 +1,282 @@
+"""Two-level cache for LLM-generated simulation summaries.
+
+Summaries are keyed by a SHA-256 of the canonical snapshot JSON together with
+the provider, model, and prompt version. Snapshots are deterministic, so the
+key changes whenever the simulation's metadata changes and cached entries
+never need explicit invalidation. Lookups check a per-process LRU first and
+fall back to the ``simulation_summary_cache`` table, which is shared by all
+workers and survives restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import _setup_custom_logger
+from app.features.assistant.case_snapshot import CaseSnapshot
+from app.features.assistant.llm_generator import (
+    CASE_SUMMARY_PROMPT_VERSION,
+    SUMMARY_PROMPT_VERSION,
+    AssistantLLMConfig,
+)
+from app.features.assistant.models import SimulationSummaryCache
+from app.features.assistant.schemas import SimulationSummaryResponse
+from app.features.assistant.snapshot import SimulationSnapshot
+
+logger = _setup_custom_logger(__name__)
+
+# Placeholder trace ID for cached summaries; callers set the real one.
+_NIL_TRACE_ID = "00000000-0000-0000-0000-000000000000"
+
+
+class _SummaryLRU:
+    """Bounded least-recently-used map of cache key to summary."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, SimulationSummaryResponse] = OrderedDict()
+
+    def get(self, key: str) -> SimulationSummaryResponse | None:
+        summary = self._entries.get(key)
+        if summary is not None:
+            self._entries.move_to_end(key)
+
+        return summary
+
+    def put(self, key: str, summary: SimulationSummaryResponse) -> None:
+        max_entries = settings.assistant_summary_cache_max_entries
+        if max_entries <= 0:
+            return
+
+        self._entries[key] = summary
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_summary_lru = _SummaryLRU()
+
+
+def build_summary_cache_key(
+    snapshot: SimulationSnapshot | CaseSnapshot, config: AssistantLLMConfig
+) -> str:
+    """Return the cache key for summarizing ``snapshot`` with ``config``.
+
+    Parameters
+    ----------
+    snapshot : SimulationSnapshot | CaseSnapshot
+        The size-budgeted snapshot that would be sent to the LLM.
+    config : AssistantLLMConfig
+        The resolved LLM configuration.
+
+    Returns
+    -------
+    str
+        Hex SHA-256 of the canonical snapshot JSON, provider, model, and
+        prompt version.
+    """
+    payload = {
+        "snapshot": snapshot.model_dump(mode="json"),
+        "provider": config.provider,
+        "model": config.model_name,
+        "prompt_version": (
+            CASE_SUMMARY_PROMPT_VERSION
+            if isinstance(snapshot, CaseSnapshot)
+            else SUMMARY_PROMPT_VERSION
+        ),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+async def get_cached_summary(
+    db: AsyncSession | None, key: str
+) -> SimulationSummaryResponse | None:
+    """Look up a cached summary in the LRU, then in Postgres.
+
+    Parameters
+    ----------
+    db : AsyncSession | None
+        Session used for the persistent lookup; ``None`` checks the LRU only.
+    key : str
+        Key from ``build_summary_cache_key``.
+
+    Returns
+    -------
+    SimulationSummaryResponse | None
+        The cached summary, or ``None`` on a miss.
+    """
+    return (await get_cached_summaries(db, [key])).get(key)
+
+
+async def get_cached_summaries(
+    db: AsyncSession | None, keys: Iterable[str]
+) -> dict[str, SimulationSummaryResponse]:
+    """Look up several cached summaries with at most one database query.
+
+    Parameters
+    ----------
+    db : AsyncSession | None
+        Session used for the persistent lookup; ``None`` checks the LRU only.
+    keys : Iterable[str]
+        Keys from ``build_summary_cache_key``.
+
+    Returns
+    -------
+    dict[str, SimulationSummaryResponse]
+        Cached summaries by key; misses are omitted.
+    """
+    found: dict[str, SimulationSummaryResponse] = {}
+    missing: list[str] = []
+
+    for key in keys:
+        summary = _summary_lru.get(key)
+        if summary is not None:
+            found[key] = summary
+        else:
+            missing.append(key)
+
+    if not missing or db is None:
+        return found
+
+    rows = await db.execute(
+        select(SimulationSummaryCache.cache_key, SimulationSummaryCache.summary).where(
+            SimulationSummaryCache.cache_key.in_(missing)
+        )
+    )
+
+    for key, stored in rows:
+        summary = SimulationSummaryResponse.model_validate(
+            {**stored, "trace_id": _NIL_TRACE_ID}
+        )
+        _summary_lru.put(key, summary)
+        found[key] = summary
+
+    return found
+
+
+async def store_cached_summary(
+    db: AsyncSession | None,
+    key: str,
+    *,
+    simulation_id: str,
+    config: AssistantLLMConfig,
+    summary: SimulationSummaryResponse,
+) -> None:
+    """Write a freshly generated summary to the LRU and Postgres.
+
+    Older entries for the same simulation, provider, and model are deleted,
+    since their snapshot no longer matches the simulation. The write runs in
+    a dedicated session on ``db``'s bind and commits on its own, so the
+    caller's request-scoped session is never committed or rolled back.
+    Persistence failures are logged and swallowed so the summary is still
+    returned.
+
+    Parameters
+    ----------
+    db : AsyncSession | None
+        Session whose bind is used for the persistent write; ``None`` updates
+        the LRU only.
+    key : str
+        Key from ``build_summary_cache_key``.
+    simulation_id : str
+        ID of the summarized simulation.
+    config : AssistantLLMConfig
+        The LLM configuration that produced ``summary``.
+    summary : SimulationSummaryResponse
+        The validated LLM summary.
+    """
+    _summary_lru.put(key, summary)
+
+    if db is None:
+        return
+
+    sim_uuid = UUID(simulation_id)
+    payload = summary.model_dump(mode="json", exclude={"trace_id"})
+
+    try:
+        async with (
+            AsyncSession(
+                bind=db.bind,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            ) as write_db,
+            write_db.begin(),
+        ):
+            await _write_summary_entry(
+                write_db, key, sim_uuid=sim_uuid, config=config, payload=payload
+            )
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to persist simulation summary cache entry for simulation %s",
+            simulation_id,
+            exc_info=True,
+        )
+
+
+async def _write_summary_entry(
+    db: AsyncSession,
+    key: str,
+    *,
+    sim_uuid: UUID,
+    config: AssistantLLMConfig,
+    payload: dict,
+) -> None:
+    await db.execute(
+        delete(SimulationSummaryCache).where(
+            SimulationSummaryCache.simulation_id == sim_uuid,
+            SimulationSummaryCache.provider == config.provider,
+            SimulationSummaryCache.model == config.model_name,
+            SimulationSummaryCache.cache_key != key,
+        )
+    )
+    await db.execute(
+        pg_insert(SimulationSummaryCache)
+        .values(
+            cache_key=key,
+            simulation_id=sim_uuid,
+            provider=config.provider,
+            model=config.model_name,
+            prompt_version=SUMMARY_PROMPT_VERSION,
+            summary=payload,
+        )
+        .on_conflict_do_update(
+            index_elements=[SimulationSummaryCache.cache_key],
+            set_={"summary": payload},
+        )
+    )
+
+
+def store_cached_case_summary(key: str, summary: SimulationSummaryResponse) -> None:
+    """Write a freshly generated case summary to the LRU.
+
+    Case summaries are not persisted: the ``simulation_summary_cache`` table is
+    keyed per simulation, and a case snapshot changes whenever any of its
+    executions does.
+
+    Parameters
+    ----------
+    key : str
+        Key from ``build_summary_cache_key``.
+    summary : SimulationSummaryResponse
+        The validated LLM case summary.
+    """
+    _summary_lru.put(key, summary)
+
+
+def clear_summary_lru() -> None:
+    """Drop every entry from this process's summary LRU."""
+    _summary_lru.clear()
@@ -0,0 +1,453 @@
+"""Case-level metadata snapshots for the simulation assistant.
+
+A case snapshot summarizes every execution of a case (or of every case in a
+case group) without loading each ``Simulation``: counts, the status histogram
+and date coverage come from the ``case_stats`` rollup, and SQL aggregates add
+the configuration values shared by all executions or drifting between them,
+the most recent executions, and the links recorded for the case and its
+executions. The whole case is then summarized with one LLM call instead of
+one per execution.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+from sqlalchemy import ColumnElement, Text, cast, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, joinedload
+
+from app.core.config import settings
+from app.features.assistant.snapshot import (
+    SNAPSHOT_TRUNCATED_CAVEAT,
+    SnapshotLink,
+    enum_value,
+    isoformat,
+    serialized_prefix_sizes,
+    sorted_links,
+)
+from app.features.simulation.models import Case, CaseStats, ExternalLink, Simulation
+
+CaseSnapshotScope = Literal["case", "case_group"]
+
+# Simulation columns compared across executions to report configuration drift.
+CONFIGURATION_FIELDS: tuple[InstrumentedAttribute, ...] = (
+    Simulation.compset,
+    Simulation.compset_alias,
+    Simulation.grid_name,
+    Simulation.grid_resolution,
+    Simulation.simulation_type,
+    Simulation.initialization_type,
+    Simulation.compiler,
+    Simulation.campaign,
+    Simulation.experiment_type,
+    Simulation.git_branch,
+    Simulation.git_tag,
+    Simulation.git_commit_hash,
+)
+
+_RECENT_EXECUTION_LIMIT = 10
+# Values kept per drifting field when the snapshot is still over budget after
+# dropping list items; the rest are counted in ``omitted_value_count``.
+_TRIMMED_DRIFT_VALUE_LIMIT = 3
+
+
+class CaseSnapshotCase(BaseModel):
+    id: str
+    name: str
+    case_group: str | None = None
+    machine: str | None = None
+    simulation_count: int = 0
+
+
+class CaseSnapshotExecutions(BaseModel):
+    count: int
+    status_counts: dict[str, int] = Field(default_factory=dict)
+    earliest_simulation_start_date: str | None = None
+    latest_simulation_end_date: str | None = None
+    first_ingested_at: str | None = None
+    last_ingested_at: str | None = None
+
+
+class CaseSnapshotConfigurationValue(BaseModel):
+    value: str | None = None
+    count: int
+
+
+class CaseSnapshotConfigurationDrift(BaseModel):
+    field: str
+    values: list[CaseSnapshotConfigurationValue]
+    omitted_value_count: int = 0
+
+
+class CaseSnapshotConfiguration(BaseModel):
+    shared: dict[str, str] = Field(default_factory=dict)
+    drift: list[CaseSnapshotConfigurationDrift] = Field(default_factory=list)
+
+
+class CaseSnapshotExecution(BaseModel):
+    id: str
+    execution_id: str
+    status: str
+    case_name: str | None = None
+    simulation_start_date: str | None = None
+    simulation_end_date: str | None = None
+
+
+class CaseSnapshot(BaseModel):
+    scope: CaseSnapshotScope
+    case_group: str | None = None
+    case_count: int
+    cases: list[CaseSnapshotCase]
+    executions: CaseSnapshotExecutions
+    configuration: CaseSnapshotConfiguration
+    recent_executions: list[CaseSnapshotExecution] = Field(default_factory=list)
+    links: list[SnapshotLink] = Field(default_factory=list)
+    snapshot_caveats: list[str] = Field(default_factory=list)
+
+
+class CaseSnapshotBudgetExceededError(ValueError):
+    def __init__(self, snapshot: CaseSnapshot, max_chars: int) -> None:
+        size = _case_snapshot_size(snapshot)
+        super().__init__(
+            f"Case snapshot size {size} exceeds budget {max_chars} even after all "
+            "trimming. Required aggregates are too large to fit within the "
+            "configured limit."
+        )
+        self.snapshot = snapshot
+        self.max_chars = max_chars
+
+
+async def build_case_snapshot(
+    db: AsyncSession,
+    case_id: UUID,
+    *,
+    max_chars: int | None = None,
+) -> CaseSnapshot | None:
+    """Build the aggregate snapshot for one case.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Active database session.
+    case_id : UUID
+        The case to summarize.
+    max_chars : int | None, optional
+        Size budget for the serialized snapshot (default:
+        ``ASSISTANT_CASE_SNAPSHOT_MAX_CHARS``).
+
+    Returns
+    -------
+    CaseSnapshot | None
+        The size-budgeted snapshot, or ``None`` if the case does not exist.
+
+    Raises
+    ------
+    CaseSnapshotBudgetExceededError
+        If the snapshot cannot be trimmed to fit the budget.
+    """
+    cases = await _load_cases(db, Case.id == case_id)
+    if not cases:
+        return None
+
+    return await _build_snapshot(
+        db, cases, scope="case", case_group=cases[0].case_group, max_chars=max_chars
+    )
+
+
+async def build_case_group_snapshot(
+    db: AsyncSession,
+    case_group: str,
+    *,
+    max_chars: int | None = None,
+) -> CaseSnapshot | None:
+    """Build the aggregate snapshot for every case in a case group.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Active database session.
+    case_group : str
+        Exact case group name.
+    max_chars : int | None, optional
+        Size budget for the serialized snapshot (default:
+        ``ASSISTANT_CASE_SNAPSHOT_MAX_CHARS``).
+
+    Returns
+    -------
+    CaseSnapshot | None
+        The size-budgeted snapshot, or ``None`` if no case is in the group.
+
+    Raises
+    ------
+    CaseSnapshotBudgetExceededError
+        If the snapshot cannot be trimmed to fit the budget.
+    """
+    cases = await _load_cases(db, Case.case_group == case_group)
+    if not cases:
+        return None
+
+    return await _build_snapshot(
+        db, cases, scope="case_group", case_group=case_group, max_chars=max_chars
+    )
+
+
+async def _load_cases(db: AsyncSession, condition: ColumnElement[bool]) -> list[Case]:
+    result = await db.execute(
+        select(Case)
+        .options(joinedload(Case.machine), joinedload(Case.stats))
+        .where(condition)
+        .order_by(Case.name, Case.id)
+    )
+
+    return list(result.scalars().unique().all())
+
+
+async def _build_snapshot(
+    db: AsyncSession,
+    cases: Sequence[Case],
+    *,
+    scope: CaseSnapshotScope,
+    case_group: str | None,
+    max_chars: int | None,
+) -> CaseSnapshot:
+    case_ids = [case.id for case in cases]
+
+    snapshot = CaseSnapshot(
+        scope=scope,
+        case_group=case_group,
+        case_count=len(cases),
+        cases=[
+            CaseSnapshotCase(
+                id=str(case.id),
+                name=case.name,
+                case_group=case.case_group,
+                machine=case.machine.name if case.machine is not None else None,
+                simulation_count=case.stats.simulation_count if case.stats else 0,
+            )
+            for case in cases
+        ],
+        executions=await _aggregate_executions(db, cases),
+        configuration=await _aggregate_configuration(db, case_ids),
+        recent_executions=await _load_recent_executions(
+            db, case_ids, include_case_name=scope == "case_group"
+        ),
+        links=await _load_links(db, case_ids),
+    )
+
+    return _apply_case_size_budget(
+        snapshot, max_chars or settings.assistant_case_snapshot_max_chars
+    )
+
+
+async def _aggregate_executions(
+    db: AsyncSession, cases: Sequence[Case]
+) -> CaseSnapshotExecutions:
+    # Counts, the status histogram and date coverage are folded from the
+    # case_stats rollups; only the first ingestion time needs a query, which
+    # the (case_id, created_at) index answers without a scan.
+    stats: list[CaseStats] = [case.stats for case in cases if case.stats is not None]
+    status_counts: dict[str, int] = {}
+    for row in stats:
+        for status, count in row.status_counts.items():
+            status_counts[status] = status_counts.get(status, 0) + count
+
+    first_created = await db.scalar(
+        select(func.min(Simulation.created_at)).where(
+            Simulation.case_id.in_([case.id for case in cases])
+        )
+    )
+    starts = [row.earliest_start_date for row in stats if row.earliest_start_date]
+    ends = [row.latest_end_date for row in stats if row.latest_end_date]
+    created = [row.latest_created_at for row in stats if row.latest_created_at]
+
+    return CaseSnapshotExecutions(
+        count=sum(row.simulation_count for row in stats),
+        status_counts=dict(sorted(status_counts.items())),
+        earliest_simulation_start_date=isoformat(min(starts, default=None)),
+        latest_simulation_end_date=isoformat(max(ends, default=None)),
+        first_ingested_at=isoformat(first_created),
+        last_ingested_at=isoformat(max(created, default=None)),
+    )
+
+
+async def _aggregate_configuration(
+    db: AsyncSession, case_ids: Sequence[UUID]
+) -> CaseSnapshotConfiguration:
+    # One round trip: a GROUP BY per configuration column, glued with UNION ALL.
+    stmt = union_all(
+        *(
+            select(
+                literal(column.key).label("field"),
+                cast(column, Text).label("value"),
+                func.count().label("count"),
+            )
+            .where(Simulation.case_id.in_(case_ids))
+            .group_by(column)
+            for column in CONFIGURATION_FIELDS
+        )
+    )
+    rows = (await db.execute(stmt)).all()
+
+    values_by_field: dict[str, list[CaseSnapshotConfigurationValue]] = {}
+    for field, value, count in rows:
+        values_by_field.setdefault(field, []).append(
+            CaseSnapshotConfigurationValue(value=value, count=count)
+        )
+
+    configuration = CaseSnapshotConfiguration()
+    for column in CONFIGURATION_FIELDS:
+        values = values_by_field.get(column.key, [])
+
+        if len(values) == 1 and values[0].value is not None:
+            configuration.shared[column.key] = values[0].value
+        elif len(values) > 1:
+            configuration.drift.append(
+                CaseSnapshotConfigurationDrift(
+                    field=column.key,
+                    values=sorted(
+                        values, key=lambda item: (-item.count, item.value or "")
+                    ),
+                )
+            )
+
+    return configuration
+
+
+async def _load_recent_executions(
+    db: AsyncSession, case_ids: Sequence[UUID], *, include_case_name: bool
+) -> list[CaseSnapshotExecution]:
+    result = await db.execute(
+        select(
+            Simulation.id,
+            Simulation.execution_id,
+            Simulation.status,
+            Case.name,
+            Simulation.simulation_start_date,
+            Simulation.simulation_end_date,
+        )
+        .join(Case, Simulation.case_id == Case.id)
+        .where(Simulation.case_id.in_(case_ids))
+        .order_by(Simulation.created_at.desc(), Simulation.id)
+        .limit(_RECENT_EXECUTION_LIMIT)
+    )
+
+    return [
+        CaseSnapshotExecution(
+            id=str(sim_id),
+            execution_id=execution_id,
+            status=enum_value(status) or "unknown",
+            case_name=case_name if include_case_name else None,
+            simulation_start_date=isoformat(start),
+            simulation_end_date=isoformat(end),
+        )
+        for sim_id, execution_id, status, case_name, start, end in result.all()
+    ]
+
+
+async def _load_links(db: AsyncSession, case_ids: Sequence[UUID]) -> list[SnapshotLink]:
+    simulation_ids = select(Simulation.id).where(Simulation.case_id.in_(case_ids))
+    result = await db.execute(
+        select(ExternalLink)
+        .where(
+            or_(
+                ExternalLink.case_id.in_(case_ids),
+                ExternalLink.simulation_id.in_(simulation_ids),
+            )
+        )
+        .order_by(ExternalLink.case_id.is_(None), ExternalLink.created_at)
+    )
+
+    # Case-owned links first, then one entry per (kind, URL) across executions.
+    unique: dict[tuple[str, str], ExternalLink] = {}
+    for link in result.scalars().all():
+        unique.setdefault((str(link.kind), link.url), link)
+
+    return sorted_links(unique.values())
+
+
+def _case_snapshot_size(snapshot: CaseSnapshot) -> int:
+    return len(snapshot.model_dump_json(exclude_none=True))
+
+
+def _add_truncation_caveat(snapshot: CaseSnapshot) -> CaseSnapshot:
+    if SNAPSHOT_TRUNCATED_CAVEAT in snapshot.snapshot_caveats:
+        return snapshot
+
+    return snapshot.model_copy(
+        update={
+            "snapshot_caveats": [*snapshot.snapshot_caveats, SNAPSHOT_TRUNCATED_CAVEAT]
+        }
+    )
+
+
+def _trim_configuration_drift(snapshot: CaseSnapshot) -> CaseSnapshot:
+    drift = [
+        item.model_copy(
+            update={
+                "values": item.values[:_TRIMMED_DRIFT_VALUE_LIMIT],
+                "omitted_value_count": item.omitted_value_count
+                + max(len(item.values) - _TRIMMED_DRIFT_VALUE_LIMIT, 0),
+            }
+        )
+        for item in snapshot.configuration.drift
+    ]
+    configuration = snapshot.configuration.model_copy(update={"drift": drift})
+
+    return snapshot.model_copy(update={"configuration": configuration})
+
+
+def _apply_case_size_budget(snapshot: CaseSnapshot, max_chars: int) -> CaseSnapshot:
+    # Same approach as the simulation snapshot budget: size candidates from
+    # per-item prefix sums and drop from the end of the longest list (links,
+    # then recent executions, then cases on ties). One case is always kept so
+    # the snapshot still identifies what it covers.
+    lists: dict[str, Sequence[BaseModel]] = {
+        "links": snapshot.links,
+        "recent_executions": snapshot.recent_executions,
+        "cases": snapshot.cases,
+    }
+    minimums = {"cases": min(len(snapshot.cases), 1)}
+    empty = snapshot.model_copy(update={name: [] for name in lists})
+    base_size = _case_snapshot_size(empty)
+    prefix_sizes = {
+        name: serialized_prefix_sizes(items) for name, items in lists.items()
+    }
+    counts = {name: len(items) for name, items in lists.items()}
+
+    def current_size() -> int:
+        return base_size + sum(prefix_sizes[name][counts[name]] for name in lists)
+
+    size = current_size()
+    if size <= max_chars:
+        return snapshot
+
+    # A trimmed snapshot carries the truncation caveat, so size it in.
+    base_size = _case_snapshot_size(_add_truncation_caveat(empty))
+    size = current_size()
+
+    while size > max_chars:
+        trimmable = [name for name in lists if counts[name] > minimums.get(name, 0)]
+        if not trimmable:
+            break
+
+        longest = max(trimmable, key=lambda name: counts[name])
+        counts[longest] -= 1
+        size = current_size()
+
+    trimmed = _add_truncation_caveat(
+        snapshot.model_copy(
+            update={name: items[: counts[name]] for name, items in lists.items()}
+        )
+    )
+
+    if size > max_chars:
+        trimmed = _trim_configuration_drift(trimmed)
+
+    if _case_snapshot_size(trimmed) > max_chars:
+        raise CaseSnapshotBudgetExceededError(trimmed, max_chars)
+
+    return trimmed
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
@@ -12,7 +13,8 @@ from pydantic_ai.output import PromptedOutput
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
-from app.features.assistant.registry import CITATION_REGISTRY
+from app.features.assistant.case_snapshot import CaseSnapshot
+from app.features.assistant.registry import CASE_CITATION_REGISTRY, CITATION_REGISTRY
 from app.features.assistant.schemas import (
     SimulationSummaryContent,
     SummaryGenerationProvider,
@@ -43,7 +45,24 @@ Rules:
 - Prefer natural language over field-by-field narration.
 """.strip()
 
+# Bump when SUMMARY_SYSTEM_PROMPT or the user prompt format changes so cached
+# summaries produced by the previous prompt are no longer served.
+SUMMARY_PROMPT_VERSION = "1"
+# Bump when the case user prompt format changes.
+CASE_SUMMARY_PROMPT_VERSION = "1"
+
+_CASE_PROMPT_GUIDANCE = """
+This snapshot aggregates every execution of a case (scope `case`) or of every
+case in a case group (scope `case_group`). Summarize the executions as a whole:
+their status mix, date coverage, shared configuration, and any configuration
+drift between executions. Do not describe executions one by one. Cite only the
+allowed paths listed below; simulation paths such as `simulation.status` do not
+apply to case snapshots.
+""".strip()
+
 _OLLAMA_PLACEHOLDER_API_KEY = "api-key-not-set"
+# Group streamed tokens so partial output is re-validated at most ~10x/second.
+_STREAM_DEBOUNCE_SECONDS = 0.1
 
 
 @dataclass(frozen=True)
@@ -58,8 +77,20 @@ class AssistantLLMConfig:
 
 
 class SummaryLLMGenerator:
+    """Long-lived LLM summary generator for one ``AssistantLLMConfig``.
+
+    The HTTP client, provider, model, and agent are built on first use and
+    reused for every call, so keep-alive connections to the LLM gateway are
+    pooled instead of re-opened per summary. Call ``aclose`` (or ``retire``
+    while calls may still be running) to release the client.
+    """
+
     def __init__(self, config: AssistantLLMConfig) -> None:
         self.config = config
+        self._http_client: AsyncClient | None = None
+        self._agent: Agent[None, SimulationSummaryContent] | None = None
+        self._active_calls = 0
+        self._retired = False
 
     async def generate(self, snapshot: SimulationSnapshot) -> SimulationSummaryContent:
         """
@@ -76,17 +107,99 @@ class SummaryLLMGenerator:
         SimulationSummaryContent
             The generated simulation summary content.
         """
-        async with AsyncClient(timeout=self.config.timeout_seconds) as http_client:
-            model = self._build_model(http_client)
-            agent = Agent(
-                model,
+        return await self._run(self._build_user_prompt(snapshot))
+
+    async def generate_case(self, snapshot: CaseSnapshot) -> SimulationSummaryContent:
+        """
+        Generates one summary for all executions of a case or case group.
+
+        Parameters
+        ----------
+        snapshot : CaseSnapshot
+            The aggregate case snapshot to summarize.
+
+        Returns
+        -------
+        SimulationSummaryContent
+            The generated case summary content.
+        """
+        return await self._run(self._build_case_user_prompt(snapshot))
+
+    async def stream(
+        self, snapshot: SimulationSnapshot
+    ) -> AsyncIterator[SimulationSummaryContent]:
+        """
+        Stream partially generated summary content from the LLM.
+
+        Parameters
+        ----------
+        snapshot : SimulationSnapshot
+            The simulation snapshot containing metadata to summarize.
+
+        Yields
+        ------
+        SimulationSummaryContent
+            Successively more complete structured output; the last item is the
+            complete output.
+        """
+        agent = self._get_agent()
+
+        self._active_calls += 1
+        try:
+            async with agent.run_stream(self._build_user_prompt(snapshot)) as result:
+                async for partial in result.stream_output(
+                    debounce_by=_STREAM_DEBOUNCE_SECONDS
+                ):
+                    yield partial
+        finally:
+            self._active_calls -= 1
+            if self._retired and self._active_calls == 0:
+                await self.aclose()
+
+    async def _run(self, prompt: str) -> SimulationSummaryContent:
+        agent = self._get_agent()
+
+        self._active_calls += 1
+        try:
+            result = await agent.run(prompt)
+        finally:
+            self._active_calls -= 1
+            if self._retired and self._active_calls == 0:
+                await self.aclose()
+
+        return result.output
+
+    def warm_up(self) -> None:
+        """Build the HTTP client and agent ahead of the first request."""
+        self._get_agent()
+
+    async def retire(self) -> None:
+        """Close the HTTP client once in-flight calls have finished."""
+        self._retired = True
+
+        if self._active_calls == 0:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and drop the cached agent."""
+        http_client = self._http_client
+        self._http_client = None
+        self._agent = None
+
+        if http_client is not None:
+            await http_client.aclose()
+
+    def _get_agent(self) -> Agent[None, SimulationSummaryContent]:
+        if self._agent is None:
+            self._http_client = AsyncClient(timeout=self.config.timeout_seconds)
+            self._agent = Agent(
+                self._build_model(self._http_client),
                 output_type=self._build_output_type(),
                 system_prompt=SUMMARY_SYSTEM_PROMPT,
                 model_settings=self._build_model_settings(),
             )
 
-            result = await agent.run(self._build_user_prompt(snapshot))
-            return result.output
+        return self._agent
 
     def _build_model(self, http_client: AsyncClient) -> OpenAIChatModel:
         """Builds the OpenAIChatModel based on the configuration and HTTP client.
@@ -178,3 +291,68 @@ class SummaryLLMGenerator:
             "Allowed citation paths:\n"
             f"{allowed_citations}\n"
         )
+
+    def _build_case_user_prompt(self, snapshot: CaseSnapshot) -> str:
+        allowed_citations = "\n".join(
+            f"- {path} ({entry.source_type})"
+            for path, entry in sorted(CASE_CITATION_REGISTRY.items())
+        )
+        snapshot_json = snapshot.model_dump_json(indent=2, exclude_none=True)
+
+        return (
+            f"{_CASE_PROMPT_GUIDANCE}\n\n"
+            "Case metadata snapshot:\n"
+            f"{snapshot_json}\n\n"
+            "Allowed citation paths:\n"
+            f"{allowed_citations}\n"
+        )
+
+
+class _SharedGenerator:
+    """Process-wide ``SummaryLLMGenerator``, replaced when the config changes."""
+
+    def __init__(self) -> None:
+        self._generator: SummaryLLMGenerator | None = None
+
+    async def get(self, config: AssistantLLMConfig) -> SummaryLLMGenerator:
+        current = self._generator
+        if current is not None and current.config == config:
+            return current
+
+        self._generator = SummaryLLMGenerator(config)
+        if current is not None:
+            await current.retire()
+
+        return self._generator
+
+    async def close(self) -> None:
+        current = self._generator
+        self._generator = None
+
+        if current is not None:
+            await current.retire()
+
+
+_shared_generator = _SharedGenerator()
+
+
+async def get_summary_llm_generator(config: AssistantLLMConfig) -> SummaryLLMGenerator:
+    """Return the shared generator for ``config``, rebuilding it on change.
+
+    Parameters
+    ----------
+    config : AssistantLLMConfig
+        The resolved LLM configuration for this request.
+
+    Returns
+    -------
+    SummaryLLMGenerator
+        The process-wide generator. A previous generator built for a
+        different config is closed once its in-flight calls finish.
+    """
+    return await _shared_generator.get(config)
+
+
+async def close_summary_llm_generator() -> None:
+    """Close the shared generator's HTTP client, e.g. at app shutdown."""
+    await _shared_generator.close()
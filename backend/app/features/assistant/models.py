@@ -0,0 +1,39 @@
+"""SQLAlchemy ORM models for persisted assistant summaries."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.models.base import Base
+
+
+class SimulationSummaryCache(Base):
+    """LLM-generated simulation summary keyed by its snapshot content hash.
+
+    The key covers the canonical snapshot JSON, provider, model, and prompt
+    version, so any change to the simulation's metadata or the generation
+    setup produces a new key instead of serving a stale summary.
+    """
+
+    __tablename__ = "simulation_summary_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    simulation_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("simulations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(String(200), nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String(50), nullable=False)
+    summary: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
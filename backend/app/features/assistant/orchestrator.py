@@ -1,20 +1,53 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from time import perf_counter
+from typing import Any, Literal, TypeVar
+from uuid import UUID
 
+from prometheus_client import Counter, Histogram
 from pydantic import ValidationError
 from pydantic_ai.exceptions import (
     ModelAPIError,
     ModelHTTPError,
     UnexpectedModelBehavior,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.features.assistant.llm_generator import AssistantLLMConfig, SummaryLLMGenerator
-from app.features.assistant.registry import VALID_CITATION_PATHS, get_citation_entry
+from app.core.logger import log_span
+from app.core.metrics import LATENCY_BUCKETS
+from app.features.assistant.cache import (
+    build_summary_cache_key,
+    get_cached_summaries,
+    get_cached_summary,
+    store_cached_case_summary,
+    store_cached_summary,
+)
+from app.features.assistant.case_snapshot import (
+    CaseSnapshot,
+    CaseSnapshotBudgetExceededError,
+    build_case_group_snapshot,
+    build_case_snapshot,
+)
+from app.features.assistant.llm_generator import (
+    AssistantLLMConfig,
+    SummaryLLMGenerator,
+    close_summary_llm_generator,
+    get_summary_llm_generator,
+)
+from app.features.assistant.registry import (
+    VALID_CASE_CITATION_PATHS,
+    VALID_CITATION_PATHS,
+    CitationRegistryEntry,
+    get_case_citation_entry,
+    get_citation_entry,
+)
 from app.features.assistant.schemas import (
     SimulationSummaryContent,
     SimulationSummaryResponse,
@@ -23,6 +56,7 @@ from app.features.assistant.schemas import (
 )
 from app.features.assistant.service import (
     LLM_LIMITATIONS,
+    build_case_summary,
     build_simulation_summary,
 )
 from app.features.assistant.snapshot import (
@@ -66,9 +100,27 @@ _SNAPSHOT_PATH_ACCESSORS = {
     else None,
 }
 
+_CASE_SNAPSHOT_PATH_ACCESSORS = {
+    "case_group": lambda snapshot: snapshot.case_group,
+    "cases": lambda snapshot: snapshot.cases,
+    "executions.count": lambda snapshot: str(snapshot.executions.count),
+    "executions.status_counts": lambda snapshot: snapshot.executions.status_counts,
+    "executions.earliest_simulation_start_date": lambda snapshot: snapshot.executions.earliest_simulation_start_date,
+    "executions.latest_simulation_end_date": lambda snapshot: snapshot.executions.latest_simulation_end_date,
+    "executions.first_ingested_at": lambda snapshot: snapshot.executions.first_ingested_at,
+    "executions.last_ingested_at": lambda snapshot: snapshot.executions.last_ingested_at,
+    "configuration.shared": lambda snapshot: snapshot.configuration.shared,
+    "configuration.drift": lambda snapshot: snapshot.configuration.drift,
+    "recent_executions": lambda snapshot: snapshot.recent_executions,
+}
+
 _INLINE_CITATION_RE = re.compile(
-    r"\s*\[(?:simulation|case|machine|artifacts|links)[^\]]+\]"
+    r"\s*\[(?:simulation|case|machine|artifacts|links|executions|configuration|recent_executions)[^\]]+\]"
 )
+
+# A simulation snapshot, or the aggregate snapshot of a case or case group.
+_SummarySnapshot = SimulationSnapshot | CaseSnapshot
+_SnapshotT = TypeVar("_SnapshotT", SimulationSnapshot, CaseSnapshot)
 _MULTISPACE_RE = re.compile(r"\s+")
 _SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:])")
 
@@ -80,37 +132,169 @@ class SummaryGenerationResult:
     llm_latency_ms: float
     attempted_provider: SummaryGenerationProvider | None
     attempted_model: str | None
+    cache_hit: bool = False
+
+
+@dataclass(frozen=True)
+class SummaryStreamEvent:
+    """One event of a streamed summary.
+
+    ``deterministic`` and ``final`` events carry a ``result``; ``partial``
+    events carry the LLM's partially generated structured output.
+    """
+
+    event: Literal["deterministic", "partial", "final"]
+    result: SummaryGenerationResult | None = None
+    partial: SimulationSummaryContent | None = None
+
+
+class _LLMConcurrencyLimiter:
+    """Cap concurrent LLM calls in this process and track the wait queue.
+
+    The semaphore is rebuilt when the running event loop or the configured
+    limit changes, since an ``asyncio.Semaphore`` is bound to one loop.
+    """
+
+    def __init__(self) -> None:
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._limit: int | None = None
+        self.active = 0
+        self.waiting = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        limit = settings.assistant_llm_max_concurrency
+
+        if self._semaphore is None or self._loop is not loop or self._limit != limit:
+            self._semaphore = asyncio.Semaphore(limit)
+            self._loop = loop
+            self._limit = limit
+
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            semaphore.release()
+
+
+_llm_limiter = _LLMConcurrencyLimiter()
+
+# In-flight LLM generations keyed by summary cache key, shared by concurrent
+# requests for the same snapshot, provider, and model.
+_inflight_generations: dict[str, asyncio.Task[SummaryGenerationResult]] = {}
+_GENERATION_COUNTS = {"coalesced": 0}
+
+LLM_REQUEST_SECONDS = Histogram(
+    "assistant_llm_request_duration_seconds",
+    "LLM summary generation latency by provider and outcome (success, fallback).",
+    ("provider", "outcome"),
+    buckets=LATENCY_BUCKETS,
+)
+# Reasons are fixed categories; the detailed reason is on each summary.
+SUMMARY_FALLBACKS = Counter(
+    "assistant_summary_fallbacks_total",
+    "Summaries that fell back to the deterministic summary, by reason "
+    "(llm_failed, snapshot_budget, llm_misconfigured).",
+    ("reason",),
+)
+
+
+def get_llm_queue_stats() -> dict[str, Any]:
+    """Return this worker's LLM concurrency and coalescing counters.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``limit`` (max concurrent LLM calls), ``active`` (calls running),
+        ``waiting`` (calls queued for a slot), ``inflight`` (distinct
+        generations in progress), and ``coalesced`` (requests that joined an
+        in-flight generation since startup).
+    """
+    return {
+        "limit": settings.assistant_llm_max_concurrency,
+        "active": _llm_limiter.active,
+        "waiting": _llm_limiter.waiting,
+        "inflight": len(_inflight_generations),
+        "coalesced": _GENERATION_COUNTS["coalesced"],
+    }
 
 
 def is_summary_llm_available() -> bool:
     """Return whether LLM-backed summaries are effectively available."""
 
+    return get_summary_llm_config() is not None
+
+
+def get_summary_llm_config() -> AssistantLLMConfig | None:
+    """Return the resolved LLM configuration, or ``None`` when unavailable."""
+
     if not settings.assistant_llm_enabled:
-        return False
+        return None
 
     try:
-        _resolve_llm_config()
+        return _resolve_llm_config()
     except ValueError:
-        return False
+        return None
+
+
+async def start_summary_llm_generator() -> None:
+    """Create and warm up the shared LLM generator when the LLM is available.
+
+    Called at app startup so the first summary request does not pay for
+    building the HTTP client and agent.
+    """
+    config = get_summary_llm_config()
+    if config is None:
+        return
+
+    generator = await get_summary_llm_generator(config)
+    generator.warm_up()
 
-    return True
+
+async def stop_summary_llm_generator() -> None:
+    """Close the shared LLM generator's pooled HTTP client at app shutdown."""
+    await close_summary_llm_generator()
 
 
 async def generate_simulation_summary(
     simulation: Simulation,
     *,
     allow_llm: bool = True,
+    db: AsyncSession | None = None,
+    refresh: bool = False,
 ) -> SummaryGenerationResult:
     """
     Generates a simulation summary, attempting LLM generation if allowed and
     falling back to deterministic generation on failure.
 
+    Successful LLM summaries are cached by snapshot content hash, so repeat
+    requests for an unchanged simulation skip the LLM call.
+
     Parameters
     ----------
     simulation : Simulation
         The simulation for which to generate the summary
     allow_llm : bool, optional
         Whether to attempt LLM generation (default: True)
+    db : AsyncSession | None, optional
+        Session for the persistent summary cache; when omitted only the
+        in-process cache is used (default: None)
+    refresh : bool, optional
+        Whether to skip cached summaries and regenerate (default: False)
 
     Returns
     -------
@@ -118,26 +302,327 @@ async def generate_simulation_summary(
         The result of the summary generation, including the summary response,
         any fallback reason, and LLM latency.
     """
-    attempted_provider, attempted_model = _resolve_attempted_llm_metadata(
-        allow_llm=allow_llm
+    prepared = _prepare_llm_generation(simulation, allow_llm=allow_llm)
+    if isinstance(prepared, SummaryGenerationResult):
+        return prepared
+
+    snapshot, config = prepared
+    generator = await get_summary_llm_generator(config)
+
+    return await _generate_llm_result(
+        snapshot, config, generator, db=db, refresh=refresh
+    )
+
+
+async def generate_simulation_summaries(
+    simulations: Sequence[Simulation],
+    *,
+    allow_llm: bool = True,
+    db: AsyncSession | None = None,
+    refresh: bool = False,
+) -> list[SummaryGenerationResult]:
+    """
+    Generate summaries for several simulations concurrently.
+
+    Cached summaries are fetched with a single query and the remaining LLM
+    calls run concurrently, subject to the process-wide LLM concurrency cap.
+    ``db`` is only used before and after the LLM calls, so one request
+    session can serve the whole batch.
+
+    Parameters
+    ----------
+    simulations : Sequence[Simulation]
+        The simulations to summarize
+    allow_llm : bool, optional
+        Whether to attempt LLM generation (default: True)
+    db : AsyncSession | None, optional
+        Session for the persistent summary cache (default: None)
+    refresh : bool, optional
+        Whether to skip cached summaries and regenerate (default: False)
+
+    Returns
+    -------
+    list[SummaryGenerationResult]
+        One result per simulation, in input order.
+    """
+    results: list[SummaryGenerationResult | None] = []
+    pending: list[tuple[int, str, SimulationSnapshot, AssistantLLMConfig]] = []
+
+    for simulation in simulations:
+        prepared = _prepare_llm_generation(simulation, allow_llm=allow_llm)
+
+        if isinstance(prepared, SummaryGenerationResult):
+            results.append(prepared)
+            continue
+
+        snapshot, config = prepared
+        pending.append(
+            (len(results), build_summary_cache_key(snapshot, config), snapshot, config)
+        )
+        results.append(None)
+
+    cache_enabled = settings.assistant_summary_cache_enabled
+    if cache_enabled and not refresh and pending:
+        cached = await get_cached_summaries(db, [key for _, key, _, _ in pending])
+        misses = []
+
+        for index, key, snapshot, config in pending:
+            if key in cached:
+                results[index] = _build_cached_result(cached[key], config)
+            else:
+                misses.append((index, key, snapshot, config))
+
+        pending = misses
+
+    calls = [
+        _run_single_flight(
+            key, snapshot, config, await get_summary_llm_generator(config)
+        )
+        for _, key, snapshot, config in pending
+    ]
+    generated = await asyncio.gather(*calls)
+
+    for (index, key, snapshot, config), (result, is_leader) in zip(
+        pending, generated, strict=True
+    ):
+        results[index] = result
+        if is_leader and cache_enabled:
+            await _store_llm_result(db, key, snapshot, config, result)
+
+    return [result for result in results if result is not None]
+
+
+async def stream_simulation_summary(
+    simulation: Simulation,
+    *,
+    allow_llm: bool = True,
+    db: AsyncSession | None = None,
+    refresh: bool = False,
+) -> AsyncIterator[SummaryStreamEvent]:
+    """
+    Stream a simulation summary as it is generated.
+
+    Yields the deterministic summary first, so clients can render something
+    immediately. When the LLM path runs, partial structured output follows
+    as it arrives. The stream always ends with a ``final`` event carrying the
+    same validated, citation-standardized result ``generate_simulation_summary``
+    would return (or its deterministic fallback).
+
+    Parameters
+    ----------
+    simulation : Simulation
+        The simulation for which to generate the summary
+    allow_llm : bool, optional
+        Whether to attempt LLM generation (default: True)
+    db : AsyncSession | None, optional
+        Session for the persistent summary cache (default: None)
+    refresh : bool, optional
+        Whether to skip cached summaries and regenerate (default: False)
+
+    Yields
+    ------
+    SummaryStreamEvent
+        ``deterministic``, zero or more ``partial``, then one ``final`` event.
+    """
+    prepared = _prepare_llm_generation(simulation, allow_llm=allow_llm)
+    if isinstance(prepared, SummaryGenerationResult):
+        yield SummaryStreamEvent(event="final", result=prepared)
+        return
+
+    snapshot, config = prepared
+    cache_key = build_summary_cache_key(snapshot, config)
+    cache_enabled = settings.assistant_summary_cache_enabled
+
+    if cache_enabled and not refresh:
+        cached = await _get_cached_result(db, cache_key, config)
+
+        if cached is not None:
+            yield SummaryStreamEvent(event="final", result=cached)
+            return
+
+    yield SummaryStreamEvent(
+        event="deterministic",
+        result=_build_deterministic_result(
+            snapshot,
+            include_fallback_caveat=False,
+            fallback_reason=None,
+            attempted_provider=config.provider,
+            attempted_model=config.model_name,
+        ),
     )
 
+    generator = await get_summary_llm_generator(config)
+    result: SummaryGenerationResult | None = None
+
+    async with _llm_limiter.slot():
+        start = perf_counter()
+        try:
+            content: SimulationSummaryContent | None = None
+
+            async for content in generator.stream(snapshot):
+                yield SummaryStreamEvent(event="partial", partial=content)
+
+            if content is None:
+                raise ValueError("empty_answer")
+
+            result = _build_validated_llm_result(content, snapshot, config, start)
+        except (ValidationError, ValueError) as exc:
+            fallback_reason = getattr(exc, "args", ["llm_validation_failed"])[0]
+        except Exception as exc:  # pragma: no cover - exercised via patched tests
+            fallback_reason = _format_model_error(exc)
+
+    if result is None:
+        result = _build_llm_fallback_result(
+            snapshot, config, str(fallback_reason), start
+        )
+    elif cache_enabled:
+        await _store_llm_result(db, cache_key, snapshot, config, result)
+
+    yield SummaryStreamEvent(event="final", result=result)
+
+
+async def generate_case_summary(
+    db: AsyncSession,
+    case_id: UUID,
+    *,
+    allow_llm: bool = True,
+    refresh: bool = False,
+) -> SummaryGenerationResult | None:
+    """
+    Generate one summary covering every execution of a case.
+
+    The case is described by an aggregate snapshot (status histogram, date
+    coverage, configuration drift, links), so a case costs one LLM call no
+    matter how many executions it has. Successful LLM summaries are cached in
+    the in-process LRU only.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Session used to aggregate the case's executions
+    case_id : UUID
+        The case to summarize
+    allow_llm : bool, optional
+        Whether to attempt LLM generation (default: True)
+    refresh : bool, optional
+        Whether to skip cached summaries and regenerate (default: False)
+
+    Returns
+    -------
+    SummaryGenerationResult | None
+        The summary result, or ``None`` if the case does not exist.
+    """
+    return await _generate_case_scope_summary(
+        build_case_snapshot(db, case_id), allow_llm=allow_llm, refresh=refresh
+    )
+
+
+async def generate_case_group_summary(
+    db: AsyncSession,
+    case_group: str,
+    *,
+    allow_llm: bool = True,
+    refresh: bool = False,
+) -> SummaryGenerationResult | None:
+    """
+    Generate one summary covering every case in a case group.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Session used to aggregate the group's executions
+    case_group : str
+        Exact case group name
+    allow_llm : bool, optional
+        Whether to attempt LLM generation (default: True)
+    refresh : bool, optional
+        Whether to skip cached summaries and regenerate (default: False)
+
+    Returns
+    -------
+    SummaryGenerationResult | None
+        The summary result, or ``None`` if no case is in the group.
+    """
+    return await _generate_case_scope_summary(
+        build_case_group_snapshot(db, case_group),
+        allow_llm=allow_llm,
+        refresh=refresh,
+    )
+
+
+async def _generate_case_scope_summary(
+    pending_snapshot: Awaitable[CaseSnapshot | None],
+    *,
+    allow_llm: bool,
+    refresh: bool,
+) -> SummaryGenerationResult | None:
+    budget_error: str | None = None
+    try:
+        snapshot = await pending_snapshot
+    except CaseSnapshotBudgetExceededError as exc:
+        snapshot, budget_error = exc.snapshot, str(exc)
+
+    if snapshot is None:
+        return None
+
+    prepared = _resolve_llm_generation(
+        snapshot, allow_llm=allow_llm, budget_error=budget_error
+    )
+    if isinstance(prepared, SummaryGenerationResult):
+        return prepared
+
+    snapshot, config = prepared
+    generator = await get_summary_llm_generator(config)
+
+    return await _generate_llm_result(
+        snapshot, config, generator, db=None, refresh=refresh
+    )
+
+
+def _prepare_llm_generation(
+    simulation: Simulation,
+    *,
+    allow_llm: bool,
+) -> SummaryGenerationResult | tuple[SimulationSnapshot, AssistantLLMConfig]:
+    """Build the snapshot and LLM config, or the deterministic result to use."""
     try:
         snapshot = build_simulation_snapshot(simulation)
     except SnapshotBudgetExceededError as exc:
+        return _resolve_llm_generation(
+            exc.snapshot, allow_llm=allow_llm, budget_error=str(exc)
+        )
+
+    return _resolve_llm_generation(snapshot, allow_llm=allow_llm)
+
+
+def _resolve_llm_generation(
+    snapshot: _SnapshotT,
+    *,
+    allow_llm: bool,
+    budget_error: str | None = None,
+) -> SummaryGenerationResult | tuple[_SnapshotT, AssistantLLMConfig]:
+    """Return the LLM config for ``snapshot``, or the deterministic result."""
+    attempted_provider, attempted_model = _resolve_attempted_llm_metadata(
+        allow_llm=allow_llm
+    )
+
+    if budget_error is not None:
         if not allow_llm:
             return _build_deterministic_result(
-                exc.snapshot,
+                snapshot,
                 include_fallback_caveat=False,
                 fallback_reason=None,
                 attempted_provider=None,
                 attempted_model=None,
             )
 
+        if settings.assistant_llm_enabled:
+            SUMMARY_FALLBACKS.labels(reason="snapshot_budget").inc()
+
         return _build_deterministic_result(
-            exc.snapshot,
+            snapshot,
             include_fallback_caveat=settings.assistant_llm_enabled,
-            fallback_reason=str(exc)
+            fallback_reason=budget_error
             if settings.assistant_llm_enabled
             else "llm_disabled",
             attempted_provider=attempted_provider,
@@ -165,8 +650,9 @@ async def generate_simulation_summary(
 
     try:
         config = _resolve_llm_config()
-        generator = SummaryLLMGenerator(config)
     except ValueError as exc:
+        SUMMARY_FALLBACKS.labels(reason="llm_misconfigured").inc()
+
         return _build_deterministic_result(
             snapshot,
             include_fallback_caveat=True,
@@ -176,25 +662,158 @@ async def generate_simulation_summary(
             fallback_used=True,
         )
 
-    start = perf_counter()
-    try:
-        llm_content = await generator.generate(snapshot)
-        llm_content = _fill_missing_llm_followups(llm_content, snapshot)
-        validated = _validate_llm_content(llm_content, snapshot)
+    return snapshot, config
 
-        return _build_llm_result(
-            validated, config=config, llm_latency_ms=(perf_counter() - start) * 1000
-        )
-    except (ValidationError, ValueError) as exc:
-        fallback_reason = getattr(exc, "args", ["llm_validation_failed"])[0]
-    except Exception as exc:  # pragma: no cover - exercised via patched tests
-        fallback_reason = _format_model_error(exc)
+
+async def _generate_llm_result(
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    generator: SummaryLLMGenerator,
+    *,
+    db: AsyncSession | None,
+    refresh: bool,
+) -> SummaryGenerationResult:
+    cache_key = build_summary_cache_key(snapshot, config)
+    cache_enabled = settings.assistant_summary_cache_enabled
+
+    if cache_enabled and not refresh:
+        cached = await _get_cached_result(db, cache_key, config)
+
+        if cached is not None:
+            return cached
+
+    result, is_leader = await _run_single_flight(cache_key, snapshot, config, generator)
+
+    if is_leader and cache_enabled:
+        await _store_llm_result(db, cache_key, snapshot, config, result)
+
+    return result
+
+
+async def _run_single_flight(
+    cache_key: str,
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    generator: SummaryLLMGenerator,
+) -> tuple[SummaryGenerationResult, bool]:
+    # Single-flight: concurrent requests for the same key await one task.
+    # The task is shielded so a disconnecting caller does not cancel it for
+    # the others; only the caller that started it writes the cache.
+    task = _inflight_generations.get(cache_key)
+    is_leader = task is None
+
+    if task is None:
+        task = asyncio.ensure_future(_call_llm(snapshot, config, generator))
+        _inflight_generations[cache_key] = task
+        task.add_done_callback(lambda _: _inflight_generations.pop(cache_key, None))
+    else:
+        _GENERATION_COUNTS["coalesced"] += 1
+
+    return await asyncio.shield(task), is_leader
+
+
+async def _store_llm_result(
+    db: AsyncSession | None,
+    cache_key: str,
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    result: SummaryGenerationResult,
+) -> None:
+    if result.summary.generation_mode != "llm":
+        return
+
+    if isinstance(snapshot, CaseSnapshot):
+        store_cached_case_summary(cache_key, result.summary)
+        return
+
+    await store_cached_summary(
+        db,
+        cache_key,
+        simulation_id=snapshot.simulation.id,
+        config=config,
+        summary=result.summary,
+    )
+
+
+async def _call_llm(
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    generator: SummaryLLMGenerator,
+) -> SummaryGenerationResult:
+    with log_span("assistant.llm", provider=config.provider, model=config.model_name):
+        async with _llm_limiter.slot():
+            start = perf_counter()
+            try:
+                if isinstance(snapshot, CaseSnapshot):
+                    content = await generator.generate_case(snapshot)
+                else:
+                    content = await generator.generate(snapshot)
+
+                return _build_validated_llm_result(content, snapshot, config, start)
+            except (ValidationError, ValueError) as exc:
+                fallback_reason = getattr(exc, "args", ["llm_validation_failed"])[0]
+            except Exception as exc:  # pragma: no cover - exercised via patched tests
+                fallback_reason = _format_model_error(exc)
+
+        return _build_llm_fallback_result(snapshot, config, str(fallback_reason), start)
+
+
+async def _get_cached_result(
+    db: AsyncSession | None, cache_key: str, config: AssistantLLMConfig
+) -> SummaryGenerationResult | None:
+    cached = await get_cached_summary(db, cache_key)
+    if cached is None:
+        return None
+
+    return _build_cached_result(cached, config)
+
+
+def _build_cached_result(
+    summary: SimulationSummaryResponse, config: AssistantLLMConfig
+) -> SummaryGenerationResult:
+    return SummaryGenerationResult(
+        summary=summary,
+        fallback_reason=None,
+        llm_latency_ms=0.0,
+        attempted_provider=config.provider,
+        attempted_model=config.model_name,
+        cache_hit=True,
+    )
+
+
+def _build_validated_llm_result(
+    content: SimulationSummaryContent,
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    start: float,
+) -> SummaryGenerationResult:
+    content = _fill_missing_llm_followups(content, snapshot)
+    validated = _validate_llm_content(content, snapshot)
+    seconds = perf_counter() - start
+    LLM_REQUEST_SECONDS.labels(provider=config.provider, outcome="success").observe(
+        seconds
+    )
+
+    return _build_llm_result(validated, config=config, llm_latency_ms=seconds * 1000)
+
+
+def _build_llm_fallback_result(
+    snapshot: _SummarySnapshot,
+    config: AssistantLLMConfig,
+    fallback_reason: str,
+    start: float,
+) -> SummaryGenerationResult:
+    seconds = perf_counter() - start
+    LLM_REQUEST_SECONDS.labels(provider=config.provider, outcome="fallback").observe(
+        seconds
+    )
+    SUMMARY_FALLBACKS.labels(reason="llm_failed").inc()
 
     return _build_deterministic_result(
         snapshot,
         include_fallback_caveat=True,
-        fallback_reason=str(fallback_reason),
-        llm_latency_ms=(perf_counter() - start) * 1000,
+        fallback_reason=fallback_reason,
+        llm_latency_ms=seconds * 1000,
         attempted_provider=config.provider,
         attempted_model=config.model_name,
         fallback_used=True,
@@ -221,7 +840,7 @@ def _configured_model_name(provider: SummaryGenerationProvider) -> str | None:
 
 
 def _build_deterministic_result(
-    snapshot: SimulationSnapshot,
+    snapshot: _SummarySnapshot,
     *,
     include_fallback_caveat: bool,
     fallback_reason: str | None,
@@ -314,20 +933,25 @@ def _resolve_llm_config() -> AssistantLLMConfig:
 
 def _standardize_citations(
     citations: list[SummaryCitationOut],
-    snapshot: SimulationSnapshot,
+    snapshot: _SummarySnapshot,
 ) -> list[SummaryCitationOut]:
     normalized: list[SummaryCitationOut] = []
+    is_case = isinstance(snapshot, CaseSnapshot)
+    valid_paths = VALID_CASE_CITATION_PATHS if is_case else VALID_CITATION_PATHS
+    get_entry = get_case_citation_entry if is_case else get_citation_entry
 
     for citation in citations:
         canonical_path = _canonicalize_citation_path(
             citation.path,
             citation.source_type,
+            valid_paths=valid_paths,
+            get_entry=get_entry,
         )
 
         if not _snapshot_has_citation_path(snapshot, canonical_path):
             raise ValueError(f"missing_citation_path:{canonical_path}")
 
-        entry = get_citation_entry(canonical_path)
+        entry = get_entry(canonical_path)
 
         normalized.append(
             SummaryCitationOut(
@@ -340,23 +964,27 @@ def _standardize_citations(
     return normalized
 
 
-def _canonicalize_citation_path(path: str, source_type: str | None = None) -> str:
+def _canonicalize_citation_path(
+    path: str,
+    source_type: str | None = None,
+    *,
+    valid_paths: frozenset[str] = VALID_CITATION_PATHS,
+    get_entry: Callable[[str], CitationRegistryEntry] = get_citation_entry,
+) -> str:
     normalized = path.strip()
 
-    if normalized in VALID_CITATION_PATHS:
+    if normalized in valid_paths:
         return normalized
 
     matches = [
-        candidate
-        for candidate in VALID_CITATION_PATHS
-        if candidate.endswith(f".{normalized}")
+        candidate for candidate in valid_paths if candidate.endswith(f".{normalized}")
     ]
 
     if source_type is not None:
         typed_matches = [
             candidate
             for candidate in matches
-            if get_citation_entry(candidate).source_type == source_type
+            if get_entry(candidate).source_type == source_type
         ]
 
         if len(typed_matches) == 1:
@@ -368,13 +996,18 @@ def _canonicalize_citation_path(path: str, source_type: str | None = None) -> st
     raise ValueError(f"invalid_citation_path:{path}")
 
 
-def _snapshot_has_citation_path(snapshot: SimulationSnapshot, path: str) -> bool:
-    accessor = _SNAPSHOT_PATH_ACCESSORS.get(path)
+def _snapshot_has_citation_path(snapshot: _SummarySnapshot, path: str) -> bool:
+    accessors: dict[str, Callable[[Any], object]] = (
+        _CASE_SNAPSHOT_PATH_ACCESSORS
+        if isinstance(snapshot, CaseSnapshot)
+        else _SNAPSHOT_PATH_ACCESSORS
+    )
+    accessor = accessors.get(path)
 
     if accessor is not None:
         return bool(accessor(snapshot))
 
-    if path.startswith("artifacts[kind="):
+    if path.startswith("artifacts[kind=") and isinstance(snapshot, SimulationSnapshot):
         kind = path[len("artifacts[kind=") : -1]
 
         return any(item.kind == kind for item in snapshot.artifacts)
@@ -401,7 +1034,7 @@ def _merge_unique_strings(*groups: list[str]) -> list[str]:
 
 def _validate_llm_content(
     content: SimulationSummaryContent,
-    snapshot: SimulationSnapshot,
+    snapshot: _SummarySnapshot,
 ) -> SimulationSummaryContent:
     normalized_answer = _normalize_llm_answer(content.answer)
 
@@ -435,14 +1068,20 @@ def _normalize_llm_answer(answer: str) -> str:
 
 
 def _build_deterministic_response(
-    snapshot: SimulationSnapshot,
+    snapshot: _SummarySnapshot,
     *,
     include_fallback_caveat: bool,
 ) -> SimulationSummaryResponse:
-    base = build_simulation_summary(
-        snapshot,
-        include_fallback_caveat=include_fallback_caveat,
-    )
+    if isinstance(snapshot, CaseSnapshot):
+        base = build_case_summary(
+            snapshot,
+            include_fallback_caveat=include_fallback_caveat,
+        )
+    else:
+        base = build_simulation_summary(
+            snapshot,
+            include_fallback_caveat=include_fallback_caveat,
+        )
 
     return base.model_copy(
         update={
@@ -455,12 +1094,14 @@ def _build_deterministic_response(
 
 def _fill_missing_llm_followups(
     content: SimulationSummaryContent,
-    snapshot: SimulationSnapshot,
+    snapshot: _SummarySnapshot,
 ) -> SimulationSummaryContent:
     if content.suggested_followups:
         return content
 
-    fallback_summary = build_simulation_summary(snapshot)
+    fallback_summary = _build_deterministic_response(
+        snapshot, include_fallback_caveat=False
+    )
 
     return content.model_copy(
         update={"suggested_followups": fallback_summary.suggested_followups}
@@ -0,0 +1,205 @@
+"""Offline precomputation of LLM simulation summaries.
+
+Runs the same generation path as the summary endpoint for simulations that
+have no cached summary for the configured provider, model, and prompt
+version, so summaries are ready before anyone opens the page. Progress is
+tracked by the summary cache table itself: an interrupted run resumes with
+whatever is still missing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database_async import AsyncSessionLocal
+from app.core.logger import _setup_custom_logger
+from app.features.assistant.llm_generator import (
+    SUMMARY_PROMPT_VERSION,
+    AssistantLLMConfig,
+)
+from app.features.assistant.models import SimulationSummaryCache
+from app.features.assistant.orchestrator import (
+    SummaryGenerationResult,
+    generate_simulation_summary,
+    get_summary_llm_config,
+)
+from app.features.assistant.snapshot import snapshot_load_options
+from app.features.simulation.models import Simulation
+
+logger = _setup_custom_logger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass
+class SummaryPrecomputeReport:
+    """Outcome counts for one precompute run."""
+
+    selected: int = 0
+    generated: int = 0
+    cached: int = 0
+    fallback: int = 0
+    failed: int = 0
+
+    def record(self, result: SummaryGenerationResult) -> None:
+        if result.cache_hit:
+            self.cached += 1
+        elif result.summary.generation_mode == "llm":
+            self.generated += 1
+        else:
+            self.fallback += 1
+
+
+async def select_simulations_to_precompute(
+    db: AsyncSession,
+    config: AssistantLLMConfig,
+    *,
+    simulation_ids: Sequence[UUID] | None = None,
+    limit: int | None = None,
+    refresh: bool = False,
+) -> list[UUID]:
+    """Return IDs of simulations that still need an LLM summary.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Active database session.
+    config : AssistantLLMConfig
+        The LLM configuration summaries are generated with.
+    simulation_ids : Sequence[UUID] | None, optional
+        Restrict the selection to these simulations (default: all).
+    limit : int | None, optional
+        Maximum number of simulations to return (default: no limit).
+    refresh : bool, optional
+        Whether to include simulations that already have a cached summary
+        (default: False).
+
+    Returns
+    -------
+    list[UUID]
+        Simulation IDs, oldest first.
+    """
+    stmt = select(Simulation.id).order_by(Simulation.created_at, Simulation.id)
+
+    if simulation_ids is not None:
+        stmt = stmt.where(Simulation.id.in_(simulation_ids))
+
+    if not refresh:
+        stmt = stmt.where(
+            ~exists().where(
+                SimulationSummaryCache.simulation_id == Simulation.id,
+                SimulationSummaryCache.provider == config.provider,
+                SimulationSummaryCache.model == config.model_name,
+                SimulationSummaryCache.prompt_version == SUMMARY_PROMPT_VERSION,
+            )
+        )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return list((await db.scalars(stmt)).all())
+
+
+async def precompute_simulation_summaries(
+    simulation_ids: Sequence[UUID] | None = None,
+    *,
+    concurrency: int | None = None,
+    limit: int | None = None,
+    refresh: bool = False,
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> SummaryPrecomputeReport:
+    """Generate and cache LLM summaries for simulations that lack one.
+
+    Each simulation is summarized in its own session, with at most
+    ``concurrency`` in progress at once. LLM calls are additionally capped by
+    ``ASSISTANT_LLM_MAX_CONCURRENCY``. Failures are logged and counted, and
+    fallbacks are not cached, so both are retried on the next run.
+
+    Parameters
+    ----------
+    simulation_ids : Sequence[UUID] | None, optional
+        Restrict the run to these simulations (default: all).
+    concurrency : int | None, optional
+        Maximum simulations summarized at once (default:
+        ``ASSISTANT_LLM_MAX_CONCURRENCY``).
+    limit : int | None, optional
+        Maximum number of simulations to summarize (default: no limit).
+    refresh : bool, optional
+        Whether to regenerate summaries that are already cached
+        (default: False).
+    session_factory : SessionFactory, optional
+        Factory for the async sessions used by the run.
+
+    Returns
+    -------
+    SummaryPrecomputeReport
+        Counts of generated, cached, fallback, and failed summaries.
+    """
+    report = SummaryPrecomputeReport()
+    config = get_summary_llm_config()
+
+    if config is None:
+        logger.info("LLM summaries are unavailable; skipping summary precompute.")
+        return report
+
+    async with session_factory() as db:
+        sim_ids = await select_simulations_to_precompute(
+            db, config, simulation_ids=simulation_ids, limit=limit, refresh=refresh
+        )
+
+    report.selected = len(sim_ids)
+    semaphore = asyncio.Semaphore(concurrency or settings.assistant_llm_max_concurrency)
+
+    async def summarize(sim_id: UUID) -> None:
+        async with semaphore:
+            try:
+                async with session_factory() as db:
+                    result = await _summarize_one(db, sim_id, refresh=refresh)
+            except Exception:
+                report.failed += 1
+                logger.exception(
+                    "Failed to precompute summary for simulation %s", sim_id
+                )
+                return
+
+        if result is not None:
+            report.record(result)
+
+    await asyncio.gather(*(summarize(sim_id) for sim_id in sim_ids))
+
+    logger.info(
+        "simulation_summary_precompute selected=%d generated=%d cached=%d "
+        "fallback=%d failed=%d",
+        report.selected,
+        report.generated,
+        report.cached,
+        report.fallback,
+        report.failed,
+    )
+
+    return report
+
+
+async def _summarize_one(
+    db: AsyncSession, sim_id: UUID, *, refresh: bool
+) -> SummaryGenerationResult | None:
+    result = await db.execute(
+        select(Simulation)
+        .options(*snapshot_load_options())
+        .where(Simulation.id == sim_id)
+    )
+    simulation = result.scalars().unique().one_or_none()
+
+    # The simulation may have been deleted since it was selected.
+    if simulation is None:
+        return None
+
+    return await generate_simulation_summary(simulation, db=db, refresh=refresh)
@@ -170,9 +170,70 @@ _CITATION_REGISTRY = {
     ),
 }
 
+_CASE_CITATION_REGISTRY = {
+    "case_group": CitationRegistryEntry(
+        source_type="case_field",
+        label="Case group",
+    ),
+    "cases": CitationRegistryEntry(
+        source_type="case_field",
+        label="Cases",
+    ),
+    "executions.count": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Execution count",
+    ),
+    "executions.status_counts": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Execution status counts",
+    ),
+    "executions.earliest_simulation_start_date": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Earliest simulation start date",
+    ),
+    "executions.latest_simulation_end_date": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Latest simulation end date",
+    ),
+    "executions.first_ingested_at": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="First ingestion time",
+    ),
+    "executions.last_ingested_at": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Last ingestion time",
+    ),
+    "configuration.shared": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Shared configuration",
+    ),
+    "configuration.drift": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Configuration drift",
+    ),
+    "recent_executions": CitationRegistryEntry(
+        source_type="simulation_field",
+        label="Recent executions",
+    ),
+    **{
+        path: entry
+        for path, entry in _CITATION_REGISTRY.items()
+        if path.startswith("links[")
+    },
+}
+
 CITATION_REGISTRY = MappingProxyType(_CITATION_REGISTRY)
 VALID_CITATION_PATHS = frozenset(CITATION_REGISTRY)
 
+# Citation paths for case and case-group summaries, which cite the aggregate
+# case snapshot rather than a single simulation.
+CASE_CITATION_REGISTRY = MappingProxyType(_CASE_CITATION_REGISTRY)
+VALID_CASE_CITATION_PATHS = frozenset(CASE_CITATION_REGISTRY)
+
 
 def get_citation_entry(path: str) -> CitationRegistryEntry:
     return CITATION_REGISTRY[path]
+
+
+def get_case_citation_entry(path: str) -> CitationRegistryEntry:
+    return CASE_CITATION_REGISTRY[path]
@@ -1,9 +1,11 @@
 from typing import Literal
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from app.common.schemas.base import CamelOutBaseModel
+from app.common.schemas.base import CamelInBaseModel, CamelOutBaseModel
+
+MAX_SUMMARY_BATCH_SIZE = 50
 
 
 class SummaryCitationOut(CamelOutBaseModel):
@@ -75,3 +77,40 @@ class SimulationSummaryResponse(SimulationSummaryContent):
         description="Configured provider model when LLM generation succeeds; otherwise null.",
     )
     trace_id: UUID = Field(..., description="Trace ID for request review and logs.")
+
+
+class SimulationSummaryBatchRequest(CamelInBaseModel):
+    """Request body for summarizing several simulations in one call."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    simulation_ids: list[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_SUMMARY_BATCH_SIZE,
+        description=(
+            "IDs of the simulations to summarize. Duplicates are ignored and "
+            "the first-seen order is preserved in the response."
+        ),
+    )
+    refresh: bool = Field(
+        default=False,
+        description="Regenerate instead of serving cached LLM summaries.",
+    )
+
+
+class SimulationSummaryBatchItem(CamelOutBaseModel):
+    """Summary of one simulation in a batch response."""
+
+    simulation_id: UUID = Field(..., description="ID of the summarized simulation.")
+    summary: SimulationSummaryResponse = Field(
+        ..., description="Summary for the simulation."
+    )
+
+
+class SimulationSummaryBatchResponse(CamelOutBaseModel):
+    """Structured response returned by the batch summary endpoint."""
+
+    summaries: list[SimulationSummaryBatchItem] = Field(
+        ..., description="Summaries in request order."
+    )
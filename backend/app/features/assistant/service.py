@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from collections.abc import Callable
 
-from app.features.assistant.registry import get_citation_entry
+from app.features.assistant.case_snapshot import CaseSnapshot
+from app.features.assistant.registry import (
+    CitationRegistryEntry,
+    get_case_citation_entry,
+    get_citation_entry,
+)
 from app.features.assistant.schemas import (
     SimulationSummaryResponse,
     SummaryCitationOut,
@@ -24,14 +30,18 @@ LLM_FALLBACK_CAVEAT = "This summary was generated using the deterministic fallba
 class SummaryDraft:
     """Mutable collector used while assembling deterministic summary output."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        get_entry: Callable[[str], CitationRegistryEntry] = get_citation_entry,
+    ) -> None:
         self.sentences: list[str] = []
         self.caveats: list[str] = []
         self.followups: list[str] = []
         self.citations: OrderedDict[str, SummaryCitationOut] = OrderedDict()
+        self._get_entry = get_entry
 
     def add_citation(self, path: str) -> None:
-        entry = get_citation_entry(path)
+        entry = self._get_entry(path)
         self.citations[path] = SummaryCitationOut(
             source_type=entry.source_type,
             path=path,
@@ -251,3 +261,195 @@ def build_simulation_summary(
         generation_model=None,
         trace_id="00000000-0000-0000-0000-000000000000",
     )
+
+
+def _case_subject(snapshot: CaseSnapshot) -> str:
+    if snapshot.scope == "case_group":
+        return "this case group"
+
+    return "this case"
+
+
+def _add_case_identity(snapshot: CaseSnapshot, draft: SummaryDraft) -> None:
+    count = snapshot.executions.count
+    draft.add_citation("executions.count")
+
+    if snapshot.scope == "case_group":
+        draft.sentences.append(
+            f"Case group {snapshot.case_group} contains {snapshot.case_count} "
+            f"case(s) with {count} recorded execution(s)."
+        )
+        draft.add_citation("case_group")
+        draft.add_citation("cases")
+    else:
+        case = snapshot.cases[0]
+        machine = f" on machine {case.machine}" if case.machine else ""
+        draft.sentences.append(
+            f"Case {case.name}{machine} has {count} recorded execution(s)."
+        )
+        draft.add_citation("cases")
+
+        if case.case_group:
+            draft.sentences.append(f"It belongs to case group {case.case_group}.")
+            draft.add_citation("case_group")
+
+    if not count:
+        draft.caveats.append(
+            f"No executions are recorded for {_case_subject(snapshot)} in SimBoard."
+        )
+
+
+def _add_case_status(snapshot: CaseSnapshot, draft: SummaryDraft) -> None:
+    status_counts = snapshot.executions.status_counts
+    if not status_counts:
+        return
+
+    draft.sentences.append(
+        "Recorded execution statuses: "
+        + ", ".join(f"{count} {status}" for status, count in status_counts.items())
+        + "."
+    )
+    draft.add_citation("executions.status_counts")
+
+    if status_counts.get("failed"):
+        draft.followups.append(
+            "Review the failed executions before drawing conclusions from this case."
+        )
+
+
+def _add_case_coverage(snapshot: CaseSnapshot, draft: SummaryDraft) -> None:
+    start_date = snapshot.executions.earliest_simulation_start_date
+    end_date = snapshot.executions.latest_simulation_end_date
+
+    if start_date and end_date:
+        draft.sentences.append(
+            f"Recorded simulation periods span {start_date[:10]} to {end_date[:10]}."
+        )
+        draft.add_citation("executions.earliest_simulation_start_date")
+        draft.add_citation("executions.latest_simulation_end_date")
+    elif start_date:
+        draft.sentences.append(
+            f"Recorded simulation periods start on {start_date[:10]}, and no end "
+            "date is stored in SimBoard metadata."
+        )
+        draft.add_citation("executions.earliest_simulation_start_date")
+        draft.caveats.append(
+            "Simulation end dates are not recorded for these executions."
+        )
+
+    first_ingested = snapshot.executions.first_ingested_at
+    last_ingested = snapshot.executions.last_ingested_at
+    if first_ingested and last_ingested and first_ingested[:10] != last_ingested[:10]:
+        draft.sentences.append(
+            f"Executions were ingested between {first_ingested[:10]} and "
+            f"{last_ingested[:10]}."
+        )
+        draft.add_citation("executions.first_ingested_at")
+        draft.add_citation("executions.last_ingested_at")
+
+
+def _configuration_label(field: str) -> str:
+    return get_citation_entry(f"simulation.{field}").label.lower()
+
+
+def _add_case_configuration(snapshot: CaseSnapshot, draft: SummaryDraft) -> None:
+    shared = snapshot.configuration.shared
+    drift = snapshot.configuration.drift
+
+    if shared:
+        lead = (
+            "All executions share"
+            if snapshot.executions.count > 1
+            else "The execution uses"
+        )
+        draft.sentences.append(
+            f"{lead} "
+            + ", ".join(
+                f"{_configuration_label(field)} {value}"
+                for field, value in shared.items()
+            )
+            + "."
+        )
+        draft.add_citation("configuration.shared")
+
+    if drift:
+        draft.sentences.append(
+            "Configuration differs across executions in "
+            + ", ".join(
+                f"{_configuration_label(item.field)} "
+                f"({len(item.values) + item.omitted_value_count} values)"
+                for item in drift
+            )
+            + "."
+        )
+        draft.add_citation("configuration.drift")
+        draft.followups.append(
+            "Compare executions that differ in configuration before treating them "
+            "as equivalent runs."
+        )
+
+
+def _add_case_recent_and_links(snapshot: CaseSnapshot, draft: SummaryDraft) -> None:
+    if snapshot.recent_executions:
+        latest = snapshot.recent_executions[0]
+        draft.sentences.append(
+            f"The most recently ingested execution is {latest.execution_id} with "
+            f"status {latest.status}."
+        )
+        draft.add_citation("recent_executions")
+
+    diagnostic_links = [link for link in snapshot.links if link.kind == "diagnostic"]
+    if diagnostic_links:
+        draft.sentences.append(
+            f"SimBoard records {len(diagnostic_links)} diagnostic link(s) for "
+            f"{_case_subject(snapshot)}, but this summary does not interpret "
+            "diagnostic outputs."
+        )
+        draft.add_citation("links[kind=diagnostic]")
+        draft.followups.append(
+            "Open the recorded diagnostic links to review supporting context for "
+            "these executions."
+        )
+    else:
+        draft.caveats.append(
+            f"No diagnostic links are recorded for {_case_subject(snapshot)} in "
+            "SimBoard."
+        )
+
+    if not draft.followups:
+        draft.followups.append(
+            "Open individual execution summaries for run-level provenance and context."
+        )
+
+
+def build_case_summary(
+    snapshot: CaseSnapshot,
+    *,
+    include_fallback_caveat: bool = False,
+) -> SimulationSummaryResponse:
+    """Build a deterministic summary of a case or case group snapshot."""
+
+    draft = SummaryDraft(get_case_citation_entry)
+    draft.caveats.extend(snapshot.snapshot_caveats)
+    _add_case_identity(snapshot, draft)
+    _add_case_status(snapshot, draft)
+    _add_case_coverage(snapshot, draft)
+    _add_case_configuration(snapshot, draft)
+    _add_case_recent_and_links(snapshot, draft)
+
+    if include_fallback_caveat and LLM_FALLBACK_CAVEAT not in draft.caveats:
+        draft.caveats.append(LLM_FALLBACK_CAVEAT)
+
+    return SimulationSummaryResponse(
+        answer=" ".join(draft.sentences),
+        citations=list(draft.citations.values()),
+        assumptions=[],
+        caveats=draft.caveats,
+        limitations=DETERMINISTIC_LIMITATIONS,
+        suggested_followups=draft.followups,
+        generation_mode="deterministic",
+        fallback_used=False,
+        generation_provider=None,
+        generation_model=None,
+        trace_id="00000000-0000-0000-0000-000000000000",
+    )
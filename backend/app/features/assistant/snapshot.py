@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.config import settings
 from app.features.simulation.link_utils import merge_simulation_and_case_links
-from app.features.simulation.models import Artifact, ExternalLink, Simulation
+from app.features.simulation.models import (
+    Artifact,
+    Case,
+    ExternalLink,
+    Simulation,
+)
 
 SNAPSHOT_TRUNCATED_CAVEAT = (
     "The metadata snapshot was truncated to fit the assistant size budget. "
@@ -18,7 +25,7 @@ SNAPSHOT_TRUNCATED_CAVEAT = (
 )
 
 
-def _enum_value(value: object) -> str | None:
+def enum_value(value: object) -> str | None:
     if value is None:
         return None
     if isinstance(value, Enum):
@@ -26,7 +33,7 @@ def _enum_value(value: object) -> str | None:
     return str(value)
 
 
-def _isoformat(value: datetime | None) -> str | None:
+def isoformat(value: datetime | None) -> str | None:
     if value is None:
         return None
     return value.isoformat()
@@ -112,7 +119,7 @@ def _sorted_artifacts(items: Iterable[Artifact]) -> list[SnapshotArtifact]:
     return sorted(
         [
             SnapshotArtifact(
-                kind=_enum_value(item.kind) or "unknown",
+                kind=enum_value(item.kind) or "unknown",
                 uri=item.uri,
                 label=item.label,
             )
@@ -122,11 +129,11 @@ def _sorted_artifacts(items: Iterable[Artifact]) -> list[SnapshotArtifact]:
     )
 
 
-def _sorted_links(items: Iterable[ExternalLink]) -> list[SnapshotLink]:
+def sorted_links(items: Iterable[ExternalLink]) -> list[SnapshotLink]:
     return sorted(
         [
             SnapshotLink(
-                kind=_enum_value(item.kind) or "unknown",
+                kind=enum_value(item.kind) or "unknown",
                 url=item.url,
                 label=item.label,
             )
@@ -163,31 +170,60 @@ def _trim_snapshot_strings(snapshot: SimulationSnapshot) -> SimulationSnapshot:
     return snapshot.model_copy(update={"simulation": simulation})
 
 
+def serialized_prefix_sizes(items: Sequence[BaseModel]) -> list[int]:
+    """Return the serialized size of each prefix of ``items`` inside a list.
+
+    Entry ``k`` is the number of characters the first ``k`` items add to the
+    enclosing JSON array: their compact JSON plus the separating commas.
+    """
+    sizes = [0]
+
+    for index, item in enumerate(items):
+        separator = 1 if index else 0
+        sizes.append(
+            sizes[-1] + separator + len(item.model_dump_json(exclude_none=True))
+        )
+
+    return sizes
+
+
 def _apply_size_budget(
     snapshot: SimulationSnapshot,
     budget: _SnapshotSizeBudget,
 ) -> SimulationSnapshot:
-    if _snapshot_size(snapshot) <= budget.max_chars:
+    # Serialize each artifact and link once and size candidate snapshots from
+    # prefix sums, instead of re-serializing the snapshot after every removal.
+    base_size = _snapshot_size(
+        snapshot.model_copy(update={"artifacts": [], "links": []})
+    )
+    artifact_sizes = serialized_prefix_sizes(snapshot.artifacts)
+    link_sizes = serialized_prefix_sizes(snapshot.links)
+    artifact_count = len(snapshot.artifacts)
+    link_count = len(snapshot.links)
+
+    size = base_size + artifact_sizes[artifact_count] + link_sizes[link_count]
+    if size <= budget.max_chars:
         return snapshot
 
-    trimmed = snapshot.model_copy(deep=True)
+    # Drop from the end of the longer list (artifacts on ties) until it fits.
+    while size > budget.max_chars and (artifact_count or link_count):
+        if artifact_count >= link_count and artifact_count:
+            artifact_count -= 1
+        else:
+            link_count -= 1
 
-    while _snapshot_size(trimmed) > budget.max_chars and (
-        trimmed.artifacts or trimmed.links
-    ):
-        if len(trimmed.artifacts) >= len(trimmed.links) and trimmed.artifacts:
-            trimmed = trimmed.model_copy(update={"artifacts": trimmed.artifacts[:-1]})
-        elif trimmed.links:
-            trimmed = trimmed.model_copy(update={"links": trimmed.links[:-1]})
+        size = base_size + artifact_sizes[artifact_count] + link_sizes[link_count]
 
-    if _snapshot_size(trimmed) > budget.max_chars:
-        trimmed = _trim_snapshot_strings(trimmed)
-
-    if _snapshot_size(trimmed) > budget.max_chars and trimmed.artifacts:
-        trimmed = trimmed.model_copy(update={"artifacts": []})
+    trimmed = snapshot.model_copy(
+        update={
+            "artifacts": snapshot.artifacts[:artifact_count],
+            "links": snapshot.links[:link_count],
+        }
+    )
 
-    if _snapshot_size(trimmed) > budget.max_chars and trimmed.links:
-        trimmed = trimmed.model_copy(update={"links": []})
+    # Past this point both lists are empty unless the snapshot already fits.
+    if size > budget.max_chars:
+        trimmed = _trim_snapshot_strings(trimmed)
 
     trimmed = _add_truncation_caveat(trimmed)
 
@@ -197,6 +233,16 @@ def _apply_size_budget(
     return trimmed
 
 
+def snapshot_load_options() -> tuple[LoaderOption, ...]:
+    """Return eager-load options for the relationships the snapshot reads."""
+    return (
+        joinedload(Simulation.case).joinedload(Case.machine),
+        joinedload(Simulation.case).selectinload(Case.links),
+        selectinload(Simulation.artifacts),
+        selectinload(Simulation.links),
+    )
+
+
 def build_simulation_snapshot(
     simulation: Simulation,
     *,
@@ -215,15 +261,15 @@ def build_simulation_snapshot(
             compset_alias=simulation.compset_alias,
             grid_name=simulation.grid_name,
             grid_resolution=simulation.grid_resolution,
-            simulation_type=_enum_value(simulation.simulation_type) or "unknown",
-            status=_enum_value(simulation.status) or "unknown",
+            simulation_type=enum_value(simulation.simulation_type) or "unknown",
+            status=enum_value(simulation.status) or "unknown",
             campaign=simulation.campaign,
             experiment_type=simulation.experiment_type,
             initialization_type=simulation.initialization_type,
-            simulation_start_date=_isoformat(simulation.simulation_start_date),
-            simulation_end_date=_isoformat(simulation.simulation_end_date),
-            run_start_date=_isoformat(simulation.run_start_date),
-            run_end_date=_isoformat(simulation.run_end_date),
+            simulation_start_date=isoformat(simulation.simulation_start_date),
+            simulation_end_date=isoformat(simulation.simulation_end_date),
+            run_start_date=isoformat(simulation.run_start_date),
+            run_end_date=isoformat(simulation.run_end_date),
             compiler=simulation.compiler,
             key_features=simulation.key_features,
             known_issues=simulation.known_issues,
@@ -245,7 +291,7 @@ def build_simulation_snapshot(
             else None
         ),
         artifacts=_sorted_artifacts(simulation.artifacts),
-        links=_sorted_links(merged_links),
+        links=sorted_links(merged_links),
         snapshot_caveats=[],
     )
 
@@ -1,19 +1,38 @@
 import hashlib
 import tempfile
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, NoReturn
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    UploadFile,
+    status,
+)
 from pydantic import ValidationError
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.common.dependencies import get_database_session
+from app.core.config import settings
 from app.core.database import transaction
-from app.features.ingestion.ingest import IngestArchiveResult, ingest_archive
+from app.core.profiling import profile_ingestion
+from app.features.assistant.precompute import precompute_simulation_summaries
+from app.features.ingestion.ingest import (
+    IngestArchiveResult,
+    detach_simulations,
+    iter_ingest_archive,
+    persist_simulations,
+)
+from app.features.ingestion.metrics import ingestion_stage
 from app.features.ingestion.models import Ingestion, IngestionSourceType
 from app.features.ingestion.parsers.parser import ArchiveValidationError
 from app.features.ingestion.schemas import (
@@ -27,8 +46,8 @@ from app.features.ingestion.schemas import (
     IngestionStatus,
 )
 from app.features.machine.utils import resolve_machine_by_name
-from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
-from app.features.simulation.schemas import SimulationCreate
+from app.features.simulation.case_stats import CaseStatsDelta
+from app.features.simulation.models import Case, Simulation
 from app.features.user.manager import current_active_user
 from app.features.user.models import User, UserRole
 
@@ -56,6 +75,7 @@ STATEFUL_INGESTION_SOURCE_TYPES = (
 )
 def ingest_from_path(
     payload: IngestFromPathRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_database_session),
     user: User = Depends(current_active_user),
 ) -> IngestionResponse:
@@ -76,6 +96,9 @@ def ingest_from_path(
     payload : IngestFromPathRequest
         Request payload containing the archive path, machine name, and optional
         HPC username for provenance.
+    background_tasks : BackgroundTasks
+        Request background tasks, used to precompute assistant summaries for
+        the created simulations when enabled.
     db : Session
         Active SQLAlchemy database session used for persistence.
     user : User
@@ -100,25 +123,24 @@ def ingest_from_path(
     _validate_archive_path(archive_path)
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        ingest_result = _run_ingest_archive(
-            archive_path=str(archive_path),
-            output_dir=tmpdir,
-            db=db,
+        response = _process_ingestion(
+            ingest_results=_run_ingest_archive(
+                archive_path=str(archive_path),
+                output_dir=tmpdir,
+                db=db,
+                hpc_username=payload.hpc_username,
+            ),
+            source_type=IngestionSourceType.HPC_PATH,
+            source_reference=str(archive_path),
+            machine_id=machine.id,
+            user=user,
+            archive_sha256=None,
             hpc_username=payload.hpc_username,
+            processed_execution_ids=payload.processed_execution_ids,
+            db=db,
+            background_tasks=background_tasks,
         )
 
-    response = _process_ingestion(
-        ingest_result=ingest_result,
-        source_type=IngestionSourceType.HPC_PATH,
-        source_reference=str(archive_path),
-        machine_id=machine.id,
-        user=user,
-        archive_sha256=None,
-        hpc_username=payload.hpc_username,
-        processed_execution_ids=payload.processed_execution_ids,
-        db=db,
-    )
-
     return response
 
 
@@ -136,6 +158,7 @@ def ingest_from_path(
     },
 )
 def ingest_from_upload(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     machine_name: str = Form(...),
     hpc_username: str | None = Form(None),
@@ -150,6 +173,9 @@ def ingest_from_upload(
 
     Parameters
     ----------
+    background_tasks : BackgroundTasks
+        Request background tasks, used to precompute assistant summaries for
+        the created simulations when enabled.
     file : UploadFile
         Uploaded archive file, expected to be .zip, .tar.gz, or .tgz
     machine_name : str
@@ -182,28 +208,25 @@ def ingest_from_upload(
             archive_path = Path(tmpdir) / filename
             sha256_hex = _save_uploaded_file_and_hash(file, archive_path)
 
-            ingest_result = _run_ingest_archive(
-                archive_path=str(archive_path),
-                output_dir=tmpdir,
-                db=db,
-                strict_validation=True,
+            response = _process_ingestion(
+                ingest_results=_run_ingest_archive(
+                    archive_path=str(archive_path),
+                    output_dir=tmpdir,
+                    db=db,
+                    strict_validation=True,
+                    hpc_username=hpc_username,
+                ),
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference=filename,
+                machine_id=machine.id,
+                user=user,
+                archive_sha256=sha256_hex,
                 hpc_username=hpc_username,
+                db=db,
+                background_tasks=background_tasks,
+                reject_errors=True,
             )
 
-        if ingest_result.errors:
-            _raise_archive_validation_error(ingest_result.errors)
-
-        response = _process_ingestion(
-            ingest_result=ingest_result,
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference=filename,
-            machine_id=machine.id,
-            user=user,
-            archive_sha256=sha256_hex,
-            hpc_username=hpc_username,
-            db=db,
-        )
-
         return response
     finally:
         try:
@@ -232,6 +255,7 @@ def ingest_from_upload(
     },
 )
 def ingest_from_hpc_upload(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     machine_name: str = Form(...),
     case_path: str = Form(...),
@@ -244,6 +268,9 @@ def ingest_from_hpc_upload(
 
     Parameters
     ----------
+    background_tasks : BackgroundTasks
+        Request background tasks, used to precompute assistant summaries for
+        the created simulations when enabled.
     file : UploadFile
         Uploaded archive file, expected to be .zip, .tar.gz, or .tgz
     machine_name : str
@@ -293,26 +320,24 @@ def ingest_from_hpc_upload(
             archive_path = Path(tmpdir) / filename
             sha256_hex = _save_uploaded_file_and_hash(file, archive_path)
 
-            ingest_result = _run_ingest_archive(
-                archive_path=str(archive_path),
-                output_dir=tmpdir,
-                db=db,
+            return _process_ingestion(
+                ingest_results=_run_ingest_archive(
+                    archive_path=str(archive_path),
+                    output_dir=tmpdir,
+                    db=db,
+                    hpc_username=payload.hpc_username,
+                ),
+                source_type=IngestionSourceType.HPC_UPLOAD,
+                source_reference=payload.case_path,
+                machine_id=machine.id,
+                user=user,
+                archive_sha256=sha256_hex,
                 hpc_username=payload.hpc_username,
+                processed_execution_ids=payload.processed_execution_ids,
+                db=db,
+                background_tasks=background_tasks,
+                single_case_path=payload.case_path,
             )
-
-        _validate_single_case_upload_ingest_result(ingest_result, payload.case_path)
-
-        return _process_ingestion(
-            ingest_result=ingest_result,
-            source_type=IngestionSourceType.HPC_UPLOAD,
-            source_reference=payload.case_path,
-            machine_id=machine.id,
-            user=user,
-            archive_sha256=sha256_hex,
-            hpc_username=payload.hpc_username,
-            processed_execution_ids=payload.processed_execution_ids,
-            db=db,
-        )
     finally:
         try:
             file.file.close()
@@ -530,9 +555,14 @@ def _run_ingest_archive(
     *,
     strict_validation: bool = False,
     hpc_username: str | None = None,
-) -> IngestArchiveResult:
+) -> Iterator[IngestArchiveResult]:
+    """Yield the archive's ingestion chunks, mapping failures to HTTP errors.
+
+    Only errors raised while parsing and resolving a chunk are mapped; errors
+    raised by the caller while persisting a chunk propagate unchanged.
+    """
     try:
-        return ingest_archive(
+        yield from iter_ingest_archive(
             archive_path=archive_path,
             output_dir=output_dir,
             db=db,
@@ -569,15 +599,7 @@ def _raise_archive_validation_error(errors: list[dict[str, str]]) -> NoReturn:
     )
 
 
-def _validate_single_case_upload_ingest_result(
-    ingest_result: IngestArchiveResult,
-    case_path: str,
-) -> None:
-    created_case_ids = {
-        simulation.case_id
-        for simulation in ingest_result.simulations
-        if simulation.case_id is not None
-    }
+def _validate_single_case_upload(created_case_ids: set[UUID], case_path: str) -> None:
     if len(created_case_ids) <= 1:
         return
 
@@ -591,7 +613,7 @@ def _validate_single_case_upload_ingest_result(
 
 
 def _process_ingestion(
-    ingest_result: IngestArchiveResult,
+    ingest_results: Iterable[IngestArchiveResult],
     source_type: IngestionSourceType,
     source_reference: str,
     machine_id: UUID,
@@ -600,19 +622,29 @@ def _process_ingestion(
     db: Session,
     hpc_username: str | None = None,
     processed_execution_ids: list[str] | None = None,
+    background_tasks: BackgroundTasks | None = None,
+    *,
+    reject_errors: bool = False,
+    single_case_path: str | None = None,
 ) -> IngestionResponse:
-    """Finalize and persist an ingestion operation.
+    """Persist the chunks of an archive ingestion.
 
-    This function completes the ingestion workflow after archive parsing has
-    succeeded. It determines ingestion status, persists simulation records and
-    ingestion metadata within a transactional boundary, and returns a structured
-    response model.
+    Chunks are consumed one at a time: each chunk's simulations are
+    persisted, flushed, and then detached from the session, so memory use is
+    bounded by the chunk size rather than the archive size. All chunks share
+    one transaction; any failure rolls back the whole ingestion.
+
+    Chunks are parsed lazily while the transaction is open, so it lasts as
+    long as the whole archive. The case stats rollup is accumulated in
+    memory and applied once just before commit, so its ``case_stats`` row
+    locks are only held for that final step and concurrent ingestions into
+    the same cases are not blocked for the whole archive.
 
     Parameters
     ----------
-    ingest_result : IngestArchiveResult
-        Structured result produced by the archive ingestion step, including
-        parsed simulations, duplicate counts, and per-execution errors.
+    ingest_results : Iterable[IngestArchiveResult]
+        Per-chunk results of the archive ingestion step, including parsed
+        simulations, duplicate counts, and per-execution errors.
     source_type : IngestionSourceType
         Enumeration indicating the ingestion source (e.g., HPC_PATH,
         HPC_UPLOAD).
@@ -629,6 +661,16 @@ def _process_ingestion(
         Active SQLAlchemy database session used for persistence.
     hpc_username : str | None, optional
         HPC username for provenance (trusted, informational only)
+    background_tasks : BackgroundTasks | None, optional
+        Request background tasks; when provided and
+        ``ASSISTANT_PRECOMPUTE_AFTER_INGESTION`` is enabled, LLM summaries for
+        the created simulations are precomputed after the response is sent.
+    reject_errors : bool, optional
+        Reject the whole archive with a 400 listing every error when any
+        chunk reports errors.
+    single_case_path : str | None, optional
+        Reject the archive with a 400 when its simulations span more than one
+        case; the path is quoted in the error.
 
     Returns
     -------
@@ -636,8 +678,13 @@ def _process_ingestion(
         Response model summarizing ingestion results, including counts,
         created simulations, and any recorded errors.
     """
-    error_count = len(ingest_result.errors)
-    status_value = _resolve_ingestion_status(ingest_result.created_count, error_count)
+    created_count = 0
+    duplicate_count = 0
+    errors: list[dict[str, str]] = []
+    created_case_ids: set[UUID] = set()
+    created_sim_ids: list[UUID] = []
+    summaries: list[IngestionSimulationSummary] = []
+    case_stats = CaseStatsDelta()
 
     with transaction(db):
         ingestion_create = IngestionCreate(
@@ -645,10 +692,10 @@ def _process_ingestion(
             source_reference=source_reference,
             machine_id=machine_id,
             triggered_by=user.id,
-            status=status_value,
-            created_count=ingest_result.created_count,
-            duplicate_count=ingest_result.duplicate_count,
-            error_count=error_count,
+            status=IngestionStatus.FAILED.value,
+            created_count=0,
+            duplicate_count=0,
+            error_count=0,
             archive_sha256=archive_sha256,
             processed_execution_ids=processed_execution_ids,
         )
@@ -659,15 +706,63 @@ def _process_ingestion(
         db.add(ingestion)
         db.flush()
 
-        created_sims = _persist_simulations(
-            ingestion.id, ingest_result.simulations, db, user, hpc_username
+        # Profile the whole loop: the chunks are parsed lazily while it runs.
+        with profile_ingestion(Path(source_reference).name):
+            for ingest_result in ingest_results:
+                created_count += ingest_result.created_count
+                duplicate_count += ingest_result.duplicate_count
+                errors.extend(ingest_result.errors)
+
+                # Keep reading so the rejection lists the errors of every chunk.
+                if reject_errors and errors:
+                    continue
+
+                if single_case_path is not None:
+                    created_case_ids.update(
+                        sim.case_id
+                        for sim in ingest_result.simulations
+                        if sim.case_id is not None
+                    )
+                    _validate_single_case_upload(created_case_ids, single_case_path)
+
+                with ingestion_stage("persist"):
+                    created_sims = persist_simulations(
+                        ingestion.id, ingest_result.simulations, db, user, hpc_username
+                    )
+                    db.flush()
+                    case_stats.add(created_sims)
+
+                summaries.extend(
+                    _build_ingestion_simulation_summaries(created_sims, db)
+                )
+                created_sim_ids.extend(sim.id for sim in created_sims)
+                detach_simulations(created_sims, db)
+
+        if reject_errors and errors:
+            _raise_archive_validation_error(errors)
+
+        with ingestion_stage("persist"):
+            case_stats.apply(db)
+
+        ingestion.status = IngestionStatus(
+            _resolve_ingestion_status(created_count, len(errors))
         )
+        ingestion.created_count = created_count
+        ingestion.duplicate_count = duplicate_count
+        ingestion.error_count = len(errors)
+
+    if (
+        background_tasks is not None
+        and created_sim_ids
+        and settings.assistant_precompute_after_ingestion
+    ):
+        background_tasks.add_task(precompute_simulation_summaries, created_sim_ids)
 
     return IngestionResponse(
-        created_count=ingest_result.created_count,
-        duplicate_count=ingest_result.duplicate_count,
-        simulations=_build_ingestion_simulation_summaries(created_sims, db),
-        errors=ingest_result.errors,
+        created_count=created_count,
+        duplicate_count=duplicate_count,
+        simulations=summaries,
+        errors=errors,
     )
 
 
@@ -681,78 +776,6 @@ def _resolve_ingestion_status(created_count: int, error_count: int) -> str:
     return IngestionStatus.FAILED.value
 
 
-def _persist_simulations(
-    ingestion_id: UUID,
-    simulations: list[SimulationCreate],
-    db: Session,
-    user: User,
-    hpc_username: str | None = None,
-) -> list[Simulation]:
-    """Persist simulation records with artifacts and links to the database.
-
-    Parameters
-    ----------
-    ingestion_id : UUID
-        Identifier of the parent ingestion record to associate with each
-        simulation.
-    simulations : list[SimulationCreate]
-        List of simulation data to persist, including nested artifacts and
-        links.
-    db : Session
-        Active SQLAlchemy database session used for persistence.
-    user : User
-        Authenticated user who initiated the ingestion, set as creator and
-        last updater of each simulation record.
-    hpc_username : str | None, optional
-        HPC username for provenance (trusted, informational only)
-    """
-    now = datetime.now(timezone.utc)
-    created_sims: list[Simulation] = []
-
-    for sim_create in simulations:
-        data = sim_create.model_dump(
-            by_alias=False,
-            exclude={"artifacts", "links", "created_by", "last_updated_by"},
-            exclude_unset=True,
-        )
-
-        if data.get("git_repository_url") is not None:
-            data["git_repository_url"] = str(data["git_repository_url"])
-
-        sim = Simulation(
-            **data,
-            ingestion_id=ingestion_id,
-            created_by=user.id,
-            last_updated_by=user.id,
-            created_at=now,
-            updated_at=now,
-        )
-
-        if sim_create.artifacts:
-            for artifact in sim_create.artifacts:
-                artifact_data = artifact.model_dump(
-                    by_alias=False,
-                    exclude_unset=True,
-                )
-                artifact_data["uri"] = str(artifact.uri)
-                sim.artifacts.append(Artifact(**artifact_data))
-
-        if sim_create.links:
-            for link in sim_create.links:
-                link_data = link.model_dump(
-                    by_alias=False,
-                    exclude_unset=True,
-                )
-                link_data["url"] = str(link.url)
-                sim.links.append(ExternalLink(**link_data))
-
-        db.add(sim)
-        created_sims.append(sim)
-
-    db.flush()
-    return created_sims
-
-
 def _build_ingestion_simulation_summaries(
     created_sims: list[Simulation], db: Session
 ) -> list[IngestionSimulationSummary]:
@@ -1,29 +1,36 @@
 """Module for ingesting simulation archives and mapping to DB schemas."""
 
 import shlex
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from uuid import UUID
 
-from dateutil import parser as dateutil_parser
 from pydantic import HttpUrl, TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
 from app.common.utils import _normalize_hpc_username
+from app.core.config import settings
 from app.core.logger import _setup_custom_logger
-from app.features.ingestion.parsers.parser import main_parser
+from app.core.profiling import profile_ingestion
+from app.features.ingestion.metrics import ingestion_stage
+from app.features.ingestion.parsers.dates import parse_datetime
+from app.features.ingestion.parsers.parser import main_parser, open_archive
 from app.features.ingestion.parsers.types import ParsedSimulation
 from app.features.machine.utils import resolve_machine_by_name
 from app.features.simulation.enums import ArtifactKind, SimulationStatus, SimulationType
-from app.features.simulation.models import Case, Simulation
+from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
 from app.features.simulation.schemas import ArtifactCreate, SimulationCreate
+from app.features.user.models import User
 
 logger = _setup_custom_logger(__name__)
 
 _STRING_ADAPTER = TypeAdapter(str)
 _DATETIME_ADAPTER = TypeAdapter(datetime)
 _HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+_SIMULATION_CREATE_LIST_ADAPTER = TypeAdapter(list[SimulationCreate])
 CaseIdentity = tuple[str, UUID, str]
 
 
@@ -83,6 +90,17 @@ class SimulationCreateDraft:
     case_hash: str | None = None
 
 
+@dataclass
+class _ResolveCaches:
+    """Lookups shared by every chunk resolved from one archive."""
+
+    case_hash_cache: dict[CaseIdentity, str] = field(default_factory=dict)
+    persisted_case_hash_cache: dict[UUID, str | None] = field(default_factory=dict)
+    # New execution IDs from earlier chunks. Their rows may already be flushed,
+    # but they are not duplicates of pre-existing simulations.
+    created_execution_ids: set[str] = field(default_factory=set)
+
+
 def ingest_archive(
     archive_path: Path | str,
     output_dir: Path | str,
@@ -110,6 +128,11 @@ def ingest_archive(
     IngestArchiveResult
         Dataclass containing list of SimulationCreate objects, counts of
         created and duplicate simulations, and any errors encountered.
+
+    Notes
+    -----
+    The whole archive is held in memory. Use ``iter_ingest_archive`` to
+    process large archives in chunks.
     """
     archive_path_resolved = (
         Path(archive_path) if isinstance(archive_path, str) else archive_path
@@ -118,67 +141,290 @@ def ingest_archive(
         Path(output_dir) if isinstance(output_dir, str) else output_dir
     )
 
-    parsed_simulations, skipped_count = main_parser(
+    with profile_ingestion(archive_path_resolved.name):
+        parsed_simulations, skipped_count = main_parser(
+            archive_path_resolved,
+            output_dir_resolved,
+            strict_validation=strict_validation,
+        )
+
+        if not parsed_simulations:
+            logger.warning("No simulations found in archive: %s", archive_path_resolved)
+
+            return IngestArchiveResult(
+                simulations=[],
+                created_count=0,
+                duplicate_count=0,
+                skipped_count=skipped_count,
+            )
+
+        with ingestion_stage("resolve"):
+            return _resolve_parsed_simulations(
+                parsed_simulations,
+                db,
+                skipped_count=skipped_count,
+                hpc_username=hpc_username,
+            )
+
+
+def iter_ingest_archive(
+    archive_path: Path | str,
+    output_dir: Path | str,
+    db: Session,
+    *,
+    strict_validation: bool = False,
+    hpc_username: str | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[IngestArchiveResult]:
+    """Ingest a simulation archive in fixed-size chunks.
+
+    Execution directories are parsed lazily, so only one chunk of parsed and
+    validated simulations is held at a time. Each yielded result covers the
+    next ``chunk_size`` parsed executions; summing the results gives the same
+    counts and errors as ``ingest_archive``. The caller should persist,
+    flush, and detach each chunk (``persist_simulations``,
+    ``detach_simulations``) before requesting the next one.
+
+    Unlike ``ingest_archive``, the chunks are not profiled here: the
+    generator runs interleaved with the caller, so the caller wraps the whole
+    loop in ``profile_ingestion`` instead.
+
+    Parameters
+    ----------
+    archive_path : Path | str
+        Path to the archive file to ingest (.zip or .tar.gz).
+    output_dir : Path | str
+        Directory where extracted files will be stored.
+    db : Session
+        SQLAlchemy database session for machine and simulation lookups.
+    strict_validation : bool, optional
+        Raise ``ArchiveValidationError`` for incomplete runs instead of
+        skipping them. The error is raised after the last chunk.
+    hpc_username : str | None, optional
+        Fallback HPC username when the parsed metadata has none.
+    chunk_size : int | None, optional
+        Parsed executions per chunk; defaults to ``INGESTION_CHUNK_SIZE``.
+
+    Yields
+    ------
+    IngestArchiveResult
+        Per-chunk simulations, counts, and errors. ``skipped_count`` holds
+        the runs skipped since the previous chunk. An archive without
+        simulations yields a single empty result.
+    """
+    chunk_size = chunk_size or settings.ingestion_chunk_size
+    archive_path_resolved = Path(archive_path)
+
+    archive = open_archive(
         archive_path_resolved,
-        output_dir_resolved,
+        Path(output_dir),
         strict_validation=strict_validation,
     )
+    parsed_iter = iter(archive)
+    caches = _ResolveCaches()
+    reported_skipped_count = 0
+    found_simulations = False
+
+    while True:
+        with ingestion_stage("parse"):
+            parsed_chunk = list(islice(parsed_iter, chunk_size))
+
+        if not parsed_chunk:
+            break
+
+        found_simulations = True
+        with ingestion_stage("resolve"):
+            result = _resolve_parsed_simulations(
+                parsed_chunk,
+                db,
+                skipped_count=archive.skipped_count - reported_skipped_count,
+                hpc_username=hpc_username,
+                caches=caches,
+            )
+        reported_skipped_count = archive.skipped_count
 
-    if not parsed_simulations:
-        logger.warning(f"No simulations found in archive: {archive_path_resolved}")
+        yield result
 
-        return IngestArchiveResult(
+    if not found_simulations:
+        logger.warning("No simulations found in archive: %s", archive_path_resolved)
+
+    if not found_simulations or archive.skipped_count > reported_skipped_count:
+        yield IngestArchiveResult(
             simulations=[],
             created_count=0,
             duplicate_count=0,
-            skipped_count=skipped_count,
+            skipped_count=archive.skipped_count - reported_skipped_count,
         )
 
+
+def persist_simulations(
+    ingestion_id: UUID,
+    simulations: list[SimulationCreate],
+    db: Session,
+    user: User,
+    hpc_username: str | None = None,
+) -> list[Simulation]:
+    """Persist simulation records with artifacts and links to the database.
+
+    Parameters
+    ----------
+    ingestion_id : UUID
+        Identifier of the parent ingestion record to associate with each
+        simulation.
+    simulations : list[SimulationCreate]
+        List of simulation data to persist, including nested artifacts and
+        links.
+    db : Session
+        Active SQLAlchemy database session used for persistence.
+    user : User
+        Authenticated user who initiated the ingestion, set as creator and
+        last updater of each simulation record.
+    hpc_username : str | None, optional
+        HPC username for provenance (trusted, informational only)
+    """
+    now = datetime.now(timezone.utc)
+    created_sims: list[Simulation] = []
+
+    for sim_create in simulations:
+        data = sim_create.model_dump(
+            by_alias=False,
+            exclude={"artifacts", "links", "created_by", "last_updated_by"},
+            exclude_unset=True,
+        )
+
+        if data.get("git_repository_url") is not None:
+            data["git_repository_url"] = str(data["git_repository_url"])
+
+        sim = Simulation(
+            **data,
+            ingestion_id=ingestion_id,
+            created_by=user.id,
+            last_updated_by=user.id,
+            created_at=now,
+            updated_at=now,
+        )
+
+        if sim_create.artifacts:
+            for artifact in sim_create.artifacts:
+                artifact_data = artifact.model_dump(
+                    by_alias=False,
+                    exclude_unset=True,
+                )
+                artifact_data["uri"] = str(artifact.uri)
+                sim.artifacts.append(Artifact(**artifact_data))
+
+        if sim_create.links:
+            for link in sim_create.links:
+                link_data = link.model_dump(
+                    by_alias=False,
+                    exclude_unset=True,
+                )
+                link_data["url"] = str(link.url)
+                sim.links.append(ExternalLink(**link_data))
+
+        db.add(sim)
+        created_sims.append(sim)
+
+    db.flush()
+    return created_sims
+
+
+def detach_simulations(simulations: list[Simulation], db: Session) -> None:
+    """Expunge flushed simulations (and their artifacts and links) from ``db``.
+
+    Keeps the session's identity map from growing with every persisted chunk.
+    """
+    for sim in simulations:
+        db.expunge(sim)
+
+
+def _resolve_parsed_simulations(
+    parsed_simulations: Iterable[ParsedSimulation],
+    db: Session,
+    *,
+    skipped_count: int = 0,
+    hpc_username: str | None = None,
+    caches: _ResolveCaches | None = None,
+) -> IngestArchiveResult:
+    """Resolve parsed simulations against the database.
+
+    Detects duplicates, resolves machines and cases, and validates each
+    parsed simulation into a ``SimulationCreate``. Per-simulation failures
+    are recorded as errors instead of aborting the ingestion.
+
+    Parameters
+    ----------
+    parsed_simulations : Iterable[ParsedSimulation]
+        Parser output for one archive, or one chunk of it.
+    db : Session
+        SQLAlchemy database session for machine, case, and simulation lookups.
+    skipped_count : int, optional
+        Number of incomplete runs skipped by the parser.
+    hpc_username : str | None, optional
+        Fallback HPC username when the parsed metadata has none.
+    caches : _ResolveCaches | None, optional
+        Lookups shared with earlier chunks of the same archive.
+
+    Returns
+    -------
+    IngestArchiveResult
+        New simulations, duplicate counts, and per-simulation errors.
+    """
     simulations: list[SimulationCreate] = []
     duplicate_count = 0
-    errors: list[dict[str, str]] = []
-    case_hash_cache: dict[CaseIdentity, str] = {}
-    persisted_case_hash_cache: dict[UUID, str | None] = {}
+    # Errors keyed by input position, so they keep the input order even
+    # though schema validation runs after every case has been resolved.
+    errors_by_index: dict[int, dict[str, str]] = {}
+    pending: list[tuple[int, ParsedSimulation, SimulationCreateDraft]] = []
+    caches = caches or _ResolveCaches()
 
-    for parsed_simulation in parsed_simulations:
+    for index, parsed_simulation in enumerate(parsed_simulations):
         try:
-            simulation, is_duplicate = _process_simulation_for_ingest(
+            draft, is_duplicate = _process_simulation_for_ingest(
                 parsed_simulation=parsed_simulation,
                 db=db,
-                case_hash_cache=case_hash_cache,
-                persisted_case_hash_cache=persisted_case_hash_cache,
+                case_hash_cache=caches.case_hash_cache,
+                persisted_case_hash_cache=caches.persisted_case_hash_cache,
                 request_hpc_username=hpc_username,
+                created_execution_ids=caches.created_execution_ids,
             )
 
             if is_duplicate:
                 duplicate_count += 1
                 continue
 
-            if simulation is not None:
-                simulations.append(simulation)
+            if draft is not None:
+                pending.append((index, parsed_simulation, draft))
 
         except (ValueError, LookupError, ValidationError) as e:
-            logger.error(
-                "Failed to process simulation from %s: %s",
-                parsed_simulation.execution_dir,
-                e,
-            )
+            errors_by_index[index] = _build_ingest_error(parsed_simulation, e)
+
+    validated = _validate_simulation_creates([draft for _, _, draft in pending])
 
-            errors.append(
-                {
-                    "execution_dir": parsed_simulation.execution_dir,
-                    "error_type": type(e).__name__,
-                    "error": str(e),
-                }
+    for (index, parsed_simulation, _), simulation_or_error in zip(
+        pending, validated, strict=True
+    ):
+        if isinstance(simulation_or_error, ValidationError):
+            errors_by_index[index] = _build_ingest_error(
+                parsed_simulation, simulation_or_error
             )
             continue
 
+        simulation = _attach_path_artifacts(simulation_or_error, parsed_simulation)
+        logger.info(
+            "Mapped simulation from %s: %s",
+            parsed_simulation.execution_dir,
+            parsed_simulation.case_name,
+        )
+        simulations.append(simulation)
+        caches.created_execution_ids.add(simulation.execution_id)
+
     result = IngestArchiveResult(
         simulations=simulations,
         created_count=len(simulations),
         duplicate_count=duplicate_count,
         skipped_count=skipped_count,
-        errors=errors,
+        errors=[errors_by_index[index] for index in sorted(errors_by_index)],
     )
 
     return result
@@ -190,7 +436,8 @@ def _process_simulation_for_ingest(
     case_hash_cache: dict[CaseIdentity, str],
     persisted_case_hash_cache: dict[UUID, str | None],
     request_hpc_username: str | None = None,
-) -> tuple[SimulationCreate | None, bool]:
+    created_execution_ids: set[str] | None = None,
+) -> tuple[SimulationCreateDraft | None, bool]:
     """Process one parsed simulation entry.
 
     Parameters
@@ -201,14 +448,19 @@ def _process_simulation_for_ingest(
         Active database session for lookups and case resolution.
     Returns
     -------
-    tuple[SimulationCreate | None, bool]
-        ``(simulation, is_duplicate)`` where ``simulation`` is populated
-        only for new records and ``is_duplicate`` is True when an existing
-        ``execution_id`` was found.
+    tuple[SimulationCreateDraft | None, bool]
+        ``(draft, is_duplicate)`` where ``draft`` is populated only for new
+        records, with its case resolved, and ``is_duplicate`` is True when an
+        existing ``execution_id`` was found. Drafts are validated into
+        ``SimulationCreate`` in bulk by the caller.
     """
     execution_id = parsed_simulation.execution_id
 
-    if _is_duplicate_simulation(execution_id, parsed_simulation.execution_dir, db):
+    # An execution ID created by an earlier chunk is a repeat within the
+    # archive, not a duplicate; persisting it fails as before.
+    if (
+        created_execution_ids is None or execution_id not in created_execution_ids
+    ) and _is_duplicate_simulation(execution_id, parsed_simulation.execution_dir, db):
         return None, True
 
     case_name = _require_case_name(parsed_simulation)
@@ -236,13 +488,24 @@ def _process_simulation_for_ingest(
         db=db,
     )
 
-    simulation = _build_simulation_create(
-        parsed_simulation=parsed_simulation,
-        prevalidated_draft=prevalidated_draft,
-        case=case,
+    return replace(prevalidated_draft, case_id=case.id), False
+
+
+def _build_ingest_error(
+    parsed_simulation: ParsedSimulation, error: Exception
+) -> dict[str, str]:
+    """Log and describe a per-simulation ingestion failure."""
+    logger.error(
+        "Failed to process simulation from %s: %s",
+        parsed_simulation.execution_dir,
+        error,
     )
 
-    return simulation, False
+    return {
+        "execution_dir": parsed_simulation.execution_dir,
+        "error_type": type(error).__name__,
+        "error": str(error),
+    }
 
 
 def _track_case_hash_grouping(
@@ -360,22 +623,6 @@ def _is_duplicate_simulation(
     return True
 
 
-def _build_simulation_create(
-    parsed_simulation: ParsedSimulation,
-    prevalidated_draft: SimulationCreateDraft,
-    case: Case,
-) -> SimulationCreate:
-    """Create a SimulationCreate from parsed archive metadata."""
-    simulation = _validate_simulation_create(
-        replace(prevalidated_draft, case_id=case.id)
-    )
-    simulation = _attach_path_artifacts(simulation, parsed_simulation)
-    logger.info(
-        "Mapped simulation from %s: %s", parsed_simulation.execution_dir, case.name
-    )
-    return simulation
-
-
 def _attach_path_artifacts(
     simulation: SimulationCreate,
     parsed_simulation: ParsedSimulation,
@@ -746,11 +993,50 @@ def _build_simulation_create_draft(
 
 def _validate_simulation_create(draft: SimulationCreateDraft) -> SimulationCreate:
     """Validate a typed ingest draft into ``SimulationCreate``."""
-    return SimulationCreate.model_validate(
-        draft,
-        by_name=True,
-        from_attributes=True,
-    )
+    return SimulationCreate.model_validate(vars(draft), by_name=True)
+
+
+def _validate_simulation_creates(
+    drafts: list[SimulationCreateDraft],
+) -> list[SimulationCreate | ValidationError]:
+    """Validate a batch of ingest drafts into ``SimulationCreate``.
+
+    The batch is validated with a single ``TypeAdapter`` call. Drafts are
+    passed as their field dicts, which pydantic validates several times
+    faster than reading the same values with ``from_attributes``. If any
+    draft is invalid, the batch is validated again row by row so each
+    failure is reported exactly as ``_validate_simulation_create`` raises it.
+
+    Parameters
+    ----------
+    drafts : list[SimulationCreateDraft]
+        Drafts with their case resolved.
+
+    Returns
+    -------
+    list[SimulationCreate | ValidationError]
+        The validated schema, or the validation error, for each draft.
+    """
+    if not drafts:
+        return []
+
+    try:
+        return list(
+            _SIMULATION_CREATE_LIST_ADAPTER.validate_python(
+                [vars(draft) for draft in drafts], by_name=True
+            )
+        )
+    except ValidationError:
+        pass
+
+    results: list[SimulationCreate | ValidationError] = []
+    for draft in drafts:
+        try:
+            results.append(_validate_simulation_create(draft))
+        except ValidationError as exc:
+            results.append(exc)
+
+    return results
 
 
 def _normalize_simulation_type(value: str | None) -> SimulationType:
@@ -815,8 +1101,8 @@ def _parse_datetime_field(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        # Try parsing with dateutil for flexibility
-        dt = dateutil_parser.parse(value)
+        # ISO 8601 fast path with dateutil fallback for flexibility
+        dt = parse_datetime(value)
         # Ensure timezone-aware (UTC if not specified)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
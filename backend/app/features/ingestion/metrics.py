@@ -0,0 +1,34 @@
+"""Ingestion metrics exported on ``/metrics``."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from prometheus_client import Counter, Histogram
+
+from app.core.logger import log_span
+
+# Archives can take minutes to extract and parse; extend the default buckets.
+INGESTION_STAGE_SECONDS = Histogram(
+    "ingestion_stage_duration_seconds",
+    "Duration of each ingestion stage (extract, parse, resolve, persist).",
+    ("stage",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+INGESTION_PARSED_EXECUTIONS = Counter(
+    "ingestion_parsed_executions_total",
+    "Execution directories parsed into simulations.",
+)
+INGESTION_ARCHIVE_BYTES = Counter(
+    "ingestion_archive_bytes_total",
+    "Bytes of archive files extracted for ingestion.",
+)
+
+
+@contextmanager
+def ingestion_stage(stage: str) -> Iterator[None]:
+    """Time an ingestion stage as a log span and in the stage histogram."""
+    with (
+        log_span(f"ingestion.{stage}"),
+        INGESTION_STAGE_SECONDS.labels(stage=stage).time(),
+    ):
+        yield
@@ -1,13 +1,13 @@
 import re
 import xml.etree.ElementTree as ET
-from datetime import datetime
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
-
+from app.features.ingestion.parsers.dates import parse_datetime_format, shift_date
 from app.features.ingestion.parsers.utils import _open_text
 from app.features.simulation.schemas import KNOWN_EXPERIMENT_TYPES
 
+_STOP_OPTION_UNITS = {"ndays": "days", "nmonths": "months", "nyears": "years"}
+
 
 def parse_env_case(env_case_path: str | Path) -> dict[str, str | None]:
     """Parse env_case.xml (plain or gzipped).
@@ -277,21 +277,16 @@ def _calculate_simulation_end_date(
         return None
 
     try:
-        start_date = datetime.strptime(simulation_start_date, "%Y-%m-%d")
+        start_date = parse_datetime_format(simulation_start_date, "%Y-%m-%d")
         stop_n_int = int(stop_n)
     except ValueError:
         return None
 
-    if stop_option == "ndays":
-        end_date = start_date + relativedelta(days=stop_n_int)
-    elif stop_option == "nmonths":
-        end_date = start_date + relativedelta(months=stop_n_int)
-    elif stop_option == "nyears":
-        end_date = start_date + relativedelta(years=stop_n_int)
-    else:
+    unit = _STOP_OPTION_UNITS.get(stop_option)
+    if unit is None:
         return None
 
-    return end_date.strftime("%Y-%m-%d")
+    return shift_date(start_date, unit, stop_n_int)
 
 
 def _parse_stop_date(stop_date: str | None) -> str | None:
@@ -299,6 +294,6 @@ def _parse_stop_date(stop_date: str | None) -> str | None:
         return None
 
     try:
-        return datetime.strptime(stop_date, "%Y%m%d").strftime("%Y-%m-%d")
+        return parse_datetime_format(stop_date, "%Y%m%d").strftime("%Y-%m-%d")
     except ValueError:
         return None
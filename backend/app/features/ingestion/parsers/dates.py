@@ -0,0 +1,112 @@
+"""Memoized date parsing shared by the archive parsers and ingestion.
+
+Archives repeat a handful of date strings (``RUN_STARTDATE``, ``STOP_DATE``,
+``STOP_N``) across thousands of executions, so every parse is cached in a
+bounded LRU. Cached values are immutable ``datetime`` objects (or strings),
+so sharing them between callers is safe. Failed parses raise as usual and
+are not cached.
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from dateutil import parser as dateutil_parser
+from dateutil.relativedelta import relativedelta
+
+DATE_CACHE_MAX_ENTRIES = 4096
+
+# Naive ISO 8601 dates and date-times, parsed by ``datetime.fromisoformat``
+# exactly as dateutil parses them. Anything else (time zones, other formats)
+# goes through dateutil so results keep dateutil's types.
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?"
+)
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse a date or date-time string, trying ISO 8601 before dateutil.
+
+    Parameters
+    ----------
+    value : str
+        Date string in any format dateutil understands.
+
+    Returns
+    -------
+    datetime
+        The parsed value; naive unless ``value`` carries a time zone.
+
+    Raises
+    ------
+    ValueError
+        If the string cannot be parsed.
+    """
+    # dateutil fills missing fields from today's date, so the day is part
+    # of the key for values that are not full dates.
+    return _parse_datetime(value, date.today())
+
+
+def parse_datetime_format(value: str, date_format: str) -> datetime:
+    """Memoized ``datetime.strptime``.
+
+    Raises
+    ------
+    ValueError
+        If ``value`` does not match ``date_format``.
+    """
+    return _parse_datetime_format(value, date_format)
+
+
+@lru_cache(maxsize=DATE_CACHE_MAX_ENTRIES)
+def shift_date(start_date: datetime, unit: str, count: int) -> str:
+    """Add ``count`` days, months, or years to a date.
+
+    Parameters
+    ----------
+    start_date : datetime
+        Date to shift.
+    unit : str
+        ``"days"``, ``"months"``, or ``"years"``.
+    count : int
+        Number of units to add.
+
+    Returns
+    -------
+    str
+        The shifted date in ``YYYY-MM-DD`` format.
+    """
+    if unit == "days":
+        offset = relativedelta(days=count)
+    elif unit == "months":
+        offset = relativedelta(months=count)
+    else:
+        offset = relativedelta(years=count)
+
+    shifted = start_date + offset
+
+    return shifted.strftime("%Y-%m-%d")
+
+
+def clear_date_caches() -> None:
+    """Empty every date cache."""
+    _parse_datetime.cache_clear()
+    _parse_datetime_format.cache_clear()
+    shift_date.cache_clear()
+
+
+@lru_cache(maxsize=DATE_CACHE_MAX_ENTRIES)
+def _parse_datetime(value: str, today: date) -> datetime:
+    if _ISO_DATETIME_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            # Out-of-range fields; let dateutil raise its usual error.
+            pass
+
+    return dateutil_parser.parse(value)
+
+
+@lru_cache(maxsize=DATE_CACHE_MAX_ENTRIES)
+def _parse_datetime_format(value: str, date_format: str) -> datetime:
+    return datetime.strptime(value, date_format)
@@ -3,8 +3,17 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from app.features.ingestion.parsers.dates import parse_datetime_format
 from app.features.ingestion.parsers.utils import _open_text
 
+# Header fields that drive run timing, keyed by their label in the file.
+TIMING_FIELD_PATTERN = re.compile(
+    r"\s*(?P<label>LID|Curr Date|Init Time|Run Time|Final Time)"
+    r"\s*[:=]\s*(?P<value>.*\S)"
+)
+TIMING_FIELD_COUNT = 5
+SECONDS_PATTERN = re.compile(r"(-?\d+(?:\.\d+)?)")
+
 
 def parse_e3sm_timing(path: str | Path) -> dict[str, Any]:
     """Parse an E3SM timing file and extract run metadata.
@@ -31,13 +40,13 @@ def parse_e3sm_timing(path: str | Path) -> dict[str, Any]:
     except (OSError, UnicodeDecodeError):
         return result
 
-    lines = text.splitlines()
+    fields = _extract_fields(text.splitlines())
 
-    execution_id = _extract(lines, r"LID\s*[:=]\s*(.+)")
-    curr_date = _parse_curr_date(_extract(lines, r"Curr Date\s*[:=]\s*(.+)"))
-    init_time = _parse_seconds(_extract(lines, r"Init Time\s*[:=]\s*(.+)"))
-    run_time = _parse_seconds(_extract(lines, r"Run Time\s*[:=]\s*(.+)"))
-    final_time = _parse_seconds(_extract(lines, r"Final Time\s*[:=]\s*(.+)"))
+    execution_id = fields.get("LID")
+    curr_date = _parse_curr_date(fields.get("Curr Date"))
+    init_time = _parse_seconds(fields.get("Init Time"))
+    run_time = _parse_seconds(fields.get("Run Time"))
+    final_time = _parse_seconds(fields.get("Final Time"))
 
     result["execution_id"] = execution_id
     if curr_date is not None:
@@ -62,35 +71,39 @@ def _parse_curr_date(date_str: str | None) -> datetime | None:
         return None
 
     try:
-        return datetime.strptime(date_str, "%a %b %d %H:%M:%S %Y")
+        return parse_datetime_format(date_str, "%a %b %d %H:%M:%S %Y")
     except ValueError:
         return None
 
 
-def _extract(lines: list[str], pattern: str, group: int = 1) -> str | None:
-    """Extract the first regex group matching a pattern from a list of lines.
+def _extract_fields(lines: list[str]) -> dict[str, str]:
+    """Extract the first value of each timing header field in one pass.
+
+    The header precedes the (much longer) per-component timer tables, so the
+    scan stops as soon as every field has been seen.
 
     Parameters
     ----------
     lines : list of str
         Lines to search.
-    pattern : str
-        Regex pattern to match.
-    group : int, optional
-        Group number to extract (default is 1).
 
     Returns
     -------
-    str or None
-        The matched group, or None if not found.
+    dict[str, str]
+        Field values keyed by label (e.g. ``"LID"``); missing fields are
+        omitted.
     """
+    fields: dict[str, str] = {}
+
     for line in lines:
-        m = re.match(pattern, line.strip())
+        m = TIMING_FIELD_PATTERN.match(line)
 
         if m:
-            return m.group(group).strip()
+            fields.setdefault(m.group("label"), m.group("value"))
+            if len(fields) == TIMING_FIELD_COUNT:
+                break
 
-    return None
+    return fields
 
 
 def _parse_seconds(value: str | None) -> float | None:
@@ -98,7 +111,7 @@ def _parse_seconds(value: str | None) -> float | None:
     if not value:
         return None
 
-    match = re.search(r"(-?\d+(?:\.\d+)?)", value)
+    match = SECONDS_PATTERN.search(value)
     if not match:
         return None
 
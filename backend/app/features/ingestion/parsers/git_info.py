@@ -3,6 +3,15 @@ from pathlib import Path
 
 from app.features.ingestion.parsers.utils import _open_text
 
+# Example: v2.0.0-beta.3-3091-g3219b44fc
+DESCRIBE_PATTERN = re.compile(r"^(?P<tag>v[\w.\-]+)(?:-\d+)?-g(?P<hash>[0-9a-f]+)")
+# Fallbacks for less structured describe outputs
+DESCRIBE_TAG_PATTERN = re.compile(r"^([^-]+)")
+DESCRIBE_HASH_PATTERN = re.compile(r"-g([0-9a-f]+)$")
+BRANCH_PATTERN = re.compile(r"On branch (.+)")
+REMOTE_ORIGIN_PATTERN = re.compile(r'\[remote "origin"\]')
+REMOTE_URL_PATTERN = re.compile(r"url\s*=\s*(.+)")
+
 
 def parse_git_describe(describe_path: str | Path) -> dict[str, str | None]:
     """Parse GIT_DESCRIBE file for the version string.
@@ -21,24 +30,20 @@ def parse_git_describe(describe_path: str | Path) -> dict[str, str | None]:
     describe_lines = _open_text(describe_path).splitlines()
     result: dict[str, str | None] = {"git_tag": None, "git_commit_hash": None}
 
-    describe_pattern = re.compile(r"^(?P<tag>v[\w.\-]+)(?:-\d+)?-g(?P<hash>[0-9a-f]+)")
-
     for line in describe_lines:
         line = line.strip()
         if line:
-            # Example: v2.0.0-beta.3-3091-g3219b44fc
-            match = describe_pattern.match(line)
+            match = DESCRIBE_PATTERN.match(line)
             if match:
                 result["git_tag"] = match.group("tag")
                 result["git_commit_hash"] = match.group("hash")
                 continue
 
-            # Fallback for less structured describe outputs
-            tag_match = re.match(r"^([^-]+)", line)
+            tag_match = DESCRIBE_TAG_PATTERN.match(line)
             if tag_match:
                 result["git_tag"] = tag_match.group(1)
 
-            hash_match = re.search(r"-g([0-9a-f]+)$", line)
+            hash_match = DESCRIBE_HASH_PATTERN.search(line)
             if hash_match:
                 result["git_commit_hash"] = hash_match.group(1)
 
@@ -92,7 +97,7 @@ def parse_git_config(config_path: str | Path) -> dict[str, str | None]:
 def _extract_branch(lines: list[str]) -> str | None:
     """Extract the current branch from GIT_STATUS lines."""
     for line in lines:
-        m = re.match(r"On branch (.+)", line.strip())
+        m = BRANCH_PATTERN.match(line.strip())
 
         if m:
             return m.group(1).strip()
@@ -105,13 +110,13 @@ def _extract_remote_url(lines: list[str]) -> str | None:
     in_origin = False
 
     for line in lines:
-        if re.match(r'\[remote "origin"\]', line.strip()):
+        if REMOTE_ORIGIN_PATTERN.match(line.strip()):
             in_origin = True
 
             continue
 
         if in_origin:
-            m = re.match(r"url\s*=\s*(.+)", line.strip())
+            m = REMOTE_URL_PATTERN.match(line.strip())
             if m:
                 return m.group(1).strip()
 
@@ -26,9 +26,14 @@ import re
 import tarfile
 import zipfile
 from pathlib import Path
-from typing import Callable, Iterable, TypedDict
+from typing import Callable, Iterable, Iterator, TypedDict
 
 from app.core.logger import _setup_custom_logger
+from app.features.ingestion.metrics import (
+    INGESTION_ARCHIVE_BYTES,
+    INGESTION_PARSED_EXECUTIONS,
+    ingestion_stage,
+)
 from app.features.ingestion.parsers.case_docs import (
     _substitute_path_variables,
     parse_env_build,
@@ -144,6 +149,70 @@ FILE_SPECS: dict[str, FileSpec] = {
 }
 
 
+class ParsedArchive:
+    """Execution directories of an extracted archive, parsed on iteration.
+
+    Iterating yields one ``ParsedSimulation`` per complete execution
+    directory, in deterministic order. ``skipped_count`` counts the incomplete
+    runs skipped so far. With strict validation, the collected validation
+    errors are raised as ``ArchiveValidationError`` once iteration reaches the
+    end of the archive.
+
+    Parameters
+    ----------
+    case_to_executions_dirs : dict[str, list[str]]
+        Execution directories keyed by case directory.
+    strict_validation : bool
+        Collect incomplete or invalid runs as validation errors instead of
+        skipping them.
+    """
+
+    def __init__(
+        self,
+        case_to_executions_dirs: dict[str, list[str]],
+        *,
+        strict_validation: bool,
+    ) -> None:
+        self.case_to_executions_dirs = case_to_executions_dirs
+        self.strict_validation = strict_validation
+        self.skipped_count = 0
+
+    def __iter__(self) -> Iterator[ParsedSimulation]:
+        validation_errors: list[dict[str, str]] = []
+
+        for case_dir, exec_dirs in self.case_to_executions_dirs.items():
+            sorted_exec_dirs = sorted(exec_dirs)
+            logger.info(
+                "Processing case directory: %s with %d execution subdirectories.",
+                case_dir,
+                len(sorted_exec_dirs),
+            )
+
+            for exec_dir in sorted_exec_dirs:
+                parsed_simulation, exec_validation_errors, exec_skipped_count = (
+                    _process_execution_dir(
+                        exec_dir, strict_validation=self.strict_validation
+                    )
+                )
+                self.skipped_count += exec_skipped_count
+                validation_errors.extend(exec_validation_errors)
+
+                if parsed_simulation is not None:
+                    INGESTION_PARSED_EXECUTIONS.inc()
+                    yield parsed_simulation
+
+        if validation_errors:
+            raise ArchiveValidationError(validation_errors)
+
+        if self.skipped_count:
+            logger.info(
+                "Skipped %d incomplete run(s) missing required files.",
+                self.skipped_count,
+            )
+
+        logger.info("Completed parsing all execution directories.")
+
+
 def main_parser(
     archive_path: str | Path,
     output_dir: str | Path,
@@ -174,12 +243,60 @@ def main_parser(
         count of skipped incomplete runs. Only directories that contain all
         required metadata files and a timing-file LID are included.
     """
+    archive = open_archive(
+        archive_path, output_dir, strict_validation=strict_validation
+    )
+
+    with ingestion_stage("parse"):
+        results = list(archive)
+
+    return results, archive.skipped_count
+
+
+def open_archive(
+    archive_path: str | Path,
+    output_dir: str | Path,
+    *,
+    strict_validation: bool = False,
+) -> ParsedArchive:
+    """Extract an archive and return its execution directories, unparsed.
+
+    Extraction and execution-directory discovery happen immediately; the
+    metadata files of each execution directory are parsed only while the
+    returned ``ParsedArchive`` is iterated, so callers can process very large
+    archives one simulation (or chunk) at a time.
+
+    Parameters
+    ----------
+    archive_path : str
+        Path to the archive file (.zip, .tar.gz, .tgz) or an already-extracted
+        directory.
+    output_dir : str
+        Directory to extract and process files.
+    strict_validation : bool, optional
+        Collect incomplete or invalid runs as validation errors instead of
+        skipping them.
+
+    Returns
+    -------
+    ParsedArchive
+        Lazily parsed execution directories of the archive.
+
+    Raises
+    ------
+    ValueError
+        If ``archive_path`` is neither a supported archive nor a directory.
+    FileNotFoundError
+        If no execution directories are found.
+    """
     archive_path = str(archive_path)
     output_dir = str(output_dir)
     search_root = output_dir
 
     if _is_supported_archive(archive_path):
-        _extract_archive(archive_path, output_dir)
+        with ingestion_stage("extract"):
+            _extract_archive(archive_path, output_dir)
+        INGESTION_ARCHIVE_BYTES.inc(os.path.getsize(archive_path))
     else:
         if not os.path.isdir(archive_path):
             raise ValueError(f"Unsupported archive format: {archive_path}")
@@ -188,8 +305,9 @@ def main_parser(
 
     case_to_executions_dirs = _map_case_to_execution_dirs(search_root)
     logger.info(
-        f"Found {sum(len(dirs) for dirs in case_to_executions_dirs.values())} case "
-        f"directories across {len(case_to_executions_dirs)} base directories."
+        "Found %d case directories across %d base directories.",
+        sum(len(dirs) for dirs in case_to_executions_dirs.values()),
+        len(case_to_executions_dirs),
     )
 
     if not case_to_executions_dirs:
@@ -199,39 +317,7 @@ def main_parser(
             "directories matching pattern: <digits>.<digits>-<digits>"
         )
 
-    results: list[ParsedSimulation] = []
-    skipped_count = 0
-
-    validation_errors: list[dict[str, str]] = []
-
-    for case_dir, exec_dirs in case_to_executions_dirs.items():
-        sorted_exec_dirs = sorted(exec_dirs)
-        logger.info(
-            f"Processing case directory: {case_dir} with {len(sorted_exec_dirs)} "
-            "execution subdirectories."
-        )
-
-        for exec_dir in sorted_exec_dirs:
-            parsed_simulation, exec_validation_errors, exec_skipped_count = (
-                _process_execution_dir(exec_dir, strict_validation=strict_validation)
-            )
-            skipped_count += exec_skipped_count
-            validation_errors.extend(exec_validation_errors)
-
-            if parsed_simulation is not None:
-                results.append(parsed_simulation)
-
-    if validation_errors:
-        raise ArchiveValidationError(validation_errors)
-
-    if skipped_count:
-        logger.info(
-            f"Skipped {skipped_count} incomplete run(s) missing required files."
-        )
-
-    logger.info("Completed parsing all execution directories.")
-
-    return results, skipped_count
+    return ParsedArchive(case_to_executions_dirs, strict_validation=strict_validation)
 
 
 def _process_execution_dir(
@@ -3,6 +3,9 @@ from pathlib import Path
 
 from app.features.ingestion.parsers.utils import _open_text
 
+TIMESTAMP_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})")
+CREATE_NEWCASE_FLAGS = ("--res", "--compset")
+
 
 def parse_readme_case(path: str | Path) -> dict[str, str | None]:
     """
@@ -23,10 +26,13 @@ def parse_readme_case(path: str | Path) -> dict[str, str | None]:
     lines = text.splitlines()
 
     creation_date = _extract_timestamp(lines)
-    grid_name = _extract_flag_value(lines, "--res")
-    compset = _extract_flag_value(lines, "--compset")
+    flag_values = _extract_flag_values(lines, CREATE_NEWCASE_FLAGS)
 
-    return {"creation_date": creation_date, "grid_name": grid_name, "compset": compset}
+    return {
+        "creation_date": creation_date,
+        "grid_name": flag_values["--res"],
+        "compset": flag_values["--compset"],
+    }
 
 
 def _extract_timestamp(lines: list[str]) -> str | None:
@@ -34,7 +40,7 @@ def _extract_timestamp(lines: list[str]) -> str | None:
     Extract the timestamp from the first line (format: YYYY-MM-DD HH:MM:SS: ...)
     """
     if lines:
-        m = re.match(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", lines[0])
+        m = TIMESTAMP_PATTERN.match(lines[0])
 
         if m:
             return m.group(1)
@@ -42,32 +48,47 @@ def _extract_timestamp(lines: list[str]) -> str | None:
     return None
 
 
-def _extract_flag_value(lines: list[str], flag: str) -> str | None:
+def _extract_flag_values(
+    lines: list[str], flags: tuple[str, ...]
+) -> dict[str, str | None]:
     """
-    Extract a value for a given flag (e.g., --res) from the create_newcase
-    command line.
+    Extract the values of the given flags (e.g., --res) from the
+    create_newcase command line in a single pass.
 
     Parameters
     ----------
     lines : list of str
         Lines from the README.case file.
-    flag : str
-        The flag to search for (e.g., '--res').
+    flags : tuple of str
+        The flags to search for (e.g., '--res').
 
     Returns
     -------
-    str or None
-        The value for the flag, or None if not found.
+    dict[str, str | None]
+        The first value found for each flag, or None if not found.
     """
+    values: dict[str, str | None] = dict.fromkeys(flags)
+    pending = set(flags)
+
     for line in lines:
-        if "create_newcase" in line:
-            parts = line.strip().split()
+        if "create_newcase" not in line:
+            continue
 
-            for i, part in enumerate(parts):
-                if part == flag:
-                    if i + 1 < len(parts):
-                        return parts[i + 1]
-                elif part.startswith(flag + "="):
-                    return part.split("=", 1)[1]
+        parts = line.split()
 
-    return None
+        for i, part in enumerate(parts):
+            flag, sep, value = part.partition("=")
+            if flag not in pending:
+                continue
+
+            if sep:
+                values[flag] = value
+                pending.discard(flag)
+            elif i + 1 < len(parts):
+                values[flag] = parts[i + 1]
+                pending.discard(flag)
+
+        if not pending:
+            break
+
+    return values
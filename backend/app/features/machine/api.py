@@ -1,10 +1,13 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.common.dependencies import get_database_session
 from app.core.database import transaction
+from app.core.database_async import get_async_session
 from app.features.machine.models import Machine
 from app.features.machine.schemas import MachineCreate, MachineOut
 from app.features.machine.utils import normalize_machine_name_for_storage
@@ -77,22 +80,23 @@ def create_machine(payload: MachineCreate, db: Session = Depends(get_database_se
         500: {"description": "Internal server error."},
     },
 )
-def list_machines(db: Session = Depends(get_database_session)):
+async def list_machines(db: AsyncSession = Depends(get_async_session)):
     """
     Retrieve a list of machines from the database, ordered by name in ascending
     order.
 
     Parameters
     ----------
-    db : Session, optional
-        The database session dependency, by default provided by `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by `Depends(get_async_session)`.
 
     Returns
     -------
     list
         A list of `Machine` objects retrieved from the database.
     """
-    machines = db.query(Machine).order_by(Machine.name.asc()).all()
+    result = await db.execute(select(Machine).order_by(Machine.name.asc()))
+    machines = result.scalars().all()
 
     return machines
 
@@ -107,15 +111,15 @@ def list_machines(db: Session = Depends(get_database_session)):
         500: {"description": "Internal server error."},
     },
 )
-def get_machine(machine_id: UUID, db: Session = Depends(get_database_session)):
+async def get_machine(machine_id: UUID, db: AsyncSession = Depends(get_async_session)):
     """Retrieve a machine by its ID.
 
     Parameters
     ----------
     machine_id : UUID
         The unique identifier of the machine to retrieve.
-    db : Session, optional
-        The database session dependency, by default provided by `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by `Depends(get_async_session)`.
 
     Returns
     -------
@@ -128,7 +132,7 @@ def get_machine(machine_id: UUID, db: Session = Depends(get_database_session)):
         If the machine with the given ID is not found, raises a 404 HTTP exception
         with the message "Machine not found".
     """
-    machine = db.query(Machine).filter(Machine.id == machine_id).first()
+    machine = await db.get(Machine, machine_id)
 
     if not machine:
         raise HTTPException(status_code=404, detail="Machine not found")
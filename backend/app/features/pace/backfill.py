@@ -0,0 +1,119 @@
+"""Offline backfill of the PACE experiment mapping table.
+
+Resolves execution IDs of simulations that have no stored PACE mapping, so the
+browse page can serve PACE links from Postgres instead of calling PACE per
+row. Progress is tracked by the mapping table itself: an interrupted run
+resumes with whatever is still missing, and unresolved IDs are retried on the
+next run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database_async import AsyncSessionLocal
+from app.core.logger import _setup_custom_logger
+from app.features.pace.models import PaceExperimentMapping
+from app.features.pace.resolver import resolve_experiment_ids
+from app.features.pace.schemas import MAX_PACE_RESOLVE_BATCH_SIZE
+from app.features.simulation.models import Simulation
+
+logger = _setup_custom_logger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass
+class PaceBackfillReport:
+    """Outcome counts for one backfill run."""
+
+    selected: int = 0
+    resolved: int = 0
+    unresolved: int = 0
+
+
+async def select_execution_ids_to_backfill(
+    db: AsyncSession, *, limit: int | None = None
+) -> list[str]:
+    """Return execution IDs of simulations without a stored PACE mapping.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Active database session.
+    limit : int | None, optional
+        Maximum number of execution IDs to return (default: no limit).
+
+    Returns
+    -------
+    list[str]
+        Execution IDs, newest simulation first.
+    """
+    stmt = (
+        select(Simulation.execution_id)
+        .where(
+            ~exists().where(
+                PaceExperimentMapping.execution_id == Simulation.execution_id
+            )
+        )
+        .order_by(Simulation.created_at.desc(), Simulation.id)
+    )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return list((await db.scalars(stmt)).all())
+
+
+async def backfill_pace_mappings(
+    *,
+    limit: int | None = None,
+    batch_size: int = MAX_PACE_RESOLVE_BATCH_SIZE,
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> PaceBackfillReport:
+    """Resolve and store PACE experiment IDs for unmapped simulations.
+
+    IDs are resolved in batches through the shared resolver, so PACE calls are
+    capped by ``PACE_LOOKUP_MAX_CONCURRENCY`` and each batch is persisted
+    before the next starts.
+
+    Parameters
+    ----------
+    limit : int | None, optional
+        Maximum number of execution IDs to resolve (default: no limit).
+    batch_size : int, optional
+        Execution IDs resolved per batch.
+    session_factory : SessionFactory, optional
+        Factory for the async sessions used by the run.
+
+    Returns
+    -------
+    PaceBackfillReport
+        Counts of selected, resolved, and unresolved execution IDs.
+    """
+    report = PaceBackfillReport()
+
+    async with session_factory() as db:
+        execution_ids = await select_execution_ids_to_backfill(db, limit=limit)
+        report.selected = len(execution_ids)
+
+        for start in range(0, len(execution_ids), batch_size):
+            batch = execution_ids[start : start + batch_size]
+            resolved = await resolve_experiment_ids(db, batch)
+            found = sum(1 for value in resolved.values() if value is not None)
+            report.resolved += found
+            report.unresolved += len(batch) - found
+
+    logger.info(
+        "pace_mapping_backfill selected=%d resolved=%d unresolved=%d",
+        report.selected,
+        report.resolved,
+        report.unresolved,
+    )
+
+    return report
@@ -0,0 +1,28 @@
+"""SQLAlchemy ORM models for resolved PACE experiment IDs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.models.base import Base
+
+
+class PaceExperimentMapping(Base):
+    """PACE experiment ID resolved for a simulation execution ID.
+
+    Only successful resolutions are stored: an execution ID maps to at most
+    one PACE experiment and that mapping never changes, so rows are shared by
+    every worker and never expire. Misses are cached in memory only so runs
+    that PACE has not indexed yet are retried.
+    """
+
+    __tablename__ = "pace_experiment_mappings"
+
+    execution_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    experiment_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    resolved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,345 @@
+"""Async, cached resolution of execution IDs to PACE experiment IDs.
+
+Lookups check three layers in order: a bounded per-process LRU, the
+``pace_experiment_mappings`` table shared by all workers, and finally the PACE
+search endpoint over one pooled ``httpx.AsyncClient`` per worker. Resolved IDs
+are cached for ``PACE_CACHE_TTL_SECONDS`` and persisted. Misses and upstream
+failures are cached in memory for the shorter
+``PACE_NEGATIVE_CACHE_TTL_SECONDS``, so runs PACE has not indexed yet and
+transient outages are retried soon.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+from prometheus_client import Counter
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import _setup_custom_logger
+from app.features.pace.models import PaceExperimentMapping
+
+logger = _setup_custom_logger(__name__)
+
+PACE_BASE_URL = "https://pace.ornl.gov"
+
+# The LRU hit ratio is the "memory" share of all lookups.
+PACE_LOOKUPS = Counter(
+    "pace_lookups_total",
+    "Execution ID lookups by where they were resolved (memory, database, pace).",
+    ("source",),
+)
+
+
+class _PaceLRU:
+    """Bounded least-recently-used map of execution ID to experiment ID.
+
+    ``None`` values record misses and expire after the negative TTL.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+
+    def get(self, execution_id: str) -> tuple[bool, str | None]:
+        entry = self._entries.get(execution_id)
+        if entry is None:
+            return False, None
+
+        expires_at, experiment_id = entry
+        if expires_at <= time.monotonic():
+            del self._entries[execution_id]
+            return False, None
+
+        self._entries.move_to_end(execution_id)
+
+        return True, experiment_id
+
+    def put(self, execution_id: str, experiment_id: str | None) -> None:
+        max_entries = settings.pace_cache_max_entries
+        if max_entries <= 0:
+            return
+
+        ttl = (
+            settings.pace_cache_ttl_seconds
+            if experiment_id is not None
+            else settings.pace_negative_cache_ttl_seconds
+        )
+        self._entries[execution_id] = (time.monotonic() + ttl, experiment_id)
+        self._entries.move_to_end(execution_id)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _PaceHttpClient:
+    """Pooled PACE HTTP client with a per-worker concurrency cap.
+
+    The client and semaphore are rebuilt when the running event loop changes,
+    since both are bound to one loop.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _bind(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._semaphore is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                headers={"Accept": "application/json"},
+                timeout=settings.pace_lookup_timeout_seconds,
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(settings.pace_lookup_max_concurrency)
+            self._loop = loop
+
+        return self._client, self._semaphore
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[httpx.AsyncClient]:
+        client, semaphore = self._bind()
+        async with semaphore:
+            yield client
+
+    async def close(self) -> None:
+        client = self._client
+        self._client = None
+        self._semaphore = None
+        self._loop = None
+
+        if client is not None:
+            await client.aclose()
+
+
+_pace_lru = _PaceLRU()
+_pace_http = _PaceHttpClient()
+
+# In-flight PACE lookups keyed by execution ID, shared by concurrent callers.
+_inflight_lookups: dict[str, asyncio.Task[str | None]] = {}
+
+
+async def resolve_experiment_id(
+    db: AsyncSession | None, execution_id: str
+) -> str | None:
+    """Resolve one execution ID to its PACE experiment ID.
+
+    Parameters
+    ----------
+    db : AsyncSession | None
+        Session for the persistent mapping table; ``None`` skips it.
+    execution_id : str
+        Normalized simulation execution ID.
+
+    Returns
+    -------
+    str | None
+        The PACE experiment ID, or ``None`` when PACE has no match or the
+        lookup failed.
+    """
+    return (await resolve_experiment_ids(db, [execution_id]))[execution_id]
+
+
+async def resolve_experiment_ids(
+    db: AsyncSession | None, execution_ids: Iterable[str]
+) -> dict[str, str | None]:
+    """Resolve several execution IDs with at most one database query.
+
+    IDs missing from both the LRU and the mapping table are looked up in PACE
+    concurrently, capped by ``PACE_LOOKUP_MAX_CONCURRENCY``. New resolutions
+    are written back to the table on a best-effort basis.
+
+    Parameters
+    ----------
+    db : AsyncSession | None
+        Session for the persistent mapping table; ``None`` skips it.
+    execution_ids : Iterable[str]
+        Normalized simulation execution IDs; duplicates are resolved once.
+
+    Returns
+    -------
+    dict[str, str | None]
+        Experiment ID (or ``None``) for every requested execution ID.
+    """
+    resolved: dict[str, str | None] = {}
+    missing: list[str] = []
+
+    for execution_id in dict.fromkeys(execution_ids):
+        cache_hit, experiment_id = _pace_lru.get(execution_id)
+        if cache_hit:
+            resolved[execution_id] = experiment_id
+        else:
+            missing.append(execution_id)
+
+    PACE_LOOKUPS.labels(source="memory").inc(len(resolved))
+
+    if missing and db is not None:
+        stored = await _get_stored_experiment_ids(db, missing)
+        PACE_LOOKUPS.labels(source="database").inc(len(stored))
+        for execution_id, experiment_id in stored.items():
+            _pace_lru.put(execution_id, experiment_id)
+            resolved[execution_id] = experiment_id
+        missing = [item for item in missing if item not in stored]
+
+    if not missing:
+        return resolved
+
+    PACE_LOOKUPS.labels(source="pace").inc(len(missing))
+    fetched = await asyncio.gather(*(_lookup_single_flight(item) for item in missing))
+    new_mappings = {
+        execution_id: experiment_id
+        for execution_id, experiment_id in zip(missing, fetched, strict=True)
+        if experiment_id is not None
+    }
+    resolved.update(zip(missing, fetched, strict=True))
+
+    if new_mappings and db is not None:
+        await store_experiment_ids(db, new_mappings)
+
+    return resolved
+
+
+async def store_experiment_ids(db: AsyncSession, mappings: dict[str, str]) -> None:
+    """Persist resolved experiment IDs, logging and swallowing failures.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Session used for the write; it is committed on success.
+    mappings : dict[str, str]
+        Experiment ID by execution ID.
+    """
+    stmt = pg_insert(PaceExperimentMapping).values(
+        [
+            {"execution_id": execution_id, "experiment_id": experiment_id}
+            for execution_id, experiment_id in mappings.items()
+        ]
+    )
+
+    try:
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PaceExperimentMapping.execution_id],
+                set_={"experiment_id": stmt.excluded.experiment_id},
+            )
+        )
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        logger.warning(
+            "Failed to persist %d PACE experiment mapping(s)",
+            len(mappings),
+            exc_info=True,
+        )
+
+
+async def close_pace_client() -> None:
+    """Close this worker's pooled PACE HTTP client, e.g. at app shutdown."""
+    await _pace_http.close()
+
+
+def clear_pace_cache() -> None:
+    """Drop every entry from this process's PACE lookup LRU."""
+    _pace_lru.clear()
+
+
+async def _get_stored_experiment_ids(
+    db: AsyncSession, execution_ids: list[str]
+) -> dict[str, str]:
+    rows = await db.execute(
+        select(
+            PaceExperimentMapping.execution_id, PaceExperimentMapping.experiment_id
+        ).where(PaceExperimentMapping.execution_id.in_(execution_ids))
+    )
+
+    return {execution_id: experiment_id for execution_id, experiment_id in rows}
+
+
+async def _lookup_single_flight(execution_id: str) -> str | None:
+    # Concurrent requests for the same ID (e.g. several browse tabs) await
+    # one shielded lookup, so a disconnecting caller does not cancel it.
+    task = _inflight_lookups.get(execution_id)
+
+    if task is None:
+        task = asyncio.ensure_future(_fetch_experiment_id(execution_id))
+        _inflight_lookups[execution_id] = task
+        task.add_done_callback(lambda _: _inflight_lookups.pop(execution_id, None))
+
+    return await asyncio.shield(task)
+
+
+async def _fetch_experiment_id(execution_id: str) -> str | None:
+    experiment_id = await _request_experiment_id(execution_id)
+    _pace_lru.put(execution_id, experiment_id)
+
+    return experiment_id
+
+
+async def _request_experiment_id(execution_id: str) -> str | None:
+    try:
+        async with _pace_http.session() as client:
+            response = await client.get(_build_pace_lookup_url(execution_id))
+
+        if response.status_code != 200:
+            return None
+
+        response_body = response.content.decode("utf-8")
+    except (httpx.HTTPError, UnicodeDecodeError):
+        return None
+
+    try:
+        payload = json.loads(response_body)
+    except json.JSONDecodeError:
+        return _extract_experiment_id(response_body)
+
+    return _extract_experiment_id(payload)
+
+
+def _build_pace_lookup_url(execution_id: str) -> str:
+    encoded_execution_id = urllib.parse.quote(execution_id, safe="")
+    return f"{PACE_BASE_URL}/ajax/specificSearch/lid:{encoded_execution_id}/expid"
+
+
+def _extract_experiment_id(payload: Any) -> str | None:
+    direct_experiment_id = _normalize_experiment_id(payload)
+    if direct_experiment_id is not None:
+        return direct_experiment_id
+
+    if not isinstance(payload, list) or not payload:
+        return None
+
+    first_item = payload[0]
+    if not isinstance(first_item, dict):
+        return None
+
+    return _normalize_experiment_id(first_item.get("expid"))
+
+
+def _normalize_experiment_id(value: Any) -> str | None:
+    if isinstance(value, int):
+        return str(value)
+
+    if not isinstance(value, str):
+        return None
+
+    normalized_experiment_id = value.strip()
+    if not normalized_experiment_id or not normalized_experiment_id.isdigit():
+        return None
+
+    return normalized_experiment_id
@@ -0,0 +1,40 @@
+from pydantic import ConfigDict, Field
+
+from app.common.schemas.base import CamelInBaseModel, CamelOutBaseModel
+
+MAX_PACE_RESOLVE_BATCH_SIZE = 200
+
+
+class PaceResolutionOut(CamelOutBaseModel):
+    """PACE experiment ID resolved for one execution ID."""
+
+    execution_id: str = Field(..., description="Normalized simulation execution ID.")
+    experiment_id: str | None = Field(
+        ...,
+        description="PACE experiment ID, or null when PACE has no match.",
+    )
+
+
+class PaceResolutionBatchRequest(CamelInBaseModel):
+    """Request body for resolving several execution IDs in one call."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    execution_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_PACE_RESOLVE_BATCH_SIZE,
+        description=(
+            "Simulation execution IDs to resolve. Surrounding whitespace is "
+            "stripped, duplicates are ignored, and the first-seen order is "
+            "preserved in the response."
+        ),
+    )
+
+
+class PaceResolutionBatchResponse(CamelOutBaseModel):
+    """Structured response returned by the batch PACE resolve endpoint."""
+
+    resolutions: list[PaceResolutionOut] = Field(
+        ..., description="Resolutions in request order."
+    )
@@ -2,24 +2,43 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import distinct
+from sqlalchemy import distinct, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.common.dependencies import get_database_session
 from app.core.database import transaction
+from app.core.database_async import get_async_session
 from app.features.assistant.orchestrator import is_summary_llm_available
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
 from app.features.ingestion.models import Ingestion
 from app.features.machine.utils import resolve_machine_by_name
+from app.features.simulation.case_stats import (
+    apply_simulations_to_case_stats,
+    apply_status_change_to_case_stats,
+)
+from app.features.simulation.compare_utils import (
+    COMPARE_FIELDS,
+    build_simulation_comparison,
+)
 from app.features.simulation.enums import ExternalLinkKind
 from app.features.simulation.link_utils import merge_simulation_and_case_links
-from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
+from app.features.simulation.models import (
+    Artifact,
+    Case,
+    CaseStats,
+    ExternalLink,
+    Simulation,
+)
 from app.features.simulation.schemas import (
     CaseDetailOut,
+    CaseStatsOut,
     CaseSummaryOut,
     CaseUpdate,
     DiagnosticsLinkRequest,
+    SimulationCompareOut,
+    SimulationCompareRequest,
     SimulationCreate,
     SimulationOut,
     SimulationSummaryCapabilitiesOut,
@@ -42,27 +61,35 @@ diagnostics_router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
         500: {"description": "Internal server error."},
     },
 )
-def list_cases(db: Session = Depends(get_database_session)) -> list[CaseSummaryOut]:
-    """Retrieve all cases with nested simulation summaries.
+async def list_cases(
+    db: AsyncSession = Depends(get_async_session),
+) -> list[CaseSummaryOut]:
+    """Retrieve all cases with their precomputed simulation rollups.
+
+    Simulation counts, status histograms and the latest execution come from
+    the ``case_stats`` row of each case, so executions are not loaded.
 
     Parameters
     ----------
-    db : Session, optional
-        The database session dependency, by default provided by
-        `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
 
     Returns
     -------
     list[CaseSummaryOut]
-        A list of cases, each with nested summaries of their associated
-        simulations.
+        A list of cases, each with its simulation rollup.
     """
-    cases = (
-        db.query(Case)
-        .options(selectinload(Case.machine), selectinload(Case.simulations))
+    result = await db.execute(
+        select(Case)
+        .options(
+            selectinload(Case.machine),
+            selectinload(Case.links),
+            selectinload(Case.stats),
+        )
         .order_by(Case.created_at.desc())
-        .all()
     )
+    cases = result.scalars().all()
 
     resp = [_case_to_summary_out(c) for c in cases]
 
@@ -77,7 +104,7 @@ def list_cases(db: Session = Depends(get_database_session)) -> list[CaseSummaryO
         500: {"description": "Internal server error."},
     },
 )
-def list_case_names(db: Session = Depends(get_database_session)) -> list[str]:
+async def list_case_names(db: AsyncSession = Depends(get_async_session)) -> list[str]:
     """Return a sorted list of all case names.
 
     This lightweight endpoint avoids loading nested simulation data,
@@ -85,18 +112,58 @@ def list_case_names(db: Session = Depends(get_database_session)) -> list[str]:
 
     Parameters
     ----------
-    db : Session, optional
-        The database session dependency, by default provided by
-        `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
 
     Returns
     -------
     list[str]
         Alphabetically sorted case names.
     """
-    names = db.query(distinct(Case.name)).order_by(Case.name).all()
+    result = await db.execute(select(distinct(Case.name)).order_by(Case.name))
+
+    return list(result.scalars().all())
+
+
+@case_router.get(
+    "/stats",
+    response_model=list[CaseStatsOut],
+    responses={
+        200: {"description": "List per-case simulation statistics."},
+        500: {"description": "Internal server error."},
+    },
+)
+async def list_case_stats(
+    db: AsyncSession = Depends(get_async_session),
+) -> list[CaseStatsOut]:
+    """Return precomputed simulation rollups for every case.
+
+    Reads one ``case_stats`` row per case instead of loading every
+    simulation, so it stays cheap for cases with many executions. Cases
+    without executions are omitted.
+
+    Parameters
+    ----------
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
+
+    Returns
+    -------
+    list[CaseStatsOut]
+        Per-case statistics ordered by case name.
+    """
+    result = await db.execute(
+        select(CaseStats, Case.name, Case.case_group)
+        .join(Case, CaseStats.case_id == Case.id)
+        .order_by(Case.name, Case.id)
+    )
 
-    return [n[0] for n in names]
+    return [
+        _case_stats_to_out(stats, name, case_group)
+        for stats, name, case_group in result.all()
+    ]
 
 
 @case_router.get(
@@ -108,8 +175,8 @@ def list_case_names(db: Session = Depends(get_database_session)) -> list[str]:
         500: {"description": "Internal server error."},
     },
 )
-def get_case(
-    case_id: UUID, db: Session = Depends(get_database_session)
+async def get_case(
+    case_id: UUID, db: AsyncSession = Depends(get_async_session)
 ) -> CaseDetailOut:
     """Retrieve a case by its unique identifier.
 
@@ -117,22 +184,26 @@ def get_case(
     ----------
     case_id : UUID
         The unique identifier of the case to retrieve.
-    db : Session, optional
-        The database session dependency, by default provided by
-        `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
 
     Returns
     -------
     CaseDetailOut
         The case object with nested simulation summaries if found.
     """
-    case = (
-        db.query(Case)
-        .options(selectinload(Case.machine), selectinload(Case.simulations))
-        .options(selectinload(Case.links))
-        .filter(Case.id == case_id)
-        .first()
+    result = await db.execute(
+        select(Case)
+        .options(
+            selectinload(Case.machine),
+            selectinload(Case.simulations),
+            selectinload(Case.links),
+            selectinload(Case.stats),
+        )
+        .where(Case.id == case_id)
     )
+    case = result.scalars().one_or_none()
 
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
@@ -176,6 +247,7 @@ def update_case(
             selectinload(Case.machine),
             selectinload(Case.simulations),
             selectinload(Case.links),
+            selectinload(Case.stats),
         )
         .filter(Case.id == case_id)
         .one_or_none()
@@ -205,6 +277,7 @@ def update_case(
             selectinload(Case.machine),
             selectinload(Case.simulations),
             selectinload(Case.links),
+            selectinload(Case.stats),
         )
         .filter(Case.id == case_id)
         .one_or_none()
@@ -283,6 +356,7 @@ def create_simulation(
     with transaction(db):
         db.add(sim)
         db.flush()
+        apply_simulations_to_case_stats(db, [sim])
 
     # Re-query with relationships loaded
     sim_loaded = (
@@ -345,8 +419,8 @@ def link_case_diagnostics(
         500: {"description": "Internal server error."},
     },
 )
-def list_simulations(
-    db: Session = Depends(get_database_session),
+async def list_simulations(
+    db: AsyncSession = Depends(get_async_session),
     case_name: str | None = Query(
         None,
         description="Filter simulations by exact case name.",
@@ -362,9 +436,9 @@ def list_simulations(
 
     Parameters
     ----------
-    db : Session, optional
-        The database session dependency, by default obtained via
-        `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default obtained via
+        `Depends(get_async_session)`.
     case_name : str, optional
         If provided, only simulations whose associated case name matches
         exactly will be returned.
@@ -378,22 +452,72 @@ def list_simulations(
         A list of `Simulation` objects, ordered by their `created_at` timestamp
         in descending order.
     """
-    query = db.query(Simulation).options(
-        joinedload(Simulation.case).joinedload(Case.machine),
-        joinedload(Simulation.case).selectinload(Case.links),
-        selectinload(Simulation.artifacts),
-        selectinload(Simulation.links),
-    )
+    stmt = _simulation_detail_stmt()
 
     if case_name is not None:
-        query = query.filter(Simulation.case.has(name=case_name))
+        stmt = stmt.where(Simulation.case.has(name=case_name))
     if case_group is not None:
-        query = query.filter(Simulation.case.has(case_group=case_group))
+        stmt = stmt.where(Simulation.case.has(case_group=case_group))
 
-    sims = query.order_by(Simulation.created_at.desc()).all()
+    result = await db.execute(stmt.order_by(Simulation.created_at.desc()))
+    sims = result.scalars().unique().all()
     return [_simulation_to_out(s) for s in sims]
 
 
+@simulation_router.post(
+    "/compare",
+    response_model=SimulationCompareOut,
+    responses={
+        200: {"description": "Comparison computed successfully."},
+        404: {"description": "One or more simulations not found."},
+        422: {"description": "Validation error."},
+        500: {"description": "Internal server error."},
+    },
+)
+async def compare_simulations(
+    payload: SimulationCompareRequest,
+    db: AsyncSession = Depends(get_async_session),
+) -> SimulationCompareOut:
+    """Compare simulations and return only the fields that differ.
+
+    The comparable columns of every requested simulation are loaded in a
+    single query (no relationships), then split into fields that are constant
+    across the set and fields that vary, with the simulations grouped by value.
+
+    Parameters
+    ----------
+    payload : SimulationCompareRequest
+        The IDs of the simulations to compare.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
+
+    Returns
+    -------
+    SimulationCompareOut
+        The columnar diff of the requested simulations.
+
+    Raises
+    ------
+    HTTPException
+        If any requested simulation does not exist, raises a 404 HTTP exception.
+    """
+    sim_ids = list(dict.fromkeys(payload.simulation_ids))
+    result = await db.execute(_compare_query(sim_ids))
+    rows_by_id = {row["id"]: row for row in result.mappings()}
+
+    missing = [str(sim_id) for sim_id in sim_ids if sim_id not in rows_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulations not found: {', '.join(missing)}",
+        )
+
+    comparison = build_simulation_comparison([rows_by_id[sim_id] for sim_id in sim_ids])
+
+    return SimulationCompareOut.model_validate(comparison)
+
+
 @simulation_router.patch(
     "/{sim_id}",
     response_model=SimulationOut,
@@ -428,6 +552,7 @@ def update_simulation(
         raise HTTPException(status_code=404, detail="Simulation not found")
 
     now = datetime.now(timezone.utc)
+    previous_status = sim.status
     updates = payload.model_dump(by_alias=False, exclude_unset=True)
     updates.pop("artifacts", None)
     updates.pop("links", None)
@@ -447,6 +572,7 @@ def update_simulation(
     with transaction(db):
         db.add(sim)
         db.flush()
+        apply_status_change_to_case_stats(db, sim, previous_status)
 
     db.expire_all()
     sim_loaded = (
@@ -542,16 +668,16 @@ def _upsert_case_diagnostic_links(
         500: {"description": "Internal server error."},
     },
 )
-def get_simulation(sim_id: UUID, db: Session = Depends(get_database_session)):
+async def get_simulation(sim_id: UUID, db: AsyncSession = Depends(get_async_session)):
     """Retrieve a simulation by its unique identifier.
 
     Parameters
     ----------
     sim_id : UUID
         The unique identifier of the simulation to retrieve.
-    db : Session, optional
-        The database session dependency, by default provided by
-        `Depends(get_database_session)`.
+    db : AsyncSession, optional
+        The async database session dependency, by default provided by
+        `Depends(get_async_session)`.
 
     Returns
     -------
@@ -563,7 +689,8 @@ def get_simulation(sim_id: UUID, db: Session = Depends(get_database_session)):
     HTTPException
         If the simulation with the given ID is not found, raises a 404 HTTP exception.
     """
-    sim = _simulation_detail_query(db).filter(Simulation.id == sim_id).one_or_none()
+    result = await db.execute(_simulation_detail_stmt().where(Simulation.id == sim_id))
+    sim = result.scalars().unique().one_or_none()
 
     if not sim:
         raise HTTPException(status_code=404, detail="Simulation not found")
@@ -572,8 +699,12 @@ def get_simulation(sim_id: UUID, db: Session = Depends(get_database_session)):
 
 
 def _build_case_summary(case: Case) -> dict:
-    """Build shared summary data for case response schemas."""
-    summaries = []
+    """Build shared summary data for case response schemas.
+
+    Simulation rollups are read from ``case.stats``; a case without a stats
+    row has no executions yet.
+    """
+    stats = case.stats
     machine_names = sorted(
         {case.machine.name}
         if case.machine is not None and case.machine.name
@@ -585,23 +716,14 @@ def _build_case_summary(case: Case) -> dict:
         key=lambda username: username.lower(),
     )
 
-    for sim in case.simulations:
-        summaries.append(
-            SimulationSummaryOut(
-                id=sim.id,
-                execution_id=sim.execution_id,
-                case_hash=sim.case_hash,
-                status=sim.status,
-                simulation_start_date=sim.simulation_start_date,
-                simulation_end_date=sim.simulation_end_date,
-            )
-        )
-
     return {
         "id": case.id,
         "name": case.name,
         "case_group": case.case_group,
-        "simulations": summaries,
+        "simulation_count": stats.simulation_count if stats else 0,
+        "status_counts": stats.status_counts if stats else {},
+        "latest_status": stats.latest_status if stats else None,
+        "latest_created_at": stats.latest_created_at if stats else None,
         "machine_names": machine_names,
         "hpc_usernames": hpc_usernames,
         "links": [_external_link_to_out(link) for link in case.links],
@@ -610,8 +732,28 @@ def _build_case_summary(case: Case) -> dict:
     }
 
 
+def _case_stats_to_out(
+    stats: CaseStats, case_name: str, case_group: str | None
+) -> CaseStatsOut:
+    """Convert a CaseStats row and its case's name and group to CaseStatsOut."""
+    return CaseStatsOut(
+        case_id=stats.case_id,
+        case_name=case_name,
+        case_group=case_group,
+        simulation_count=stats.simulation_count,
+        status_counts=stats.status_counts,
+        latest_simulation_id=stats.latest_simulation_id,
+        latest_status=stats.latest_status,
+        latest_created_at=stats.latest_created_at,
+        earliest_start_date=stats.earliest_start_date,
+        latest_end_date=stats.latest_end_date,
+        compilers=stats.compilers,
+        git_tags=stats.git_tags,
+    )
+
+
 def _case_to_summary_out(case: Case) -> CaseSummaryOut:
-    """Convert a Case ORM instance to CaseSummaryOut with nested summaries.
+    """Convert a Case ORM instance to CaseSummaryOut with its stats rollup.
 
     Parameters
     ----------
@@ -621,8 +763,7 @@ def _case_to_summary_out(case: Case) -> CaseSummaryOut:
     Returns
     -------
     CaseSummaryOut
-        The corresponding CaseSummaryOut schema instance with nested
-        SimulationSummaryOut
+        The corresponding CaseSummaryOut schema instance.
     """
     result = CaseSummaryOut(**_build_case_summary(case))
 
@@ -633,6 +774,17 @@ def _case_to_detail_out(case: Case) -> CaseDetailOut:
     """Convert a Case ORM instance to CaseDetailOut."""
     result = CaseDetailOut(
         **_build_case_summary(case),
+        simulations=[
+            SimulationSummaryOut(
+                id=sim.id,
+                execution_id=sim.execution_id,
+                case_hash=sim.case_hash,
+                status=sim.status,
+                simulation_start_date=sim.simulation_start_date,
+                simulation_end_date=sim.simulation_end_date,
+            )
+            for sim in case.simulations
+        ],
         description=case.description,
         key_features=case.key_features,
         known_issues=case.known_issues,
@@ -698,8 +850,8 @@ def _external_link_to_out(link: ExternalLink) -> dict:
     }
 
 
-def _simulation_detail_query(db: Session):
-    return db.query(Simulation).options(
+def _simulation_detail_options() -> tuple:
+    return (
         joinedload(Simulation.case).joinedload(Case.machine),
         joinedload(Simulation.case).selectinload(Case.links),
         selectinload(Simulation.artifacts),
@@ -707,6 +859,35 @@ def _simulation_detail_query(db: Session):
     )
 
 
+def _simulation_detail_query(db: Session):
+    return db.query(Simulation).options(*_simulation_detail_options())
+
+
+def _simulation_detail_stmt():
+    return select(Simulation).options(*_simulation_detail_options())
+
+
+def _compare_query(sim_ids: list[UUID]):
+    case_columns = {
+        "case_name": Case.name,
+        "case_group": Case.case_group,
+        "machine_id": Case.machine_id,
+        "hpc_username": Case.hpc_username,
+    }
+    columns = [
+        case_columns[field].label(field)
+        if field in case_columns
+        else getattr(Simulation, field)
+        for field in COMPARE_FIELDS
+    ]
+
+    return (
+        select(Simulation.id, Simulation.execution_id, Simulation.extra, *columns)
+        .join(Case, Simulation.case_id == Case.id)
+        .where(Simulation.id.in_(sim_ids))
+    )
+
+
 def _simulation_to_out(sim: Simulation) -> SimulationOut:
     """Convert a Simulation ORM instance to a SimulationOut schema.
 
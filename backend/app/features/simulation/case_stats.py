@@ -0,0 +1,318 @@
+"""Incremental maintenance of the per-case ``case_stats`` rollup."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.features.simulation.models import CaseStats, Simulation
+
+
+class _Latest(NamedTuple):
+    id: UUID
+    status: str
+    created_at: datetime
+    execution_id: str
+
+
+@dataclass
+class _CaseDelta:
+    simulation_count: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+    earliest_start_date: datetime | None = None
+    latest_end_date: datetime | None = None
+    compilers: set[str] = field(default_factory=set)
+    git_tags: set[str] = field(default_factory=set)
+    latest: _Latest | None = None
+
+
+class CaseStatsDelta:
+    """Per-case changes of persisted simulations, applied to ``case_stats`` later.
+
+    ``add`` only reads the simulations, so a multi-chunk ingestion can fold in
+    each chunk before detaching it and call ``apply`` once, just before
+    commit. The ``case_stats`` row locks taken by ``apply`` are then held for
+    the end of the transaction only, not while the rest of the archive is
+    parsed and persisted.
+    """
+
+    def __init__(self) -> None:
+        self._cases: dict[UUID, _CaseDelta] = {}
+
+    def add(self, simulations: Iterable[Simulation]) -> None:
+        """Fold flushed simulations into the per-case changes.
+
+        Parameters
+        ----------
+        simulations : Iterable[Simulation]
+            Flushed simulations that are not yet reflected in ``case_stats``.
+        """
+        for sim in simulations:
+            delta = self._cases.setdefault(sim.case_id, _CaseDelta())
+            status = _status_value(sim.status)
+
+            delta.simulation_count += 1
+            delta.status_counts[status] = delta.status_counts.get(status, 0) + 1
+            delta.earliest_start_date = _min_date(
+                delta.earliest_start_date, sim.simulation_start_date
+            )
+            delta.latest_end_date = _max_date(
+                delta.latest_end_date, sim.simulation_end_date
+            )
+            if sim.compiler is not None:
+                delta.compilers.add(sim.compiler)
+            if sim.git_tag is not None:
+                delta.git_tags.add(sim.git_tag)
+
+            # Same order as ``_recompute``: newest created_at, then execution_id.
+            candidate = _Latest(sim.id, status, sim.created_at, sim.execution_id)
+            if delta.latest is None or (
+                (candidate.created_at, candidate.execution_id)
+                > (delta.latest.created_at, delta.latest.execution_id)
+            ):
+                delta.latest = candidate
+
+    def apply(self, db: Session) -> None:
+        """Apply the changes to the cases' stats rows and reset them.
+
+        Must run inside the transaction that flushed the simulations. Stats
+        rows are locked with ``SELECT ... FOR UPDATE`` so concurrent
+        ingestions into the same case serialize. A case without a stats row
+        yet is recomputed from its simulations instead, so executions
+        written before the row existed are included.
+
+        Parameters
+        ----------
+        db : Session
+            Active SQLAlchemy session inside a transaction.
+        """
+        cases, self._cases = self._cases, {}
+        if not cases:
+            return
+
+        inserted = set(
+            db.execute(
+                pg_insert(CaseStats)
+                .values([{"case_id": case_id} for case_id in cases])
+                .on_conflict_do_nothing(index_elements=[CaseStats.case_id])
+                .returning(CaseStats.case_id)
+            ).scalars()
+        )
+        rows = _lock_case_stats(db, list(cases))
+
+        for case_id, delta in cases.items():
+            stats = rows[case_id]
+
+            if case_id in inserted:
+                _recompute(db, stats)
+            else:
+                _merge_delta(db, stats, delta)
+
+            stats.updated_at = datetime.now(timezone.utc)
+
+
+def apply_simulations_to_case_stats(
+    db: Session, simulations: Iterable[Simulation]
+) -> None:
+    """Fold newly persisted simulations into their cases' stats rows.
+
+    Equivalent to ``CaseStatsDelta.add`` followed by ``CaseStatsDelta.apply``.
+
+    Parameters
+    ----------
+    db : Session
+        Active SQLAlchemy session inside a transaction.
+    simulations : Iterable[Simulation]
+        Flushed simulations that are not yet reflected in ``case_stats``.
+    """
+    delta = CaseStatsDelta()
+    delta.add(simulations)
+    delta.apply(db)
+
+
+def rebuild_case_stats(db: Session, case_ids: Iterable[UUID]) -> None:
+    """Recompute the stats rows of the given cases from their simulations.
+
+    Used after bulk loads that insert simulations without going through
+    ``apply_simulations_to_case_stats``. Missing stats rows are created.
+
+    Parameters
+    ----------
+    db : Session
+        Active SQLAlchemy session inside a transaction.
+    case_ids : Iterable[UUID]
+        Cases whose stats rows are rebuilt.
+    """
+    case_ids = list(case_ids)
+    if not case_ids:
+        return
+
+    db.execute(
+        pg_insert(CaseStats)
+        .values([{"case_id": case_id} for case_id in case_ids])
+        .on_conflict_do_nothing(index_elements=[CaseStats.case_id])
+    )
+
+    for stats in _lock_case_stats(db, case_ids).values():
+        _recompute(db, stats)
+        stats.updated_at = datetime.now(timezone.utc)
+
+
+def apply_status_change_to_case_stats(
+    db: Session, simulation: Simulation, previous_status: Any
+) -> None:
+    """Move one simulation between status buckets in its case's stats row.
+
+    Parameters
+    ----------
+    db : Session
+        Active SQLAlchemy session inside a transaction.
+    simulation : Simulation
+        The flushed simulation with its new status.
+    previous_status : Any
+        The status (enum member or value) before the update.
+    """
+    previous_status = _status_value(previous_status)
+    new_status = _status_value(simulation.status)
+    if new_status == previous_status:
+        return
+
+    stats = _lock_case_stats(db, [simulation.case_id]).get(simulation.case_id)
+    if stats is None:
+        apply_simulations_to_case_stats(db, [simulation])
+        return
+
+    counts = dict(stats.status_counts)
+    remaining = counts.get(previous_status, 0) - 1
+    if remaining > 0:
+        counts[previous_status] = remaining
+    else:
+        counts.pop(previous_status, None)
+    counts[new_status] = counts.get(new_status, 0) + 1
+    stats.status_counts = counts
+
+    if stats.latest_simulation_id == simulation.id:
+        stats.latest_status = new_status
+
+    stats.updated_at = datetime.now(timezone.utc)
+
+
+def _lock_case_stats(db: Session, case_ids: list[UUID]) -> dict[UUID, CaseStats]:
+    rows = db.execute(
+        select(CaseStats)
+        .where(CaseStats.case_id.in_(case_ids))
+        .order_by(CaseStats.case_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalars()
+
+    return {row.case_id: row for row in rows}
+
+
+def _merge_delta(db: Session, stats: CaseStats, delta: _CaseDelta) -> None:
+    counts = dict(stats.status_counts)
+    for status, count in delta.status_counts.items():
+        counts[status] = counts.get(status, 0) + count
+
+    stats.simulation_count += delta.simulation_count
+    stats.status_counts = counts
+    stats.earliest_start_date = _min_date(
+        stats.earliest_start_date, delta.earliest_start_date
+    )
+    stats.latest_end_date = _max_date(stats.latest_end_date, delta.latest_end_date)
+    stats.compilers = sorted(set(stats.compilers) | delta.compilers)
+    stats.git_tags = sorted(set(stats.git_tags) | delta.git_tags)
+
+    if delta.latest is not None and _is_newer(db, delta.latest, stats):
+        stats.latest_simulation_id = delta.latest.id
+        stats.latest_status = delta.latest.status
+        stats.latest_created_at = delta.latest.created_at
+
+
+def _recompute(db: Session, stats: CaseStats) -> None:
+    case_filter = Simulation.case_id == stats.case_id
+
+    count, earliest_start, latest_end = db.execute(
+        select(
+            func.count(Simulation.id),
+            func.min(Simulation.simulation_start_date),
+            func.max(Simulation.simulation_end_date),
+        ).where(case_filter)
+    ).one()
+    status_rows = db.execute(
+        select(Simulation.status, func.count(Simulation.id))
+        .where(case_filter)
+        .group_by(Simulation.status)
+    ).all()
+    latest = db.execute(
+        select(Simulation.id, Simulation.status, Simulation.created_at)
+        .where(case_filter)
+        .order_by(Simulation.created_at.desc(), Simulation.execution_id.desc())
+        .limit(1)
+    ).one_or_none()
+    compilers = db.execute(
+        select(Simulation.compiler)
+        .where(case_filter, Simulation.compiler.is_not(None))
+        .distinct()
+    ).scalars()
+    git_tags = db.execute(
+        select(Simulation.git_tag)
+        .where(case_filter, Simulation.git_tag.is_not(None))
+        .distinct()
+    ).scalars()
+
+    stats.simulation_count = count
+    stats.status_counts = {_status_value(s): n for s, n in status_rows}
+    stats.earliest_start_date = earliest_start
+    stats.latest_end_date = latest_end
+    stats.compilers = sorted(compilers)
+    stats.git_tags = sorted(git_tags)
+    stats.latest_simulation_id = latest.id if latest else None
+    stats.latest_status = _status_value(latest.status) if latest else None
+    stats.latest_created_at = latest.created_at if latest else None
+
+
+def _is_newer(db: Session, sim: _Latest, stats: CaseStats) -> bool:
+    """Return whether ``sim`` sorts after the case's current latest execution.
+
+    Mirrors ``_recompute``: newest ``created_at`` wins and ties, such as a
+    chunk persisted with one timestamp, go to the larger ``execution_id``.
+    """
+    if stats.latest_created_at is None or sim.created_at is None:
+        return stats.latest_simulation_id is None
+
+    if sim.created_at != stats.latest_created_at:
+        return sim.created_at > stats.latest_created_at
+
+    latest_execution_id = db.execute(
+        select(Simulation.execution_id).where(
+            Simulation.id == stats.latest_simulation_id
+        )
+    ).scalar_one_or_none()
+
+    return latest_execution_id is None or sim.execution_id > latest_execution_id
+
+
+def _min_date(current: datetime | None, value: datetime | None) -> datetime | None:
+    if current is None or (value is not None and value < current):
+        return value
+
+    return current
+
+
+def _max_date(current: datetime | None, value: datetime | None) -> datetime | None:
+    if current is None or (value is not None and value > current):
+        return value
+
+    return current
+
+
+def _status_value(status: Any) -> str:
+    return getattr(status, "value", status)
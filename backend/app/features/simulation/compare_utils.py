@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from app.common.schemas.utils import to_camel_case
+
+# ``SimulationOut`` fields included in a comparison, in display order. The
+# execution ID is reported per member instead because it always varies.
+COMPARE_FIELDS: tuple[str, ...] = (
+    "case_name",
+    "case_group",
+    "case_hash",
+    "machine_id",
+    "hpc_username",
+    "compset",
+    "compset_alias",
+    "grid_name",
+    "grid_resolution",
+    "simulation_type",
+    "status",
+    "campaign",
+    "experiment_type",
+    "initialization_type",
+    "simulation_start_date",
+    "simulation_end_date",
+    "run_start_date",
+    "run_end_date",
+    "compiler",
+    "git_repository_url",
+    "git_branch",
+    "git_tag",
+    "git_commit_hash",
+)
+
+EXTRA_FIELD_PREFIX = "extra."
+
+
+def build_simulation_comparison(
+    rows: Sequence[Mapping],
+) -> dict[str, Any]:
+    """Build a columnar diff across simulation rows.
+
+    Each row maps ``COMPARE_FIELDS`` (plus ``id``, ``execution_id`` and
+    ``extra``) to its value. Top-level ``extra`` keys are compared
+    individually as ``extra.<key>`` fields; a key missing from a row compares
+    as ``None``.
+
+    Parameters
+    ----------
+    rows : Sequence[Mapping[str, Any]]
+        Simulation rows in the order they should be reported.
+
+    Returns
+    -------
+    dict[str, Any]
+        ``simulations`` (id and execution ID per row), ``constant_fields``
+        (field name to shared value) and ``varying_fields`` (field name with
+        value groups, ordered by first appearance).
+    """
+    columns: dict[str, list[Any]] = {
+        to_camel_case(field): [_normalize_value(row[field]) for row in rows]
+        for field in COMPARE_FIELDS
+    }
+
+    for key in _collect_extra_keys(row["extra"] for row in rows):
+        columns[f"{EXTRA_FIELD_PREFIX}{key}"] = [
+            _normalize_value((row["extra"] or {}).get(key)) for row in rows
+        ]
+
+    ids = [row["id"] for row in rows]
+    constant_fields: dict[str, Any] = {}
+    varying_fields: list[dict[str, Any]] = []
+
+    for field, values in columns.items():
+        groups = _group_values(ids, values)
+
+        if len(groups) <= 1:
+            constant_fields[field] = values[0] if values else None
+        else:
+            varying_fields.append({"field": field, "groups": groups})
+
+    return {
+        "simulations": [
+            {"id": row["id"], "execution_id": row["execution_id"]} for row in rows
+        ],
+        "constant_fields": constant_fields,
+        "varying_fields": varying_fields,
+    }
+
+
+def _collect_extra_keys(extras: Iterable[dict | None]) -> list[str]:
+    keys: set[str] = set()
+
+    for extra in extras:
+        if extra:
+            keys.update(extra.keys())
+
+    return sorted(keys)
+
+
+def _group_values(ids: list[UUID], values: list[Any]) -> list[dict[str, Any]]:
+    groups: dict[str, dict[str, Any]] = {}
+
+    for sim_id, value in zip(ids, values, strict=True):
+        key = json.dumps(value, sort_keys=True, default=str)
+        group = groups.setdefault(key, {"value": value, "simulation_ids": []})
+        group["simulation_ids"].append(sim_id)
+
+    return list(groups.values())
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, UUID):
+        return str(value)
+
+    return value
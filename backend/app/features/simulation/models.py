@@ -15,6 +15,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
     text,
 )
 from sqlalchemy import Enum as SAEnum
@@ -80,11 +81,29 @@ class Case(Base, IDMixin, TimestampMixin):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+    stats: Mapped[CaseStats | None] = relationship(
+        "CaseStats",
+        back_populates="case",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class Simulation(Base, IDMixin, TimestampMixin):
     __tablename__ = "simulations"
 
+    __table_args__ = (
+        Index("ix_simulations_created_at", "created_at"),
+        # Serves the first-known CASE_HASH lookup during ingestion.
+        Index(
+            "ix_simulations_case_id_created_at_with_case_hash",
+            "case_id",
+            "created_at",
+            postgresql_where=text("case_hash IS NOT NULL"),
+        ),
+    )
+
     # Configuration
     # ~~~~~~~~~~~~~~
     case_id: Mapped[UUID] = mapped_column(
@@ -272,3 +291,52 @@ class ExternalLink(Base, IDMixin, TimestampMixin):
         foreign_keys=[case_id],
         passive_deletes=True,
     )
+
+
+class CaseStats(Base):
+    """Per-case rollup of simulation executions.
+
+    Maintained incrementally when simulations are ingested, created, or have
+    their status updated, so case-level views can read one row per case
+    instead of loading every execution.
+    """
+
+    __tablename__ = "case_stats"
+
+    case_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("cases.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    simulation_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
+    status_counts: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+    latest_simulation_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("simulations.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    latest_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    latest_created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    earliest_start_date: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    latest_end_date: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    compilers: Mapped[list] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    git_tags: Mapped[list] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    case: Mapped[Case] = relationship("Case", back_populates="stats")
@@ -595,7 +595,7 @@ class SimulationSummaryCapabilitiesOut(CamelOutBaseModel):
 
 
 class CaseSummaryOut(CamelOutBaseModel):
-    """Schema for representing a Case summary with nested simulation summaries."""
+    """Schema for representing a Case summary with its ``case_stats`` rollup."""
 
     id: Annotated[UUID, Field(..., description="The unique identifier of the case.")]
     name: Annotated[str, Field(..., description="The case name.")]
@@ -609,12 +609,21 @@ class CaseSummaryOut(CamelOutBaseModel):
             ),
         ),
     ]
-    simulations: Annotated[
-        list[SimulationSummaryOut],
-        Field(
-            default_factory=list,
-            description="Simulation executions belonging to this case.",
-        ),
+    simulation_count: Annotated[
+        int,
+        Field(0, description="Number of simulation executions in the case."),
+    ]
+    status_counts: Annotated[
+        dict[str, int],
+        Field(default_factory=dict, description="Execution counts keyed by status."),
+    ]
+    latest_status: Annotated[
+        SimulationStatus | None,
+        Field(None, description="Status of the most recently created execution."),
+    ]
+    latest_created_at: Annotated[
+        datetime | None,
+        Field(None, description="Creation time of the most recent execution."),
     ]
     machine_names: Annotated[
         list[str],
@@ -645,9 +654,61 @@ class CaseSummaryOut(CamelOutBaseModel):
     ]
 
 
+class CaseStatsOut(CamelOutBaseModel):
+    """Per-case simulation rollup read from the ``case_stats`` table."""
+
+    case_id: Annotated[UUID, Field(..., description="The case identifier.")]
+    case_name: Annotated[str, Field(..., description="The case name.")]
+    case_group: Annotated[
+        str | None, Field(None, description="Optional case group of the case.")
+    ]
+    simulation_count: Annotated[
+        int, Field(..., description="Number of simulation executions in the case.")
+    ]
+    status_counts: Annotated[
+        dict[str, int],
+        Field(default_factory=dict, description="Execution counts keyed by status."),
+    ]
+    latest_simulation_id: Annotated[
+        UUID | None, Field(None, description="Most recently created execution.")
+    ]
+    latest_status: Annotated[
+        SimulationStatus | None,
+        Field(None, description="Status of the most recently created execution."),
+    ]
+    latest_created_at: Annotated[
+        datetime | None,
+        Field(None, description="Creation time of the most recent execution."),
+    ]
+    earliest_start_date: Annotated[
+        datetime | None,
+        Field(None, description="Earliest simulation start date across executions."),
+    ]
+    latest_end_date: Annotated[
+        datetime | None,
+        Field(None, description="Latest simulation end date across executions."),
+    ]
+    compilers: Annotated[
+        list[str],
+        Field(default_factory=list, description="Distinct compilers, sorted."),
+    ]
+    git_tags: Annotated[
+        list[str],
+        Field(default_factory=list, description="Distinct Git tags, sorted."),
+    ]
+
+
 class CaseDetailOut(CaseSummaryOut):
     """Schema for representing full case details used by Case Details."""
 
+    simulations: Annotated[
+        list[SimulationSummaryOut],
+        Field(
+            default_factory=list,
+            description="Simulation executions belonging to this case.",
+        ),
+    ]
+
     description: Annotated[
         str | None, Field(None, description="Optional shared description of the case")
     ]
@@ -952,3 +1013,87 @@ class SimulationOut(CamelOutBaseModel):
             grouped[item.kind].append(item)
 
         return dict(grouped)
+
+
+class SimulationCompareRequest(CamelInBaseModel):
+    """Schema for requesting a server-side comparison of simulations."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    simulation_ids: Annotated[
+        list[UUID],
+        Field(
+            ...,
+            min_length=2,
+            max_length=1000,
+            description=(
+                "IDs of the simulations to compare. Duplicates are ignored and "
+                "the first-seen order is preserved in the response."
+            ),
+        ),
+    ]
+
+
+class SimulationCompareMemberOut(CamelOutBaseModel):
+    """Identity of one simulation included in a comparison."""
+
+    id: Annotated[
+        UUID, Field(..., description="The unique identifier of the simulation.")
+    ]
+    execution_id: Annotated[
+        str, Field(..., description="Execution ID of the simulation.")
+    ]
+
+
+class SimulationCompareValueGroupOut(CamelOutBaseModel):
+    """Simulations sharing the same value for a varying field."""
+
+    value: Annotated[
+        Any, Field(None, description="The shared value (JSON-serializable).")
+    ]
+    simulation_ids: Annotated[
+        list[UUID],
+        Field(..., description="IDs of the simulations that have this value."),
+    ]
+
+
+class SimulationCompareFieldOut(CamelOutBaseModel):
+    """A field whose value differs across the compared simulations."""
+
+    field: Annotated[
+        str,
+        Field(
+            ...,
+            description=(
+                "camelCase SimulationOut field name, or 'extra.<key>' for a "
+                "top-level key of the extra metadata."
+            ),
+        ),
+    ]
+    groups: Annotated[
+        list[SimulationCompareValueGroupOut],
+        Field(..., description="Value groups ordered by first appearance."),
+    ]
+
+
+class SimulationCompareOut(CamelOutBaseModel):
+    """Columnar diff of simulations, split into constant and varying fields."""
+
+    simulations: Annotated[
+        list[SimulationCompareMemberOut],
+        Field(..., description="Compared simulations in request order."),
+    ]
+    constant_fields: Annotated[
+        dict[str, Any],
+        Field(
+            default_factory=dict,
+            description="Fields with one shared value, keyed by field name.",
+        ),
+    ]
+    varying_fields: Annotated[
+        list[SimulationCompareFieldOut],
+        Field(
+            default_factory=list,
+            description="Fields with more than one value across the set.",
+        ),
+    ]
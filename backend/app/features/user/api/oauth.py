@@ -1,7 +1,12 @@
-from datetime import datetime, timezone
-from typing import Literal
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
 from fastapi.responses import JSONResponse
 from fastapi_users.authentication.strategy import Strategy
 from fastapi_users.exceptions import UserAlreadyExists
@@ -13,7 +18,6 @@ from fastapi_users.router.oauth import (
     decode_jwt,
     generate_state_token,
 )
-from httpx import AsyncClient, HTTPError
 from httpx_oauth.integrations.fastapi import OAuth2AuthorizeCallback
 
 from app.core.config import settings
@@ -29,6 +33,10 @@ from app.features.user.manager import (
     fastapi_users,
     get_user_manager,
 )
+from app.features.user.membership import (
+    is_membership_stale,
+    refresh_user_membership,
+)
 from app.features.user.schemas import UserRead, UserUpdate
 
 user_router = APIRouter(prefix="/users", tags=["users"])
@@ -37,8 +45,6 @@ oauth2_authorize_callback = OAuth2AuthorizeCallback(
     GITHUB_OAUTH_CLIENT,
     redirect_url=settings.github_redirect_url,
 )
-E3SM_GITHUB_ORG = "E3SM-Project"
-GitHubOrgMembershipState = Literal[True, False, None]
 
 
 # --- GitHub OAuth Routes ---
@@ -105,6 +111,7 @@ async def github_authorize(
 )
 async def github_callback(
     request: Request,
+    background_tasks: BackgroundTasks,
     access_token_state=Depends(oauth2_authorize_callback),  # noqa: B008
     user_manager: BaseUserManager = Depends(get_user_manager),  # noqa: B008
     strategy: Strategy = Depends(GITHUB_OAUTH_BACKEND.get_strategy),  # noqa: B008
@@ -117,6 +124,9 @@ async def github_callback(
     ----------
     request : Request
         The incoming HTTP request.
+    background_tasks : BackgroundTasks
+        Request background tasks, used to refresh a stale E3SM org membership
+        after the response is sent.
     access_token_state : tuple[dict, str | None]
         A tuple containing the access token information and the state token.
     user_manager : BaseUserManager
@@ -178,17 +188,11 @@ async def github_callback(
             detail=ErrorCode.LOGIN_BAD_CREDENTIALS,
         )
 
-    has_verified_e3sm_membership = await _fetch_verified_e3sm_membership(
-        token["access_token"]
-    )
-
-    if has_verified_e3sm_membership is not None and hasattr(
-        user_manager, "refresh_github_org_membership"
-    ):
-        user = await user_manager.refresh_github_org_membership(
-            user,
-            is_verified_member=has_verified_e3sm_membership,
-            checked_at=datetime.now(timezone.utc),
+    # Membership is re-checked after the response is sent, so login never
+    # waits on GitHub; until then the stored result applies.
+    if is_membership_stale(user):
+        background_tasks.add_task(
+            refresh_user_membership, user.id, token["access_token"]
         )
 
     response = await GITHUB_OAUTH_BACKEND.login(strategy, user)
@@ -199,41 +203,6 @@ async def github_callback(
     return response
 
 
-async def _fetch_verified_e3sm_membership(
-    access_token: str,
-) -> GitHubOrgMembershipState:
-    """Return membership state, or None when GitHub result is indeterminate."""
-
-    try:
-        async with AsyncClient(timeout=10.0) as http_client:
-            response = await http_client.get(
-                f"https://api.github.com/user/memberships/orgs/{E3SM_GITHUB_ORG}",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-            )
-    except HTTPError:
-        return None
-
-    if response.status_code == status.HTTP_404_NOT_FOUND:
-        return False
-
-    if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
-        return None
-
-    if response.status_code >= status.HTTP_400_BAD_REQUEST:
-        return None
-
-    try:
-        payload = response.json()
-    except ValueError:
-        return None
-
-    return payload.get("state") == "active"
-
-
 # --- JWT Login Routes ---
 auth_router.include_router(
     fastapi_users.get_auth_router(JWT_BEARER_BACKEND),
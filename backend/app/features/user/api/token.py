@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.common.dependencies import get_database_session
 from app.core.config import settings
-from app.features.user.auth.token import generate_token
+from app.features.user.auth.token import commit_token_revocation, generate_token
 from app.features.user.manager import current_active_user
 from app.features.user.models import ApiToken, User, UserRole
 from app.features.user.schemas import (
@@ -179,7 +179,8 @@ def revoke_api_token(
     Revoke an API token.
 
     Only administrators can revoke API tokens.
-    Revoked tokens cannot be used for authentication.
+    Revoked tokens cannot be used for authentication, including on workers
+    that have the token in their verification cache.
 
     Parameters
     ----------
@@ -210,7 +211,7 @@ def revoke_api_token(
         )
 
     token.revoked = True
-    db.commit()
+    commit_token_revocation(db)
 
     return None
 
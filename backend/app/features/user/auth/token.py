@@ -2,14 +2,24 @@
 
 import hashlib
 import secrets
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi_users.authentication import AuthenticationBackend, BearerTransport
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.sql.dml import ReturningInsert
 
+from app.core.config import settings
 from app.features.user.auth.utils import get_jwt_strategy
-from app.features.user.models import ApiToken, User, UserRole
+from app.features.user.models import ApiToken, ApiTokenGeneration, User, UserRole
 
 # Bearer transport for JWT login (returns token as JSON).
 BEARER_TRANSPORT = BearerTransport(tokenUrl="auth/jwt/login")
@@ -19,6 +29,102 @@ JWT_BEARER_BACKEND: AuthenticationBackend = AuthenticationBackend(
     name="jwt", transport=BEARER_TRANSPORT, get_strategy=get_jwt_strategy
 )
 
+# Primary key of the single ``api_token_generation`` row.
+_GENERATION_ROW_ID = 1
+
+
+@dataclass(frozen=True)
+class _CachedToken:
+    """Verification-relevant state of one API token and its user."""
+
+    user_id: uuid.UUID
+    role: UserRole
+    is_active: bool
+    expires_at: datetime | None
+    revoked: bool
+    user_values: dict[str, Any]
+    cached_until: float
+    generation: int
+
+
+class _TokenVerificationCache:
+    """Bounded, short-TTL map of token hash to verification state.
+
+    Entries are tagged with the revocation generation observed before they
+    were loaded. When the shared counter changes, every entry is dropped, and
+    entries loaded under an older generation are never stored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CachedToken] = OrderedDict()
+        self._generation = 0
+        self._generation_checked_at: float | None = None
+
+    def sync_generation(self, db: Session) -> int:
+        now = time.monotonic()
+        with self._lock:
+            checked_at = self._generation_checked_at
+            if (
+                checked_at is not None
+                and now - checked_at < settings.api_token_cache_generation_poll_seconds
+            ):
+                return self._generation
+
+        row = (
+            db.query(ApiTokenGeneration)
+            .filter(ApiTokenGeneration.id == _GENERATION_ROW_ID)
+            .first()
+        )
+        self.reset(row.generation if row is not None else 0, checked_at=now)
+
+        return self._generation
+
+    def reset(self, generation: int, *, checked_at: float | None = None) -> None:
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            self._generation_checked_at = (
+                time.monotonic() if checked_at is None else checked_at
+            )
+
+    def get(self, token_hash: str) -> _CachedToken | None:
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is None:
+                return None
+
+            if entry.cached_until <= time.monotonic():
+                del self._entries[token_hash]
+                return None
+
+            self._entries.move_to_end(token_hash)
+
+            return entry
+
+    def put(self, token_hash: str, entry: _CachedToken) -> None:
+        max_entries = settings.api_token_cache_max_entries
+        if max_entries <= 0:
+            return
+
+        with self._lock:
+            if entry.generation != self._generation:
+                return
+
+            self._entries[token_hash] = entry
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation_checked_at = None
+
+
+_token_cache = _TokenVerificationCache()
+
 
 def generate_token() -> tuple[str, str]:
     """
@@ -52,11 +158,17 @@ def validate_token(
 
     This function:
     1. Computes SHA256 hash of the provided token
-    2. Looks up the token in the database by hash (indexed)
+    2. Looks up the token and its user in the per-worker verification cache,
+       falling back to the database by hash (indexed) on a miss
     3. Checks if token is revoked
     4. Optionally checks if token is expired
     5. Returns the associated user if valid, None otherwise
 
+    Cache hits issue no token or user queries; the cached user is attached
+    to ``db`` without loading it. Revocations are picked up from the shared
+    generation counter, which is polled at most once every
+    ``API_TOKEN_CACHE_GENERATION_POLL_SECONDS`` per worker.
+
     Parameters
     ----------
     raw_token : str
@@ -73,16 +185,27 @@ def validate_token(
 
     Security Notes
     --------------
-    - Tokens are stored as SHA256 hashes, never in plaintext.
+    - Tokens are stored as SHA256 hashes, never in plaintext. The cache is
+      keyed by the same hash.
     - The DB lookup uses an indexed hash column, so query time is
       consistent regardless of whether the token exists (no
-      timing side-channel for token discovery).
+      timing side-channel for token discovery). Only tokens that exist are
+      cached, so a cache hit reveals nothing about unknown tokens.
     - Subsequent checks (revoked, expired) only execute after a
       matching hash is found, so they reveal status of an already-
       known token — not useful for discovering valid tokens.
+    - Expiration is checked on every call, including cache hits.
     - Never logs raw tokens.
     """
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    token_hash = hash_token(raw_token)
+    generation = _token_cache.sync_generation(db)
+
+    entry = _token_cache.get(token_hash)
+    if entry is not None:
+        if not _is_token_usable(entry, check_expiration=check_expiration):
+            return None
+
+        return _attach_cached_user(db, entry)
 
     # Look up token by hash (indexed column — consistent query time).
     token = db.query(ApiToken).filter(ApiToken.token_hash == token_hash).first()
@@ -90,24 +213,103 @@ def validate_token(
     if not token:
         return None
 
-    if token.revoked:
-        return None
-
-    if check_expiration and token.expires_at:
-        if datetime.now(timezone.utc) > token.expires_at:
-            return None
-
     user = db.query(User).filter(User.id == token.user_id).first()
 
-    if not user or not user.is_active:
+    if not user:
         return None
 
-    if user.role != UserRole.SERVICE_ACCOUNT:
+    # Revoked and expired tokens are cached too, so retries are rejected
+    # without touching the database.
+    entry = _CachedToken(
+        user_id=user.id,
+        role=user.role,
+        is_active=user.is_active,
+        expires_at=token.expires_at,
+        revoked=token.revoked,
+        user_values={
+            attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+        },
+        cached_until=time.monotonic() + settings.api_token_cache_ttl_seconds,
+        generation=generation,
+    )
+    _token_cache.put(token_hash, entry)
+
+    if not _is_token_usable(entry, check_expiration=check_expiration):
         return None
 
     return user
 
 
+def commit_token_revocation(db: Session) -> None:
+    """Commit pending API token revocations and invalidate cached tokens.
+
+    Bumps the shared generation counter in the same transaction, so every
+    worker drops its verification cache on its next poll, and clears this
+    worker's cache immediately.
+
+    Parameters
+    ----------
+    db : Session
+        Database session holding the revoked tokens
+    """
+    generation = db.execute(_bump_generation_stmt()).scalar_one()
+    db.commit()
+
+    _token_cache.reset(generation)
+
+
+async def commit_token_invalidation(db: AsyncSession) -> None:
+    """Invalidate cached tokens after a user's verification state changed.
+
+    Cache entries hold each user's ``is_active`` flag and role, so
+    deactivating a user, changing a role, or deleting a user must bump the
+    same generation counter as a revocation.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Async database session; the bump is committed on it.
+    """
+    generation = (await db.execute(_bump_generation_stmt())).scalar_one()
+    await db.commit()
+
+    _token_cache.reset(generation)
+
+
+def clear_token_cache() -> None:
+    """Drop every entry from this worker's token verification cache."""
+    _token_cache.clear()
+
+
+def _bump_generation_stmt() -> ReturningInsert[tuple[int]]:
+    stmt = pg_insert(ApiTokenGeneration).values(id=_GENERATION_ROW_ID, generation=1)
+
+    return stmt.on_conflict_do_update(
+        index_elements=[ApiTokenGeneration.id],
+        set_={"generation": ApiTokenGeneration.generation + 1},
+    ).returning(ApiTokenGeneration.generation)
+
+
+def _is_token_usable(entry: _CachedToken, *, check_expiration: bool) -> bool:
+    if entry.revoked:
+        return False
+
+    if check_expiration and entry.expires_at:
+        if datetime.now(timezone.utc) > entry.expires_at:
+            return False
+
+    return entry.is_active and entry.role == UserRole.SERVICE_ACCOUNT
+
+
+def _attach_cached_user(db: Session, entry: _CachedToken) -> User:
+    # Rebuild the user from cached column values and merge it without a
+    # SELECT; relationships stay unloaded and load lazily if accessed.
+    user = User(**entry.user_values)
+    make_transient_to_detached(user)
+
+    return db.merge(user, load=False)
+
+
 def hash_token(raw_token: str) -> str:
     """
     Compute SHA256 hash of a token.
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, cast
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
@@ -11,8 +10,13 @@ from sqlalchemy.orm import Session
 from app.common.dependencies import get_database_session
 from app.core.database_async import get_async_session
 from app.core.logger import _setup_custom_logger
+from app.core.profiling import authorize_profile_request
 from app.features.user.auth.oauth import GITHUB_OAUTH_BACKEND
-from app.features.user.auth.token import JWT_BEARER_BACKEND, validate_token
+from app.features.user.auth.token import (
+    JWT_BEARER_BACKEND,
+    commit_token_invalidation,
+    validate_token,
+)
 from app.features.user.models import OAuthAccount, User, UserRole
 
 logger = _setup_custom_logger(__name__)
@@ -22,26 +26,26 @@ async def get_user_db(session: AsyncSession = Depends(get_async_session)):  # no
     yield SQLAlchemyUserDatabase(session, User, OAuthAccount)
 
 
+# User fields cached alongside API tokens; changing them invalidates the cache.
+_TOKEN_CACHED_USER_FIELDS = frozenset({"is_active", "role"})
+
+
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     async def on_after_register(self, user: User, request=None):
         logger.info(f"✅ New GitHub user registered: {user.email}")
 
-    async def refresh_github_org_membership(
-        self,
-        user: User,
-        *,
-        is_verified_member: bool,
-        checked_at: datetime | None = None,
-    ) -> User:
-        membership_checked_at = checked_at or datetime.now(timezone.utc)
-
-        return await self.user_db.update(
-            user,
-            {
-                "has_verified_e3sm_membership": is_verified_member,
-                "github_org_membership_checked_at": membership_checked_at,
-            },
-        )
+    async def on_after_update(
+        self, user: User, update_dict: dict[str, Any], request=None
+    ):
+        if _TOKEN_CACHED_USER_FIELDS & update_dict.keys():
+            await commit_token_invalidation(self._session)
+
+    async def on_after_delete(self, user: User, request=None):
+        await commit_token_invalidation(self._session)
+
+    @property
+    def _session(self) -> AsyncSession:
+        return cast(SQLAlchemyUserDatabase, self.user_db).session
 
 
 async def get_user_manager(user_db=Depends(get_user_db)):  # noqa: B008
@@ -91,12 +95,11 @@ async def current_active_user(
     HTTPException
         401 Unauthorized if neither authentication method succeeds
     """
-    if oauth_user is not None:
-        return oauth_user
-
-    user = _resolve_api_token_user(request, db, allow_missing=False)
+    user = oauth_user or _resolve_api_token_user(request, db, allow_missing=False)
     assert user is not None
 
+    authorize_profile_request(is_admin=user.role == UserRole.ADMIN)
+
     return user
 
 
@@ -107,10 +110,10 @@ async def optional_current_user(
 ) -> Optional[User]:
     """Optional auth dependency supporting OAuth and API tokens."""
 
-    if oauth_user is not None:
-        return oauth_user
+    user = oauth_user or _resolve_api_token_user(request, db, allow_missing=True)
+    authorize_profile_request(is_admin=user is not None and user.role == UserRole.ADMIN)
 
-    return _resolve_api_token_user(request, db, allow_missing=True)
+    return user
 
 
 def can_edit_managed_content(user: User | None) -> bool:
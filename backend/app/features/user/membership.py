@@ -0,0 +1,356 @@
+"""Background verification of E3SM GitHub organization membership.
+
+Membership gates who may edit human-managed content, but checking it costs a
+GitHub API round-trip. Results are stored on the user with the time of the
+check and treated as fresh for ``GITHUB_ORG_MEMBERSHIP_MAX_AGE_SECONDS``.
+Login schedules a refresh after the response is sent when the stored result
+is stale, and ``refresh_stale_memberships`` re-verifies stale users in
+batches using their stored OAuth tokens, stopping when GitHub reports a rate
+limit. Indeterminate results (network errors, 5xx, revoked tokens) never
+overwrite the stored state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+from uuid import UUID
+
+from fastapi import status
+from httpx import AsyncClient, HTTPError, Response
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database_async import AsyncSessionLocal
+from app.core.logger import _setup_custom_logger
+from app.features.user.models import OAuthAccount, User, UserRole
+
+logger = _setup_custom_logger(__name__)
+
+E3SM_GITHUB_ORG = "E3SM-Project"
+GitHubOrgMembershipState = Literal[True, False, None]
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@dataclass(frozen=True)
+class GitHubMembershipCheck:
+    """Result of one GitHub membership lookup."""
+
+    state: GitHubOrgMembershipState
+    rate_limited: bool = False
+
+
+@dataclass
+class MembershipRefreshReport:
+    """Outcome counts for one bulk membership refresh."""
+
+    selected: int = 0
+    verified: int = 0
+    unverified: int = 0
+    indeterminate: int = 0
+    deferred: int = 0
+
+
+def is_membership_stale(user: User, now: datetime | None = None) -> bool:
+    """Return whether the user's stored membership result needs a refresh.
+
+    Parameters
+    ----------
+    user : User
+        The user whose stored membership is checked.
+    now : datetime | None, optional
+        Reference time (default: the current UTC time).
+
+    Returns
+    -------
+    bool
+        True when membership was never checked or was checked more than
+        ``GITHUB_ORG_MEMBERSHIP_MAX_AGE_SECONDS`` ago.
+    """
+    checked_at = user.github_org_membership_checked_at
+    if checked_at is None:
+        return True
+
+    now = now or datetime.now(timezone.utc)
+    max_age = timedelta(seconds=settings.github_org_membership_max_age_seconds)
+
+    return now - checked_at >= max_age
+
+
+async def check_e3sm_membership(
+    client: AsyncClient, access_token: str
+) -> GitHubMembershipCheck:
+    """Look up the token owner's E3SM organization membership.
+
+    Parameters
+    ----------
+    client : AsyncClient
+        HTTP client used for the request.
+    access_token : str
+        The user's GitHub OAuth access token.
+
+    Returns
+    -------
+    GitHubMembershipCheck
+        ``state`` is True for active members, False when GitHub reports no
+        membership, and None when the result is indeterminate.
+    """
+    try:
+        response = await client.get(
+            f"{settings.github_api_base_url}/user/memberships/orgs/{E3SM_GITHUB_ORG}",
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+        )
+    except HTTPError:
+        return GitHubMembershipCheck(state=None)
+
+    if _is_rate_limited(response):
+        return GitHubMembershipCheck(state=None, rate_limited=True)
+
+    if response.status_code == status.HTTP_404_NOT_FOUND:
+        return GitHubMembershipCheck(state=False)
+
+    if response.status_code >= status.HTTP_400_BAD_REQUEST:
+        return GitHubMembershipCheck(state=None)
+
+    try:
+        payload = response.json()
+    except ValueError:
+        return GitHubMembershipCheck(state=None)
+
+    return GitHubMembershipCheck(state=payload.get("state") == "active")
+
+
+async def refresh_user_membership(
+    user_id: UUID,
+    access_token: str,
+    *,
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> GitHubOrgMembershipState:
+    """Re-check and store one user's membership, e.g. after login.
+
+    Parameters
+    ----------
+    user_id : UUID
+        ID of the user to refresh.
+    access_token : str
+        The user's GitHub OAuth access token.
+    session_factory : SessionFactory, optional
+        Factory for the async session used to store the result.
+
+    Returns
+    -------
+    GitHubOrgMembershipState
+        The stored state, or None when the result was indeterminate and the
+        stored state was left unchanged.
+    """
+    async with _github_client() as client:
+        check = await check_e3sm_membership(client, access_token)
+
+    if check.state is None:
+        logger.info(
+            "GitHub membership for user %s is indeterminate; keeping stored state",
+            user_id,
+        )
+        return None
+
+    async with session_factory() as db:
+        await _store_memberships(db, {user_id: check.state})
+
+    return check.state
+
+
+async def select_stale_memberships(
+    db: AsyncSession, *, now: datetime | None = None, limit: int | None = None
+) -> list[tuple[UUID, str]]:
+    """Return GitHub-linked users whose membership result is stale.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Active database session.
+    now : datetime | None, optional
+        Reference time (default: the current UTC time).
+    limit : int | None, optional
+        Maximum number of users to return (default: no limit).
+
+    Returns
+    -------
+    list[tuple[UUID, str]]
+        ``(user_id, access_token)`` pairs, never-checked and oldest first.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=settings.github_org_membership_max_age_seconds)
+    users = User.__table__.c
+    oauth_accounts = OAuthAccount.__table__.c
+    checked_at = users.github_org_membership_checked_at
+
+    stmt = (
+        select(users.id, oauth_accounts.access_token)
+        .join(OAuthAccount.__table__, oauth_accounts.user_id == users.id)
+        .where(
+            oauth_accounts.oauth_name == "github",
+            users.is_active.is_(True),
+            users.role != UserRole.SERVICE_ACCOUNT,
+            or_(checked_at.is_(None), checked_at <= cutoff),
+        )
+        .order_by(checked_at.asc().nulls_first(), users.id)
+    )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    return [(user_id, token) for user_id, token in await db.execute(stmt)]
+
+
+async def refresh_stale_memberships(
+    *,
+    limit: int | None = None,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+    session_factory: SessionFactory = AsyncSessionLocal,
+) -> MembershipRefreshReport:
+    """Re-verify stale memberships in batches, stopping on a rate limit.
+
+    Each batch is checked concurrently over one pooled client and stored with
+    at most two UPDATE statements. Once GitHub reports a rate limit, checks
+    that have not started are skipped and the remaining users are counted as
+    deferred, so the next run picks them up.
+
+    Parameters
+    ----------
+    limit : int | None, optional
+        Maximum number of users to refresh (default: no limit).
+    batch_size : int | None, optional
+        Users checked and stored per batch (default:
+        ``GITHUB_ORG_MEMBERSHIP_REFRESH_BATCH_SIZE``).
+    concurrency : int | None, optional
+        Maximum GitHub requests in flight (default:
+        ``GITHUB_ORG_MEMBERSHIP_REFRESH_CONCURRENCY``).
+    session_factory : SessionFactory, optional
+        Factory for the async sessions used by the run.
+
+    Returns
+    -------
+    MembershipRefreshReport
+        Counts of verified, unverified, indeterminate, and deferred users.
+    """
+    report = MembershipRefreshReport()
+    batch_size = batch_size or settings.github_org_membership_refresh_batch_size
+    semaphore = asyncio.Semaphore(
+        concurrency or settings.github_org_membership_refresh_concurrency
+    )
+    rate_limited = asyncio.Event()
+
+    async with session_factory() as db:
+        candidates = await select_stale_memberships(db, limit=limit)
+
+    report.selected = len(candidates)
+
+    async def check(client: AsyncClient, access_token: str) -> GitHubMembershipCheck:
+        async with semaphore:
+            if rate_limited.is_set():
+                return GitHubMembershipCheck(state=None, rate_limited=True)
+
+            result = await check_e3sm_membership(client, access_token)
+            if result.rate_limited:
+                rate_limited.set()
+
+            return result
+
+    async with _github_client() as client:
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start : start + batch_size]
+            checks = await asyncio.gather(
+                *(check(client, access_token) for _, access_token in batch)
+            )
+            results = _tally_checks(report, batch, checks)
+
+            if results:
+                async with session_factory() as db:
+                    await _store_memberships(db, results)
+
+            if rate_limited.is_set():
+                report.deferred += len(candidates) - start - len(batch)
+                logger.warning(
+                    "GitHub rate limit reached; deferring %d membership check(s)",
+                    report.deferred,
+                )
+                break
+
+    logger.info(
+        "github_membership_refresh selected=%d verified=%d unverified=%d "
+        "indeterminate=%d deferred=%d",
+        report.selected,
+        report.verified,
+        report.unverified,
+        report.indeterminate,
+        report.deferred,
+    )
+
+    return report
+
+
+def _github_client() -> AsyncClient:
+    return AsyncClient(timeout=settings.github_api_timeout_seconds)
+
+
+def _is_rate_limited(response: Response) -> bool:
+    if response.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+        return True
+
+    return response.status_code == status.HTTP_403_FORBIDDEN and (
+        response.headers.get("x-ratelimit-remaining") == "0"
+        or "retry-after" in response.headers
+    )
+
+
+def _tally_checks(
+    report: MembershipRefreshReport,
+    batch: Sequence[tuple[UUID, str]],
+    checks: Sequence[GitHubMembershipCheck],
+) -> dict[UUID, bool]:
+    results: dict[UUID, bool] = {}
+
+    for (user_id, _), result in zip(batch, checks, strict=True):
+        if result.rate_limited:
+            report.deferred += 1
+        elif result.state is None:
+            report.indeterminate += 1
+        else:
+            results[user_id] = result.state
+            if result.state:
+                report.verified += 1
+            else:
+                report.unverified += 1
+
+    return results
+
+
+async def _store_memberships(db: AsyncSession, results: dict[UUID, bool]) -> None:
+    checked_at = datetime.now(timezone.utc)
+
+    for is_member in (True, False):
+        user_ids = [user_id for user_id, state in results.items() if state is is_member]
+        if not user_ids:
+            continue
+
+        await db.execute(
+            update(User)
+            .where(User.__table__.c.id.in_(user_ids))
+            .values(
+                has_verified_e3sm_membership=is_member,
+                github_org_membership_checked_at=checked_at,
+            )
+        )
+
+    await db.commit()
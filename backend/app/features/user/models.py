@@ -6,7 +6,7 @@ from fastapi_users.db import (
     SQLAlchemyBaseOAuthAccountTableUUID,
     SQLAlchemyBaseUserTableUUID,
 )
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -111,3 +111,19 @@ class ApiToken(Base):
 
     def __repr__(self) -> str:
         return f"<ApiToken id={self.id} name={self.name!r} user_id={self.user_id}>"
+
+
+class ApiTokenGeneration(Base):
+    """Single-row counter bumped whenever API tokens are revoked.
+
+    Each worker caches token verifications in memory and polls this counter,
+    dropping its cache when the value changes so a revocation made on another
+    worker takes effect without waiting for cache entries to expire.
+    """
+
+    __tablename__ = "api_token_generation"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    generation: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
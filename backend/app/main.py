@@ -1,16 +1,31 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.health import router as health_router
 from app.api.meta import router as meta_router
+from app.api.metrics import router as metrics_router
+from app.api.profiles import router as profiles_router
 from app.api.version import API_BASE
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
 from app.core.logger import _setup_root_logger
+from app.core.metrics import MetricsMiddleware, mark_process_dead
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.tracing import TraceIdMiddleware
+from app.features.assistant.api import case_router as assistant_case_router
 from app.features.assistant.api import router as assistant_router
+from app.features.assistant.orchestrator import (
+    start_summary_llm_generator,
+    stop_summary_llm_generator,
+)
 from app.features.ingestion.api import router as ingestion_router
 from app.features.machine.api import router as machine_router
 from app.features.pace.api import router as pace_router
+from app.features.pace.resolver import close_pace_client
 from app.features.simulation.api import (
     case_router,
     diagnostics_router,
@@ -20,10 +35,22 @@ from app.features.user.api.oauth import auth_router, user_router
 from app.features.user.api.token import router as token_router
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Keep one pooled LLM client per worker for the app's lifetime.
+    await start_summary_llm_generator()
+    try:
+        yield
+    finally:
+        await stop_summary_llm_generator()
+        await close_pace_client()
+        mark_process_dead()
+
+
 def create_app() -> FastAPI:
     _setup_root_logger()
 
-    app = FastAPI(title="SimBoard API")
+    app = FastAPI(title="SimBoard API", lifespan=lifespan)
 
     # Register custom exception handlers that map SQLAlchemy errors to HTTP
     # responses.
@@ -38,10 +65,26 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Count SQL statements and database time per request.
+    if settings.query_stats_enabled:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # Record request latency per route for /metrics.
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+    # Sample slow or admin-requested requests (see app.core.profiling).
+    app.add_middleware(ProfilingMiddleware)
+
+    # Bind a trace ID to each request for log correlation. Added last so it is
+    # the outermost middleware and the other middlewares' logs carry it too.
+    app.add_middleware(TraceIdMiddleware)
+
     # Register routers.
     app.include_router(simulation_router, prefix=API_BASE)
     app.include_router(diagnostics_router, prefix=API_BASE)
     app.include_router(assistant_router, prefix=API_BASE)
+    app.include_router(assistant_case_router, prefix=API_BASE)
     app.include_router(case_router, prefix=API_BASE)
     app.include_router(machine_router, prefix=API_BASE)
     app.include_router(pace_router, prefix=API_BASE)
@@ -51,6 +94,10 @@ def create_app() -> FastAPI:
     app.include_router(ingestion_router, prefix=API_BASE)
     app.include_router(meta_router, prefix=API_BASE)
     app.include_router(health_router, prefix=API_BASE)
+    app.include_router(profiles_router, prefix=API_BASE)
+
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, prefix=API_BASE)
 
     return app
 
@@ -0,0 +1,79 @@
+"""Precompute LLM simulation summaries into the summary cache.
+
+Summarizes simulations that have no cached summary for the configured
+provider, model, and prompt version. Runs are resumable: progress is the
+cache table itself, so an interrupted run picks up whatever is still missing.
+
+Usage:
+    uv run python -m app.scripts.assistant.precompute_summaries
+
+Optional:
+    --simulation-id <uuid>   (repeatable) only summarize these simulations
+    --limit 500              stop after this many simulations
+    --concurrency 4          simulations summarized at once
+    --refresh                regenerate summaries that are already cached
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from app.features.assistant.orchestrator import (
+    start_summary_llm_generator,
+    stop_summary_llm_generator,
+)
+from app.features.assistant.precompute import (
+    SummaryPrecomputeReport,
+    precompute_simulation_summaries,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Precompute LLM simulation summaries into the summary cache."
+    )
+    parser.add_argument(
+        "--simulation-id", dest="simulation_ids", action="append", type=UUID
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--refresh", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        _run(
+            args.simulation_ids,
+            concurrency=args.concurrency,
+            limit=args.limit,
+            refresh=args.refresh,
+        )
+    )
+
+    print(
+        f"Selected {report.selected} simulation(s): {report.generated} generated, "
+        f"{report.cached} already cached, {report.fallback} fell back, "
+        f"{report.failed} failed."
+    )
+
+    return 1 if report.failed else 0
+
+
+async def _run(
+    simulation_ids: list[UUID] | None,
+    *,
+    concurrency: int | None,
+    limit: int | None,
+    refresh: bool,
+) -> SummaryPrecomputeReport:
+    await start_summary_llm_generator()
+    try:
+        return await precompute_simulation_summaries(
+            simulation_ids, concurrency=concurrency, limit=limit, refresh=refresh
+        )
+    finally:
+        await stop_summary_llm_generator()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
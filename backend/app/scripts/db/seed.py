@@ -4,18 +4,30 @@ SimBoard Development Seeder
 Seeds the database with case, simulation, artifact, and external link data
 from a JSON file. Safe to run only in non-production environments.
 
+Optionally adds a large synthetic catalog on top of the JSON data, e.g. for
+load testing the read endpoints.
+
 Usage:
     ENV=development python -m app.seed
+
+Optional (synthetic catalog):
+    --synthetic-cases 5000              cases to generate
+    --simulations-per-case 20           simulations per synthetic case
+    --artifacts-per-simulation 3        artifacts per synthetic simulation
+    --links-per-simulation 2            external links per synthetic simulation
 """
 
+import argparse
 import json
 import os
+import random
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from uuid import UUID, uuid4
 
 from pydantic import AnyUrl, HttpUrl
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401 # required to register models with SQLAlchemy
@@ -24,6 +36,13 @@ from app.core.database import SessionLocal
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
 from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
+from app.features.simulation.case_stats import rebuild_case_stats
+from app.features.simulation.enums import (
+    ArtifactKind,
+    ExternalLinkKind,
+    SimulationStatus,
+    SimulationType,
+)
 from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
 from app.features.simulation.schemas import (
     ArtifactCreate,
@@ -46,6 +65,9 @@ DEV_EMAIL = f"simboard-dev@{settings.domain}"
 DEV_OAUTH_PROVIDER = "github"
 DEV_HPC_USERNAME = "simboard-dev"
 
+SYNTHETIC_CASE_PREFIX = "synthetic"
+SYNTHETIC_BATCH_CASES = 100
+
 
 # --------------------------------------------------------------------
 # 🧑‍💻 Create a dummy OAuth user (GitHub-style)
@@ -346,13 +368,271 @@ def _seed_simulation(
     return sim
 
 
+# --------------------------------------------------------------------
+# 🏗️ Synthetic catalog for load testing
+# --------------------------------------------------------------------
+_SYNTHETIC_COMPSETS = (
+    ("WCYCL1850", "ne30pg2_r05_IcoswISC30E3r5", "ne30np4.pg2_r05_IcoswISC30E3r5"),
+    ("F2010", "ne30pg2_oECv3", "ne30np4.pg2_oECv3"),
+    ("WCYCL20TR", "ne30pg2_r05_IcoswISC30E3r5", "ne30np4.pg2_r05_IcoswISC30E3r5"),
+)
+_SYNTHETIC_EXPERIMENTS = ("historical", "piControl", "amip", "ssp585")
+_SYNTHETIC_STATUSES = (
+    SimulationStatus.COMPLETED,
+    SimulationStatus.COMPLETED,
+    SimulationStatus.COMPLETED,
+    SimulationStatus.FAILED,
+    SimulationStatus.RUNNING,
+)
+_SYNTHETIC_ARTIFACT_KINDS = tuple(ArtifactKind)
+_SYNTHETIC_LINK_KINDS = tuple(ExternalLinkKind)
+
+
+def seed_synthetic_catalog(
+    db: Session,
+    user_id: UUID,
+    *,
+    cases: int,
+    simulations_per_case: int,
+    artifacts_per_simulation: int = 3,
+    links_per_simulation: int = 2,
+    seed: int = 0,
+) -> tuple[int, int, int, int]:
+    """Bulk-insert a synthetic catalog of cases, simulations, and children.
+
+    Rows are written with multi-row INSERTs in batches of
+    ``SYNTHETIC_BATCH_CASES`` cases, each committed on its own so memory
+    stays flat for large catalogs. Every case gets one ingestion marked
+    ``seed:synthetic/<case>``, so ``rollback_seed`` removes the catalog, and
+    its ``case_stats`` row is rebuilt.
+
+    Parameters
+    ----------
+    db : Session
+        SQLAlchemy database session.
+    user_id : UUID
+        User recorded as creator of the simulations and ingestions.
+    cases : int
+        Number of cases to create, spread across all machines.
+    simulations_per_case : int
+        Simulations per case.
+    artifacts_per_simulation : int, optional
+        Artifacts per simulation.
+    links_per_simulation : int, optional
+        External links per simulation.
+    seed : int, optional
+        Seed for the generated values, so catalogs are reproducible.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        Counts of cases, simulations, artifacts, and links inserted.
+    """
+    machine_ids = list(db.execute(select(Machine.id).order_by(Machine.name)).scalars())
+    if not machine_ids:
+        raise ValueError("No machines found; run the migrations first.")
+
+    rng = random.Random(seed)
+    totals = [0, 0, 0, 0]
+
+    for start in range(0, cases, SYNTHETIC_BATCH_CASES):
+        batch = range(start, min(start + SYNTHETIC_BATCH_CASES, cases))
+        rows = _build_synthetic_batch(
+            rng,
+            batch,
+            machine_ids,
+            user_id,
+            simulations_per_case=simulations_per_case,
+            artifacts_per_simulation=artifacts_per_simulation,
+            links_per_simulation=links_per_simulation,
+        )
+
+        for model, key in (
+            (Case, "cases"),
+            (Ingestion, "ingestions"),
+            (Simulation, "simulations"),
+            (Artifact, "artifacts"),
+            (ExternalLink, "links"),
+        ):
+            if rows[key]:
+                db.execute(insert(model), rows[key])
+
+        rebuild_case_stats(db, [row["id"] for row in rows["cases"]])
+        db.commit()
+
+        for index, key in enumerate(("cases", "simulations", "artifacts", "links")):
+            totals[index] += len(rows[key])
+
+        print(f"   … {totals[0]}/{cases} synthetic cases")
+
+    return totals[0], totals[1], totals[2], totals[3]
+
+
+def _build_synthetic_batch(
+    rng: random.Random,
+    case_indexes: range,
+    machine_ids: list[UUID],
+    user_id: UUID,
+    *,
+    simulations_per_case: int,
+    artifacts_per_simulation: int,
+    links_per_simulation: int,
+) -> dict[str, list[dict]]:
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows: dict[str, list[dict]] = {
+        "cases": [],
+        "ingestions": [],
+        "simulations": [],
+        "artifacts": [],
+        "links": [],
+    }
+
+    for case_index in case_indexes:
+        experiment = _SYNTHETIC_EXPERIMENTS[case_index % len(_SYNTHETIC_EXPERIMENTS)]
+        case_name = f"{SYNTHETIC_CASE_PREFIX}.LR.{experiment}_{case_index:05d}"
+        machine_id = machine_ids[case_index % len(machine_ids)]
+        case_id = uuid4()
+        ingestion_id = uuid4()
+        case_created = base_time + timedelta(hours=case_index)
+        compset, grid_name, grid_resolution = rng.choice(_SYNTHETIC_COMPSETS)
+
+        rows["cases"].append(
+            {
+                "id": case_id,
+                "name": case_name,
+                "machine_id": machine_id,
+                "hpc_username": DEV_HPC_USERNAME,
+                "case_group": f"{SYNTHETIC_CASE_PREFIX}.group_{case_index % 50:02d}",
+                "created_at": case_created,
+                "updated_at": case_created,
+            }
+        )
+        rows["ingestions"].append(
+            {
+                "id": ingestion_id,
+                "source_type": IngestionSourceType.HPC_PATH,
+                "source_reference": f"seed:{SYNTHETIC_CASE_PREFIX}/{case_name}",
+                "machine_id": machine_id,
+                "triggered_by": user_id,
+                "status": IngestionStatus.SUCCESS,
+                "created_count": simulations_per_case,
+                "duplicate_count": 0,
+                "error_count": 0,
+                "created_at": case_created,
+            }
+        )
+
+        for sim_index in range(simulations_per_case):
+            simulation_id = uuid4()
+            created_at = case_created + timedelta(minutes=sim_index)
+            start_date = datetime(1850 + sim_index * 5, 1, 1, tzinfo=timezone.utc)
+            rows["simulations"].append(
+                {
+                    "id": simulation_id,
+                    "case_id": case_id,
+                    "execution_id": (
+                        f"{SYNTHETIC_CASE_PREFIX}-{case_index:05d}-{sim_index:04d}"
+                    ),
+                    "case_hash": f"{case_index:016x}",
+                    "compset": compset,
+                    "compset_alias": compset,
+                    "grid_name": grid_name,
+                    "grid_resolution": grid_resolution,
+                    "simulation_type": SimulationType.PRODUCTION,
+                    "status": rng.choice(_SYNTHETIC_STATUSES),
+                    "campaign": case_name.rsplit("_", 1)[0],
+                    "experiment_type": experiment,
+                    "initialization_type": "startup",
+                    "simulation_start_date": start_date,
+                    "simulation_end_date": start_date.replace(year=start_date.year + 5),
+                    "run_start_date": created_at - timedelta(hours=12),
+                    "run_end_date": created_at,
+                    "compiler": rng.choice(("intel", "gnu", "oneapi-ifx")),
+                    "git_repository_url": "https://github.com/E3SM-Project/E3SM",
+                    "git_branch": "master",
+                    "git_tag": f"v3.0.{rng.randrange(3)}",
+                    "git_commit_hash": f"{rng.getrandbits(160):040x}",
+                    "created_by": user_id,
+                    "last_updated_by": user_id,
+                    "ingestion_id": ingestion_id,
+                    "extra": {},
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+
+            output_root = f"/lcrc/group/e3sm/{DEV_HPC_USERNAME}/{case_name}"
+            for artifact_index in range(artifacts_per_simulation):
+                artifact_kind = _SYNTHETIC_ARTIFACT_KINDS[
+                    artifact_index % len(_SYNTHETIC_ARTIFACT_KINDS)
+                ]
+                rows["artifacts"].append(
+                    {
+                        "id": uuid4(),
+                        "simulation_id": simulation_id,
+                        "kind": artifact_kind,
+                        "uri": f"file://{output_root}/{artifact_kind.value}/{sim_index}",
+                        "label": f"{artifact_kind.value} {artifact_index}",
+                    }
+                )
+
+            for link_index in range(links_per_simulation):
+                link_kind = _SYNTHETIC_LINK_KINDS[
+                    link_index % len(_SYNTHETIC_LINK_KINDS)
+                ]
+                rows["links"].append(
+                    {
+                        "id": uuid4(),
+                        "simulation_id": simulation_id,
+                        "kind": link_kind,
+                        "url": (
+                            f"https://portal.nersc.gov/e3sm/{case_name}/"
+                            f"{link_kind.value}/{sim_index}"
+                        ),
+                        "label": f"{link_kind.value} {link_index}",
+                    }
+                )
+
+    return rows
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed the development database.")
+    parser.add_argument("--synthetic-cases", type=int, default=0)
+    parser.add_argument("--simulations-per-case", type=int, default=20)
+    parser.add_argument("--artifacts-per-simulation", type=int, default=3)
+    parser.add_argument("--links-per-simulation", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = _parse_args()
     db = SessionLocal()
     mock_filepath = str(Path(__file__).resolve().parent / "simulations.json")
 
     try:
         create_dev_oauth_user(db)  # ✅ always ensure dummy user exists
         seed_from_json(db, mock_filepath)
+
+        if args.synthetic_cases:
+            print(f"🏗️ Seeding {args.synthetic_cases} synthetic cases...")
+            # rollback_seed inside seed_from_json removes the dev user.
+            dev_user = create_dev_oauth_user(db)
+            counts = seed_synthetic_catalog(
+                db,
+                dev_user.id,
+                cases=args.synthetic_cases,
+                simulations_per_case=args.simulations_per_case,
+                artifacts_per_simulation=args.artifacts_per_simulation,
+                links_per_simulation=args.links_per_simulation,
+                seed=args.seed,
+            )
+            print(
+                "✅ Inserted {} synthetic cases with {} simulations, {} artifacts, "
+                "and {} links.".format(*counts)
+            )
     except Exception as e:
         print(f"❌ Seeding failed: {e}")
         db.rollback()
@@ -0,0 +1,639 @@
+"""Stage-by-stage benchmark of the archive ingestion pipeline.
+
+Generates synthetic E3SM performance archives of configurable size and
+ingests them through the same chunked path as the ingestion endpoints,
+timing each stage (extract, parse, resolve, persist) and recording
+throughput and the process's peak resident set size. Reports are written as
+JSON and compared against a stored baseline, so parser and ingestion changes
+can be checked for regressions before they reach large backfills. Database
+writes are flushed but never committed; the caller rolls them back, so a
+benchmark run leaves no rows behind.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import random
+import resource
+import shutil
+import sys
+import tarfile
+import time
+import zipfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.core.logger import _setup_custom_logger
+from app.core.metrics import sample_value
+from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
+from app.features.ingestion.ingest import (
+    detach_simulations,
+    iter_ingest_archive,
+    persist_simulations,
+)
+from app.features.ingestion.metrics import ingestion_stage
+from app.features.ingestion.models import Ingestion
+from app.features.simulation.case_stats import CaseStatsDelta
+from app.features.simulation.models import Case
+from app.features.user.models import User
+
+logger = _setup_custom_logger(__name__)
+
+ArchiveFormat = Literal["tar.gz", "zip", "dir"]
+
+BENCHMARK_STAGES = ("extract", "parse", "resolve", "persist")
+
+# Stages faster than this are dominated by timer and scheduler noise, so
+# smaller slowdowns are not reported as regressions.
+MIN_REGRESSION_SECONDS = 0.05
+
+_BASE_RUN_TIME = datetime(2025, 1, 6, 8, 0, 0, tzinfo=timezone.utc)
+_COMPILERS = ("intel", "gnu", "oneapi-ifx")
+_COMPSETS = (
+    ("WCYCL1850", "ne30pg2_r05_IcoswISC30E3r5", "ne30np4.pg2_r05_IcoswISC30E3r5"),
+    ("F2010", "ne30pg2_oECv3", "ne30np4.pg2_oECv3"),
+    ("WCYCL20TR", "ne30pg2_r05_IcoswISC30E3r5", "ne30np4.pg2_r05_IcoswISC30E3r5"),
+)
+_EXPERIMENTS = ("historical", "piControl", "amip", "ssp585")
+_TIMING_COMPONENTS = ("CPL", "ATM", "LND", "ICE", "OCN", "ROF", "GLC", "WAV", "IAC")
+
+
+@dataclass
+class StageTiming:
+    """Wall time and throughput of one benchmark stage.
+
+    Attributes
+    ----------
+    name : str
+        Stage name, one of ``BENCHMARK_STAGES``.
+    seconds : float
+        Wall-clock seconds spent in the stage, summed over all chunks.
+    items : int
+        Executions processed by the stage (for ``extract``, the executions
+        found in the extracted archive; for ``persist``, those created).
+    items_per_second : float
+        ``items / seconds``, or 0 when the stage took no measurable time.
+    peak_rss_mb : float
+        Process peak RSS after the stage last ran. Peak RSS never decreases,
+        so the first stage that raises it is the one that allocated the
+        memory.
+    """
+
+    name: str
+    seconds: float
+    items: int
+    items_per_second: float
+    peak_rss_mb: float
+
+
+@dataclass
+class IngestionBenchmarkReport:
+    """Result of one ingestion benchmark run."""
+
+    cases: int
+    executions: int
+    created: int
+    total_seconds: float
+    peak_rss_mb: float
+    stages: list[StageTiming] = field(default_factory=list)
+    chunks: int = 0
+    recorded_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IngestionBenchmarkReport:
+        stages = [StageTiming(**stage) for stage in data.get("stages", [])]
+
+        return cls(**{**data, "stages": stages})
+
+
+def generate_synthetic_archive(
+    output_dir: str | Path,
+    *,
+    cases: int,
+    executions_per_case: int,
+    machine: str = "chrysalis",
+    archive_format: ArchiveFormat = "tar.gz",
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic E3SM performance archive.
+
+    Every execution directory has the gzipped CaseDocs (``env_case.xml``,
+    ``env_build.xml``, ``env_run.xml``, ``README.case``), ``e3sm_timing``,
+    ``CaseStatus`` and ``GIT_*`` files the parsers expect, padded with
+    the unused entries and timing rows found in real archives.
+
+    Parameters
+    ----------
+    output_dir : str | Path
+        Directory the archive (and its staging directory) is written to.
+    cases : int
+        Number of case directories.
+    executions_per_case : int
+        Execution directories per case.
+    machine : str, optional
+        Machine name written to ``env_case.xml``; it must exist in the
+        database for the resolve stage to succeed.
+    archive_format : ArchiveFormat, optional
+        ``"tar.gz"``, ``"zip"``, or ``"dir"`` to return the extracted tree.
+    seed : int, optional
+        Seed for the per-execution variation, so runs are reproducible.
+
+    Returns
+    -------
+    Path
+        Path to the archive file, or to the directory for ``"dir"``.
+    """
+    output_dir = Path(output_dir)
+    source_dir = output_dir / "synthetic_archive"
+    rng = random.Random(seed)
+    job_id_base = rng.randrange(1_000_000, 9_000_000)
+
+    for case_index in range(cases):
+        experiment = _EXPERIMENTS[case_index % len(_EXPERIMENTS)]
+        case_name = f"v3.LR.{experiment}_{case_index:04d}"
+        case_hash = f"{rng.getrandbits(64):016x}"
+        compset, grid_name, grid_resolution = rng.choice(_COMPSETS)
+
+        for execution_index in range(executions_per_case):
+            job_id = job_id_base + case_index * executions_per_case + execution_index
+            run_end = _BASE_RUN_TIME + timedelta(
+                days=case_index, hours=execution_index * 6
+            )
+            execution_id = f"{job_id}.{run_end:%y%m%d-%H%M%S}"
+            _write_execution_dir(
+                source_dir / case_name / execution_id,
+                rng,
+                execution_id=execution_id,
+                case_name=case_name,
+                case_hash=case_hash,
+                machine=machine,
+                compset=compset,
+                grid_name=grid_name,
+                grid_resolution=grid_resolution,
+                run_end=run_end,
+            )
+
+    if archive_format == "dir":
+        return source_dir
+
+    archive_path = output_dir / f"synthetic_archive.{archive_format}"
+    _write_archive(source_dir, archive_path)
+    shutil.rmtree(source_dir)
+
+    return archive_path
+
+
+def run_ingestion_benchmark(
+    archive_path: str | Path,
+    work_dir: str | Path,
+    db: Session,
+    user: User,
+    *,
+    hpc_username: str | None = None,
+    chunk_size: int | None = None,
+) -> IngestionBenchmarkReport:
+    """Ingest an archive through the chunked ingestion path and time each stage.
+
+    The archive goes through ``iter_ingest_archive`` as in the ingestion
+    endpoints: each chunk is persisted, flushed, and detached from the
+    session before the next one is parsed, so the reported peak RSS is that
+    of the chunked path. Stage times are read from the
+    ``ingestion_stage_duration_seconds`` histogram the pipeline records, so
+    other ingestions must not run in the same process meanwhile. Database
+    writes are flushed but not committed; roll back ``db`` afterwards to
+    discard them.
+
+    Parameters
+    ----------
+    archive_path : str | Path
+        Archive file (.zip, .tar.gz, .tgz) or an already-extracted directory.
+    work_dir : str | Path
+        Directory the archive is extracted into.
+    db : Session
+        Database session used for the resolve and persist stages.
+    user : User
+        User recorded as creator of the benchmark simulations.
+    hpc_username : str | None, optional
+        Fallback HPC username for executions without one.
+    chunk_size : int | None, optional
+        Parsed executions per chunk; defaults to ``INGESTION_CHUNK_SIZE``.
+
+    Returns
+    -------
+    IngestionBenchmarkReport
+        Per-stage timings, throughput, and peak RSS.
+    """
+    stages = {
+        name: StageTiming(
+            name=name, seconds=0.0, items=0, items_per_second=0.0, peak_rss_mb=0.0
+        )
+        for name in BENCHMARK_STAGES
+    }
+    counts_before = {name: _stage_sample("count", name) for name in BENCHMARK_STAGES}
+    seconds_before = {name: _stage_sample("sum", name) for name in BENCHMARK_STAGES}
+    ingestion: Ingestion | None = None
+    case_ids: set[UUID] = set()
+    case_stats = CaseStatsDelta()
+    errors: list[dict[str, str]] = []
+    executions = created = chunks = 0
+    started = time.perf_counter()
+
+    for result in iter_ingest_archive(
+        archive_path, work_dir, db, hpc_username=hpc_username, chunk_size=chunk_size
+    ):
+        parsed = result.created_count + result.duplicate_count + len(result.errors)
+        executions += parsed
+        chunks += 1 if parsed else 0
+        errors.extend(result.errors)
+
+        if result.simulations:
+            if ingestion is None:
+                ingestion = _create_benchmark_ingestion(
+                    db, user, result.simulations[0].case_id
+                )
+
+            with ingestion_stage("persist"):
+                created_sims = persist_simulations(
+                    ingestion.id, result.simulations, db, user, hpc_username
+                )
+                db.flush()
+                case_stats.add(created_sims)
+
+            created += len(created_sims)
+            case_ids.update(sim.case_id for sim in created_sims)
+            detach_simulations(created_sims, db)
+
+        _record_stage_times(stages, seconds_before)
+
+    # Like the ingestion endpoint, apply the case stats once after all chunks.
+    with ingestion_stage("persist"):
+        case_stats.apply(db)
+    _record_stage_times(stages, seconds_before)
+
+    total_seconds = round(time.perf_counter() - started, 6)
+
+    if ingestion is not None:
+        ingestion.created_count = created
+        db.flush()
+
+    if errors:
+        logger.warning(
+            "Benchmark ingestion reported %d error(s); first: %s",
+            len(errors),
+            errors[0],
+        )
+
+    items = {"extract": executions, "parse": executions, "resolve": executions}
+    for stage in stages.values():
+        _set_stage_items(stage, items.get(stage.name, created))
+
+    return IngestionBenchmarkReport(
+        cases=len(case_ids),
+        executions=executions,
+        created=created,
+        total_seconds=total_seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        stages=[
+            stage
+            for stage in stages.values()
+            if _stage_sample("count", stage.name) > counts_before[stage.name]
+        ],
+        chunks=chunks,
+    )
+
+
+def compare_to_baseline(
+    report: IngestionBenchmarkReport,
+    baseline: IngestionBenchmarkReport,
+    *,
+    tolerance: float = 0.25,
+) -> list[str]:
+    """List the stages that regressed against a baseline report.
+
+    Stage times are compared per item, scaled to the current run's size, so
+    baselines recorded at a different archive size remain usable. Peak RSS
+    is only compared when both runs ingested the same number of executions.
+
+    Parameters
+    ----------
+    report : IngestionBenchmarkReport
+        The current run.
+    baseline : IngestionBenchmarkReport
+        The stored baseline run.
+    tolerance : float, optional
+        Allowed relative slowdown (default: 25%).
+
+    Returns
+    -------
+    list[str]
+        One human-readable line per regression; empty when none regressed.
+    """
+    regressions: list[str] = []
+    baseline_stages = {stage.name: stage for stage in baseline.stages}
+
+    for stage in report.stages:
+        reference = baseline_stages.get(stage.name)
+        if reference is None or not reference.items or not stage.items:
+            continue
+
+        expected = reference.seconds / reference.items * stage.items
+        slowdown = stage.seconds - expected
+        if slowdown > max(expected * tolerance, MIN_REGRESSION_SECONDS):
+            regressions.append(
+                f"{stage.name}: {stage.seconds:.3f}s for {stage.items} item(s), "
+                f"expected ~{expected:.3f}s from baseline "
+                f"({stage.items_per_second:.1f}/s vs "
+                f"{reference.items_per_second:.1f}/s)"
+            )
+
+    if (
+        report.executions == baseline.executions
+        and report.peak_rss_mb > baseline.peak_rss_mb * (1 + tolerance)
+    ):
+        regressions.append(
+            f"peak RSS: {report.peak_rss_mb:.1f} MiB vs "
+            f"{baseline.peak_rss_mb:.1f} MiB in baseline"
+        )
+
+    return regressions
+
+
+def _stage_sample(suffix: Literal["count", "sum"], stage: str) -> float:
+    """Return the stage histogram's observation count or total seconds."""
+    return sample_value(f"ingestion_stage_duration_seconds_{suffix}", stage=stage)
+
+
+def _record_stage_times(
+    stages: dict[str, StageTiming], seconds_before: dict[str, float]
+) -> None:
+    """Update the time of each stage, and its peak RSS if it ran since last call."""
+    peak_rss_mb = _peak_rss_mb()
+
+    for stage in stages.values():
+        seconds = round(
+            _stage_sample("sum", stage.name) - seconds_before[stage.name],
+            6,
+        )
+        if seconds != stage.seconds:
+            stage.seconds = seconds
+            stage.peak_rss_mb = peak_rss_mb
+
+
+def _set_stage_items(stage: StageTiming, items: int) -> None:
+    stage.items = items
+    stage.items_per_second = (
+        round(items / stage.seconds, 3) if stage.seconds > 0 else 0.0
+    )
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+    return round(peak / divisor, 1)
+
+
+def _create_benchmark_ingestion(db: Session, user: User, case_id: UUID) -> Ingestion:
+    case = db.get(Case, case_id)
+    if case is None:
+        raise LookupError(f"Case '{case_id}' not found.")
+
+    ingestion = Ingestion(
+        source_type=IngestionSourceType.BROWSER_UPLOAD,
+        source_reference=f"benchmark-{uuid4()}",
+        machine_id=case.machine_id,
+        triggered_by=user.id,
+        status=IngestionStatus.SUCCESS,
+        created_count=0,
+        duplicate_count=0,
+        error_count=0,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(ingestion)
+    db.flush()
+
+    return ingestion
+
+
+def _write_execution_dir(
+    execution_dir: Path,
+    rng: random.Random,
+    *,
+    execution_id: str,
+    case_name: str,
+    case_hash: str,
+    machine: str,
+    compset: str,
+    grid_name: str,
+    grid_resolution: str,
+    run_end: datetime,
+) -> None:
+    casedocs = execution_dir / "CaseDocs"
+    casedocs.mkdir(parents=True)
+    suffix = execution_id
+    case_root = f"/lcrc/group/e3sm/ac.benchmark/E3SMv3/{case_name}/case_scripts"
+    output_root = "/lcrc/group/e3sm/ac.benchmark/E3SMv3"
+    init_seconds = rng.uniform(60, 600)
+    run_seconds = rng.uniform(3_600, 40_000)
+    final_seconds = rng.uniform(1, 30)
+    run_start = run_end - timedelta(seconds=init_seconds + run_seconds + final_seconds)
+    succeeded = rng.random() > 0.1
+
+    _write_gzip(
+        casedocs / f"env_case.xml.{suffix}.gz",
+        _env_xml(
+            {
+                "CASE": case_name,
+                "CASE_HASH": case_hash,
+                "CASE_GROUP": case_name.rsplit("_", 1)[0],
+                "MACH": machine,
+                "REALUSER": "ac.benchmark",
+                "COMPSET": compset,
+                "CASEROOT": case_root,
+            },
+            rng,
+        ),
+    )
+    _write_gzip(
+        casedocs / f"env_build.xml.{suffix}.gz",
+        _env_xml(
+            {
+                "GRID": grid_resolution,
+                "COMPILER": rng.choice(_COMPILERS),
+                "MPILIB": "openmpi",
+                "CIME_OUTPUT_ROOT": output_root,
+            },
+            rng,
+        ),
+    )
+    _write_gzip(
+        casedocs / f"env_run.xml.{suffix}.gz",
+        _env_xml(
+            {
+                "RUN_TYPE": "startup",
+                "RUN_STARTDATE": "1850-01-01",
+                "STOP_OPTION": "nyears",
+                "STOP_N": str(rng.choice((1, 5, 10, 50))),
+                "RUNDIR": "$CIME_OUTPUT_ROOT/$CASE/run",
+                "DOUT_S_ROOT": "$CIME_OUTPUT_ROOT/$CASE/archive",
+                "POSTRUN_SCRIPT": f"{case_root}/post_run.sh",
+            },
+            rng,
+        ),
+    )
+    _write_gzip(
+        casedocs / f"README.case.{suffix}.gz",
+        f"{run_start:%Y-%m-%d %H:%M:%S}: ./create_newcase --case {case_name} "
+        f"--res {grid_name} --compset {compset} --mach {machine} "
+        "--project e3sm --handle-preexisting-dirs r\n"
+        f"{run_start:%Y-%m-%d %H:%M:%S}: ./case.setup\n"
+        f"{run_start:%Y-%m-%d %H:%M:%S}: ./case.build\n",
+    )
+    _write_gzip(
+        execution_dir / f"CaseStatus.{suffix}.gz",
+        f"{run_start:%Y-%m-%d %H:%M:%S}: case.setup success\n"
+        f"{run_start:%Y-%m-%d %H:%M:%S}: case.build success\n"
+        f"{run_start:%Y-%m-%d %H:%M:%S}: case.run starting {execution_id}\n"
+        f"{run_end:%Y-%m-%d %H:%M:%S}: case.run "
+        f"{'success' if succeeded else 'error'}\n",
+    )
+    _write_gzip(
+        execution_dir / f"e3sm_timing.{case_name}.{execution_id}.gz",
+        _timing_file(
+            rng,
+            execution_id=execution_id,
+            case_name=case_name,
+            machine=machine,
+            run_end=run_end,
+            init_seconds=init_seconds,
+            run_seconds=run_seconds,
+            final_seconds=final_seconds,
+        ),
+    )
+    commits = rng.randrange(1, 4000)
+    _write_gzip(
+        execution_dir / f"GIT_DESCRIBE.{suffix}.gz",
+        f"v3.0.{rng.randrange(0, 3)}-{commits}-g{rng.getrandbits(40):010x}\n",
+    )
+    _write_gzip(
+        execution_dir / f"GIT_CONFIG.{suffix}.gz",
+        "[core]\n\trepositoryformatversion = 0\n\tbare = false\n"
+        '[remote "origin"]\n'
+        "\turl = https://github.com/E3SM-Project/E3SM.git\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+    )
+    _write_gzip(
+        execution_dir / f"GIT_STATUS.{suffix}.gz",
+        "On branch master\nYour branch is up to date with 'origin/master'.\n\n"
+        "nothing to commit, working tree clean\n",
+    )
+
+
+def _env_xml(entries: dict[str, str], rng: random.Random) -> str:
+    lines = ['<?xml version="1.0"?>', '<file id="env.xml" version="2.0">']
+    lines.append('  <group id="case_desc">')
+
+    for entry_id, value in entries.items():
+        lines.append(f'    <entry id="{entry_id}" value="{value}">')
+        lines.append("      <type>char</type>")
+        lines.append(f"      <desc>{entry_id} setting</desc>")
+        lines.append("    </entry>")
+
+    # Real env_*.xml files carry dozens of entries the parsers never read.
+    for index in range(40):
+        lines.append(
+            f'    <entry id="UNUSED_SETTING_{index}" value="{rng.randrange(1000)}">'
+        )
+        lines.append("      <type>integer</type>")
+        lines.append("      <valid_values>0,1000</valid_values>")
+        lines.append("    </entry>")
+
+    lines.extend(["  </group>", "</file>", ""])
+
+    return "\n".join(lines)
+
+
+def _timing_file(
+    rng: random.Random,
+    *,
+    execution_id: str,
+    case_name: str,
+    machine: str,
+    run_end: datetime,
+    init_seconds: float,
+    run_seconds: float,
+    final_seconds: float,
+) -> str:
+    lines = [
+        "---------------- TIMING PROFILE ---------------------",
+        f"  Case        : {case_name}",
+        f"  LID         : {execution_id}",
+        f"  Machine     : {machine}",
+        "  Caseroot    : /lcrc/group/e3sm/ac.benchmark/case_scripts",
+        "  Timeroot    : /lcrc/group/e3sm/ac.benchmark/case_scripts/Tools",
+        "  User        : ac.benchmark",
+        f"  Curr Date   : {run_end:%a %b %d %H:%M:%S %Y}",
+        "  grid        : a%ne30np4.pg2_l%r05_oi%IcoswISC30E3r5",
+        "",
+        f"  Init Time   :   {init_seconds:10.3f} seconds",
+        f"  Run Time    :   {run_seconds:10.3f} seconds",
+        f"  Final Time  :   {final_seconds:10.3f} seconds",
+        "",
+        "  component       comp_pes    root_pe   tasks  x threads instances",
+    ]
+
+    for component in _TIMING_COMPONENTS:
+        lines.append(
+            f"  {component.lower():<6} = {component:<6} {rng.randrange(64, 4096):>8} "
+            f"{0:>8} {rng.randrange(64, 4096):>8} x 1 1"
+        )
+
+    lines.append("")
+    lines.append("  Overall Metrics:")
+
+    # Real timing files end with hundreds of per-component timer rows.
+    for index in range(150):
+        component = _TIMING_COMPONENTS[index % len(_TIMING_COMPONENTS)]
+        lines.append(
+            f"    {component} Run Time: {rng.uniform(1, 10_000):10.3f} seconds "
+            f"{rng.uniform(0, 5):8.3f} seconds/mday {rng.uniform(1, 50):8.2f} myears/wday"
+        )
+
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def _write_gzip(path: Path, content: str) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        handle.write(content)
+
+
+def _write_archive(source_dir: Path, archive_path: Path) -> None:
+    members: list[tuple[Path, str]] = [
+        (Path(root) / name, str((Path(root) / name).relative_to(source_dir)))
+        for root, _, files in os.walk(source_dir)
+        for name in sorted(files)
+    ]
+
+    if archive_path.name.endswith(".zip"):
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            for path, arcname in members:
+                zip_file.write(path, arcname)
+        return
+
+    with tarfile.open(archive_path, "w:gz") as tar_file:
+        for path, arcname in members:
+            tar_file.add(path, arcname=arcname)
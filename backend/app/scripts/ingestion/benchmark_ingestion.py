@@ -0,0 +1,152 @@
+"""Benchmark the ingestion pipeline against a synthetic archive.
+
+Generates an archive of ``--cases`` x ``--executions-per-case`` executions,
+ingests it chunk by chunk as the ingestion endpoints do, and prints
+per-stage throughput and peak RSS.
+Database writes are rolled back. With ``--baseline`` the run is compared
+against a stored report and the script exits with status 1 on regressions;
+``--save-baseline`` records the run as the new baseline instead.
+
+Usage:
+    uv run python -m app.scripts.ingestion.benchmark_ingestion
+
+Optional:
+    --cases 20                  case directories in the synthetic archive
+    --executions-per-case 50    executions per case
+    --format tar.gz             tar.gz, zip, or dir (pre-extracted)
+    --archive <path>            benchmark an existing archive instead
+    --chunk-size 100            executions per chunk (INGESTION_CHUNK_SIZE)
+    --output <path>             write the report as JSON
+    --baseline <path>           compare against (or save) a baseline report
+    --save-baseline             write this run to --baseline
+    --tolerance 0.25            allowed relative slowdown per stage
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import select
+
+import app.models  # noqa: F401 # required to register models with SQLAlchemy
+from app.core.database import SessionLocal
+from app.features.user.models import User
+from app.scripts.ingestion.benchmark import (
+    IngestionBenchmarkReport,
+    compare_to_baseline,
+    generate_synthetic_archive,
+    run_ingestion_benchmark,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ingestion pipeline against a synthetic archive."
+    )
+    parser.add_argument("--cases", type=int, default=20)
+    parser.add_argument("--executions-per-case", type=int, default=50)
+    parser.add_argument("--format", choices=("tar.gz", "zip", "dir"), default="tar.gz")
+    parser.add_argument("--machine", default="chrysalis")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--archive", type=Path, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+
+    args = parser.parse_args(argv)
+
+    if args.save_baseline and args.baseline is None:
+        parser.error("--save-baseline requires --baseline")
+
+    with tempfile.TemporaryDirectory(prefix="simboard-benchmark-") as tmp:
+        report = _run(args, Path(tmp))
+
+    if report is None:
+        return 1
+
+    _print_report(report)
+
+    if args.output is not None:
+        _write_report(report, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    if args.save_baseline:
+        _write_report(report, args.baseline)
+        print(f"Saved baseline to {args.baseline}.")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; rerun with --save-baseline.")
+        return 0
+
+    baseline = IngestionBenchmarkReport.from_dict(json.loads(args.baseline.read_text()))
+    regressions = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if regressions:
+        return 1
+
+    print(f"No regressions against {args.baseline}.")
+
+    return 0
+
+
+def _run(args: argparse.Namespace, tmp_dir: Path) -> IngestionBenchmarkReport | None:
+    archive_path = args.archive
+    if archive_path is None:
+        archive_path = generate_synthetic_archive(
+            tmp_dir,
+            cases=args.cases,
+            executions_per_case=args.executions_per_case,
+            machine=args.machine,
+            archive_format=args.format,
+            seed=args.seed,
+        )
+
+    work_dir = tmp_dir / "extracted"
+    work_dir.mkdir()
+
+    db = SessionLocal()
+    try:
+        user = db.execute(select(User).limit(1)).scalars().first()
+        if user is None:
+            print("No users found; create one first (e.g. make backend-seed).")
+            return None
+
+        return run_ingestion_benchmark(
+            archive_path, work_dir, db, user, chunk_size=args.chunk_size
+        )
+    finally:
+        db.rollback()
+        db.close()
+
+
+def _print_report(report: IngestionBenchmarkReport) -> None:
+    print(
+        f"Ingested {report.executions} execution(s) across {report.cases} case(s) "
+        f"in {report.chunks} chunk(s) and {report.total_seconds:.3f}s; "
+        f"peak RSS {report.peak_rss_mb:.1f} MiB."
+    )
+
+    for stage in report.stages:
+        print(
+            f"  {stage.name:<9} {stage.seconds:9.3f}s "
+            f"{stage.items:>7} item(s) {stage.items_per_second:12.1f}/s "
+            f"{stage.peak_rss_mb:8.1f} MiB"
+        )
+
+
+def _write_report(report: IngestionBenchmarkReport, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.to_dict(), indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""Backfill PACE experiment IDs into the PACE mapping table.
+
+Resolves execution IDs of simulations that have no stored PACE mapping.
+Runs are resumable: progress is the mapping table itself, and execution IDs
+PACE could not resolve are retried on the next run.
+
+Usage:
+    uv run python -m app.scripts.pace.backfill_pace_mappings
+
+Optional:
+    --limit 1000        stop after this many execution IDs
+    --batch-size 200    execution IDs resolved and stored per batch
+"""
+
+import argparse
+import asyncio
+
+from app.features.pace.backfill import PaceBackfillReport, backfill_pace_mappings
+from app.features.pace.resolver import close_pace_client
+from app.features.pace.schemas import MAX_PACE_RESOLVE_BATCH_SIZE
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Backfill PACE experiment IDs into the PACE mapping table."
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=MAX_PACE_RESOLVE_BATCH_SIZE)
+
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_run(limit=args.limit, batch_size=args.batch_size))
+
+    print(
+        f"Selected {report.selected} execution ID(s): {report.resolved} resolved, "
+        f"{report.unresolved} unresolved."
+    )
+
+    return 0
+
+
+async def _run(*, limit: int | None, batch_size: int) -> PaceBackfillReport:
+    try:
+        return await backfill_pace_mappings(limit=limit, batch_size=batch_size)
+    finally:
+        await close_pace_client()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
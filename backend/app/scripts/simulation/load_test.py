@@ -0,0 +1,139 @@
+"""Load test the case and simulation read endpoints.
+
+Samples case and simulation IDs from the database, then sends
+``--requests`` requests per scenario at ``--concurrency`` and prints latency
+percentiles, throughput, response size, and SQL statements per request.
+By default the app runs in-process; ``--base-url`` targets a running server
+instead (statement counts are then unavailable).
+
+Seed a large catalog first, e.g.:
+    uv run python -m app.scripts.db.seed --synthetic-cases 5000
+
+Usage:
+    uv run python -m app.scripts.simulation.load_test
+
+Optional:
+    --requests 200              measured requests per scenario
+    --concurrency 8             requests in flight
+    --warmup 5                  unmeasured requests per scenario
+    --scenario <name>           run only this scenario (repeatable)
+    --sample-size 100           case and simulation IDs to cycle through
+    --base-url <url>            target a running server
+    --output <path>             write the report as JSON
+"""
+
+import argparse
+import asyncio
+import json
+from collections.abc import Sequence
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+import app.models  # noqa: F401 # required to register models with SQLAlchemy
+from app.core.database import SessionLocal
+from app.main import app as asgi_app
+from app.scripts.simulation.loadtest import (
+    READ_SCENARIOS,
+    LoadTestReport,
+    LoadTestScenario,
+    build_read_scenarios,
+    run_load_test,
+    sample_catalog_ids,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Load test the case and simulation read endpoints."
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--scenario", action="append", choices=READ_SCENARIOS, default=None
+    )
+    parser.add_argument("--sample-size", type=int, default=100)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--output", type=Path, default=None)
+
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        case_ids, case_names, simulation_ids = sample_catalog_ids(
+            db, limit=args.sample_size
+        )
+    finally:
+        db.close()
+
+    if not simulation_ids:
+        print("No simulations found; seed the database first (make backend-seed).")
+        return 1
+
+    scenarios = build_read_scenarios(
+        case_ids,
+        case_names,
+        simulation_ids,
+        names=args.scenario or READ_SCENARIOS,
+    )
+    report = asyncio.run(_run(args, scenarios))
+
+    _print_report(report)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report.to_dict(), indent=2) + "\n")
+
+    return 1 if any(result.errors for result in report.scenarios) else 0
+
+
+async def _run(
+    args: argparse.Namespace, scenarios: Sequence[LoadTestScenario]
+) -> LoadTestReport:
+    if args.base_url is not None:
+        async with AsyncClient(base_url=args.base_url, timeout=None) as client:
+            return await run_load_test(
+                client,
+                scenarios,
+                requests_per_scenario=args.requests,
+                concurrency=args.concurrency,
+                warmup=args.warmup,
+            )
+
+    transport = ASGITransport(app=asgi_app)
+    async with AsyncClient(
+        transport=transport, base_url="http://loadtest", timeout=None
+    ) as client:
+        return await run_load_test(
+            client,
+            scenarios,
+            requests_per_scenario=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            count_statements=True,
+        )
+
+
+def _print_report(report: LoadTestReport) -> None:
+    print(
+        f"{'scenario':<25} {'reqs':>6} {'errs':>5} {'req/s':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'bytes':>11} {'sql/req':>8}"
+    )
+
+    for result in report.scenarios:
+        statements = (
+            "-"
+            if result.statements_per_request is None
+            else f"{result.statements_per_request:.1f}"
+        )
+        print(
+            f"{result.name:<25} {result.requests:>6} {result.errors:>5} "
+            f"{result.requests_per_second:>8.1f} {result.p50_ms:>9.1f} "
+            f"{result.p95_ms:>9.1f} {result.p99_ms:>9.1f} "
+            f"{result.mean_response_bytes:>11.0f} {statements:>8}"
+        )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,308 @@
+"""Load testing for the case and simulation read endpoints.
+
+Each scenario sends a fixed number of requests to one endpoint from
+``concurrency`` workers sharing one HTTP client, after a few unmeasured
+warmup requests. Scenarios run one after another so each scenario's latency,
+throughput, response size, and SQL statement count are measured alone.
+
+The client is usually an ``httpx.AsyncClient`` over ``ASGITransport``, which
+drives the app in-process; SQL statements are then counted on the app's
+engines with ``capture_queries``. Against a remote ``base_url`` statement
+counts are not available.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+from urllib.parse import quote
+from uuid import UUID
+
+from httpx import AsyncClient, HTTPError
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.api.version import API_BASE
+from app.core.query_stats import capture_queries
+from app.features.simulation.models import Case, Simulation
+
+READ_SCENARIOS = (
+    "list_case_names",
+    "list_cases",
+    "get_case",
+    "list_simulations",
+    "list_simulations_by_case",
+    "get_simulation",
+    "simulation_summary",
+)
+
+
+@dataclass(frozen=True)
+class LoadTestScenario:
+    """One endpoint under test and the concrete paths to cycle through."""
+
+    name: str
+    method: str
+    paths: tuple[str, ...]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements for one scenario."""
+
+    name: str
+    requests: int
+    errors: int
+    concurrency: int
+    seconds: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_response_bytes: float
+    statements_per_request: float | None = None
+
+
+@dataclass
+class LoadTestReport:
+    """Results of one load-test run, in scenario order."""
+
+    scenarios: list[ScenarioResult]
+    recorded_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def sample_catalog_ids(
+    db: Session, *, limit: int = 100
+) -> tuple[list[UUID], list[str], list[UUID]]:
+    """Pick random case IDs, case names, and simulation IDs to request.
+
+    Parameters
+    ----------
+    db : Session
+        Active database session.
+    limit : int, optional
+        Maximum number of cases and of simulations to sample.
+
+    Returns
+    -------
+    tuple[list[UUID], list[str], list[UUID]]
+        Sampled case IDs, the names of those cases, and simulation IDs.
+    """
+    cases = db.execute(
+        select(Case.id, Case.name).order_by(func.random()).limit(limit)
+    ).all()
+    simulation_ids = db.execute(
+        select(Simulation.id).order_by(func.random()).limit(limit)
+    ).scalars()
+
+    return (
+        [case_id for case_id, _ in cases],
+        [name for _, name in cases],
+        list(simulation_ids),
+    )
+
+
+def build_read_scenarios(
+    case_ids: Sequence[UUID],
+    case_names: Sequence[str],
+    simulation_ids: Sequence[UUID],
+    *,
+    names: Sequence[str] = READ_SCENARIOS,
+) -> list[LoadTestScenario]:
+    """Build the read-endpoint scenarios for the sampled catalog IDs.
+
+    Parameters
+    ----------
+    case_ids : Sequence[UUID]
+        Cases requested by ``get_case``.
+    case_names : Sequence[str]
+        Case names used as the ``list_simulations_by_case`` filter.
+    simulation_ids : Sequence[UUID]
+        Simulations requested by ``get_simulation`` and
+        ``simulation_summary``.
+    names : Sequence[str], optional
+        Scenarios to build, in run order (default: ``READ_SCENARIOS``).
+
+    Returns
+    -------
+    list[LoadTestScenario]
+        The scenarios, skipping any whose ID pool is empty.
+
+    Raises
+    ------
+    ValueError
+        If a name is not in ``READ_SCENARIOS``.
+    """
+    unknown = sorted(set(names) - set(READ_SCENARIOS))
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    candidates = {
+        "list_case_names": ("GET", (f"{API_BASE}/cases/names",)),
+        "list_cases": ("GET", (f"{API_BASE}/cases",)),
+        "get_case": ("GET", tuple(f"{API_BASE}/cases/{id_}" for id_ in case_ids)),
+        "list_simulations": ("GET", (f"{API_BASE}/simulations",)),
+        "list_simulations_by_case": (
+            "GET",
+            tuple(
+                f"{API_BASE}/simulations?case_name={quote(name)}" for name in case_names
+            ),
+        ),
+        "get_simulation": (
+            "GET",
+            tuple(f"{API_BASE}/simulations/{id_}" for id_ in simulation_ids),
+        ),
+        "simulation_summary": (
+            "POST",
+            tuple(f"{API_BASE}/simulations/{id_}/summary" for id_ in simulation_ids),
+        ),
+    }
+
+    scenarios = []
+    for name in names:
+        method, paths = candidates[name]
+        if paths:
+            scenarios.append(LoadTestScenario(name=name, method=method, paths=paths))
+
+    return scenarios
+
+
+async def run_load_test(
+    client: AsyncClient,
+    scenarios: Sequence[LoadTestScenario],
+    *,
+    requests_per_scenario: int = 200,
+    concurrency: int = 8,
+    warmup: int = 5,
+    count_statements: bool = False,
+) -> LoadTestReport:
+    """Run each scenario in turn and collect its measurements.
+
+    Parameters
+    ----------
+    client : AsyncClient
+        Client used for every request; its ``base_url`` selects the target.
+    scenarios : Sequence[LoadTestScenario]
+        Scenarios to run, in order.
+    requests_per_scenario : int, optional
+        Measured requests per scenario.
+    concurrency : int, optional
+        Requests in flight per scenario.
+    warmup : int, optional
+        Unmeasured requests sent before each scenario.
+    count_statements : bool, optional
+        Count SQL statements on this process's engines; only meaningful when
+        the client drives the app in-process (default: False, so
+        ``statements_per_request`` is None).
+
+    Returns
+    -------
+    LoadTestReport
+        One result per scenario.
+    """
+    results = []
+
+    for scenario in scenarios:
+        for index in range(warmup):
+            await _send(client, scenario, index)
+
+        with capture_queries() as stats:
+            result = await _run_scenario(
+                client,
+                scenario,
+                requests=requests_per_scenario,
+                concurrency=concurrency,
+            )
+
+        if count_statements and result.requests:
+            result.statements_per_request = stats.statements / result.requests
+
+        results.append(result)
+
+    return LoadTestReport(scenarios=results)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+
+    return ordered[rank - 1]
+
+
+async def _run_scenario(
+    client: AsyncClient,
+    scenario: LoadTestScenario,
+    *,
+    requests: int,
+    concurrency: int,
+) -> ScenarioResult:
+    latencies: list[float] = []
+    sizes: list[int] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+
+            started = perf_counter()
+            size = await _send(client, scenario, index)
+            latencies.append(perf_counter() - started)
+
+            if size is None:
+                errors += 1
+            else:
+                sizes.append(size)
+
+    started = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+    seconds = perf_counter() - started
+
+    latencies_ms = [latency * 1000 for latency in latencies]
+
+    return ScenarioResult(
+        name=scenario.name,
+        requests=len(latencies),
+        errors=errors,
+        concurrency=concurrency,
+        seconds=seconds,
+        requests_per_second=len(latencies) / seconds if seconds else 0.0,
+        p50_ms=percentile(latencies_ms, 50),
+        p95_ms=percentile(latencies_ms, 95),
+        p99_ms=percentile(latencies_ms, 99),
+        mean_response_bytes=sum(sizes) / len(sizes) if sizes else 0.0,
+    )
+
+
+async def _send(
+    client: AsyncClient, scenario: LoadTestScenario, index: int
+) -> int | None:
+    """Send one request; return the body size, or None on failure."""
+    path = scenario.paths[index % len(scenario.paths)]
+
+    try:
+        response = await client.request(scenario.method, path)
+    except HTTPError:
+        return None
+
+    if response.is_error:
+        return None
+
+    return len(response.content)
@@ -0,0 +1,51 @@
+"""Re-verify stale E3SM GitHub organization memberships in bulk.
+
+Checks GitHub-linked users whose stored membership result is older than
+``GITHUB_ORG_MEMBERSHIP_MAX_AGE_SECONDS`` using their stored OAuth tokens.
+The run stops early when GitHub reports a rate limit; deferred users are
+picked up by the next run. Intended to run on a schedule (e.g. hourly).
+
+Usage:
+    uv run python -m app.scripts.users.refresh_github_memberships
+
+Optional:
+    --limit 500          stop after this many users
+    --batch-size 50      users checked and stored per batch
+    --concurrency 4      GitHub requests in flight
+"""
+
+import argparse
+import asyncio
+
+from app.features.user.membership import refresh_stale_memberships
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-verify stale E3SM GitHub organization memberships."
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=None)
+
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        refresh_stale_memberships(
+            limit=args.limit,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+    )
+
+    print(
+        f"Selected {report.selected} user(s): {report.verified} verified, "
+        f"{report.unverified} not members, {report.indeterminate} indeterminate, "
+        f"{report.deferred} deferred by rate limiting."
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
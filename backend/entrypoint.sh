@@ -30,6 +30,14 @@ until pg_isready -d "${PG_URL}" -q; do
 done
 echo "✅ Database is ready"
 
+# -----------------------------------------------------------
+# Reset per-worker Prometheus metrics files from previous runs
+# -----------------------------------------------------------
+if [ -n "${PROMETHEUS_MULTIPROC_DIR}" ]; then
+    mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+    rm -f "${PROMETHEUS_MULTIPROC_DIR}"/*.db
+fi
+
 # -----------------------------------------------------------
 # Start application
 # -----------------------------------------------------------
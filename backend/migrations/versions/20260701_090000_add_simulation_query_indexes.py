@@ -0,0 +1,40 @@
+"""Add simulation indexes for listing and CASE_HASH lookups.
+
+Revision ID: 20260701_090000
+Revises: 20260625_130000
+Create Date: 2026-07-01 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260701_090000"
+down_revision: Union[str, Sequence[str], None] = "20260625_130000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the created_at listing index and partial CASE_HASH index."""
+    op.create_index(
+        "ix_simulations_created_at",
+        "simulations",
+        ["created_at"],
+    )
+    op.create_index(
+        "ix_simulations_case_id_created_at_with_case_hash",
+        "simulations",
+        ["case_id", "created_at"],
+        postgresql_where=sa.text("case_hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the listing and CASE_HASH indexes."""
+    op.drop_index(
+        "ix_simulations_case_id_created_at_with_case_hash", table_name="simulations"
+    )
+    op.drop_index("ix_simulations_created_at", table_name="simulations")
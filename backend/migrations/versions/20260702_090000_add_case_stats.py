@@ -0,0 +1,137 @@
+"""Add per-case simulation statistics rollup table.
+
+Revision ID: 20260702_090000
+Revises: 20260701_090000
+Create Date: 2026-07-02 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260702_090000"
+down_revision: Union[str, Sequence[str], None] = "20260701_090000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create case_stats and backfill it from existing simulations."""
+    op.create_table(
+        "case_stats",
+        sa.Column("case_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "simulation_count",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("latest_simulation_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("latest_status", sa.String(length=50), nullable=True),
+        sa.Column("latest_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("earliest_start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("latest_end_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "compilers",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "git_tags",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["case_id"],
+            ["cases.id"],
+            name=op.f("fk_case_stats_case_id_cases"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["latest_simulation_id"],
+            ["simulations.id"],
+            name=op.f("fk_case_stats_latest_simulation_id_simulations"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("case_id", name=op.f("pk_case_stats")),
+    )
+
+    op.execute(
+        """
+        INSERT INTO case_stats (
+            case_id, simulation_count, status_counts, latest_simulation_id,
+            latest_status, latest_created_at, earliest_start_date,
+            latest_end_date, compilers, git_tags
+        )
+        WITH per_case AS (
+            SELECT
+                case_id,
+                count(*) AS simulation_count,
+                min(simulation_start_date) AS earliest_start_date,
+                max(simulation_end_date) AS latest_end_date,
+                coalesce(
+                    jsonb_agg(DISTINCT compiler ORDER BY compiler)
+                        FILTER (WHERE compiler IS NOT NULL),
+                    '[]'::jsonb
+                ) AS compilers,
+                coalesce(
+                    jsonb_agg(DISTINCT git_tag ORDER BY git_tag)
+                        FILTER (WHERE git_tag IS NOT NULL),
+                    '[]'::jsonb
+                ) AS git_tags
+            FROM simulations
+            GROUP BY case_id
+        ),
+        per_status AS (
+            SELECT case_id, jsonb_object_agg(status, n) AS status_counts
+            FROM (
+                SELECT case_id, status, count(*) AS n
+                FROM simulations
+                GROUP BY case_id, status
+            ) AS by_status
+            GROUP BY case_id
+        )
+        SELECT
+            p.case_id,
+            p.simulation_count,
+            st.status_counts,
+            latest.id,
+            latest.status,
+            latest.created_at,
+            p.earliest_start_date,
+            p.latest_end_date,
+            p.compilers,
+            p.git_tags
+        FROM per_case AS p
+        JOIN per_status AS st ON st.case_id = p.case_id
+        CROSS JOIN LATERAL (
+            SELECT id, status, created_at
+            FROM simulations
+            WHERE case_id = p.case_id
+            ORDER BY created_at DESC, execution_id DESC
+            LIMIT 1
+        ) AS latest
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop case_stats."""
+    op.drop_table("case_stats")
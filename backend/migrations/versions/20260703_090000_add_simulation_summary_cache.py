@@ -0,0 +1,59 @@
+"""Add persistent cache table for LLM simulation summaries.
+
+Revision ID: 20260703_090000
+Revises: 20260702_090000
+Create Date: 2026-07-03 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20260703_090000"
+down_revision: Union[str, Sequence[str], None] = "20260702_090000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create simulation_summary_cache."""
+    op.create_table(
+        "simulation_summary_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("simulation_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("provider", sa.String(length=50), nullable=False),
+        sa.Column("model", sa.String(length=200), nullable=False),
+        sa.Column("prompt_version", sa.String(length=50), nullable=False),
+        sa.Column("summary", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["simulation_id"],
+            ["simulations.id"],
+            name=op.f("fk_simulation_summary_cache_simulation_id_simulations"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("cache_key", name=op.f("pk_simulation_summary_cache")),
+    )
+    op.create_index(
+        op.f("ix_simulation_summary_cache_simulation_id"),
+        "simulation_summary_cache",
+        ["simulation_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop simulation_summary_cache."""
+    op.drop_index(
+        op.f("ix_simulation_summary_cache_simulation_id"),
+        table_name="simulation_summary_cache",
+    )
+    op.drop_table("simulation_summary_cache")
@@ -0,0 +1,40 @@
+"""Add persistent PACE experiment ID mapping table.
+
+Revision ID: 20260704_090000
+Revises: 20260703_090000
+Create Date: 2026-07-04 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260704_090000"
+down_revision: Union[str, Sequence[str], None] = "20260703_090000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create pace_experiment_mappings."""
+    op.create_table(
+        "pace_experiment_mappings",
+        sa.Column("execution_id", sa.Text(), nullable=False),
+        sa.Column("experiment_id", sa.String(length=32), nullable=False),
+        sa.Column(
+            "resolved_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "execution_id", name=op.f("pk_pace_experiment_mappings")
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop pace_experiment_mappings."""
+    op.drop_table("pace_experiment_mappings")
@@ -0,0 +1,33 @@
+"""Add API token revocation generation counter.
+
+Revision ID: 20260705_090000
+Revises: 20260704_090000
+Create Date: 2026-07-05 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260705_090000"
+down_revision: Union[str, Sequence[str], None] = "20260704_090000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create api_token_generation with its single row."""
+    op.create_table(
+        "api_token_generation",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("generation", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_api_token_generation")),
+    )
+    op.execute("INSERT INTO api_token_generation (id, generation) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    """Drop api_token_generation."""
+    op.drop_table("api_token_generation")
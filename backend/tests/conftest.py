@@ -1,10 +1,13 @@
+import asyncio
 import os
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from pathlib import Path
 from typing import Generator
 from urllib.parse import urlparse
+from uuid import UUID
 
+import httpx
 import psycopg
 import pytest
 import pytest_asyncio
@@ -13,14 +16,27 @@ from alembic.config import Config
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 from psycopg.rows import tuple_row
-from sqlalchemy import create_engine, event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.common.dependencies import get_database_session
 from app.core.config import settings
 from app.core.database_async import get_async_session
 from app.core.logger import _setup_custom_logger
+from app.core.query_stats import register_query_stats
+from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
+from app.features.ingestion.models import Ingestion
+from app.features.machine.models import Machine
+from app.features.pace import resolver as pace_resolver
+from app.features.simulation.case_stats import apply_simulations_to_case_stats
+from app.features.simulation.models import Case, Simulation
 from app.features.user.models import OAuthAccount, User, UserRole
 from app.main import app
 
@@ -37,6 +53,7 @@ ALEMBIC_INI_PATH = BASE_DIR / "alembic.ini"
 # Set up the SQLAlchemy engine and sessionmaker for testing
 TEST_DB_URL = settings.test_database_url
 engine = create_engine(TEST_DB_URL, future=True)
+register_query_stats(engine)
 
 # NOTE: Keep a Sessionmaker here, but bind it per-test to a single connection
 # that's inside a transaction to ensure isolation.
@@ -333,10 +350,11 @@ def _run_migrations():
 
 @pytest.fixture(scope="function")
 def client(db: Session):
-    """Sets up a FastAPI TestClient with a database dependency override.
+    """Sets up a FastAPI TestClient with database dependency overrides.
 
-    This fixture overrides the `get_database_session` dependency used in FastAPI
-    routes to inject a test database session instead of the production database.
+    This fixture overrides the `get_database_session` and `get_async_session`
+    dependencies used in FastAPI routes to inject the test database session
+    instead of the production database.
     This ensures that the application uses the `simboard_test` database
     during tests, isolating test data from production data.
 
@@ -354,6 +372,11 @@ def client(db: Session):
     -----
     - The `get_database_session` dependency is overridden to yield the provided test
       database session.
+    - The `get_async_session` dependency is overridden to yield a real asyncpg
+      `AsyncSession` bound to a separate per-test transaction that is rolled
+      back afterwards. It cannot see data written through `db`; tests that
+      read seeded data from async routes use `async_client` and seed through
+      `async_db` instead.
     - After the test client is used, the dependency overrides are cleared
       and the test database session is closed.
     """
@@ -366,21 +389,52 @@ def client(db: Session):
         finally:
             pass
 
+    async def override_get_async_session():
+        async with AsyncTestingSessionLocal(
+            bind=async_conn, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+
     app.dependency_overrides[get_database_session] = override_get_database_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
 
     with TestClient(app) as c:
-        yield c
+        # asyncpg connections are bound to an event loop, so open the async
+        # test transaction on the loop that serves the client's requests.
+        portal = c.portal
+        assert portal is not None
+
+        async_conn = portal.call(_begin_async_connection)
+        try:
+            yield c
+        finally:
+            portal.call(_rollback_async_connection, async_conn)
 
     app.dependency_overrides.clear()
 
 
+async def _begin_async_connection() -> AsyncConnection:
+    conn = await async_engine.connect()
+    await conn.begin()
+
+    return conn
+
+
+async def _rollback_async_connection(conn: AsyncConnection) -> None:
+    await conn.rollback()
+    await conn.close()
+
+
 # -----------------------------------------------
 # Asynchronous fixtures
 # -----------------------------------------------
 
 # Async engine and sessionmaker for FastAPI Users
 ASYNC_TEST_DB_URL = TEST_DB_URL.replace("postgresql://", "postgresql+asyncpg://")
-async_engine = create_async_engine(ASYNC_TEST_DB_URL, future=True)
+# NullPool: pooled asyncpg connections cannot move between the event loops of
+# pytest-asyncio and the sync TestClient.
+async_engine = create_async_engine(ASYNC_TEST_DB_URL, future=True, poolclass=NullPool)
+register_query_stats(async_engine.sync_engine)
 AsyncTestingSessionLocal = async_sessionmaker(
     async_engine, expire_on_commit=False, autoflush=False, autocommit=False
 )
@@ -470,3 +524,87 @@ async def admin_user(async_db):
     await async_db.refresh(admin)
 
     return {"id": str(admin.id), "email": admin.email}
+
+
+async def _create_case(db: AsyncSession, name: str = "assistant_api_case") -> Case:
+    machine = (await db.execute(select(Machine))).scalars().first()
+    assert machine is not None
+
+    case = Case(name=name, machine_id=machine.id, hpc_username="assistant-user")
+    db.add(case)
+    await db.flush()
+    return case
+
+
+async def create_simulation(
+    db: AsyncSession,
+    normal_user: dict[str, str],
+    admin_user: dict[str, str],
+    *,
+    execution_id: str = "assistant-api-exec-1",
+    case_name: str = "assistant_api_case",
+) -> Simulation:
+    """Commit a completed simulation in a new case, with its case statistics."""
+    machine = (await db.execute(select(Machine))).scalars().first()
+    assert machine is not None
+
+    case = await _create_case(db, case_name)
+    ingestion = Ingestion(
+        source_type=IngestionSourceType.BROWSER_UPLOAD,
+        source_reference=execution_id,
+        machine_id=machine.id,
+        triggered_by=UUID(normal_user["id"]),
+        status=IngestionStatus.SUCCESS,
+        created_count=1,
+        duplicate_count=0,
+        error_count=0,
+    )
+    db.add(ingestion)
+    await db.flush()
+
+    simulation = Simulation(
+        case_id=case.id,
+        execution_id=execution_id,
+        compset="AQUAPLANET",
+        compset_alias="QPC4",
+        grid_name="f19_f19",
+        grid_resolution="1.9x2.5",
+        simulation_type="experimental",
+        status="completed",
+        initialization_type="startup",
+        simulation_start_date="2023-01-01T00:00:00Z",
+        git_tag="v2.0.0",
+        created_by=UUID(normal_user["id"]),
+        last_updated_by=UUID(admin_user["id"]),
+        ingestion_id=ingestion.id,
+    )
+    db.add(simulation)
+    await db.flush()
+    await db.run_sync(apply_simulations_to_case_stats, [simulation])
+    await db.commit()
+    await db.refresh(simulation)
+    return simulation
+
+
+def mock_pace(
+    monkeypatch: pytest.MonkeyPatch, handler: Callable[[httpx.Request], object]
+) -> list[httpx.Request]:
+    """Route PACE HTTP calls to ``handler`` and return the captured requests."""
+    captured: list[httpx.Request] = []
+
+    async def record(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        response = handler(request)
+        if asyncio.iscoroutine(response):
+            response = await response
+        assert isinstance(response, httpx.Response)
+
+        return response
+
+    monkeypatch.setattr(
+        pace_resolver,
+        "_pace_http",
+        pace_resolver._PaceHttpClient(transport=httpx.MockTransport(record)),
+    )
+
+    return captured
@@ -0,0 +1,125 @@
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from app.core import logger as app_logger
+from app.core.logger import (
+    JsonFormatter,
+    TraceIdFilter,
+    _DeferredQueueHandler,
+    log_span,
+)
+from app.core.tracing import bind_trace_id
+
+
+def _record(msg: str, *args: object, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+
+    return record
+
+
+class TestJsonFormatter:
+    def test_formats_message_trace_id_and_extra_fields(self) -> None:
+        record = _record("parsed %d executions", 3, stage="parse")
+
+        with bind_trace_id() as trace_id:
+            TraceIdFilter().filter(record)
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["message"] == "parsed 3 executions"
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "app.test"
+        assert payload["trace_id"] == str(trace_id)
+        assert payload["stage"] == "parse"
+        assert payload["timestamp"].endswith("Z")
+
+    def test_includes_exception_text(self) -> None:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord(
+                "app.test", logging.ERROR, __file__, 1, "failed", (), None
+            )
+            record.exc_info = sys.exc_info()
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert "RuntimeError: boom" in payload["exc_info"]
+        assert payload["trace_id"] is None
+
+
+class TestDeferredQueueHandler:
+    def test_renders_message_but_not_layout(self) -> None:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(records)
+        handler.setFormatter(logging.Formatter(app_logger.LOG_FORMAT))
+        handler.addFilter(TraceIdFilter())
+        values = ["before"]
+        record = _record("values=%s", values)
+
+        with bind_trace_id() as trace_id:
+            handler.handle(record)
+        values.append("after")
+
+        queued = records.get_nowait()
+        assert queued.msg == "values=['before']"
+        assert queued.message == "values=['before']"
+        assert queued.args is None
+        assert queued.trace_id == str(trace_id)  # type: ignore[attr-defined]
+        assert record.args == (values,)
+
+    def test_renders_traceback_before_enqueueing(self) -> None:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(records)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = _record("failed")
+            record.exc_info = sys.exc_info()
+
+        handler.handle(record)
+
+        queued = records.get_nowait()
+        assert queued.exc_info is None
+        assert queued.exc_text is not None
+        assert "RuntimeError: boom" in queued.exc_text
+        assert "RuntimeError: boom" in logging.Formatter().format(queued)
+        assert (
+            "RuntimeError: boom"
+            in json.loads(JsonFormatter().format(queued))["exc_info"]
+        )
+
+
+class TestLogSpan:
+    @pytest.fixture
+    def logged(self, monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+        logged: list[dict] = []
+        monkeypatch.setattr(app_logger._span_logger, "disabled", False)
+        monkeypatch.setattr(
+            app_logger._span_logger,
+            "info",
+            lambda message, *args, extra: logged.append(extra),
+        )
+
+        return logged
+
+    def test_logs_duration_and_fields(self, logged: list[dict]) -> None:
+        with log_span("ingestion.parse", archive="a.zip"):
+            pass
+
+        assert logged[0]["span"] == "ingestion.parse"
+        assert logged[0]["outcome"] == "ok"
+        assert logged[0]["archive"] == "a.zip"
+        assert logged[0]["duration_ms"] >= 0
+
+    def test_marks_failed_spans(self, logged: list[dict]) -> None:
+        with pytest.raises(ValueError):
+            with log_span("ingestion.parse"):
+                raise ValueError("bad archive")
+
+        assert logged[0]["outcome"] == "error"
@@ -0,0 +1,120 @@
+import os
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client import values as prometheus_values
+
+from app.core import metrics
+from app.core.metrics import (
+    MetricsMiddleware,
+    mark_process_dead,
+    render_latest,
+    sample_value,
+)
+
+
+@pytest.fixture
+def single_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+
+@pytest.fixture
+def requests_total(single_process: None) -> Iterator[Counter]:
+    counter = Counter("test_requests_total", "Requests.", ("path",))
+    yield counter
+    REGISTRY.unregister(counter)
+
+
+class TestRender:
+    def test_renders_default_registry(self, requests_total: Counter) -> None:
+        requests_total.labels(path='/a"b').inc(3)
+
+        output = render_latest().decode()
+
+        assert "# TYPE test_requests_total counter" in output
+        assert 'test_requests_total{path="/a\\"b"} 3.0' in output
+
+    def test_sample_value_defaults_to_zero(self, requests_total: Counter) -> None:
+        requests_total.labels(path="/a").inc(2)
+
+        assert sample_value("test_requests_total", path="/a") == 2
+        assert sample_value("test_requests_total", path="/b") == 0
+
+
+class TestMultiprocess:
+    @staticmethod
+    def _worker_metrics(
+        monkeypatch: pytest.MonkeyPatch, pid: int
+    ) -> tuple[Counter, Gauge, Histogram]:
+        # Metrics pick their value class on creation; use one per fake worker.
+        monkeypatch.setattr(
+            prometheus_values,
+            "ValueClass",
+            prometheus_values.MultiProcessValue(process_identifier=lambda: pid),
+        )
+
+        return (
+            Counter("requests_total", "Requests.", registry=None),
+            Gauge("in_use", "In use.", multiprocess_mode="livesum", registry=None),
+            Histogram("latency_seconds", "Latency.", buckets=(1.0,), registry=None),
+        )
+
+    def test_aggregates_workers_and_drops_dead_live_gauges(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ) -> None:
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        for pid in (os.getpid(), 222):
+            requests, in_use, latency = self._worker_metrics(monkeypatch, pid)
+            requests.inc()
+            in_use.set(1)
+            latency.observe(0.5)
+
+        before = render_latest().decode()
+        mark_process_dead()
+        after = render_latest().decode()
+
+        assert "requests_total 2.0" in before
+        assert 'latency_seconds_bucket{le="1.0"} 2.0' in before
+        assert "in_use 2.0" in before
+        # Counters and histograms include exited workers; live gauges do not.
+        assert "requests_total 2.0" in after
+        assert "in_use 1.0" in after
+
+    def test_mark_process_dead_without_directory_is_a_no_op(
+        self, single_process: None
+    ) -> None:
+        mark_process_dead()
+
+
+class TestMetricsMiddleware:
+    def test_labels_requests_with_route_templates(
+        self, single_process: None, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        registry = CollectorRegistry()
+        latency = Histogram(
+            "latency", "Latency.", ("method", "route", "status"), registry=registry
+        )
+        monkeypatch.setattr(metrics, "HTTP_REQUEST_SECONDS", latency)
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: int) -> dict:
+            return {}
+
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+        def count(route: str, status: str) -> float | None:
+            return registry.get_sample_value(
+                "latency_count", {"method": "GET", "route": route, "status": status}
+            )
+
+        assert count("/items/{item_id}", "200") == 2
+        assert count("<unmatched>", "404") == 1
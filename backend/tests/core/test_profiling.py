@@ -0,0 +1,213 @@
+import json
+import pstats
+import threading
+import time
+from pathlib import Path
+from typing import cast
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.api.version import API_BASE
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import (
+    PROFILE_HEADER,
+    ProfilingMiddleware,
+    SamplingProfiler,
+    authorize_profile_request,
+    list_profiles,
+    profile_ingestion,
+)
+from app.core.tracing import REQUEST_ID_HEADER, TraceIdMiddleware
+from app.features.user.manager import current_active_user
+from app.features.user.models import User, UserRole
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def profiling_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(settings, "profiling_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "profiling_sample_interval_ms", 1.0)
+
+    return tmp_path
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _make_client(role: UserRole | None) -> TestClient:
+    test_app = FastAPI()
+    test_app.add_middleware(ProfilingMiddleware)
+    test_app.add_middleware(TraceIdMiddleware)
+
+    def fake_user() -> None:
+        authorize_profile_request(is_admin=role == UserRole.ADMIN)
+
+    @test_app.get("/slow", dependencies=[Depends(fake_user)])
+    def slow_route() -> dict:
+        _busy(0.05)
+        return {}
+
+    @test_app.get("/async", dependencies=[Depends(fake_user)])
+    async def async_route(request: Request) -> dict:
+        request.app.state.loop_thread = threading.current_thread()
+        return {}
+
+    @test_app.post("/ingest", dependencies=[Depends(fake_user)])
+    def ingest_route() -> dict:
+        with profile_ingestion("archive.tar.gz"):
+            _busy(0.001)
+        return {}
+
+    return TestClient(test_app)
+
+
+class TestSamplingProfiler:
+    def test_samples_busy_threads_into_speedscope_profiles(self) -> None:
+        profiler = SamplingProfiler(0.001)
+        worker = threading.Thread(target=_busy, args=(0.05,))
+
+        profiler.start()
+        worker.start()
+        worker.join()
+        profiler.stop()
+
+        profile = profiler.to_speedscope("busy")
+        frame_names = {frame["name"] for frame in profile["shared"]["frames"]}
+
+        assert "_busy" in frame_names
+        assert all(p["type"] == "sampled" for p in profile["profiles"])
+        assert all(len(p["samples"]) == len(p["weights"]) for p in profile["profiles"])
+
+
+class TestProfilingMiddleware:
+    def test_saves_slow_requests_when_enabled(
+        self, monkeypatch: pytest.MonkeyPatch, profiling_dir: Path
+    ) -> None:
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        monkeypatch.setattr(settings, "profiling_slow_request_ms", 10.0)
+
+        response = _make_client(UserRole.USER).get("/slow")
+
+        [path] = profiling_dir.iterdir()
+        assert response.headers[REQUEST_ID_HEADER] in path.name
+        assert path.name.endswith(".speedscope.json")
+        assert json.loads(path.read_text())["name"] == "GET /slow"
+
+    def test_skips_fast_requests(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        monkeypatch.setattr(settings, "profiling_slow_request_ms", 60_000.0)
+
+        _make_client(UserRole.USER).get("/slow")
+
+        assert list_profiles() == []
+
+    def test_honors_profile_header_only_for_admins(self) -> None:
+        _make_client(UserRole.ADMIN).get("/slow", headers={PROFILE_HEADER: "1"})
+
+        [profile] = list_profiles()
+        assert profile.name.endswith(".speedscope.json")
+
+    def test_saves_profiles_off_the_event_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        threads: dict[str, threading.Thread] = {}
+        save = profiling._save_request_profile
+
+        def record_save(*args) -> None:
+            threads["save"] = threading.current_thread()
+            save(*args)
+
+        monkeypatch.setattr(profiling, "_save_request_profile", record_save)
+        client = _make_client(UserRole.ADMIN)
+
+        client.get("/async", headers={PROFILE_HEADER: "1"})
+
+        assert threads["save"] is not cast(FastAPI, client.app).state.loop_thread
+        assert len(list_profiles()) == 1
+
+    @pytest.mark.parametrize("role", [None, UserRole.USER])
+    def test_ignores_profile_header_from_non_admins(
+        self, monkeypatch: pytest.MonkeyPatch, role: UserRole | None
+    ) -> None:
+        started: list[SamplingProfiler] = []
+        monkeypatch.setattr(SamplingProfiler, "start", started.append)
+        client = _make_client(role)
+
+        client.get("/slow", headers={PROFILE_HEADER: "1"})
+        client.post("/ingest", headers={PROFILE_HEADER: "1"})
+
+        assert started == []
+        assert list_profiles() == []
+
+
+class TestProfileIngestion:
+    def test_saves_pstats_and_enforces_retention(
+        self, monkeypatch: pytest.MonkeyPatch, profiling_dir: Path
+    ) -> None:
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        monkeypatch.setattr(settings, "profiling_max_files", 2)
+
+        for index in range(3):
+            with profile_ingestion(f"archive-{index}.tar.gz"):
+                _busy(0.001)
+
+        names = [profile.name for profile in list_profiles()]
+        assert len(names) == 2
+        assert "archive-2.tar.gz.pstats" in names[0]
+        stats = pstats.Stats(str(profiling_dir / names[0])).get_stats_profile()
+        assert stats.func_profiles
+
+    def test_profiles_admin_requested_ingestion(self) -> None:
+        _make_client(UserRole.ADMIN).post("/ingest", headers={PROFILE_HEADER: "1"})
+
+        names = [profile.name for profile in list_profiles()]
+        assert any(name.endswith("archive.tar.gz.pstats") for name in names)
+
+    def test_does_nothing_when_disabled(self) -> None:
+        with profile_ingestion("archive.tar.gz"):
+            pass
+
+        assert list_profiles() == []
+
+
+class TestProfilesAPI:
+    @pytest.fixture
+    def saved_profile(self, monkeypatch: pytest.MonkeyPatch) -> str:
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        with profile_ingestion("archive.tar.gz"):
+            pass
+
+        return list_profiles()[0].name
+
+    def _override_role(self, role: UserRole) -> None:
+        user = User(email="profiler@example.com", role=role)
+        app.dependency_overrides[current_active_user] = lambda: user
+
+    def test_admin_lists_and_downloads_profiles(
+        self, client: TestClient, saved_profile: str
+    ) -> None:
+        self._override_role(UserRole.ADMIN)
+
+        listed = client.get(f"{API_BASE}/profiles")
+        downloaded = client.get(f"{API_BASE}/profiles/{saved_profile}")
+        missing = client.get(f"{API_BASE}/profiles/unknown.pstats")
+
+        assert [item["name"] for item in listed.json()] == [saved_profile]
+        assert {"sizeBytes", "createdAt"} <= set(listed.json()[0])
+        assert downloaded.status_code == 200
+        assert downloaded.content
+        assert missing.status_code == 404
+
+    def test_non_admins_are_forbidden(
+        self, client: TestClient, saved_profile: str
+    ) -> None:
+        self._override_role(UserRole.USER)
+
+        assert client.get(f"{API_BASE}/profiles").status_code == 403
+        assert client.get(f"{API_BASE}/profiles/{saved_profile}").status_code == 403
@@ -0,0 +1,138 @@
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core import query_stats
+from app.core.config import settings
+from app.core.query_stats import (
+    QueryStats,
+    QueryStatsMiddleware,
+    assert_query_budget,
+    capture_queries,
+    current_query_stats,
+    track_queries,
+)
+from tests.conftest import async_engine
+
+
+@pytest.fixture(autouse=True)
+def _begin_transaction(db: Session) -> None:
+    # Open the per-test savepoint up front so it is not counted.
+    db.execute(text("SELECT 0"))
+
+
+@pytest.fixture
+def stats_client(db: Session) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/sync/{count}")
+    def sync_route(count: int) -> dict:
+        for _ in range(count):
+            db.execute(text("SELECT 1"))
+
+        return {}
+
+    @app.get("/async")
+    async def async_route() -> dict:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+
+        return {}
+
+    return TestClient(app)
+
+
+class TestQueryStats:
+    def test_reports_repeats_and_server_timing(self) -> None:
+        stats = QueryStats()
+        for statement in ("SELECT a", "SELECT b", "SELECT a", "SELECT a"):
+            stats.record(statement, 0.002)
+
+        assert stats.repeated_statements(2) == [("SELECT a", 3)]
+        assert stats.server_timing() == 'db;dur=8.0;desc="4 queries"'
+
+
+class TestTrackQueries:
+    def test_records_statements_of_current_context_only(self, db: Session) -> None:
+        with track_queries() as stats:
+            assert current_query_stats() is stats
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT   1"))
+
+        db.execute(text("SELECT 2"))
+
+        assert current_query_stats() is None
+        assert stats.statement_counts == {"SELECT 1": 2}
+        assert stats.db_seconds > 0
+
+
+class TestCaptureQueries:
+    def test_records_statements_from_other_threads(self, db: Session) -> None:
+        with capture_queries() as stats:
+            thread = threading.Thread(target=db.execute, args=(text("SELECT 1"),))
+            thread.start()
+            thread.join()
+
+        assert stats.statements == 1
+
+
+class TestAssertQueryBudget:
+    def test_passes_within_budget(self, db: Session) -> None:
+        with assert_query_budget(2, max_repeats=1):
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+
+    def test_fails_over_budget_and_lists_statements(self, db: Session) -> None:
+        with pytest.raises(AssertionError, match="at most 1 SQL") as exc_info:
+            with assert_query_budget(1):
+                db.execute(text("SELECT 1"))
+                db.execute(text("SELECT 2"))
+
+        assert "1x SELECT 2" in str(exc_info.value)
+
+    def test_fails_on_repeated_statement(self, db: Session) -> None:
+        with pytest.raises(AssertionError, match="at most 1 repeat"):
+            with assert_query_budget(10, max_repeats=1):
+                db.execute(text("SELECT 1"))
+                db.execute(text("SELECT 1"))
+
+
+class TestQueryStatsMiddleware:
+    def test_adds_server_timing_for_sync_and_async_routes(
+        self, stats_client: TestClient
+    ) -> None:
+        sync_response = stats_client.get("/sync/3")
+        async_response = stats_client.get("/async")
+
+        assert sync_response.headers["Server-Timing"].endswith('desc="3 queries"')
+        assert async_response.headers["Server-Timing"].endswith('desc="2 queries"')
+
+    def test_logs_counts_and_warns_on_repeated_statements(
+        self, stats_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        logged: list[tuple[str, dict]] = []
+        monkeypatch.setattr(settings, "query_repeat_warning_threshold", 3)
+        for level in ("info", "warning"):
+            monkeypatch.setattr(
+                query_stats.logger,
+                level,
+                lambda message, *args, level=level, extra: logged.append(
+                    (level, extra)
+                ),
+            )
+
+        stats_client.get("/sync/2")
+        stats_client.get("/sync/3")
+
+        assert [level for level, _ in logged] == ["info", "info", "warning"]
+        assert logged[0][1]["path"] == "/sync/2"
+        assert logged[0][1]["sql_statements"] == 2
+        assert logged[1][1]["sql_statements"] == 3
+        assert logged[2][1]["repeat_count"] == 3
+        assert logged[2][1]["repeated_statement"] == "SELECT 1"
@@ -0,0 +1,55 @@
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.tracing import (
+    REQUEST_ID_HEADER,
+    TraceIdMiddleware,
+    bind_trace_id,
+    get_trace_id,
+)
+
+
+def _make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(TraceIdMiddleware)
+
+    @app.get("/sync")
+    def sync_route() -> dict:
+        return {"trace_id": str(get_trace_id())}
+
+    @app.get("/async")
+    async def async_route() -> dict:
+        return {"trace_id": str(get_trace_id())}
+
+    return TestClient(app)
+
+
+class TestBindTraceId:
+    def test_binds_and_restores(self) -> None:
+        with bind_trace_id() as trace_id:
+            assert get_trace_id() == trace_id
+
+        assert get_trace_id() is None
+
+
+class TestTraceIdMiddleware:
+    def test_exposes_trace_id_to_sync_and_async_routes(self) -> None:
+        client = _make_client()
+
+        for path in ("/sync", "/async"):
+            response = client.get(path)
+
+            assert response.json()["trace_id"] == response.headers[REQUEST_ID_HEADER]
+            UUID(response.headers[REQUEST_ID_HEADER])
+
+    def test_reuses_valid_request_id_and_ignores_invalid_ones(self) -> None:
+        client = _make_client()
+        request_id = "6f1c7f3e-2f55-4d8e-9a49-1e0d4a7c5b21"
+
+        reused = client.get("/sync", headers={REQUEST_ID_HEADER: request_id})
+        replaced = client.get("/sync", headers={REQUEST_ID_HEADER: "not a uuid"})
+
+        assert reused.headers[REQUEST_ID_HEADER] == request_id
+        assert replaced.headers[REQUEST_ID_HEADER] != "not a uuid"
@@ -1,22 +1,27 @@
+import json
 from typing import cast
 from uuid import UUID, uuid4
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.version import API_BASE
 from app.core.config import settings
 from app.features.assistant import api as assistant_api
-from app.features.assistant.schemas import SimulationSummaryResponse
-from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
-from app.features.ingestion.models import Ingestion
-from app.features.machine.models import Machine
+from app.features.assistant.cache import clear_summary_lru
+from app.features.assistant.llm_generator import SummaryLLMGenerator
+from app.features.assistant.schemas import (
+    MAX_SUMMARY_BATCH_SIZE,
+    SimulationSummaryContent,
+    SimulationSummaryResponse,
+    SummaryCitationOut,
+)
 from app.features.simulation.models import Case, Simulation
 from app.features.user.manager import current_active_user, optional_current_user
 from app.features.user.models import User, UserRole
 from app.main import app
+from tests.conftest import create_simulation
 
 
 @pytest.fixture
@@ -35,63 +40,6 @@ def authenticated_client(async_client: AsyncClient, normal_user):
     return async_client
 
 
-async def _create_case(db: AsyncSession, name: str = "assistant_api_case") -> Case:
-    machine = (await db.execute(select(Machine))).scalars().first()
-    assert machine is not None
-
-    case = Case(name=name, machine_id=machine.id, hpc_username="assistant-user")
-    db.add(case)
-    await db.flush()
-    return case
-
-
-async def _create_simulation(
-    db: AsyncSession,
-    normal_user: dict[str, str],
-    admin_user: dict[str, str],
-    *,
-    execution_id: str = "assistant-api-exec-1",
-) -> Simulation:
-    machine = (await db.execute(select(Machine))).scalars().first()
-    assert machine is not None
-
-    case = await _create_case(db)
-    ingestion = Ingestion(
-        source_type=IngestionSourceType.BROWSER_UPLOAD,
-        source_reference=execution_id,
-        machine_id=machine.id,
-        triggered_by=UUID(normal_user["id"]),
-        status=IngestionStatus.SUCCESS,
-        created_count=1,
-        duplicate_count=0,
-        error_count=0,
-    )
-    db.add(ingestion)
-    await db.flush()
-
-    simulation = Simulation(
-        case_id=case.id,
-        execution_id=execution_id,
-        compset="AQUAPLANET",
-        compset_alias="QPC4",
-        grid_name="f19_f19",
-        grid_resolution="1.9x2.5",
-        simulation_type="experimental",
-        status="completed",
-        initialization_type="startup",
-        simulation_start_date="2023-01-01T00:00:00Z",
-        git_tag="v2.0.0",
-        created_by=UUID(normal_user["id"]),
-        last_updated_by=UUID(admin_user["id"]),
-        ingestion_id=ingestion.id,
-    )
-    db.add(simulation)
-    await db.flush()
-    await db.commit()
-    await db.refresh(simulation)
-    return simulation
-
-
 class TestSummarizeSimulationEndpoint:
     @pytest.fixture(autouse=True)
     def _force_deterministic(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -105,7 +53,7 @@ class TestSummarizeSimulationEndpoint:
         normal_user,
         admin_user,
     ) -> None:
-        simulation = await _create_simulation(
+        simulation = await create_simulation(
             async_db,
             normal_user,
             admin_user,
@@ -143,7 +91,7 @@ class TestSummarizeSimulationEndpoint:
         normal_user,
         admin_user,
     ) -> None:
-        simulation = await _create_simulation(
+        simulation = await create_simulation(
             async_db,
             normal_user,
             admin_user,
@@ -158,6 +106,22 @@ class TestSummarizeSimulationEndpoint:
         assert data["generationMode"] == "deterministic"
         assert data["fallbackUsed"] is False
 
+    @pytest.mark.asyncio
+    async def test_trace_id_matches_request_id_header(
+        self,
+        async_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+
+        response = await async_client.post(
+            f"{API_BASE}/simulations/{simulation.id}/summary"
+        )
+
+        assert response.json()["traceId"] == response.headers["X-Request-ID"]
+
     @pytest.mark.asyncio
     async def test_unauthenticated_request_returns_deterministic_summary_when_llm_enabled(
         self,
@@ -168,7 +132,7 @@ class TestSummarizeSimulationEndpoint:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         monkeypatch.setattr(settings, "assistant_llm_enabled", True)
-        simulation = await _create_simulation(
+        simulation = await create_simulation(
             async_db,
             normal_user,
             admin_user,
@@ -196,6 +160,288 @@ class TestSummarizeSimulationEndpoint:
         assert response.json() == {"detail": "Simulation not found"}
 
 
+class TestSummarizeSimulationCache:
+    @pytest.fixture(autouse=True)
+    def _enable_llm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "assistant_llm_enabled", True)
+        monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
+        monkeypatch.setattr(settings, "assistant_ollama_model", "gemma4:26b")
+        monkeypatch.setattr(
+            settings, "assistant_ollama_base_url", "http://localhost:11434"
+        )
+        clear_summary_lru()
+        yield
+        clear_summary_lru()
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_reuses_persisted_summary(
+        self,
+        authenticated_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        calls: list[str] = []
+
+        async def fake_generate(self, snapshot):
+            calls.append(snapshot.simulation.execution_id)
+            return SimulationSummaryContent(
+                answer=f"LLM summary {len(calls)}.",
+                citations=[
+                    SummaryCitationOut(
+                        source_type="case_field", path="case.name", label="Case"
+                    )
+                ],
+                limitations=["limit"],
+                suggested_followups=["follow up"],
+            )
+
+        monkeypatch.setattr(SummaryLLMGenerator, "generate", fake_generate)
+        url = f"{API_BASE}/simulations/{simulation.id}/summary"
+
+        first = await authenticated_client.post(url)
+        # Drop the in-process layer so the second request reads Postgres.
+        clear_summary_lru()
+        second = await authenticated_client.post(url)
+        refreshed = await authenticated_client.post(url, params={"refresh": "true"})
+
+        assert [r.status_code for r in (first, second, refreshed)] == [200] * 3
+        assert first.json()["answer"] == "LLM summary 1."
+        assert second.json()["answer"] == "LLM summary 1."
+        assert second.json()["traceId"] != first.json()["traceId"]
+        assert refreshed.json()["answer"] == "LLM summary 2."
+        assert len(calls) == 2
+
+
+class TestSummarizeSimulationsBatchEndpoint:
+    @pytest.fixture(autouse=True)
+    def _enable_llm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "assistant_llm_enabled", True)
+        monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
+        monkeypatch.setattr(settings, "assistant_ollama_model", "gemma4:26b")
+        monkeypatch.setattr(
+            settings, "assistant_ollama_base_url", "http://localhost:11434"
+        )
+        clear_summary_lru()
+        yield
+        clear_summary_lru()
+
+    async def _create_simulations(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> list[Simulation]:
+        return [
+            await create_simulation(
+                async_db,
+                normal_user,
+                admin_user,
+                execution_id=f"assistant-api-batch-{index}",
+                case_name=f"assistant_api_batch_case_{index}",
+            )
+            for index in range(2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_returns_summaries_in_request_order_and_reuses_cache(
+        self,
+        authenticated_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulations = await self._create_simulations(async_db, normal_user, admin_user)
+        calls: list[str] = []
+
+        async def fake_generate(self, snapshot):
+            calls.append(snapshot.simulation.execution_id)
+            return SimulationSummaryContent(
+                answer=f"LLM summary for {snapshot.simulation.execution_id}.",
+                citations=[
+                    SummaryCitationOut(
+                        source_type="case_field", path="case.name", label="Case"
+                    )
+                ],
+                limitations=["limit"],
+                suggested_followups=["follow up"],
+            )
+
+        monkeypatch.setattr(SummaryLLMGenerator, "generate", fake_generate)
+        ids = [str(simulations[1].id), str(simulations[0].id), str(simulations[1].id)]
+        url = f"{API_BASE}/simulations/summaries"
+
+        first = await authenticated_client.post(url, json={"simulationIds": ids})
+        clear_summary_lru()
+        second = await authenticated_client.post(url, json={"simulationIds": ids})
+
+        assert first.status_code == 200
+        items = first.json()["summaries"]
+        assert [item["simulationId"] for item in items] == ids[:2]
+        assert items[0]["summary"]["answer"] == (
+            "LLM summary for assistant-api-batch-1."
+        )
+        assert items[0]["summary"]["traceId"] != items[1]["summary"]["traceId"]
+        assert second.json()["summaries"][1]["summary"]["answer"] == (
+            "LLM summary for assistant-api-batch-0."
+        )
+        assert sorted(calls) == ["assistant-api-batch-0", "assistant-api-batch-1"]
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated_request_returns_deterministic_summaries(
+        self,
+        async_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+    ) -> None:
+        simulations = await self._create_simulations(async_db, normal_user, admin_user)
+
+        response = await async_client.post(
+            f"{API_BASE}/simulations/summaries",
+            json={"simulationIds": [str(sim.id) for sim in simulations]},
+        )
+
+        assert response.status_code == 200
+        assert [
+            item["summary"]["generationMode"] for item in response.json()["summaries"]
+        ] == ["deterministic", "deterministic"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_simulation_returns_404(
+        self,
+        authenticated_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        missing_id = uuid4()
+
+        response = await authenticated_client.post(
+            f"{API_BASE}/simulations/summaries",
+            json={"simulationIds": [str(simulation.id), str(missing_id)]},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Simulations not found: {missing_id}"}
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_batch(
+        self, authenticated_client: AsyncClient
+    ) -> None:
+        response = await authenticated_client.post(
+            f"{API_BASE}/simulations/summaries",
+            json={
+                "simulationIds": [
+                    str(uuid4()) for _ in range(MAX_SUMMARY_BATCH_SIZE + 1)
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+
+    return events
+
+
+class TestStreamSimulationSummaryEndpoint:
+    @pytest.fixture(autouse=True)
+    def _enable_llm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "assistant_llm_enabled", True)
+        monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
+        monkeypatch.setattr(settings, "assistant_ollama_model", "gemma4:26b")
+        monkeypatch.setattr(
+            settings, "assistant_ollama_base_url", "http://localhost:11434"
+        )
+        clear_summary_lru()
+        yield
+        clear_summary_lru()
+
+    @pytest.mark.asyncio
+    async def test_authenticated_request_streams_events(
+        self,
+        authenticated_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+
+        async def fake_stream(self, snapshot):
+            yield SimulationSummaryContent(answer="LLM")
+            yield SimulationSummaryContent(
+                answer="LLM streamed summary.",
+                citations=[
+                    SummaryCitationOut(
+                        source_type="case_field", path="case.name", label="Case"
+                    )
+                ],
+                limitations=["limit"],
+                suggested_followups=["follow up"],
+            )
+
+        monkeypatch.setattr(SummaryLLMGenerator, "stream", fake_stream)
+
+        response = await authenticated_client.post(
+            f"{API_BASE}/simulations/{simulation.id}/summary/stream"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == [
+            "deterministic",
+            "partial",
+            "partial",
+            "final",
+        ]
+        assert events[0][1]["generationMode"] == "deterministic"
+        assert events[1][1]["answer"] == "LLM"
+        final = events[-1][1]
+        assert final["answer"] == "LLM streamed summary."
+        assert final["generationMode"] == "llm"
+        assert final["fallbackUsed"] is False
+        assert final["traceId"] == events[0][1]["traceId"]
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated_request_streams_single_final_event(
+        self,
+        async_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+
+        response = await async_client.post(
+            f"{API_BASE}/simulations/{simulation.id}/summary/stream"
+        )
+
+        assert response.status_code == 200
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["final"]
+        assert events[0][1]["generationMode"] == "deterministic"
+
+    @pytest.mark.asyncio
+    async def test_unknown_simulation_returns_404(
+        self, authenticated_client: AsyncClient
+    ) -> None:
+        response = await authenticated_client.post(
+            f"{API_BASE}/simulations/{uuid4()}/summary/stream"
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Simulation not found"}
+
+
 class _FakeScalarResult:
     def __init__(self, simulation) -> None:
         self._simulation = simulation
@@ -256,7 +502,7 @@ class TestSummarizeSimulationUnit:
         )
         logged: list[tuple[str, tuple[object, ...]]] = []
 
-        async def fake_generate(simulation, *, allow_llm=True):
+        async def fake_generate(simulation, *, allow_llm=True, db=None, refresh=False):
             assert simulation.id == sim_id
             assert allow_llm is True
             return type(
@@ -268,6 +514,7 @@ class TestSummarizeSimulationUnit:
                     "llm_latency_ms": 12.5,
                     "attempted_provider": "livai",
                     "attempted_model": "livai-model",
+                    "cache_hit": False,
                 },
             )()
 
@@ -325,7 +572,7 @@ class TestSummarizeSimulationUnit:
         )
         logged: list[tuple[str, tuple[object, ...]]] = []
 
-        async def fake_generate(simulation, *, allow_llm=True):
+        async def fake_generate(simulation, *, allow_llm=True, db=None, refresh=False):
             assert simulation.id == sim_id
             assert allow_llm is True
             return type(
@@ -337,6 +584,7 @@ class TestSummarizeSimulationUnit:
                     "llm_latency_ms": 12.5,
                     "attempted_provider": "ollama",
                     "attempted_model": "gemma4:3b",
+                    "cache_hit": False,
                 },
             )()
 
@@ -391,7 +639,7 @@ class TestSummarizeSimulationUnit:
         )
         logged: list[tuple[str, tuple[object, ...]]] = []
 
-        async def fake_generate(simulation, *, allow_llm=True):
+        async def fake_generate(simulation, *, allow_llm=True, db=None, refresh=False):
             assert simulation.id == sim_id
             assert allow_llm is True
             return type(
@@ -403,6 +651,7 @@ class TestSummarizeSimulationUnit:
                     "llm_latency_ms": 9.0,
                     "attempted_provider": "ollama",
                     "attempted_model": "gemma4:26b",
+                    "cache_hit": False,
                 },
             )()
 
@@ -486,7 +735,7 @@ class TestSummarizeSimulationUnit:
         )
         logged: list[tuple[str, tuple[object, ...]]] = []
 
-        async def fake_generate(simulation, *, allow_llm=True):
+        async def fake_generate(simulation, *, allow_llm=True, db=None, refresh=False):
             assert simulation.id == sim_id
             assert allow_llm is False
             return type(
@@ -498,6 +747,7 @@ class TestSummarizeSimulationUnit:
                     "llm_latency_ms": 0.0,
                     "attempted_provider": None,
                     "attempted_model": None,
+                    "cache_hit": False,
                 },
             )()
 
@@ -515,3 +765,100 @@ class TestSummarizeSimulationUnit:
         assert response.fallback_used is False
         assert response.trace_id == trace_id
         assert logged[0][1][2] == "null"
+
+
+class TestSummarizeCaseEndpoints:
+    @pytest.fixture(autouse=True)
+    def _enable_llm(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "assistant_llm_enabled", True)
+        monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
+        monkeypatch.setattr(settings, "assistant_ollama_model", "gemma4:26b")
+        monkeypatch.setattr(
+            settings, "assistant_ollama_base_url", "http://localhost:11434"
+        )
+        clear_summary_lru()
+        yield
+        clear_summary_lru()
+
+    @pytest.mark.asyncio
+    async def test_case_summary_is_one_llm_call(
+        self,
+        authenticated_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        calls: list[int] = []
+
+        async def fake_generate_case(self, snapshot):
+            calls.append(snapshot.executions.count)
+            return SimulationSummaryContent(
+                answer=f"Case {snapshot.cases[0].name} has one execution.",
+                citations=[
+                    SummaryCitationOut(
+                        source_type="simulation_field",
+                        path="executions.count",
+                        label="Count",
+                    )
+                ],
+                limitations=["limit"],
+                suggested_followups=["follow up"],
+            )
+
+        monkeypatch.setattr(SummaryLLMGenerator, "generate_case", fake_generate_case)
+
+        response = await authenticated_client.post(
+            f"{API_BASE}/cases/{simulation.case_id}/summary"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert calls == [1]
+        assert data["generationMode"] == "llm"
+        assert data["answer"] == "Case assistant_api_case has one execution."
+        assert data["citations"][0]["label"] == "Execution count"
+        assert UUID(data["traceId"])
+
+    @pytest.mark.asyncio
+    async def test_anonymous_case_group_summary_is_deterministic(
+        self,
+        async_client: AsyncClient,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        case = await async_db.get(Case, simulation.case_id)
+        assert case is not None
+        case.case_group = "assistant_api_group"
+        await async_db.commit()
+
+        response = await async_client.post(
+            f"{API_BASE}/cases/summary",
+            params={"case_group": "assistant_api_group"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["generationMode"] == "deterministic"
+        assert data["fallbackUsed"] is False
+        assert data["answer"].startswith(
+            "Case group assistant_api_group contains 1 case(s) with 1 recorded "
+            "execution(s)."
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_case_or_group_returns_404(
+        self, async_client: AsyncClient
+    ) -> None:
+        case_response = await async_client.post(f"{API_BASE}/cases/{uuid4()}/summary")
+        group_response = await async_client.post(
+            f"{API_BASE}/cases/summary", params={"case_group": "missing-group"}
+        )
+
+        assert case_response.status_code == 404
+        assert case_response.json()["detail"] == "Case not found"
+        assert group_response.status_code == 404
+        assert group_response.json()["detail"] == "Case group not found"
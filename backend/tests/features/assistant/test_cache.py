@@ -0,0 +1,227 @@
+from uuid import uuid4
+
+import pytest
+from pydantic import SecretStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.features.assistant.cache import (
+    build_summary_cache_key,
+    clear_summary_lru,
+    get_cached_summaries,
+    get_cached_summary,
+    store_cached_summary,
+)
+from app.features.assistant.llm_generator import AssistantLLMConfig
+from app.features.assistant.models import SimulationSummaryCache
+from app.features.assistant.schemas import SimulationSummaryResponse
+from app.features.assistant.snapshot import (
+    SimulationSnapshot,
+    SnapshotCaseFields,
+    SnapshotSimulationFields,
+)
+from tests.conftest import create_simulation
+
+
+@pytest.fixture(autouse=True)
+def _clear_summary_cache():
+    clear_summary_lru()
+    yield
+    clear_summary_lru()
+
+
+def _make_config(model_name: str = "livai-model") -> AssistantLLMConfig:
+    return AssistantLLMConfig(
+        provider="livai",
+        model_name=model_name,
+        api_key=SecretStr("key"),
+        timeout_seconds=30.0,
+        temperature=0.2,
+        max_tokens=2048,
+    )
+
+
+def _make_snapshot(status: str = "completed", **extra) -> SimulationSnapshot:
+    return SimulationSnapshot(
+        simulation=SnapshotSimulationFields(
+            id=str(uuid4()),
+            execution_id="cache-exec",
+            compset="AQUAPLANET",
+            compset_alias="QPC4",
+            grid_name="f19_f19",
+            grid_resolution="1.9x2.5",
+            simulation_type="experimental",
+            status=status,
+            initialization_type="startup",
+            extra=extra,
+        ),
+        case=SnapshotCaseFields(name="cache_case"),
+    )
+
+
+def _make_summary(answer: str = "Cached summary.") -> SimulationSummaryResponse:
+    return SimulationSummaryResponse(
+        answer=answer,
+        generation_mode="llm",
+        generation_provider="livai",
+        generation_model="livai-model",
+        trace_id=uuid4(),
+    )
+
+
+class TestBuildSummaryCacheKey:
+    def test_key_is_stable_for_equal_snapshots(self) -> None:
+        snapshot = _make_snapshot(queue="debug", nodes=4)
+        reordered = snapshot.model_copy(
+            update={
+                "simulation": snapshot.simulation.model_copy(
+                    update={"extra": {"nodes": 4, "queue": "debug"}}
+                )
+            }
+        )
+
+        assert build_summary_cache_key(
+            snapshot, _make_config()
+        ) == build_summary_cache_key(reordered, _make_config())
+
+    def test_key_changes_with_snapshot_and_model(self) -> None:
+        snapshot = _make_snapshot()
+        key = build_summary_cache_key(snapshot, _make_config())
+        changed = snapshot.model_copy(
+            update={
+                "simulation": snapshot.simulation.model_copy(
+                    update={"status": "failed"}
+                )
+            }
+        )
+
+        assert build_summary_cache_key(changed, _make_config()) != key
+        assert build_summary_cache_key(snapshot, _make_config("other")) != key
+
+
+class TestSummaryLRU:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_entry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "assistant_summary_cache_max_entries", 2)
+        config = _make_config()
+
+        for key in ("a", "b"):
+            await store_cached_summary(
+                None, key, simulation_id="", config=config, summary=_make_summary(key)
+            )
+        assert await get_cached_summary(None, "a") is not None
+        await store_cached_summary(
+            None, "c", simulation_id="", config=config, summary=_make_summary("c")
+        )
+
+        assert await get_cached_summary(None, "a") is not None
+        assert await get_cached_summary(None, "b") is None
+        assert await get_cached_summary(None, "c") is not None
+
+
+class TestPersistentSummaryCache:
+    @pytest.mark.asyncio
+    async def test_round_trips_through_postgres(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        config = _make_config()
+
+        await store_cached_summary(
+            async_db,
+            "key-1",
+            simulation_id=str(simulation.id),
+            config=config,
+            summary=_make_summary(),
+        )
+        clear_summary_lru()
+
+        cached = await get_cached_summary(async_db, "key-1")
+
+        assert cached is not None
+        assert cached.answer == "Cached summary."
+        assert cached.generation_mode == "llm"
+        assert await get_cached_summary(async_db, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_does_not_commit_the_callers_session(
+        self,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+
+        async def fail_commit() -> None:
+            raise AssertionError("store_cached_summary committed the caller's session")
+
+        monkeypatch.setattr(async_db, "commit", fail_commit)
+
+        await store_cached_summary(
+            async_db,
+            "key-1",
+            simulation_id=str(simulation.id),
+            config=_make_config(),
+            summary=_make_summary(),
+        )
+
+        stored = await async_db.scalar(
+            select(SimulationSummaryCache.cache_key).where(
+                SimulationSummaryCache.simulation_id == simulation.id
+            )
+        )
+        assert stored == "key-1"
+
+    @pytest.mark.asyncio
+    async def test_replaces_stale_entries_for_the_simulation(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        config = _make_config()
+
+        for key in ("old-key", "new-key"):
+            await store_cached_summary(
+                async_db,
+                key,
+                simulation_id=str(simulation.id),
+                config=config,
+                summary=_make_summary(key),
+            )
+
+        keys = (
+            await async_db.scalars(
+                select(SimulationSummaryCache.cache_key).where(
+                    SimulationSummaryCache.simulation_id == simulation.id
+                )
+            )
+        ).all()
+
+        assert keys == ["new-key"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_combines_lru_and_postgres(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        config = _make_config()
+        await store_cached_summary(
+            async_db,
+            "db-key",
+            simulation_id=str(simulation.id),
+            config=config,
+            summary=_make_summary("From Postgres."),
+        )
+        clear_summary_lru()
+        await store_cached_summary(
+            None, "lru-key", simulation_id="", config=config, summary=_make_summary()
+        )
+
+        cached = await get_cached_summaries(async_db, ["lru-key", "db-key", "missing"])
+
+        assert set(cached) == {"lru-key", "db-key"}
+        assert cached["db-key"].answer == "From Postgres."
+        assert await get_cached_summary(None, "db-key") is not None
@@ -0,0 +1,311 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.assistant.case_snapshot import (
+    CaseSnapshot,
+    CaseSnapshotBudgetExceededError,
+    CaseSnapshotCase,
+    CaseSnapshotConfiguration,
+    CaseSnapshotConfigurationDrift,
+    CaseSnapshotConfigurationValue,
+    CaseSnapshotExecution,
+    CaseSnapshotExecutions,
+    _apply_case_size_budget,
+    _case_snapshot_size,
+    build_case_group_snapshot,
+    build_case_snapshot,
+)
+from app.features.assistant.snapshot import SNAPSHOT_TRUNCATED_CAVEAT, SnapshotLink
+from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
+from app.features.ingestion.models import Ingestion
+from app.features.machine.models import Machine
+from app.features.simulation.case_stats import apply_simulations_to_case_stats
+from app.features.simulation.enums import ExternalLinkKind
+from app.features.simulation.models import Case, ExternalLink, Simulation
+
+_BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+async def _create_case_with_executions(
+    db: AsyncSession,
+    normal_user: dict[str, str],
+    admin_user: dict[str, str],
+    *,
+    name: str,
+    case_group: str | None = None,
+    executions: list[dict],
+) -> Case:
+    machine = (await db.execute(select(Machine))).scalars().first()
+    assert machine is not None
+
+    case = Case(
+        name=name,
+        machine_id=machine.id,
+        hpc_username="assistant-user",
+        case_group=case_group,
+    )
+    db.add(case)
+    ingestion = Ingestion(
+        source_type=IngestionSourceType.BROWSER_UPLOAD,
+        source_reference=name,
+        machine_id=machine.id,
+        triggered_by=UUID(normal_user["id"]),
+        status=IngestionStatus.SUCCESS,
+        created_count=len(executions),
+        duplicate_count=0,
+        error_count=0,
+    )
+    db.add(ingestion)
+    await db.flush()
+
+    simulations = []
+    for index, overrides in enumerate(executions):
+        fields = {
+            "execution_id": f"{name}-exec-{index}",
+            "compset": "AQUAPLANET",
+            "compset_alias": "QPC4",
+            "grid_name": "f19_f19",
+            "grid_resolution": "1.9x2.5",
+            "simulation_type": "experimental",
+            "status": "completed",
+            "initialization_type": "startup",
+            "simulation_start_date": _BASE_TIME + timedelta(days=index),
+            "created_at": _BASE_TIME + timedelta(hours=index),
+            **overrides,
+        }
+        simulations.append(
+            Simulation(
+                case_id=case.id,
+                created_by=UUID(normal_user["id"]),
+                last_updated_by=UUID(admin_user["id"]),
+                ingestion_id=ingestion.id,
+                **fields,
+            )
+        )
+
+    db.add_all(simulations)
+    await db.flush()
+    await db.run_sync(apply_simulations_to_case_stats, simulations)
+    return case
+
+
+def _make_case_snapshot(
+    *, links: int = 0, recent: int = 0, cases: int = 1, drift_values: int = 2
+) -> CaseSnapshot:
+    return CaseSnapshot(
+        scope="case_group" if cases > 1 else "case",
+        case_count=cases,
+        cases=[
+            CaseSnapshotCase(id=str(uuid4()), name=f"case-{index}", simulation_count=1)
+            for index in range(cases)
+        ],
+        executions=CaseSnapshotExecutions(
+            count=recent, status_counts={"completed": recent}
+        ),
+        configuration=CaseSnapshotConfiguration(
+            shared={"compset": "AQUAPLANET"},
+            drift=[
+                CaseSnapshotConfigurationDrift(
+                    field="git_tag",
+                    values=[
+                        CaseSnapshotConfigurationValue(value=f"v{index}", count=1)
+                        for index in range(drift_values)
+                    ],
+                )
+            ],
+        ),
+        recent_executions=[
+            CaseSnapshotExecution(
+                id=str(uuid4()), execution_id=f"exec-{index}", status="completed"
+            )
+            for index in range(recent)
+        ],
+        links=[
+            SnapshotLink(kind="diagnostic", url=f"https://example.com/{index}")
+            for index in range(links)
+        ],
+    )
+
+
+class TestBuildCaseSnapshot:
+    @pytest.mark.asyncio
+    async def test_aggregates_status_coverage_and_configuration(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        case = await _create_case_with_executions(
+            async_db,
+            normal_user,
+            admin_user,
+            name="case_snapshot_case",
+            case_group="case_snapshot_group",
+            executions=[
+                {"git_tag": "v1.0.0", "compiler": "gnu"},
+                {
+                    "git_tag": "v1.0.0",
+                    "simulation_end_date": _BASE_TIME + timedelta(days=30),
+                },
+                {"git_tag": "v1.1.0", "status": "failed"},
+            ],
+        )
+
+        snapshot = await build_case_snapshot(async_db, case.id)
+
+        assert snapshot is not None
+        assert snapshot.scope == "case"
+        assert snapshot.case_group == "case_snapshot_group"
+        assert [item.name for item in snapshot.cases] == ["case_snapshot_case"]
+        assert snapshot.cases[0].simulation_count == 3
+        assert snapshot.executions.count == 3
+        assert snapshot.executions.status_counts == {"completed": 2, "failed": 1}
+        assert snapshot.executions.earliest_simulation_start_date == (
+            _BASE_TIME.isoformat()
+        )
+        assert snapshot.executions.latest_simulation_end_date == (
+            (_BASE_TIME + timedelta(days=30)).isoformat()
+        )
+        assert snapshot.configuration.shared["compset"] == "AQUAPLANET"
+        assert snapshot.configuration.shared["simulation_type"] == "experimental"
+        assert "git_tag" not in snapshot.configuration.shared
+        drift = {item.field: item for item in snapshot.configuration.drift}
+        assert [(value.value, value.count) for value in drift["git_tag"].values] == [
+            ("v1.0.0", 2),
+            ("v1.1.0", 1),
+        ]
+        assert {value.value for value in drift["compiler"].values} == {"gnu", None}
+        assert [item.execution_id for item in snapshot.recent_executions] == [
+            "case_snapshot_case-exec-2",
+            "case_snapshot_case-exec-1",
+            "case_snapshot_case-exec-0",
+        ]
+        assert snapshot.recent_executions[0].case_name is None
+        assert snapshot.snapshot_caveats == []
+
+    @pytest.mark.asyncio
+    async def test_merges_case_and_execution_links(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        case = await _create_case_with_executions(
+            async_db,
+            normal_user,
+            admin_user,
+            name="case_snapshot_links",
+            executions=[{}, {}],
+        )
+        simulations = (
+            await async_db.scalars(
+                select(Simulation).where(Simulation.case_id == case.id)
+            )
+        ).all()
+        async_db.add_all(
+            [
+                ExternalLink(
+                    case_id=case.id,
+                    kind=ExternalLinkKind.DIAGNOSTIC,
+                    url="https://example.com/shared",
+                    label="Case shared",
+                ),
+                *(
+                    ExternalLink(
+                        simulation_id=simulation.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/shared",
+                        label="Execution shared",
+                    )
+                    for simulation in simulations
+                ),
+                ExternalLink(
+                    simulation_id=simulations[0].id,
+                    kind=ExternalLinkKind.PERFORMANCE,
+                    url="https://example.com/perf",
+                ),
+            ]
+        )
+        await async_db.flush()
+
+        snapshot = await build_case_snapshot(async_db, case.id)
+
+        assert snapshot is not None
+        assert [(link.kind, link.url, link.label) for link in snapshot.links] == [
+            ("diagnostic", "https://example.com/shared", "Case shared"),
+            ("performance", "https://example.com/perf", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_case_group_snapshot_covers_every_case(
+        self, async_db: AsyncSession, normal_user, admin_user
+    ) -> None:
+        for name, grid in (("group_case_a", "f19_f19"), ("group_case_b", "ne30")):
+            await _create_case_with_executions(
+                async_db,
+                normal_user,
+                admin_user,
+                name=name,
+                case_group="case_snapshot_group_scope",
+                executions=[{"grid_name": grid}],
+            )
+
+        snapshot = await build_case_group_snapshot(
+            async_db, "case_snapshot_group_scope"
+        )
+
+        assert snapshot is not None
+        assert snapshot.scope == "case_group"
+        assert snapshot.case_count == 2
+        assert [item.name for item in snapshot.cases] == [
+            "group_case_a",
+            "group_case_b",
+        ]
+        assert snapshot.executions.count == 2
+        assert [item.field for item in snapshot.configuration.drift] == ["grid_name"]
+        assert {item.case_name for item in snapshot.recent_executions} == {
+            "group_case_a",
+            "group_case_b",
+        }
+
+    @pytest.mark.asyncio
+    async def test_returns_none_for_unknown_case_or_group(
+        self, async_db: AsyncSession
+    ) -> None:
+        assert await build_case_snapshot(async_db, uuid4()) is None
+        assert await build_case_group_snapshot(async_db, "no-such-group") is None
+
+
+class TestApplyCaseSizeBudget:
+    def test_returns_snapshot_unchanged_when_within_budget(self) -> None:
+        snapshot = _make_case_snapshot(links=2, recent=2)
+
+        assert _apply_case_size_budget(snapshot, 100_000) is snapshot
+
+    def test_drops_from_longest_list_and_keeps_one_case(self) -> None:
+        snapshot = _make_case_snapshot(links=20, recent=5, cases=3)
+        max_chars = _case_snapshot_size(_make_case_snapshot(links=3, recent=3)) + 400
+
+        trimmed = _apply_case_size_budget(snapshot, max_chars)
+
+        assert _case_snapshot_size(trimmed) <= max_chars
+        assert len(trimmed.links) < 20
+        assert len(trimmed.cases) >= 1
+        assert trimmed.links == snapshot.links[: len(trimmed.links)]
+        assert trimmed.case_count == 3
+        assert SNAPSHOT_TRUNCATED_CAVEAT in trimmed.snapshot_caveats
+
+    def test_caps_drift_values_when_lists_are_exhausted(self) -> None:
+        snapshot = _make_case_snapshot(links=2, drift_values=40)
+        max_chars = _case_snapshot_size(_make_case_snapshot(drift_values=3)) + 200
+
+        trimmed = _apply_case_size_budget(snapshot, max_chars)
+
+        drift = trimmed.configuration.drift[0]
+        assert trimmed.links == []
+        assert len(drift.values) == 3
+        assert drift.omitted_value_count == 37
+
+    def test_raises_when_required_aggregates_do_not_fit(self) -> None:
+        with pytest.raises(CaseSnapshotBudgetExceededError) as exc_info:
+            _apply_case_size_budget(_make_case_snapshot(links=5), 50)
+
+        assert exc_info.value.snapshot.links == []
@@ -1,12 +1,25 @@
+import asyncio
 from types import SimpleNamespace
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
 from pydantic import SecretStr
 from pydantic_ai.output import PromptedOutput
 
 from app.features.assistant import llm_generator
-from app.features.assistant.llm_generator import AssistantLLMConfig, SummaryLLMGenerator
+from app.features.assistant.case_snapshot import (
+    CaseSnapshot,
+    CaseSnapshotCase,
+    CaseSnapshotConfiguration,
+    CaseSnapshotExecutions,
+)
+from app.features.assistant.llm_generator import (
+    AssistantLLMConfig,
+    SummaryLLMGenerator,
+    close_summary_llm_generator,
+    get_summary_llm_generator,
+)
 from app.features.assistant.schemas import SimulationSummaryContent, SummaryCitationOut
 from app.features.assistant.snapshot import (
     SimulationSnapshot,
@@ -32,6 +45,25 @@ def _make_snapshot() -> SimulationSnapshot:
     )
 
 
+def _make_config(model_name: str = "livai-model") -> AssistantLLMConfig:
+    return AssistantLLMConfig(
+        provider="livai",
+        model_name=model_name,
+        api_key=SecretStr("livai-key"),
+        timeout_seconds=30.0,
+        temperature=0.2,
+        max_tokens=2048,
+        base_url="https://example.livai.test/v1",
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_shared_generator():
+    await close_summary_llm_generator()
+    yield
+    await close_summary_llm_generator()
+
+
 class TestSummaryLLMGenerator:
     @pytest.mark.asyncio
     async def test_build_model_uses_livai_base_url_for_openai_compatible_provider(
@@ -169,6 +201,22 @@ class TestSummaryLLMGenerator:
         assert "simulation.execution_id (simulation_field)" in prompt
         assert "case.name (case_field)" in prompt
 
+    def test_build_case_user_prompt_uses_case_citation_paths(self) -> None:
+        prompt = SummaryLLMGenerator(_make_config())._build_case_user_prompt(
+            CaseSnapshot(
+                scope="case",
+                case_count=1,
+                cases=[CaseSnapshotCase(id="case-1", name="assistant_case")],
+                executions=CaseSnapshotExecutions(count=4),
+                configuration=CaseSnapshotConfiguration(),
+            )
+        )
+
+        assert "Case metadata snapshot:" in prompt
+        assert "assistant_case" in prompt
+        assert "- configuration.drift (simulation_field)" in prompt
+        assert "- simulation.status (simulation_field)" not in prompt
+
     def test_summary_system_prompt_enforces_short_natural_answer_shape(self) -> None:
         assert (
             "Keep `answer` to 2-4 short sentences"
@@ -331,3 +379,118 @@ class TestSummaryLLMGenerator:
 
         assert result == expected
         assert isinstance(captured["output_type"], PromptedOutput)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_partial_outputs_from_agent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        partials = [
+            SimulationSummaryContent(answer="Generated"),
+            SimulationSummaryContent(answer="Generated summary."),
+        ]
+        captured: dict[str, object] = {}
+
+        class FakeStreamResult:
+            async def stream_output(self, debounce_by: float | None = None):
+                captured["debounce_by"] = debounce_by
+                for partial in partials:
+                    yield partial
+
+        class FakeRunStream:
+            async def __aenter__(self):
+                return FakeStreamResult()
+
+            async def __aexit__(self, *exc_info) -> None:
+                captured["closed"] = True
+
+        class FakeAgent:
+            def __init__(
+                self, model, output_type, system_prompt, model_settings=None
+            ) -> None:
+                pass
+
+            def run_stream(self, prompt: str):
+                captured["prompt"] = prompt
+                return FakeRunStream()
+
+        monkeypatch.setattr(llm_generator, "Agent", FakeAgent)
+        generator = SummaryLLMGenerator(_make_config())
+
+        received = [item async for item in generator.stream(_make_snapshot())]
+
+        assert received == partials
+        assert captured["closed"] is True
+        assert captured["debounce_by"] == llm_generator._STREAM_DEBOUNCE_SECONDS
+        assert "Allowed citation paths:" in str(captured["prompt"])
+        assert generator._active_calls == 0
+
+        await generator.aclose()
+
+
+class TestSummaryLLMGeneratorLifecycle:
+    @pytest.fixture
+    def agent_inits(self, monkeypatch: pytest.MonkeyPatch) -> list[object]:
+        inits: list[object] = []
+
+        class FakeAgent:
+            def __init__(
+                self, model, output_type, system_prompt, model_settings=None
+            ) -> None:
+                inits.append(model)
+
+            async def run(self, prompt: str):
+                await asyncio.sleep(0)
+                return SimpleNamespace(output="summary")
+
+        monkeypatch.setattr(llm_generator, "Agent", FakeAgent)
+
+        return inits
+
+    @pytest.mark.asyncio
+    async def test_generate_reuses_client_and_agent(self, agent_inits) -> None:
+        generator = SummaryLLMGenerator(_make_config())
+
+        await generator.generate(_make_snapshot())
+        http_client = generator._http_client
+        await generator.generate(_make_snapshot())
+
+        assert len(agent_inits) == 1
+        assert http_client is not None
+        assert generator._http_client is http_client
+
+        await generator.aclose()
+
+        assert http_client.is_closed
+        assert generator._agent is None
+
+    @pytest.mark.asyncio
+    async def test_retire_waits_for_in_flight_calls(self, agent_inits) -> None:
+        generator = SummaryLLMGenerator(_make_config())
+        generator.warm_up()
+        http_client = generator._http_client
+        assert http_client is not None
+
+        pending = asyncio.ensure_future(generator.generate(_make_snapshot()))
+        await asyncio.sleep(0)
+        await generator.retire()
+
+        assert not http_client.is_closed
+        assert await pending == "summary"
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_shared_generator_is_rebuilt_only_when_config_changes(
+        self, agent_inits
+    ) -> None:
+        first = await get_summary_llm_generator(_make_config())
+        first.warm_up()
+        old_client = first._http_client
+        assert old_client is not None
+
+        same = await get_summary_llm_generator(_make_config())
+        changed = await get_summary_llm_generator(_make_config("other-model"))
+
+        assert same is first
+        assert changed is not first
+        assert changed.config.model_name == "other-model"
+        assert old_client.is_closed
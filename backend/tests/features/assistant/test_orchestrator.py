@@ -1,11 +1,23 @@
+import asyncio
 from typing import cast
+from uuid import UUID, uuid4
 
 import pytest
 from pydantic import SecretStr
 from pydantic_ai.exceptions import ModelAPIError, ModelHTTPError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import sample_value
 from app.features.assistant import orchestrator
+from app.features.assistant.cache import clear_summary_lru
+from app.features.assistant.case_snapshot import (
+    CaseSnapshot,
+    CaseSnapshotBudgetExceededError,
+    CaseSnapshotCase,
+    CaseSnapshotConfiguration,
+    CaseSnapshotExecutions,
+)
 from app.features.assistant.schemas import (
     SimulationSummaryContent,
     SummaryCitationOut,
@@ -24,6 +36,14 @@ from app.features.assistant.snapshot import (
 from app.features.simulation.models import Simulation
 
 DEFAULT_LIVAI_API_KEY = SecretStr("livai-key")
+CASE_ID = UUID("00000000-0000-0000-0000-0000000000c1")
+
+
+@pytest.fixture(autouse=True)
+def _clear_summary_cache():
+    clear_summary_lru()
+    yield
+    clear_summary_lru()
 
 
 def _make_snapshot() -> SimulationSnapshot:
@@ -822,9 +842,29 @@ class TestGenerateSimulationSummary:
             "generate",
             fake_generate,
         )
+        fallbacks = sample_value(
+            "assistant_summary_fallbacks_total", reason="llm_failed"
+        )
+        failures = sample_value(
+            "assistant_llm_request_duration_seconds_count",
+            provider="livai",
+            outcome="fallback",
+        )
 
         result = await orchestrator.generate_simulation_summary(cast(Simulation, None))
 
+        assert (
+            sample_value("assistant_summary_fallbacks_total", reason="llm_failed")
+            == fallbacks + 1
+        )
+        assert (
+            sample_value(
+                "assistant_llm_request_duration_seconds_count",
+                provider="livai",
+                outcome="fallback",
+            )
+            == failures + 1
+        )
         assert result.fallback_reason == "RuntimeError: boom"
         assert result.summary.generation_mode == "deterministic"
         assert result.summary.fallback_used is True
@@ -892,3 +932,564 @@ class TestGenerateSimulationSummary:
         assert result.summary.generation_mode == "deterministic"
         assert result.attempted_provider == "ollama"
         assert result.attempted_model == "gemma4:e4b"
+
+
+class TestGenerateSimulationSummaryCache:
+    @pytest.fixture(autouse=True)
+    def _patch_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        snapshot = _make_snapshot()
+        _set_livai_settings(monkeypatch)
+        monkeypatch.setattr(
+            orchestrator,
+            "build_simulation_snapshot",
+            lambda simulation: snapshot,
+        )
+
+    def _count_generate_calls(
+        self, monkeypatch: pytest.MonkeyPatch, content=None
+    ) -> list[int]:
+        calls: list[int] = []
+
+        async def fake_generate(self, snapshot_arg):
+            calls.append(1)
+            if content is None:
+                return _make_llm_content()
+            if isinstance(content, Exception):
+                raise content
+            return content
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "generate", fake_generate)
+
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_is_served_from_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._count_generate_calls(monkeypatch)
+
+        first = await orchestrator.generate_simulation_summary(cast(Simulation, None))
+        second = await orchestrator.generate_simulation_summary(cast(Simulation, None))
+
+        assert len(calls) == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.summary == first.summary
+        assert second.attempted_provider == "livai"
+        assert second.llm_latency_ms == 0.0
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._count_generate_calls(monkeypatch)
+
+        await orchestrator.generate_simulation_summary(cast(Simulation, None))
+        result = await orchestrator.generate_simulation_summary(
+            cast(Simulation, None), refresh=True
+        )
+
+        assert len(calls) == 2
+        assert result.cache_hit is False
+
+    @pytest.mark.asyncio
+    async def test_model_change_misses_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._count_generate_calls(monkeypatch)
+
+        await orchestrator.generate_simulation_summary(cast(Simulation, None))
+        monkeypatch.setattr(settings, "assistant_livai_model", "livai-model-2")
+        result = await orchestrator.generate_simulation_summary(cast(Simulation, None))
+
+        assert len(calls) == 2
+        assert result.summary.generation_model == "livai-model-2"
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_are_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._count_generate_calls(
+            monkeypatch, content=ModelAPIError("livai-model", "boom")
+        )
+
+        await orchestrator.generate_simulation_summary(cast(Simulation, None))
+        result = await orchestrator.generate_simulation_summary(cast(Simulation, None))
+
+        assert len(calls) == 2
+        assert result.cache_hit is False
+        assert result.summary.generation_mode == "deterministic"
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "assistant_summary_cache_enabled", False)
+        calls = self._count_generate_calls(monkeypatch)
+
+        await orchestrator.generate_simulation_summary(cast(Simulation, None))
+        await orchestrator.generate_simulation_summary(cast(Simulation, None))
+
+        assert len(calls) == 2
+
+
+class TestGenerateSimulationSummaryConcurrency:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_generation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        snapshot = _make_snapshot()
+        _set_livai_settings(monkeypatch)
+        monkeypatch.setattr(
+            orchestrator, "build_simulation_snapshot", lambda simulation: snapshot
+        )
+        release = asyncio.Event()
+        calls: list[int] = []
+
+        async def fake_generate(self, snapshot_arg):
+            calls.append(1)
+            await release.wait()
+            return _make_llm_content()
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "generate", fake_generate)
+        coalesced_before = orchestrator.get_llm_queue_stats()["coalesced"]
+
+        pending = [
+            asyncio.ensure_future(
+                orchestrator.generate_simulation_summary(cast(Simulation, None))
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        stats = orchestrator.get_llm_queue_stats()
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert len(calls) == 1
+        assert stats["inflight"] == 1
+        assert stats["coalesced"] == coalesced_before + 2
+        assert {result.summary.answer for result in results} == {
+            results[0].summary.answer
+        }
+        assert orchestrator.get_llm_queue_stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_are_capped_by_max_concurrency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _set_livai_settings(monkeypatch)
+        monkeypatch.setattr(settings, "assistant_llm_max_concurrency", 2)
+        snapshots = iter(
+            _make_snapshot().model_copy(
+                update={"case": SnapshotCaseFields(name=f"case-{index}")}
+            )
+            for index in range(4)
+        )
+        monkeypatch.setattr(
+            orchestrator,
+            "build_simulation_snapshot",
+            lambda simulation: next(snapshots),
+        )
+        release = asyncio.Event()
+        running: list[int] = []
+        peak = 0
+
+        async def fake_generate(self, snapshot_arg):
+            nonlocal peak
+            running.append(1)
+            peak = max(peak, len(running))
+            await release.wait()
+            running.pop()
+            return _make_llm_content()
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "generate", fake_generate)
+
+        pending = [
+            asyncio.ensure_future(
+                orchestrator.generate_simulation_summary(cast(Simulation, None))
+            )
+            for _ in range(4)
+        ]
+        for _ in range(3):
+            await asyncio.sleep(0)
+        stats = orchestrator.get_llm_queue_stats()
+        release.set()
+        await asyncio.gather(*pending)
+
+        assert peak == 2
+        assert stats["active"] == 2
+        assert stats["waiting"] == 2
+        assert stats["inflight"] == 4
+        assert orchestrator.get_llm_queue_stats()["waiting"] == 0
+
+
+class TestGenerateSimulationSummaries:
+    @pytest.fixture(autouse=True)
+    def _patch_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _set_livai_settings(monkeypatch)
+        monkeypatch.setattr(
+            orchestrator,
+            "build_simulation_snapshot",
+            lambda simulation: _make_snapshot().model_copy(
+                update={"case": SnapshotCaseFields(name=cast(str, simulation))}
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_llm_calls_concurrently_and_preserves_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def fake_generate(self, snapshot_arg):
+            started.append(snapshot_arg.case.name)
+            await release.wait()
+            return _make_llm_content(answer=f"Summary of {snapshot_arg.case.name}.")
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "generate", fake_generate)
+        simulations = [cast(Simulation, name) for name in ("case-a", "case-b")]
+
+        pending = asyncio.ensure_future(
+            orchestrator.generate_simulation_summaries(simulations)
+        )
+        for _ in range(3):
+            await asyncio.sleep(0)
+        running = list(started)
+        release.set()
+        results = await pending
+
+        assert sorted(running) == ["case-a", "case-b"]
+        assert [result.summary.answer for result in results] == [
+            "Summary of case-a.",
+            "Summary of case-b.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_summaries_without_llm_call(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        async def fake_generate(self, snapshot_arg):
+            calls.append(snapshot_arg.case.name)
+            return _make_llm_content()
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "generate", fake_generate)
+        await orchestrator.generate_simulation_summary(cast(Simulation, "case-a"))
+
+        results = await orchestrator.generate_simulation_summaries(
+            [cast(Simulation, "case-a"), cast(Simulation, "case-b")]
+        )
+
+        assert calls == ["case-a", "case-b"]
+        assert [result.cache_hit for result in results] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_returns_deterministic_results_when_llm_disallowed(self) -> None:
+        results = await orchestrator.generate_simulation_summaries(
+            [cast(Simulation, "case-a")], allow_llm=False
+        )
+
+        assert [result.summary.generation_mode for result in results] == [
+            "deterministic"
+        ]
+
+
+class TestStreamSimulationSummary:
+    @pytest.fixture(autouse=True)
+    def _patch_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        snapshot = _make_snapshot()
+        _set_livai_settings(monkeypatch)
+        monkeypatch.setattr(
+            orchestrator,
+            "build_simulation_snapshot",
+            lambda simulation: snapshot,
+        )
+
+    def _patch_stream(
+        self, monkeypatch: pytest.MonkeyPatch, error: Exception | None = None
+    ) -> list[int]:
+        calls: list[int] = []
+
+        async def fake_stream(self, snapshot_arg):
+            calls.append(1)
+            yield SimulationSummaryContent(answer="Simulation assistant")
+            if error is not None:
+                raise error
+            yield _make_llm_content()
+
+        monkeypatch.setattr(orchestrator.SummaryLLMGenerator, "stream", fake_stream)
+
+        return calls
+
+    async def _collect(self, **kwargs) -> list[orchestrator.SummaryStreamEvent]:
+        return [
+            event
+            async for event in orchestrator.stream_simulation_summary(
+                cast(Simulation, None), **kwargs
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streams_deterministic_partials_then_validated_final(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._patch_stream(monkeypatch)
+
+        events = await self._collect()
+
+        assert [event.event for event in events] == [
+            "deterministic",
+            "partial",
+            "partial",
+            "final",
+        ]
+        assert events[0].result is not None
+        assert events[0].result.summary.generation_mode == "deterministic"
+        assert events[1].partial is not None
+        assert events[1].partial.answer == "Simulation assistant"
+        final = events[-1].result
+        assert final is not None
+        assert final.summary.generation_mode == "llm"
+        assert final.fallback_reason is None
+        assert [citation.path for citation in final.summary.citations] == [
+            "simulation.execution_id",
+            "case.name",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_stream_fails(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._patch_stream(monkeypatch, error=ModelAPIError("livai-model", "boom"))
+
+        events = await self._collect()
+
+        final = events[-1].result
+        assert events[-1].event == "final"
+        assert final is not None
+        assert final.summary.generation_mode == "deterministic"
+        assert final.fallback_reason == "ModelAPIError: boom"
+        assert LLM_FALLBACK_CAVEAT in final.summary.caveats
+
+    @pytest.mark.asyncio
+    async def test_only_final_event_when_llm_disallowed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._patch_stream(monkeypatch)
+
+        events = await self._collect(allow_llm=False)
+
+        assert [event.event for event in events] == ["final"]
+        assert events[0].result is not None
+        assert events[0].result.summary.generation_mode == "deterministic"
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_cached_summary_is_sent_as_single_final_event(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._patch_stream(monkeypatch)
+
+        first = await self._collect()
+        second = await self._collect()
+
+        assert len(calls) == 1
+        assert [event.event for event in second] == ["final"]
+        assert second[0].result is not None
+        assert second[0].result.cache_hit is True
+        assert first[-1].result is not None
+        assert second[0].result.summary == first[-1].result.summary
+
+
+class TestSummaryLLMGeneratorLifespan:
+    @pytest.mark.asyncio
+    async def test_start_warms_shared_generator_and_stop_closes_it(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _set_livai_settings(monkeypatch)
+
+        await orchestrator.start_summary_llm_generator()
+        generator = await orchestrator.get_summary_llm_generator(
+            orchestrator._resolve_llm_config()
+        )
+        http_client = generator._http_client
+        await orchestrator.stop_summary_llm_generator()
+
+        assert http_client is not None
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_start_is_noop_when_llm_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _set_livai_settings(monkeypatch, enabled=False)
+        calls: list[object] = []
+
+        async def fake_get(config):
+            calls.append(config)
+
+        monkeypatch.setattr(orchestrator, "get_summary_llm_generator", fake_get)
+
+        await orchestrator.start_summary_llm_generator()
+
+        assert calls == []
+
+
+def _make_case_snapshot() -> CaseSnapshot:
+    return CaseSnapshot(
+        scope="case",
+        case_count=1,
+        cases=[
+            CaseSnapshotCase(id="case-1", name="assistant_case", simulation_count=2)
+        ],
+        executions=CaseSnapshotExecutions(
+            count=2, status_counts={"completed": 1, "failed": 1}
+        ),
+        configuration=CaseSnapshotConfiguration(shared={"compset": "AQUAPLANET"}),
+    )
+
+
+def _make_case_llm_content(**overrides) -> SimulationSummaryContent:
+    payload = {
+        "answer": "Case assistant_case has two executions, one of which failed.",
+        "citations": [
+            SummaryCitationOut(
+                source_type="simulation_field",
+                path="status_counts",
+                label="Statuses",
+            ),
+            SummaryCitationOut(source_type="case_field", path="cases", label="Case"),
+        ],
+        "limitations": ["Custom LLM caveat."],
+        "suggested_followups": ["Review the failed execution."],
+    }
+    payload.update(overrides)
+    return SimulationSummaryContent(**payload)
+
+
+class TestGenerateCaseSummary:
+    @pytest.fixture(autouse=True)
+    def _patch_case_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _set_livai_settings(monkeypatch)
+
+        async def fake_build_case_snapshot(db, case_id):
+            return _make_case_snapshot() if case_id == CASE_ID else None
+
+        monkeypatch.setattr(
+            orchestrator, "build_case_snapshot", fake_build_case_snapshot
+        )
+
+    def _patch_generate_case(
+        self, monkeypatch: pytest.MonkeyPatch, content=None
+    ) -> list[CaseSnapshot]:
+        calls: list[CaseSnapshot] = []
+
+        async def fake_generate_case(self, snapshot_arg):
+            calls.append(snapshot_arg)
+            if isinstance(content, Exception):
+                raise content
+            return content or _make_case_llm_content()
+
+        monkeypatch.setattr(
+            orchestrator.SummaryLLMGenerator, "generate_case", fake_generate_case
+        )
+
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_llm_summary_uses_case_citations_and_is_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._patch_generate_case(monkeypatch)
+
+        first = await orchestrator.generate_case_summary(
+            cast(AsyncSession, None), CASE_ID
+        )
+        second = await orchestrator.generate_case_summary(
+            cast(AsyncSession, None), CASE_ID
+        )
+
+        assert first is not None and second is not None
+        assert len(calls) == 1
+        assert first.summary.generation_mode == "llm"
+        assert [
+            (citation.path, citation.label) for citation in first.summary.citations
+        ] == [
+            ("executions.status_counts", "Execution status counts"),
+            ("cases", "Cases"),
+        ]
+        assert second.cache_hit is True
+        assert second.summary == first.summary
+
+    @pytest.mark.asyncio
+    async def test_simulation_citation_path_falls_back_to_case_summary(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._patch_generate_case(
+            monkeypatch,
+            content=_make_case_llm_content(
+                citations=[
+                    SummaryCitationOut(
+                        source_type="simulation_field",
+                        path="simulation.status",
+                        label="Status",
+                    )
+                ]
+            ),
+        )
+
+        result = await orchestrator.generate_case_summary(
+            cast(AsyncSession, None), CASE_ID
+        )
+
+        assert result is not None
+        assert result.fallback_reason == "invalid_citation_path:simulation.status"
+        assert result.summary.generation_mode == "deterministic"
+        assert result.summary.answer.startswith(
+            "Case assistant_case has 2 recorded execution(s)."
+        )
+        assert LLM_FALLBACK_CAVEAT in result.summary.caveats
+
+    @pytest.mark.asyncio
+    async def test_budget_overflow_uses_deterministic_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._patch_generate_case(monkeypatch)
+
+        async def overflowing_snapshot(db, case_id):
+            raise CaseSnapshotBudgetExceededError(_make_case_snapshot(), 10)
+
+        monkeypatch.setattr(orchestrator, "build_case_snapshot", overflowing_snapshot)
+
+        result = await orchestrator.generate_case_summary(
+            cast(AsyncSession, None), CASE_ID
+        )
+
+        assert result is not None
+        assert calls == []
+        assert result.summary.generation_mode == "deterministic"
+        assert result.summary.fallback_used is True
+        assert result.fallback_reason is not None
+        assert result.fallback_reason.startswith("Case snapshot size")
+
+    @pytest.mark.asyncio
+    async def test_anonymous_request_skips_llm(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = self._patch_generate_case(monkeypatch)
+
+        result = await orchestrator.generate_case_summary(
+            cast(AsyncSession, None), CASE_ID, allow_llm=False
+        )
+
+        assert result is not None
+        assert calls == []
+        assert result.summary.generation_mode == "deterministic"
+        assert result.attempted_provider is None
+
+    @pytest.mark.asyncio
+    async def test_returns_none_for_unknown_case(self) -> None:
+        assert (
+            await orchestrator.generate_case_summary(cast(AsyncSession, None), uuid4())
+            is None
+        )
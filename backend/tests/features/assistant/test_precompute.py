@@ -0,0 +1,220 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.features.assistant import precompute
+from app.features.assistant.cache import clear_summary_lru
+from app.features.assistant.llm_generator import SummaryLLMGenerator
+from app.features.assistant.orchestrator import get_summary_llm_config
+from app.features.assistant.precompute import (
+    SummaryPrecomputeReport,
+    precompute_simulation_summaries,
+    select_simulations_to_precompute,
+)
+from app.features.assistant.schemas import SimulationSummaryContent, SummaryCitationOut
+from app.scripts.assistant import precompute_summaries
+from tests.conftest import create_simulation
+
+
+@pytest.fixture(autouse=True)
+def _enable_llm(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "assistant_llm_enabled", True)
+    monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
+    monkeypatch.setattr(settings, "assistant_ollama_model", "gemma4:26b")
+    monkeypatch.setattr(settings, "assistant_ollama_base_url", "http://localhost:11434")
+    clear_summary_lru()
+    yield
+    clear_summary_lru()
+
+
+def _session_factory(db: AsyncSession):
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory
+
+
+def _patch_generate(
+    monkeypatch: pytest.MonkeyPatch, error: Exception | None = None
+) -> list[str]:
+    calls: list[str] = []
+
+    async def fake_generate(self, snapshot):
+        calls.append(snapshot.simulation.execution_id)
+        if error is not None:
+            raise error
+        return SimulationSummaryContent(
+            answer="Precomputed summary.",
+            citations=[
+                SummaryCitationOut(
+                    source_type="case_field", path="case.name", label="Case"
+                )
+            ],
+            limitations=["limit"],
+            suggested_followups=["follow up"],
+        )
+
+    monkeypatch.setattr(SummaryLLMGenerator, "generate", fake_generate)
+
+    return calls
+
+
+class TestSelectSimulationsToPrecompute:
+    @pytest.mark.asyncio
+    async def test_skips_simulations_with_cached_summary_unless_refreshing(
+        self,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        _patch_generate(monkeypatch)
+        config = get_summary_llm_config()
+        assert config is not None
+
+        before = await select_simulations_to_precompute(
+            async_db, config, simulation_ids=[simulation.id]
+        )
+        await precompute_simulation_summaries(
+            [simulation.id], session_factory=_session_factory(async_db)
+        )
+        after = await select_simulations_to_precompute(
+            async_db, config, simulation_ids=[simulation.id]
+        )
+        refreshed = await select_simulations_to_precompute(
+            async_db, config, simulation_ids=[simulation.id], refresh=True
+        )
+        other_model = await select_simulations_to_precompute(
+            async_db,
+            replace(config, model_name="other-model"),
+            simulation_ids=[simulation.id],
+        )
+
+        assert before == [simulation.id]
+        assert after == []
+        assert refreshed == [simulation.id]
+        assert other_model == [simulation.id]
+
+
+class TestPrecomputeSimulationSummaries:
+    @pytest.mark.asyncio
+    async def test_second_run_resumes_with_nothing_left(
+        self,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        calls = _patch_generate(monkeypatch)
+        factory = _session_factory(async_db)
+
+        first = await precompute_simulation_summaries(
+            [simulation.id], session_factory=factory
+        )
+        second = await precompute_simulation_summaries(
+            [simulation.id], session_factory=factory
+        )
+
+        assert first == SummaryPrecomputeReport(selected=1, generated=1)
+        assert second == SummaryPrecomputeReport()
+        assert calls == ["assistant-api-exec-1"]
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_are_counted_and_retried(
+        self,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        simulation = await create_simulation(async_db, normal_user, admin_user)
+        calls = _patch_generate(monkeypatch, error=ValueError("empty_answer"))
+        factory = _session_factory(async_db)
+
+        first = await precompute_simulation_summaries(
+            [simulation.id], session_factory=factory
+        )
+        second = await precompute_simulation_summaries(
+            [simulation.id], session_factory=factory
+        )
+
+        assert first == SummaryPrecomputeReport(selected=1, fallback=1)
+        assert second == SummaryPrecomputeReport(selected=1, fallback=1)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_counts_failures(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sim_ids = [uuid4() for _ in range(5)]
+        running: list[int] = []
+        peak = 0
+
+        async def fake_select(db, config, **kwargs):
+            return sim_ids
+
+        async def fake_summarize_one(db, sim_id, *, refresh):
+            nonlocal peak
+            running.append(1)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0)
+            running.pop()
+            if sim_id == sim_ids[0]:
+                raise RuntimeError("boom")
+            return None
+
+        monkeypatch.setattr(precompute, "select_simulations_to_precompute", fake_select)
+        monkeypatch.setattr(precompute, "_summarize_one", fake_summarize_one)
+
+        report = await precompute_simulation_summaries(
+            concurrency=2, session_factory=_session_factory(AsyncMock())
+        )
+
+        assert peak == 2
+        assert report == SummaryPrecomputeReport(selected=5, failed=1)
+
+    @pytest.mark.asyncio
+    async def test_is_noop_when_llm_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "assistant_llm_enabled", False)
+        factory = AsyncMock()
+
+        report = await precompute_simulation_summaries(session_factory=factory)
+
+        assert report == SummaryPrecomputeReport()
+        factory.assert_not_called()
+
+
+class TestPrecomputeSummariesScript:
+    def test_main_passes_arguments_and_reports_failures(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        sim_id = uuid4()
+        run = AsyncMock(return_value=SummaryPrecomputeReport(selected=2, failed=1))
+        monkeypatch.setattr(
+            precompute_summaries, "precompute_simulation_summaries", run
+        )
+        monkeypatch.setattr(
+            precompute_summaries, "start_summary_llm_generator", AsyncMock()
+        )
+        stop = AsyncMock()
+        monkeypatch.setattr(precompute_summaries, "stop_summary_llm_generator", stop)
+
+        exit_code = precompute_summaries.main(
+            ["--simulation-id", str(sim_id), "--limit", "10", "--concurrency", "3"]
+        )
+
+        assert exit_code == 1
+        run.assert_awaited_once_with([sim_id], concurrency=3, limit=10, refresh=False)
+        stop.assert_awaited_once()
+        assert "Selected 2 simulation(s)" in capsys.readouterr().out
@@ -2,10 +2,20 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.features.assistant.service import build_simulation_summary
+from app.features.assistant.case_snapshot import (
+    CaseSnapshot,
+    CaseSnapshotCase,
+    CaseSnapshotConfiguration,
+    CaseSnapshotConfigurationDrift,
+    CaseSnapshotConfigurationValue,
+    CaseSnapshotExecution,
+    CaseSnapshotExecutions,
+)
+from app.features.assistant.service import build_case_summary, build_simulation_summary
 from app.features.assistant.snapshot import (
     SimulationSnapshot,
     SnapshotCaseFields,
+    SnapshotLink,
     SnapshotSimulationFields,
 )
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
@@ -286,3 +296,100 @@ class TestBuildSimulationSummary:
         assert summary.suggested_followups == [
             "Review the simulation detail page metadata for additional provenance and run context."
         ]
+
+
+def _make_case_snapshot(**overrides) -> CaseSnapshot:
+    payload = {
+        "scope": "case",
+        "case_count": 1,
+        "cases": [
+            CaseSnapshotCase(
+                id="case-1",
+                name="assistant_case",
+                case_group="assistant_group",
+                machine="chrysalis",
+                simulation_count=3,
+            )
+        ],
+        "executions": CaseSnapshotExecutions(
+            count=3,
+            status_counts={"completed": 2, "failed": 1},
+            earliest_simulation_start_date="2023-01-01T00:00:00+00:00",
+            latest_simulation_end_date="2023-12-31T00:00:00+00:00",
+        ),
+        "configuration": CaseSnapshotConfiguration(
+            shared={"compset": "AQUAPLANET", "grid_name": "f19_f19"},
+            drift=[
+                CaseSnapshotConfigurationDrift(
+                    field="git_tag",
+                    values=[
+                        CaseSnapshotConfigurationValue(value="v1.0.0", count=2),
+                        CaseSnapshotConfigurationValue(value="v1.1.0", count=1),
+                    ],
+                )
+            ],
+        ),
+        "recent_executions": [
+            CaseSnapshotExecution(
+                id="simulation-3", execution_id="assistant-exec-3", status="failed"
+            )
+        ],
+        "links": [SnapshotLink(kind="diagnostic", url="https://example.com/diag")],
+    }
+    payload.update(overrides)
+    return CaseSnapshot(**payload)
+
+
+class TestBuildCaseSummary:
+    def test_summarizes_status_coverage_and_configuration_drift(self) -> None:
+        summary = build_case_summary(_make_case_snapshot())
+
+        assert summary.answer.startswith(
+            "Case assistant_case on machine chrysalis has 3 recorded execution(s). "
+            "It belongs to case group assistant_group. "
+            "Recorded execution statuses: 2 completed, 1 failed. "
+            "Recorded simulation periods span 2023-01-01 to 2023-12-31. "
+            "All executions share compset AQUAPLANET, grid name f19_f19. "
+            "Configuration differs across executions in git tag (2 values)."
+        )
+        assert [citation.path for citation in summary.citations] == [
+            "executions.count",
+            "cases",
+            "case_group",
+            "executions.status_counts",
+            "executions.earliest_simulation_start_date",
+            "executions.latest_simulation_end_date",
+            "configuration.shared",
+            "configuration.drift",
+            "recent_executions",
+            "links[kind=diagnostic]",
+        ]
+        assert summary.generation_mode == "deterministic"
+        assert (
+            "Review the failed executions before drawing conclusions from this case."
+            in summary.suggested_followups
+        )
+
+    def test_case_group_without_executions_adds_caveats(self) -> None:
+        summary = build_case_summary(
+            _make_case_snapshot(
+                scope="case_group",
+                case_group="empty_group",
+                case_count=2,
+                executions=CaseSnapshotExecutions(count=0),
+                configuration=CaseSnapshotConfiguration(),
+                recent_executions=[],
+                links=[],
+            )
+        )
+
+        assert summary.answer == (
+            "Case group empty_group contains 2 case(s) with 0 recorded execution(s)."
+        )
+        assert summary.caveats == [
+            "No executions are recorded for this case group in SimBoard.",
+            "No diagnostic links are recorded for this case group in SimBoard.",
+        ]
+        assert summary.suggested_followups == [
+            "Open individual execution summaries for run-level provenance and context."
+        ]
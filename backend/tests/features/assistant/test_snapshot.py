@@ -59,15 +59,38 @@ def _make_snapshot() -> SimulationSnapshot:
     )
 
 
+def _trim_item_by_item(snapshot: SimulationSnapshot, max_chars: int):
+    """Reference budgeting that re-serializes after every single removal."""
+    size = snapshot_module._snapshot_size
+    if size(snapshot) <= max_chars:
+        return snapshot
+
+    trimmed = snapshot
+    while size(trimmed) > max_chars and (trimmed.artifacts or trimmed.links):
+        if len(trimmed.artifacts) >= len(trimmed.links) and trimmed.artifacts:
+            trimmed = trimmed.model_copy(update={"artifacts": trimmed.artifacts[:-1]})
+        else:
+            trimmed = trimmed.model_copy(update={"links": trimmed.links[:-1]})
+
+    if size(trimmed) > max_chars:
+        trimmed = snapshot_module._trim_snapshot_strings(trimmed)
+
+    trimmed = snapshot_module._add_truncation_caveat(trimmed)
+    if size(trimmed) > max_chars:
+        raise SnapshotBudgetExceededError(trimmed, max_chars)
+
+    return trimmed
+
+
 class TestSnapshotHelpers:
     def test_enum_value_and_isoformat_handle_none_enum_and_plain_values(self) -> None:
         timestamp = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
 
-        assert snapshot_module._enum_value(None) is None
-        assert snapshot_module._enum_value(SimulationStatus.COMPLETED) == "completed"
-        assert snapshot_module._enum_value("plain-value") == "plain-value"
-        assert snapshot_module._isoformat(None) is None
-        assert snapshot_module._isoformat(timestamp) == "2024-01-02T03:04:05+00:00"
+        assert snapshot_module.enum_value(None) is None
+        assert snapshot_module.enum_value(SimulationStatus.COMPLETED) == "completed"
+        assert snapshot_module.enum_value("plain-value") == "plain-value"
+        assert snapshot_module.isoformat(None) is None
+        assert snapshot_module.isoformat(timestamp) == "2024-01-02T03:04:05+00:00"
 
     def test_add_truncation_caveat_is_idempotent(self) -> None:
         snapshot = _make_snapshot()
@@ -201,6 +224,53 @@ class TestSnapshotHelpers:
         assert exc_info.value.snapshot.simulation.extra == {}
         assert SNAPSHOT_TRUNCATED_CAVEAT in exc_info.value.snapshot.snapshot_caveats
 
+    def test_serialized_prefix_sizes_match_full_serialization(self) -> None:
+        snapshot = _make_snapshot()
+        base = snapshot.model_copy(update={"artifacts": [], "links": []})
+
+        artifact_sizes = snapshot_module.serialized_prefix_sizes(snapshot.artifacts)
+        link_sizes = snapshot_module.serialized_prefix_sizes(snapshot.links)
+
+        assert snapshot_module._snapshot_size(snapshot) == (
+            snapshot_module._snapshot_size(base) + artifact_sizes[-1] + link_sizes[-1]
+        )
+
+    @pytest.mark.parametrize("max_chars", [500, 600, 700, 800, 1300, 1800, 5000])
+    def test_apply_size_budget_matches_item_by_item_trimming(
+        self, max_chars: int
+    ) -> None:
+        snapshot = _make_snapshot().model_copy(
+            update={
+                "artifacts": [
+                    SnapshotArtifact(kind="output", uri=f"/output-{index}.nc")
+                    for index in range(7)
+                ],
+                "links": [
+                    SnapshotLink(
+                        kind="docs",
+                        url=f"https://example.com/{'x' * index}",
+                        label=f"Link {index}" if index % 2 else None,
+                    )
+                    for index in range(12)
+                ],
+            }
+        )
+
+        def outcome(apply_budget):
+            try:
+                return apply_budget()
+            except SnapshotBudgetExceededError as exc:
+                return exc.snapshot
+
+        expected = outcome(lambda: _trim_item_by_item(snapshot, max_chars))
+        trimmed = outcome(
+            lambda: snapshot_module._apply_size_budget(
+                snapshot, _SnapshotSizeBudget(max_chars=max_chars)
+            )
+        )
+
+        assert trimmed == expected
+
     def test_build_snapshot_merges_case_links_with_simulation_precedence(self) -> None:
         case = Case(
             id=uuid4(),
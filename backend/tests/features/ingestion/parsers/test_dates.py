@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+from dateutil import parser as dateutil_parser
+
+from app.features.ingestion.parsers import dates
+from app.features.ingestion.parsers.dates import (
+    clear_date_caches,
+    parse_datetime,
+    parse_datetime_format,
+    shift_date,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    clear_date_caches()
+    yield
+    clear_date_caches()
+
+
+class TestParseDatetime:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2020-01-01",
+            "0001-01-01",
+            "2025-12-18T20:09:33",
+            "2025-12-18 20:09:33",
+            "2025-12-18T20:09:33.250",
+            "2025-12-18T20:09:33Z",
+            "2025-12-18T20:09:33+05:00",
+            "Thu Dec 18 20:09:33 2025",
+            "20200101",
+        ],
+    )
+    def test_matches_dateutil(self, value):
+        expected = dateutil_parser.parse(value)
+
+        result = parse_datetime(value)
+
+        assert result == expected
+        assert type(result.tzinfo) is type(expected.tzinfo)
+
+    def test_raises_dateutil_error_for_invalid_iso_date(self):
+        with pytest.raises(ValueError) as expected:
+            dateutil_parser.parse("2020-02-30")
+
+        with pytest.raises(ValueError) as result:
+            parse_datetime("2020-02-30")
+
+        assert str(result.value) == str(expected.value)
+
+    def test_caches_repeated_values(self):
+        first = parse_datetime("Thu Dec 18 20:09:33 2025")
+        second = parse_datetime("Thu Dec 18 20:09:33 2025")
+
+        assert first is second
+        assert dates._parse_datetime.cache_info().hits == 1
+
+    def test_does_not_cache_failures(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_datetime("not a date")
+
+        assert dates._parse_datetime.cache_info().currsize == 0
+
+
+class TestParseDatetimeFormat:
+    def test_matches_strptime(self):
+        value = "Thu Dec 18 20:54:58 2025"
+
+        result = parse_datetime_format(value, "%a %b %d %H:%M:%S %Y")
+
+        assert result == datetime.strptime(value, "%a %b %d %H:%M:%S %Y")
+
+    def test_raises_for_mismatched_format(self):
+        with pytest.raises(ValueError):
+            parse_datetime_format("2020-01-01", "%Y%m%d")
+
+
+class TestShiftDate:
+    @pytest.mark.parametrize(
+        ("unit", "count", "expected"),
+        [
+            ("days", 5, "2020-02-03"),
+            ("months", 1, "2020-02-29"),
+            ("years", 2, "2022-01-29"),
+        ],
+    )
+    def test_shifts_by_unit(self, unit, count, expected):
+        assert shift_date(datetime(2020, 1, 29), unit, count) == expected
+
+    def test_is_bounded(self):
+        assert shift_date.cache_info().maxsize == dates.DATE_CACHE_MAX_ENTRIES
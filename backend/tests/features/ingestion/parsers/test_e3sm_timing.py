@@ -181,6 +181,25 @@ class TestE3SMTimingParser:
         assert data["run_end_date"] == "2025-12-18T20:54:58"
         assert data["run_start_date"] is None
 
+    def test_uses_first_occurrence_of_each_field(self, tmp_path):
+        content = (
+            "  LID         : 1081156.251218-200923  \n"
+            "Init Time   : \n"
+            "Curr Date   : Thu Dec 18 20:54:58 2025\n"
+            "Init Time   : 124.909 seconds\n"
+            "Run Time    : 2599.194 seconds\n"
+            "Final Time  : 0.375 seconds\n"
+            "LID         : ignored\n"
+            "Run Time    : 1.0 seconds\n"
+        )
+        file_path = tmp_path / "e3sm_timing_repeated_fields.txt"
+        file_path.write_text(content)
+
+        data = parse_e3sm_timing(file_path)
+
+        assert data["execution_id"] == "1081156.251218-200923"
+        assert data["run_start_date"] == "2025-12-18T20:09:33"
+
     def test_parse_seconds_returns_none_on_float_value_error(self):
         with patch(
             "app.features.ingestion.parsers.e3sm_timing.float",
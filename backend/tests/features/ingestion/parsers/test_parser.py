@@ -13,9 +13,12 @@ from unittest.mock import patch
 
 import pytest
 
+from app.core.metrics import sample_value
 from app.features.ingestion.parsers import parser
 from app.features.ingestion.parsers.types import ParsedSimulation
 
+_STAGE_COUNT = "ingestion_stage_duration_seconds_count"
+
 
 class TestMainParser:
     @staticmethod
@@ -194,6 +197,64 @@ class TestMainParser:
         assert isinstance(result[0], ParsedSimulation)
         assert any("1.0-0" in parsed.execution_dir for parsed in result)
 
+    def test_records_stage_metrics(self, tmp_path: Path) -> None:
+        archive_base = tmp_path / "archive_extract"
+        execution_dir = archive_base / "1.0-0"
+        execution_dir.mkdir(parents=True)
+        self._create_execution_metadata_files(execution_dir, "001.001")
+        archive_path = tmp_path / "archive.zip"
+        self._create_zip_archive(archive_base, archive_path)
+        extract_dir = tmp_path / "extracted"
+        extract_dir.mkdir()
+        extracts = sample_value(_STAGE_COUNT, stage="extract")
+        parses = sample_value(_STAGE_COUNT, stage="parse")
+        executions = sample_value("ingestion_parsed_executions_total")
+        archive_bytes = sample_value("ingestion_archive_bytes_total")
+
+        with self._mock_all_parsers():
+            result, _ = parser.main_parser(archive_path, extract_dir)
+
+        assert sample_value(_STAGE_COUNT, stage="extract") == extracts + 1
+        assert sample_value(_STAGE_COUNT, stage="parse") == parses + 1
+        assert sample_value("ingestion_parsed_executions_total") == executions + len(
+            result
+        )
+        assert (
+            sample_value("ingestion_archive_bytes_total")
+            == archive_bytes + archive_path.stat().st_size
+        )
+
+    def test_open_archive_parses_executions_lazily(self, tmp_path: Path) -> None:
+        archive_base = tmp_path / "archive_extract"
+        complete_dir = archive_base / "1.0-0"
+        incomplete_dir = archive_base / "1.0-1"
+        complete_dir.mkdir(parents=True)
+        incomplete_dir.mkdir(parents=True)
+        self._create_execution_metadata_files(complete_dir, "001.001")
+        self._create_execution_metadata_files(
+            incomplete_dir, "001.002", include_env_run=False
+        )
+
+        with (
+            self._mock_all_parsers(),
+            patch.object(
+                parser, "_parse_all_files", wraps=parser._parse_all_files
+            ) as mock_parse,
+        ):
+            archive = parser.open_archive(archive_base, tmp_path / "unused_output")
+            assert mock_parse.call_count == 0
+
+            executions = iter(archive)
+            parsed = next(executions)
+            assert mock_parse.call_count == 1
+            assert archive.skipped_count == 0
+
+            remaining = list(executions)
+
+        assert parsed.execution_dir.endswith("1.0-0")
+        assert remaining == []
+        assert archive.skipped_count == 1
+
     def test_supports_single_execution_archive_at_root(self, tmp_path: Path) -> None:
         archive_base = tmp_path / "archive_extract"
         execution_dir = archive_base / "1085209.251220-105556"
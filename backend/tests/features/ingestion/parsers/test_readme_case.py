@@ -75,3 +75,17 @@ class TestParseReadmeCase:
 
         assert result["grid_name"] == "ne30pg2_r05_IcoswISC30E3r5"
         assert result["compset"] == "WCYCL20TR"
+
+    def test_parse_flags_across_create_newcase_lines(self, tmp_path):
+        content = (
+            "2025-12-18 22:36:01: /path/create_newcase --case v3 --res\n"
+            "2025-12-18 22:36:01: /path/create_newcase --res ne30 --compset=F2010\n"
+            "2025-12-18 22:36:02: /path/create_newcase --res ne120 --compset B1850\n"
+        )
+        file_path = tmp_path / "README.case"
+        file_path.write_text(content)
+
+        result = parse_readme_case(file_path)
+
+        assert result["grid_name"] == "ne30"
+        assert result["compset"] == "F2010"
@@ -4,18 +4,20 @@ This test module provides comprehensive coverage for the ingestion API,
 including path-based and upload-based ingestion endpoints.
 """
 
+import pstats
 import uuid
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from fastapi import HTTPException, UploadFile
+from fastapi import BackgroundTasks, HTTPException, UploadFile
 from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
 
 from app.api.version import API_BASE
+from app.core.config import settings
 from app.features.ingestion.api import (
     _build_hpc_upload_payload,
     _build_ingestion_state_response,
@@ -28,13 +30,14 @@ from app.features.ingestion.api import (
     ingest_from_upload,
 )
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
-from app.features.ingestion.ingest import IngestArchiveResult
+from app.features.ingestion.ingest import IngestArchiveResult, persist_simulations
 from app.features.ingestion.models import Ingestion
 from app.features.ingestion.parsers.parser import ArchiveValidationError
 from app.features.ingestion.parsers.types import ParsedSimulation
 from app.features.machine.models import Machine
+from app.features.simulation.case_stats import CaseStatsDelta
 from app.features.simulation.enums import ArtifactKind
-from app.features.simulation.models import Case, Simulation
+from app.features.simulation.models import Case, CaseStats, Simulation
 from app.features.simulation.schemas import SimulationCreate
 from app.features.user.manager import current_active_user
 from app.features.user.models import User, UserRole
@@ -71,6 +74,44 @@ def fake_non_admin_user():
     )
 
 
+def _parsed_archive(
+    parsed_simulations: list[ParsedSimulation], skipped_count: int = 0
+) -> MagicMock:
+    archive = MagicMock(skipped_count=skipped_count)
+    archive.__iter__.return_value = iter(parsed_simulations)
+    return archive
+
+
+def _minimal_parsed_simulation(
+    execution_id: str, case_name: str | None, machine_name: str
+) -> ParsedSimulation:
+    return ParsedSimulation(
+        execution_dir=f"/tmp/archive/case/{execution_id}",
+        execution_id=execution_id,
+        case_name=case_name,
+        case_group=None,
+        machine=machine_name,
+        hpc_username="test-user",
+        compset="FHIST",
+        compset_alias="test_alias",
+        grid_name="grid1",
+        grid_resolution="0.9x1.25",
+        campaign=None,
+        experiment_type=None,
+        initialization_type="startup",
+        simulation_start_date="2020-01-01",
+        simulation_end_date=None,
+        run_start_date=None,
+        run_end_date=None,
+        compiler=None,
+        git_repository_url=None,
+        git_branch=None,
+        git_tag=None,
+        git_commit_hash=None,
+        status="completed",
+    )
+
+
 def _create_case(
     db: Session,
     name: str,
@@ -629,13 +670,15 @@ class TestIngestFromPathEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -652,7 +695,7 @@ class TestIngestFromPathEndpoint:
         payload = {"archive_path": str(archive_path), "machine_name": machine.name}
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=ValueError("Duplicate simulation"),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
@@ -707,13 +750,15 @@ class TestIngestFromPathEndpoint:
         mock_errors = [{"file": "sim2.json", "error": "Invalid format"}]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=2,
-                duplicate_count=0,
-                errors=mock_errors,
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=2,
+                    duplicate_count=0,
+                    errors=mock_errors,
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -768,13 +813,15 @@ class TestIngestFromPathEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             client.post(f"{API_BASE}/ingestions/from-path", json=payload)
         ingestion = (
@@ -791,6 +838,66 @@ class TestIngestFromPathEndpoint:
         assert ingestion.error_count == 0
         assert ingestion.archive_sha256 is None
 
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 1
+        assert stats.status_counts == {"created": 1}
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_endpoint_schedules_summary_precompute_when_enabled(
+        self, client, db: Session, tmp_path, monkeypatch, enabled: bool
+    ):
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        archive_path = self._create_archive_file(tmp_path, "precompute.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+        case = _create_case(db, "test_case_precompute", machine=machine)
+        mock_simulations = [
+            SimulationCreate.model_validate(
+                {
+                    "caseId": str(case.id),
+                    "executionId": "exec-precompute-1",
+                    "compset": "AQUAPLANET",
+                    "compsetAlias": "QPC4",
+                    "gridName": "f19_f19",
+                    "gridResolution": "1.9x2.5",
+                    "initializationType": "startup",
+                    "simulationType": "experimental",
+                    "status": "created",
+                    "simulationStartDate": "2023-01-01T00:00:00Z",
+                }
+            )
+        ]
+        monkeypatch.setattr(settings, "assistant_precompute_after_ingestion", enabled)
+        precompute = AsyncMock()
+
+        with (
+            patch(
+                "app.features.ingestion.api.iter_ingest_archive",
+                return_value=[
+                    IngestArchiveResult(
+                        simulations=mock_simulations,
+                        created_count=1,
+                        duplicate_count=0,
+                        errors=[],
+                    )
+                ],
+            ),
+            patch(
+                "app.features.ingestion.api.precompute_simulation_summaries",
+                precompute,
+            ),
+        ):
+            response = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert response.status_code == 201
+        if enabled:
+            created = db.query(Simulation).filter_by(execution_id="exec-precompute-1")
+            precompute.assert_awaited_once_with([created.one().id])
+        else:
+            precompute.assert_not_called()
+
     def test_endpoint_persists_processed_execution_ids_when_provided(
         self, client, db: Session, tmp_path
     ):
@@ -805,13 +912,15 @@ class TestIngestFromPathEndpoint:
         }
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=[],
-                created_count=0,
-                duplicate_count=2,
-                errors=[{"execution_dir": "x", "error": "duplicate"}],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=[],
+                    created_count=0,
+                    duplicate_count=2,
+                    errors=[{"execution_dir": "x", "error": "duplicate"}],
+                )
+            ],
         ):
             client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -849,7 +958,7 @@ class TestIngestFromPathEndpoint:
         payload = {"archive_path": str(archive_path), "machine_name": machine.name}
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=RuntimeError("processing failed"),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
@@ -911,17 +1020,175 @@ class TestIngestFromPathEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 201
+
+    def test_endpoint_persists_archive_in_chunks(
+        self, client, db: Session, tmp_path, monkeypatch
+    ):
+        """Each chunk is persisted separately; the response covers them all."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        monkeypatch.setattr(settings, "ingestion_chunk_size", 2)
+        archive_path = self._create_archive_file(tmp_path, "chunked.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+        execution_ids = [f"108302{index}.260305-12000{index}" for index in range(5)]
+        parsed_simulations = [
+            _minimal_parsed_simulation(execution_id, "chunked_case", machine.name)
+            for execution_id in execution_ids
+        ]
+
+        with (
+            patch(
+                "app.features.ingestion.ingest.open_archive",
+                return_value=_parsed_archive(parsed_simulations),
+            ),
+            patch(
+                "app.features.ingestion.api.persist_simulations",
+                wraps=persist_simulations,
+            ) as mock_persist,
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 201
+        data = res.json()
+        assert data["created_count"] == 5
+        assert [sim["execution_id"] for sim in data["simulations"]] == execution_ids
+        assert mock_persist.call_count == 3
+
+        ingestion = (
+            db.query(Ingestion)
+            .filter(Ingestion.source_reference == str(archive_path))
+            .one()
+        )
+        assert ingestion.status == IngestionStatus.SUCCESS
+        assert ingestion.created_count == 5
+
+        case = db.query(Case).filter(Case.name == "chunked_case").one()
+        stats = db.query(CaseStats).filter(CaseStats.case_id == case.id).one()
+        assert stats.simulation_count == 5
+
+    def test_endpoint_applies_case_stats_once_after_the_last_chunk(
+        self, client, db: Session, tmp_path, monkeypatch
+    ):
+        """case_stats rows are only locked at the end of the transaction."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        monkeypatch.setattr(settings, "ingestion_chunk_size", 2)
+        archive_path = self._create_archive_file(tmp_path, "stats.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+        parsed_simulations = [
+            _minimal_parsed_simulation(
+                f"108305{index}.260305-12005{index}", "stats_case", machine.name
+            )
+            for index in range(5)
+        ]
+        calls: list[str] = []
+        apply = CaseStatsDelta.apply
+
+        def record_persist(*args):
+            calls.append("persist")
+            return persist_simulations(*args)
+
+        def record_apply(self, db):
+            calls.append("apply")
+            apply(self, db)
+
+        with (
+            patch(
+                "app.features.ingestion.ingest.open_archive",
+                return_value=_parsed_archive(parsed_simulations),
             ),
+            patch(
+                "app.features.ingestion.api.persist_simulations",
+                side_effect=record_persist,
+            ),
+            patch.object(CaseStatsDelta, "apply", record_apply),
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 201
+        assert calls == ["persist", "persist", "persist", "apply"]
+        case = db.query(Case).filter(Case.name == "stats_case").one()
+        stats = db.query(CaseStats).filter(CaseStats.case_id == case.id).one()
+        assert stats.simulation_count == 5
+
+    def test_endpoint_profiles_every_chunk_in_one_profile(
+        self, client, db: Session, tmp_path, monkeypatch
+    ):
+        """The profile spans parsing and persisting all chunks."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        profiles_dir = tmp_path / "profiles"
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        monkeypatch.setattr(settings, "profiling_dir", str(profiles_dir))
+        monkeypatch.setattr(settings, "ingestion_chunk_size", 1)
+        archive_path = self._create_archive_file(tmp_path, "profiled.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+        parsed_simulations = [
+            _minimal_parsed_simulation(
+                f"108304{index}.260305-12004{index}", "profiled_case", machine.name
+            )
+            for index in range(2)
+        ]
+
+        with patch(
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
         assert res.status_code == 201
+        [profile] = profiles_dir.glob("*-ingestion-*.pstats")
+        assert profile.name.endswith("profiled.tar.gz.pstats")
+        functions = pstats.Stats(str(profile)).get_stats_profile().func_profiles
+        assert functions["_resolve_parsed_simulations"].ncalls == "2"
+        assert functions["persist_simulations"].ncalls == "2"
+
+    def test_endpoint_rejects_execution_id_repeated_across_chunks(
+        self, client, db: Session, tmp_path, monkeypatch
+    ):
+        """A repeat in a later chunk conflicts instead of counting as a duplicate."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        monkeypatch.setattr(settings, "ingestion_chunk_size", 1)
+        archive_path = self._create_archive_file(tmp_path, "repeated.tar.gz")
+        payload = {"archive_path": str(archive_path), "machine_name": machine.name}
+        parsed_simulations = [
+            _minimal_parsed_simulation(
+                "1083030.260305-120030", "repeated_case", machine.name
+            )
+            for _ in range(2)
+        ]
+
+        with patch(
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
+        ):
+            res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
+
+        assert res.status_code == 409
+        assert (
+            db.query(Simulation)
+            .filter(Simulation.execution_id == "1083030.260305-120030")
+            .count()
+            == 0
+        )
 
 
 class TestIngestFromUploadEndpoint:
@@ -965,13 +1232,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1017,13 +1286,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1094,13 +1365,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1154,13 +1427,15 @@ class TestIngestFromUploadEndpoint:
         mock_errors = [{"file": "sim2.json", "error": "Invalid format"}]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=mock_errors,
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=mock_errors,
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1195,10 +1470,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=[], created_count=0, duplicate_count=0, errors=mock_errors
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=[],
+                    created_count=0,
+                    duplicate_count=0,
+                    errors=mock_errors,
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1282,8 +1562,8 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.ingest.main_parser",
-            return_value=(parsed_simulations, 0),
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-upload",
@@ -1317,7 +1597,7 @@ class TestIngestFromUploadEndpoint:
         payload = {"archive_path": str(archive_path), "machine_name": machine.name}
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=LookupError("Machine not found"),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
@@ -1325,6 +1605,47 @@ class TestIngestFromUploadEndpoint:
         assert res.status_code == 400
         assert res.json()["detail"] == "Machine not found"
 
+    def test_upload_rejects_errors_from_every_chunk(
+        self, client, db: Session, monkeypatch
+    ):
+        """Errors from all chunks are reported and nothing is persisted."""
+        machine = db.query(Machine).first()
+        assert machine is not None
+
+        monkeypatch.setattr(settings, "ingestion_chunk_size", 1)
+        parsed_simulations = [
+            _minimal_parsed_simulation("1083040.260305-120040", None, machine.name),
+            _minimal_parsed_simulation(
+                "1083041.260305-120041", "valid_case", machine.name
+            ),
+            _minimal_parsed_simulation("1083042.260305-120042", None, machine.name),
+        ]
+
+        with patch(
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
+        ):
+            res = client.post(
+                f"{API_BASE}/ingestions/from-upload",
+                data={"machine_name": machine.name},
+                files={
+                    "file": ("chunked.zip", BytesIO(b"PK\x03\x04"), "application/zip")
+                },
+            )
+
+        assert res.status_code == 400
+        errors = res.json()["detail"]["errors"]
+        assert [error["execution_dir"] for error in errors] == [
+            "/tmp/archive/case/1083040.260305-120040",
+            "/tmp/archive/case/1083042.260305-120042",
+        ]
+        assert (
+            db.query(Simulation)
+            .filter(Simulation.execution_id == "1083041.260305-120041")
+            .count()
+            == 0
+        )
+
     def test_path_endpoint_persists_remote_hpc_path_artifacts_as_metadata(
         self, client, db: Session, tmp_path
     ):
@@ -1367,8 +1688,8 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.ingest.main_parser",
-            return_value=(parsed_simulations, 0),
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1400,7 +1721,7 @@ class TestIngestFromUploadEndpoint:
         payload = {"archive_path": str(archive_path), "machine_name": machine.name}
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=RuntimeError("Unexpected error"),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
@@ -1424,10 +1745,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=[], created_count=0, duplicate_count=0, errors=mock_errors
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=[],
+                    created_count=0,
+                    duplicate_count=0,
+                    errors=mock_errors,
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1481,8 +1807,8 @@ class TestIngestFromUploadEndpoint:
         )
 
         with patch(
-            "app.features.ingestion.ingest.main_parser",
-            return_value=([parsed_simulation], 0),
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive([parsed_simulation]),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1527,7 +1853,7 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=ArchiveValidationError(validation_errors),
         ):
             res = client.post(
@@ -1553,7 +1879,7 @@ class TestIngestFromUploadEndpoint:
         unique_filename = f"lookup_error_{uuid.uuid4().hex[:8]}.zip"
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=LookupError("Machine not found in upload"),
         ):
             res = client.post(
@@ -1576,7 +1902,7 @@ class TestIngestFromUploadEndpoint:
         unique_filename = f"generic_error_{uuid.uuid4().hex[:8]}.zip"
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=RuntimeError("Unexpected upload error"),
         ):
             res = client.post(
@@ -1627,13 +1953,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1683,13 +2011,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1752,13 +2082,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1811,13 +2143,15 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1874,8 +2208,8 @@ class TestIngestFromUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.ingest.main_parser",
-            return_value=(parsed_simulations, 0),
+            "app.features.ingestion.ingest.open_archive",
+            return_value=_parsed_archive(parsed_simulations),
         ):
             res = client.post(f"{API_BASE}/ingestions/from-path", json=payload)
 
@@ -1941,13 +2275,15 @@ class TestIngestFromHpcUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=1,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=1,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-hpc-upload",
@@ -1985,13 +2321,15 @@ class TestIngestFromHpcUploadEndpoint:
         assert machine is not None
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=[],
-                created_count=0,
-                duplicate_count=1,
-                errors=[{"execution_dir": "x", "error": "duplicate"}],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=[],
+                    created_count=0,
+                    duplicate_count=1,
+                    errors=[{"execution_dir": "x", "error": "duplicate"}],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-hpc-upload",
@@ -2061,13 +2399,15 @@ class TestIngestFromHpcUploadEndpoint:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=IngestArchiveResult(
-                simulations=mock_simulations,
-                created_count=2,
-                duplicate_count=0,
-                errors=[],
-            ),
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[
+                IngestArchiveResult(
+                    simulations=mock_simulations,
+                    created_count=2,
+                    duplicate_count=0,
+                    errors=[],
+                )
+            ],
         ):
             res = client.post(
                 f"{API_BASE}/ingestions/from-hpc-upload",
@@ -2100,11 +2440,11 @@ class TestIngestionApiCoverage:
             _InvalidSchema.model_validate({"value": "not-an-int"})
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=validation_exc.value,
         ):
             with pytest.raises(HTTPException) as exc_info:
-                _run_ingest_archive("/tmp/archive.tar.gz", "/tmp", db)
+                list(_run_ingest_archive("/tmp/archive.tar.gz", "/tmp", db))
 
         assert exc_info.value.status_code == 400
 
@@ -2119,18 +2459,20 @@ class TestIngestionApiCoverage:
         )
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
-            return_value=expected_result,
+            "app.features.ingestion.api.iter_ingest_archive",
+            return_value=[expected_result],
         ) as mock_ingest_archive:
-            result = _run_ingest_archive(
-                "/tmp/archive.tar.gz",
-                "/tmp",
-                db,
-                strict_validation=True,
-                hpc_username="request-user",
+            results = list(
+                _run_ingest_archive(
+                    "/tmp/archive.tar.gz",
+                    "/tmp",
+                    db,
+                    strict_validation=True,
+                    hpc_username="request-user",
+                )
             )
 
-        assert result == expected_result
+        assert results == [expected_result]
         mock_ingest_archive.assert_called_once_with(
             archive_path="/tmp/archive.tar.gz",
             output_dir="/tmp",
@@ -2151,11 +2493,11 @@ class TestIngestionApiCoverage:
         ]
 
         with patch(
-            "app.features.ingestion.api.ingest_archive",
+            "app.features.ingestion.api.iter_ingest_archive",
             side_effect=ArchiveValidationError(validation_errors),
         ):
             with pytest.raises(HTTPException) as exc_info:
-                _run_ingest_archive("/tmp/archive.tar.gz", "/tmp", db)
+                list(_run_ingest_archive("/tmp/archive.tar.gz", "/tmp", db))
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == {
@@ -2184,6 +2526,7 @@ class TestIngestionApiCoverage:
         ):
             with pytest.raises(HTTPException) as exc_info:
                 ingest_from_upload(
+                    background_tasks=BackgroundTasks(),
                     file=upload_file,
                     machine_name=machine.name,
                     db=db,
@@ -2234,6 +2577,7 @@ class TestIngestionApiCoverage:
             ),
         ):
             result = ingest_from_upload(
+                background_tasks=BackgroundTasks(),
                 file=upload_file,
                 machine_name=machine.name,
                 db=db,
@@ -2278,6 +2622,7 @@ class TestIngestionApiCoverage:
         ):
             with pytest.raises(HTTPException) as exc_info:
                 ingest_from_hpc_upload(
+                    background_tasks=BackgroundTasks(),
                     file=upload_file,
                     machine_name=machine.name,
                     case_path="/archive/case_a",
@@ -2331,6 +2676,7 @@ class TestIngestionApiCoverage:
             ),
         ):
             result = ingest_from_hpc_upload(
+                background_tasks=BackgroundTasks(),
                 file=upload_file,
                 machine_name=machine.name,
                 case_path="/archive/case_a",
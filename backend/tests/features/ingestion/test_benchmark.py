@@ -0,0 +1,212 @@
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.features.ingestion.parsers.parser import main_parser
+from app.features.simulation.models import Simulation
+from app.features.user.models import User
+from app.scripts.ingestion import benchmark_ingestion
+from app.scripts.ingestion.benchmark import (
+    BENCHMARK_STAGES,
+    IngestionBenchmarkReport,
+    StageTiming,
+    compare_to_baseline,
+    generate_synthetic_archive,
+    run_ingestion_benchmark,
+)
+
+
+def _stage(name: str, seconds: float, items: int) -> StageTiming:
+    return StageTiming(
+        name=name,
+        seconds=seconds,
+        items=items,
+        items_per_second=items / seconds,
+        peak_rss_mb=100.0,
+    )
+
+
+def _report(
+    *stages: StageTiming, executions: int = 100, peak_rss_mb: float = 100.0
+) -> IngestionBenchmarkReport:
+    return IngestionBenchmarkReport(
+        cases=1,
+        executions=executions,
+        created=executions,
+        total_seconds=sum(stage.seconds for stage in stages),
+        peak_rss_mb=peak_rss_mb,
+        stages=list(stages),
+    )
+
+
+class TestGenerateSyntheticArchive:
+    def test_every_execution_parses_completely(self, tmp_path: Path) -> None:
+        archive_dir = generate_synthetic_archive(
+            tmp_path, cases=2, executions_per_case=3, archive_format="dir"
+        )
+
+        parsed, skipped_count = main_parser(archive_dir, tmp_path / "unused")
+
+        assert skipped_count == 0
+        assert len(parsed) == 6
+        assert len({simulation.execution_id for simulation in parsed}) == 6
+        first = next(
+            item for item in parsed if item.case_name == "v3.LR.historical_0000"
+        )
+        assert first.execution_id == Path(first.execution_dir).name
+        assert first.experiment_type == "historical"
+        assert first.machine == "chrysalis"
+        assert first.hpc_username == "ac.benchmark"
+        assert first.git_tag is not None and first.git_tag.startswith("v3.0.")
+        assert first.git_repository_url == ("https://github.com/E3SM-Project/E3SM.git")
+        assert first.git_branch == "master"
+        assert first.status in ("completed", "failed")
+        assert first.run_start_date is not None
+        assert first.simulation_end_date is not None
+        assert first.output_path is not None and "$" not in first.output_path
+
+    @pytest.mark.parametrize("archive_format", ["tar.gz", "zip"])
+    def test_writes_reproducible_archives(self, tmp_path: Path, archive_format) -> None:
+        first = generate_synthetic_archive(
+            tmp_path / "a",
+            cases=1,
+            executions_per_case=2,
+            archive_format=archive_format,
+        )
+        second = generate_synthetic_archive(
+            tmp_path / "b",
+            cases=1,
+            executions_per_case=2,
+            archive_format=archive_format,
+        )
+
+        first_ids = [
+            item.execution_id for item in main_parser(first, tmp_path / "x")[0]
+        ]
+        second_ids = [
+            item.execution_id for item in main_parser(second, tmp_path / "y")[0]
+        ]
+        assert first.name == f"synthetic_archive.{archive_format}"
+        assert first_ids == second_ids
+        assert not (tmp_path / "a" / "synthetic_archive").exists()
+
+
+class TestRunIngestionBenchmark:
+    def test_times_every_stage(
+        self, tmp_path: Path, db: Session, normal_user_sync
+    ) -> None:
+        archive = generate_synthetic_archive(tmp_path, cases=2, executions_per_case=2)
+        user = db.get(User, normal_user_sync["id"])
+        assert user is not None
+        simulation_count = db.scalar(select(func.count(Simulation.id))) or 0
+
+        report = run_ingestion_benchmark(archive, tmp_path / "work", db, user)
+
+        assert [stage.name for stage in report.stages] == list(BENCHMARK_STAGES)
+        assert report.cases == 2
+        assert report.executions == 4
+        assert report.created == 4
+        assert all(stage.items == 4 for stage in report.stages)
+        assert all(stage.seconds > 0 for stage in report.stages)
+        assert report.peak_rss_mb > 0
+        assert db.scalar(select(func.count(Simulation.id))) == simulation_count + 4
+
+    def test_persists_and_detaches_each_chunk(
+        self, tmp_path: Path, db: Session, normal_user_sync
+    ) -> None:
+        archive = generate_synthetic_archive(
+            tmp_path, cases=1, executions_per_case=3, archive_format="dir"
+        )
+        user = db.get(User, normal_user_sync["id"])
+        assert user is not None
+
+        report = run_ingestion_benchmark(
+            archive, tmp_path / "work", db, user, chunk_size=1
+        )
+
+        assert report.chunks == 3
+        assert report.created == 3
+        # A pre-extracted directory has no extract stage.
+        assert [stage.name for stage in report.stages] == [
+            "parse",
+            "resolve",
+            "persist",
+        ]
+        assert not any(isinstance(obj, Simulation) for obj in db.identity_map.values())
+
+    def test_report_round_trips_through_json(self) -> None:
+        report = _report(_stage("parse", 1.0, 100))
+
+        restored = IngestionBenchmarkReport.from_dict(
+            json.loads(json.dumps(report.to_dict()))
+        )
+
+        assert restored == report
+
+
+class TestCompareToBaseline:
+    def test_scales_expected_time_to_run_size(self) -> None:
+        baseline = _report(_stage("parse", 1.0, 100))
+
+        assert compare_to_baseline(_report(_stage("parse", 2.1, 200)), baseline) == []
+
+        regressions = compare_to_baseline(_report(_stage("parse", 3.0, 200)), baseline)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("parse: 3.000s for 200 item(s)")
+
+    def test_ignores_slowdowns_below_noise_floor(self) -> None:
+        baseline = _report(_stage("discover", 0.001, 100))
+
+        assert (
+            compare_to_baseline(_report(_stage("discover", 0.01, 100)), baseline) == []
+        )
+
+    def test_compares_peak_rss_only_for_equal_sizes(self) -> None:
+        baseline = _report(peak_rss_mb=100.0)
+
+        assert compare_to_baseline(_report(peak_rss_mb=200.0), baseline) == [
+            "peak RSS: 200.0 MiB vs 100.0 MiB in baseline"
+        ]
+        assert (
+            compare_to_baseline(_report(executions=1000, peak_rss_mb=200.0), baseline)
+            == []
+        )
+
+
+class TestBenchmarkIngestionScript:
+    def test_compares_against_saved_baseline(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        db: Session,
+        normal_user_sync,
+    ) -> None:
+        reports = iter(
+            [_report(_stage("parse", 1.0, 100)), _report(_stage("parse", 2.0, 100))]
+        )
+        monkeypatch.setattr(benchmark_ingestion, "SessionLocal", lambda: db)
+        monkeypatch.setattr(
+            benchmark_ingestion,
+            "run_ingestion_benchmark",
+            lambda *args, **kwargs: next(reports),
+        )
+        baseline = tmp_path / "baseline.json"
+        argv = [
+            "--cases",
+            "1",
+            "--executions-per-case",
+            "1",
+            "--baseline",
+            str(baseline),
+        ]
+
+        assert benchmark_ingestion.main([*argv, "--save-baseline"]) == 0
+        assert benchmark_ingestion.main(argv) == 1
+
+        output = capsys.readouterr().out
+        assert f"Saved baseline to {baseline}." in output
+        assert "REGRESSION parse: 2.000s" in output
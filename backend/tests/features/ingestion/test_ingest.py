@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Mapping
@@ -6,6 +7,7 @@ from uuid import UUID, uuid4
 
 import pytest
 from dateutil import parser as real_dateutil_parser
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.features.ingestion.ingest import (
@@ -20,7 +22,9 @@ from app.features.ingestion.ingest import (
     _normalize_simulation_type,
     _track_case_hash_grouping,
     _validate_simulation_create,
+    _validate_simulation_creates,
     ingest_archive,
+    iter_ingest_archive,
 )
 from app.features.ingestion.models import (
     Ingestion,
@@ -1163,7 +1167,7 @@ class TestIngestArchiveContinued(TestIngestArchive):
                 return_value=(_parsed_simulations_from_mapping(mock_simulations), 0),
             ),
             patch(
-                "app.features.ingestion.ingest.dateutil_parser.parse",
+                "app.features.ingestion.parsers.dates.dateutil_parser.parse",
                 side_effect=mock_parse_wrapper,
             ),
         ):
@@ -1261,6 +1265,102 @@ class TestIngestArchiveContinued(TestIngestArchive):
             assert ingest_result.errors[0]["error_type"] == "ValidationError"
 
 
+class TestIterIngestArchive:
+    """Tests for chunked archive ingestion."""
+
+    @staticmethod
+    def _parsed_archive(
+        parsed_simulations: list[ParsedSimulation], skipped_count: int = 0
+    ) -> MagicMock:
+        archive = MagicMock(skipped_count=skipped_count)
+        archive.__iter__.return_value = iter(parsed_simulations)
+        return archive
+
+    @staticmethod
+    def _mock_simulations(machine_name: str) -> dict[str, dict[str, str | None]]:
+        simulations: dict[str, dict[str, str | None]] = {}
+        for index in range(5):
+            execution_id = f"108120{index}.251218-20100{index}"
+            simulations[f"/path/to/{execution_id}"] = {
+                "execution_id": execution_id,
+                # The third execution has no case name and fails to resolve.
+                "case_name": None if index == 2 else f"case{index % 2}",
+                "compset": "FHIST",
+                "compset_alias": "test_alias",
+                "grid_name": "grid1",
+                "grid_resolution": "0.9x1.25",
+                "machine": machine_name,
+                "simulation_start_date": "2020-01-01",
+                "initialization_type": "startup",
+            }
+
+        return simulations
+
+    def test_chunks_add_up_to_ingest_archive_result(self, db: Session) -> None:
+        machine = TestIngestArchive._create_machine(db, "test-machine")
+        parsed_simulations = _parsed_simulations_from_mapping(
+            self._mock_simulations(machine.name)
+        )
+
+        with patch(
+            "app.features.ingestion.ingest.open_archive",
+            return_value=self._parsed_archive(parsed_simulations),
+        ):
+            chunks = list(
+                iter_ingest_archive(
+                    Path("/tmp/archive.zip"), Path("/tmp/out"), db, chunk_size=2
+                )
+            )
+
+        with patch(
+            "app.features.ingestion.ingest.main_parser",
+            return_value=(parsed_simulations, 0),
+        ):
+            expected = ingest_archive(Path("/tmp/archive.zip"), Path("/tmp/out"), db)
+
+        assert [len(chunk.simulations) for chunk in chunks] == [2, 1, 1]
+        assert sum(chunk.created_count for chunk in chunks) == expected.created_count
+        assert sum(chunk.duplicate_count for chunk in chunks) == 0
+        assert [error for chunk in chunks for error in chunk.errors] == expected.errors
+        assert [sim.execution_id for chunk in chunks for sim in chunk.simulations] == [
+            sim.execution_id for sim in expected.simulations
+        ]
+
+    def test_reports_skipped_runs_after_last_chunk(self, db: Session) -> None:
+        archive = self._parsed_archive([], skipped_count=3)
+
+        with patch("app.features.ingestion.ingest.open_archive", return_value=archive):
+            chunks = list(
+                iter_ingest_archive(Path("/tmp/archive.zip"), Path("/tmp/out"), db)
+            )
+
+        assert len(chunks) == 1
+        assert chunks[0].simulations == []
+        assert chunks[0].skipped_count == 3
+
+    def test_uses_configured_chunk_size(self, db: Session, monkeypatch) -> None:
+        machine = TestIngestArchive._create_machine(db, "test-machine")
+        parsed_simulations = _parsed_simulations_from_mapping(
+            self._mock_simulations(machine.name)
+        )
+        monkeypatch.setattr(
+            "app.features.ingestion.ingest.settings.ingestion_chunk_size", 4
+        )
+
+        with patch(
+            "app.features.ingestion.ingest.open_archive",
+            return_value=self._parsed_archive(parsed_simulations),
+        ):
+            chunks = list(
+                iter_ingest_archive(Path("/tmp/archive.zip"), Path("/tmp/out"), db)
+            )
+
+        assert [len(chunk.simulations) + len(chunk.errors) for chunk in chunks] == [
+            4,
+            1,
+        ]
+
+
 class TestNormalizeGitUrl:
     """Tests for the _normalize_git_url helper function.
 
@@ -2444,6 +2544,45 @@ class TestIngestHelpers:
         assert schema.links == []
         assert schema.case_hash == "abc123"
 
+    def test_validate_simulation_creates_reports_errors_per_draft(self) -> None:
+        valid = SimulationCreateDraft(
+            case_id=uuid4(),
+            execution_id="1082007.260305-120007",
+            compset="FHIST",
+            compset_alias="test_alias",
+            grid_name="grid1",
+            grid_resolution="0.9x1.25",
+            simulation_type=SimulationType.UNKNOWN,
+            status=SimulationStatus.CREATED,
+            campaign=None,
+            experiment_type=None,
+            initialization_type="test",
+            simulation_start_date=datetime(2020, 1, 1),
+            simulation_end_date=None,
+            run_start_date=None,
+            run_end_date=None,
+            compiler=None,
+            git_repository_url=None,
+            git_branch=None,
+            git_tag=None,
+            git_commit_hash=None,
+            created_by=None,
+            last_updated_by=None,
+        )
+        invalid = replace(valid, execution_id="1082008.260305-120008", case_id=None)
+
+        results = _validate_simulation_creates([valid, invalid, valid])
+
+        assert isinstance(results[0], SimulationCreate)
+        assert isinstance(results[2], SimulationCreate)
+        assert isinstance(results[1], ValidationError)
+        with pytest.raises(ValidationError) as exc_info:
+            _validate_simulation_create(invalid)
+        assert str(results[1]) == str(exc_info.value)
+        assert _validate_simulation_creates([valid]) == [
+            _validate_simulation_create(valid)
+        ]
+
     def test_build_simulation_create_draft_normalizes_values(self) -> None:
         parsed = ParsedSimulation(
             execution_dir="/path/to/1082006.260305-120006",
@@ -153,7 +153,7 @@ class TestIngestionWithAPIToken:
             mock_result.duplicate_count = 0
             mock_result.errors = []
             mock_result.simulations = []
-            mock_ingest.return_value = mock_result
+            mock_ingest.return_value = [mock_result]
 
             machine = Machine(
                 name="test-hpc",
@@ -203,7 +203,7 @@ class TestIngestionWithAPIToken:
             mock_result.duplicate_count = 1
             mock_result.errors = [{"execution_dir": "x", "error": "duplicate"}]
             mock_result.simulations = []
-            mock_ingest.return_value = mock_result
+            mock_ingest.return_value = [mock_result]
 
             machine = Machine(
                 name="test-hpc-upload",
@@ -420,7 +420,7 @@ class TestIngestionWithAPIToken:
             mock_result.duplicate_count = 0
             mock_result.errors = []
             mock_result.simulations = [mock_sim]
-            mock_ingest.return_value = mock_result
+            mock_ingest.return_value = [mock_result]
 
             payload = {
                 "archive_path": "/fake/path/archive.tar.gz",
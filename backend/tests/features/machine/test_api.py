@@ -4,6 +4,7 @@ import pytest
 from fastapi import HTTPException
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.version import API_BASE
@@ -231,7 +232,8 @@ class TestCreateMachine:
 
 
 class TestListMachines:
-    def test_function_successfully_list_machines(self, db: Session):
+    @pytest.mark.asyncio
+    async def test_function_successfully_list_machines(self, async_db: AsyncSession):
         expected_machines = {
             "aurora",
             "frontier",
@@ -243,7 +245,7 @@ class TestListMachines:
             "chrysalis",
         }
 
-        machines = list_machines(db)
+        machines = await list_machines(async_db)
         result = {m.name for m in machines}
 
         assert result == expected_machines
@@ -269,7 +271,8 @@ class TestListMachines:
 
 
 class TestGetMachine:
-    def test_function_successfully_gets_machine(self, db: Session):
+    @pytest.mark.asyncio
+    async def test_function_successfully_gets_machine(self, async_db: AsyncSession):
         expected = Machine(
             name="machine e",
             site="Site E",
@@ -278,15 +281,18 @@ class TestGetMachine:
             gpu=True,
             notes="Test machine",
         )
-        db.add(expected)
-        db.commit()
-        db.refresh(expected)
+        async_db.add(expected)
+        await async_db.commit()
+        await async_db.refresh(expected)
 
-        result = get_machine(expected.id, db)
+        result = await get_machine(expected.id, async_db)
         assert result.name == expected.name
         assert result.notes == expected.notes
 
-    def test_endpoint_successfully_get_machine(self, client, db: Session):
+    @pytest.mark.asyncio
+    async def test_endpoint_successfully_get_machine(
+        self, async_client, async_db: AsyncSession
+    ):
         expected = Machine(
             name="machine e",
             site="Site E",
@@ -295,22 +301,25 @@ class TestGetMachine:
             gpu=True,
             notes="Test machine",
         )
-        db.add(expected)
-        db.commit()
-        db.refresh(expected)
+        async_db.add(expected)
+        await async_db.commit()
+        await async_db.refresh(expected)
 
-        res = client.get(f"{API_BASE}/machines/{expected.id}")
+        res = await async_client.get(f"{API_BASE}/machines/{expected.id}")
         assert res.status_code == 200
 
         result_endpoint = res.json()
         assert result_endpoint["name"] == expected.name
         assert result_endpoint["notes"] == expected.notes
 
-    def test_function_raises_error_if_machine_not_found(self, db: Session):
+    @pytest.mark.asyncio
+    async def test_function_raises_error_if_machine_not_found(
+        self, async_db: AsyncSession
+    ):
         random_id = uuid4()
 
         try:
-            get_machine(random_id, db)
+            await get_machine(random_id, async_db)
         except HTTPException as e:
             assert str(e) == "404: Machine not found"
 
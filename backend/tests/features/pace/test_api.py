@@ -1,56 +1,48 @@
+import asyncio
 import json
-import urllib.error
-import urllib.request
-from email.message import Message
+from collections.abc import Callable
 from urllib.parse import urlparse
 
+import httpx
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.version import API_BASE
-from app.features.pace import api as pace_api
+from app.core.config import settings
+from app.core.metrics import sample_value
+from app.features.pace import resolver as pace_resolver
+from app.features.pace.models import PaceExperimentMapping
+from app.features.pace.schemas import MAX_PACE_RESOLVE_BATCH_SIZE
+from tests.conftest import mock_pace
 
 
-class _FakeHttpResponse:
-    def __init__(self, status: int, body: str) -> None:
-        self.status = status
-        self._body = body.encode("utf-8")
+@pytest.fixture(autouse=True)
+def _clear_pace_cache():
+    pace_resolver.clear_pace_cache()
+    yield
+    pace_resolver.clear_pace_cache()
 
-    def read(self) -> bytes:
-        return self._body
 
-    def __enter__(self) -> "_FakeHttpResponse":
-        return self
+def _respond(status_code: int, body: str) -> Callable[[httpx.Request], object]:
+    return lambda request: httpx.Response(status_code, content=body.encode("utf-8"))
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        return None
 
+def _raise(error: Exception) -> Callable[[httpx.Request], object]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise error
 
-class _FakeHttpError(urllib.error.HTTPError):
-    def __init__(self, url: str, code: int, msg: str, body: bytes) -> None:
-        super().__init__(url, code, msg, hdrs=Message(), fp=None)
-        self._body = body
-
-    def read(self, amt: int = -1) -> bytes:
-        return self._body if amt == -1 else self._body[:amt]
+    return handler
 
 
 class TestResolvePaceExecution:
-    @pytest.fixture(autouse=True)
-    def clear_cache(self) -> None:
-        pace_api._PACE_CACHE.clear()
-
     def test_endpoint_returns_experiment_id_on_success(
         self, client, monkeypatch
     ) -> None:
-        captured_request: list[urllib.request.Request] = []
         execution_id = "52448807.260505-035011"
-
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            captured_request.append(request)
-            assert timeout == 5.0
-            return _FakeHttpResponse(200, json.dumps([{"expid": "228920"}]))
-
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
+        captured = mock_pace(
+            monkeypatch, _respond(200, json.dumps([{"expid": "228920"}]))
+        )
 
         response = client.get(
             f"{API_BASE}/pace/resolve", params={"execution_id": execution_id}
@@ -61,18 +53,16 @@ class TestResolvePaceExecution:
             "executionId": execution_id,
             "experimentId": "228920",
         }
-        assert captured_request[0].full_url == (
+        assert str(captured[0].url) == (
             "https://pace.ornl.gov/ajax/specificSearch/lid:52448807.260505-035011/expid"
         )
+        assert captured[0].headers["Accept"] == "application/json"
+        assert captured[0].extensions["timeout"]["read"] == 5.0
 
     def test_endpoint_returns_experiment_id_on_direct_numeric_payload(
         self, client, monkeypatch
     ) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(200, "214043"),
-        )
+        mock_pace(monkeypatch, _respond(200, "214043"))
 
         response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
 
@@ -82,40 +72,31 @@ class TestResolvePaceExecution:
     def test_endpoint_encodes_only_execution_id_portion(
         self, client, monkeypatch
     ) -> None:
-        captured_request: list[urllib.request.Request] = []
-        execution_id = "lid/ 42?next=1"
-
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            captured_request.append(request)
-            return _FakeHttpResponse(200, json.dumps([{"expid": "228920"}]))
-
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
+        captured = mock_pace(
+            monkeypatch, _respond(200, json.dumps([{"expid": "228920"}]))
+        )
 
         response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": execution_id}
+            f"{API_BASE}/pace/resolve", params={"execution_id": "lid/ 42?next=1"}
         )
 
         assert response.status_code == 200
-        assert captured_request[0].full_url == (
+        assert str(captured[0].url) == (
             "https://pace.ornl.gov/ajax/specificSearch/lid:lid%2F%2042%3Fnext%3D1/expid"
         )
 
     def test_endpoint_uses_fixed_pace_host(self, client, monkeypatch) -> None:
-        captured_request: list[urllib.request.Request] = []
-        execution_id = "https://evil.example/path?q=1"
-
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            captured_request.append(request)
-            return _FakeHttpResponse(200, json.dumps([{"expid": "228920"}]))
-
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
+        captured = mock_pace(
+            monkeypatch, _respond(200, json.dumps([{"expid": "228920"}]))
+        )
 
         response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": execution_id}
+            f"{API_BASE}/pace/resolve",
+            params={"execution_id": "https://evil.example/path?q=1"},
         )
 
         assert response.status_code == 200
-        parsed_url = urlparse(captured_request[0].full_url)
+        parsed_url = urlparse(str(captured[0].url))
         assert parsed_url.scheme == "https"
         assert parsed_url.netloc == "pace.ornl.gov"
         assert (
@@ -123,207 +104,273 @@ class TestResolvePaceExecution:
             == "/ajax/specificSearch/lid:https%3A%2F%2Fevil.example%2Fpath%3Fq%3D1/expid"
         )
 
-    def test_endpoint_returns_null_on_timeout(self, client, monkeypatch) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: (_ for _ in ()).throw(TimeoutError()),
-        )
-
-        response = client.get(
-            f"{API_BASE}/pace/resolve",
-            params={"execution_id": "52448807.260505-035011"},
-        )
-
-        assert response.status_code == 200
-        assert response.json() == {
-            "executionId": "52448807.260505-035011",
-            "experimentId": None,
-        }
-
-    def test_endpoint_returns_null_on_upstream_non_200(
-        self, client, monkeypatch
+    @pytest.mark.parametrize(
+        "handler",
+        [
+            _raise(httpx.ReadTimeout("timed out")),
+            _raise(httpx.ConnectError("unreachable")),
+            _respond(503, "retry later"),
+            _respond(200, "{not-json"),
+            _respond(200, "[]"),
+            _respond(200, json.dumps([{}])),
+            _respond(200, json.dumps([{"expid": "   "}])),
+            lambda request: httpx.Response(200, content=b"\xff\xfe"),
+        ],
+        ids=[
+            "timeout",
+            "connect-error",
+            "non-200",
+            "malformed-json",
+            "empty-array",
+            "missing-expid",
+            "blank-expid",
+            "non-utf8",
+        ],
+    )
+    def test_endpoint_returns_null_when_unresolved(
+        self, client, monkeypatch, handler
     ) -> None:
-        request = urllib.request.Request(
-            "https://pace.ornl.gov/ajax/specificSearch/lid:x/expid"
-        )
-        error = _FakeHttpError(
-            request.full_url, 503, "Service Unavailable", b"retry later"
-        )
-
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: (_ for _ in ()).throw(error),
-        )
+        mock_pace(monkeypatch, handler)
 
         response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
 
         assert response.status_code == 200
         assert response.json() == {"executionId": "x", "experimentId": None}
 
-    def test_endpoint_returns_null_on_non_200_response_object(
-        self, client, monkeypatch
-    ) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(503, "retry later"),
-        )
-
-        response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
-
-        assert response.status_code == 200
-        assert response.json() == {"executionId": "x", "experimentId": None}
+    @pytest.mark.parametrize(
+        "handler",
+        [
+            _respond(200, json.dumps([{"expid": "228920"}])),
+            _respond(200, "[]"),
+            _raise(httpx.ReadTimeout("timed out")),
+        ],
+        ids=["hit", "miss", "timeout"],
+    )
+    def test_endpoint_caches_resolutions(self, client, monkeypatch, handler) -> None:
+        captured = mock_pace(monkeypatch, handler)
 
-    def test_endpoint_returns_null_on_malformed_json(self, client, monkeypatch) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(200, "{not-json"),
+        first_response = client.get(
+            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-exec"}
+        )
+        second_response = client.get(
+            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-exec"}
         )
 
-        response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
+        assert first_response.status_code == 200
+        assert second_response.json() == first_response.json()
+        assert len(captured) == 1
 
-        assert response.status_code == 200
-        assert response.json() == {"executionId": "x", "experimentId": None}
+    def test_endpoint_rejects_missing_execution_id(self, client) -> None:
+        response = client.get(f"{API_BASE}/pace/resolve")
 
-    def test_endpoint_returns_null_on_empty_array(self, client, monkeypatch) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(200, "[]"),
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["query", "execution_id"]
+
+    @pytest.mark.parametrize("value", ["", "   "])
+    def test_endpoint_rejects_blank_execution_id(self, client, value: str) -> None:
+        response = client.get(
+            f"{API_BASE}/pace/resolve", params={"execution_id": value}
         )
 
-        response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
+        assert response.status_code == 422
+        assert response.json() == {"detail": "execution_id must not be blank"}
 
-        assert response.status_code == 200
-        assert response.json() == {"executionId": "x", "experimentId": None}
 
-    def test_endpoint_returns_null_when_expid_is_missing(
+class TestResolvePaceExecutions:
+    def test_batch_endpoint_preserves_order_and_dedupes(
         self, client, monkeypatch
     ) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(200, json.dumps([{}])),
-        )
+        expids = {"exec-a": "101", "exec-c": "303"}
 
-        response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
+        def handler(request: httpx.Request) -> httpx.Response:
+            execution_id = request.url.path.split("lid:")[1].removesuffix("/expid")
+            return httpx.Response(
+                200,
+                json=[{"expid": expids[execution_id]}]
+                if execution_id in expids
+                else [],
+            )
 
-        assert response.status_code == 200
-        assert response.json() == {"executionId": "x", "experimentId": None}
+        captured = mock_pace(monkeypatch, handler)
 
-    def test_endpoint_returns_null_when_expid_is_blank(
-        self, client, monkeypatch
-    ) -> None:
-        monkeypatch.setattr(
-            pace_api.urllib.request,
-            "urlopen",
-            lambda *args, **kwargs: _FakeHttpResponse(
-                200, json.dumps([{"expid": "   "}])
-            ),
+        response = client.post(
+            f"{API_BASE}/pace/resolve",
+            json={"executionIds": ["exec-c", " exec-a ", "exec-b", "exec-c"]},
         )
 
-        response = client.get(f"{API_BASE}/pace/resolve", params={"execution_id": "x"})
-
         assert response.status_code == 200
-        assert response.json() == {"executionId": "x", "experimentId": None}
-
-    def test_endpoint_caches_successful_resolutions(self, client, monkeypatch) -> None:
-        call_count = 0
-
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            nonlocal call_count
-            call_count += 1
-            return _FakeHttpResponse(200, json.dumps([{"expid": "228920"}]))
-
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
+        assert response.json() == {
+            "resolutions": [
+                {"executionId": "exec-c", "experimentId": "303"},
+                {"executionId": "exec-a", "experimentId": "101"},
+                {"executionId": "exec-b", "experimentId": None},
+            ]
+        }
+        assert len(captured) == 3
 
-        first_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-exec"}
+    def test_batch_endpoint_rejects_blank_and_oversized_batches(self, client) -> None:
+        blank = client.post(
+            f"{API_BASE}/pace/resolve", json={"executionIds": ["ok", "  "]}
         )
-        second_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-exec"}
+        empty = client.post(f"{API_BASE}/pace/resolve", json={"executionIds": []})
+        oversized = client.post(
+            f"{API_BASE}/pace/resolve",
+            json={
+                "executionIds": [
+                    f"exec-{index}" for index in range(MAX_PACE_RESOLVE_BATCH_SIZE + 1)
+                ]
+            },
         )
 
-        assert first_response.status_code == 200
-        assert second_response.status_code == 200
-        assert first_response.json()["experimentId"] == "228920"
-        assert second_response.json()["experimentId"] == "228920"
-        assert call_count == 1
-
-    def test_endpoint_caches_unresolved_resolutions(self, client, monkeypatch) -> None:
-        call_count = 0
-
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            nonlocal call_count
-            call_count += 1
-            return _FakeHttpResponse(200, "[]")
+        assert blank.status_code == 422
+        assert blank.json() == {"detail": "execution_id must not be blank"}
+        assert empty.status_code == 422
+        assert oversized.status_code == 422
 
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
 
-        first_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-miss"}
-        )
-        second_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-miss"}
+class TestResolveExperimentIds:
+    @pytest.mark.asyncio
+    async def test_serves_stored_mappings_and_persists_new_ones(
+        self, async_db: AsyncSession, monkeypatch
+    ) -> None:
+        async_db.add(
+            PaceExperimentMapping(execution_id="stored-exec", experiment_id="111")
         )
+        await async_db.flush()
+        captured = mock_pace(monkeypatch, _respond(200, json.dumps([{"expid": "222"}])))
 
-        assert first_response.status_code == 200
-        assert second_response.status_code == 200
-        assert first_response.json()["experimentId"] is None
-        assert second_response.json()["experimentId"] is None
-        assert call_count == 1
+        resolved = await pace_resolver.resolve_experiment_ids(
+            async_db, ["stored-exec", "new-exec"]
+        )
+        rows = (
+            await async_db.execute(
+                select(
+                    PaceExperimentMapping.execution_id,
+                    PaceExperimentMapping.experiment_id,
+                ).order_by(PaceExperimentMapping.execution_id)
+            )
+        ).all()
+
+        assert resolved == {"stored-exec": "111", "new-exec": "222"}
+        assert [str(request.url).split("lid:")[1] for request in captured] == [
+            "new-exec/expid"
+        ]
+        assert [tuple(row) for row in rows] == [
+            ("new-exec", "222"),
+            ("stored-exec", "111"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_does_not_persist_misses(
+        self, async_db: AsyncSession, monkeypatch
+    ) -> None:
+        mock_pace(monkeypatch, _respond(200, "[]"))
 
-    def test_endpoint_caches_timeouts(self, client, monkeypatch) -> None:
-        call_count = 0
+        resolved = await pace_resolver.resolve_experiment_ids(async_db, ["miss-exec"])
+        stored = await async_db.scalar(
+            select(PaceExperimentMapping).where(
+                PaceExperimentMapping.execution_id == "miss-exec"
+            )
+        )
 
-        def fake_urlopen(request: urllib.request.Request, timeout: float):
-            nonlocal call_count
-            call_count += 1
-            raise TimeoutError()
+        assert resolved == {"miss-exec": None}
+        assert stored is None
 
-        monkeypatch.setattr(pace_api.urllib.request, "urlopen", fake_urlopen)
+    @pytest.mark.asyncio
+    async def test_counts_lookups_by_source(
+        self, async_db: AsyncSession, monkeypatch
+    ) -> None:
+        async_db.add(
+            PaceExperimentMapping(execution_id="stored-exec", experiment_id="111")
+        )
+        await async_db.flush()
+        mock_pace(monkeypatch, _respond(200, json.dumps([{"expid": "222"}])))
+        sources = ("memory", "database", "pace")
+        before = {s: sample_value("pace_lookups_total", source=s) for s in sources}
 
-        first_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-timeout"}
+        await pace_resolver.resolve_experiment_ids(
+            async_db, ["stored-exec", "new-exec"]
         )
-        second_response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": "cached-timeout"}
+        await pace_resolver.resolve_experiment_ids(async_db, ["new-exec"])
+
+        assert {
+            s: sample_value("pace_lookups_total", source=s) - before[s] for s in sources
+        } == {"memory": 1, "database": 1, "pace": 1}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, monkeypatch) -> None:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, json=[{"expid": "228920"}])
+
+        captured = mock_pace(monkeypatch, handler)
+
+        pending = [
+            asyncio.ensure_future(pace_resolver.resolve_experiment_id(None, "shared"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert await asyncio.gather(*pending) == ["228920"] * 3
+        assert len(captured) == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_pace_requests(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "pace_lookup_max_concurrency", 2)
+        running = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, text="[]")
+
+        mock_pace(monkeypatch, handler)
+
+        resolved = await pace_resolver.resolve_experiment_ids(
+            None, [f"exec-{index}" for index in range(6)]
         )
 
-        assert first_response.status_code == 200
-        assert second_response.status_code == 200
-        assert first_response.json()["experimentId"] is None
-        assert second_response.json()["experimentId"] is None
-        assert call_count == 1
+        assert len(resolved) == 6
+        assert peak == 2
 
-    def test_extract_experiment_id_returns_none_for_non_dict_first_item(self) -> None:
-        assert pace_api._extract_experiment_id(["228920"]) is None
 
-    def test_get_cached_experiment_id_expires_entries(self, monkeypatch) -> None:
-        monkeypatch.setattr(pace_api.time, "monotonic", lambda: 100.0)
-        pace_api._set_cached_experiment_id("expired-exec", "228920")
+class TestPaceLRU:
+    def test_negative_entries_expire_before_positive_ones(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "pace_cache_ttl_seconds", 300.0)
+        monkeypatch.setattr(settings, "pace_negative_cache_ttl_seconds", 60.0)
+        lru = pace_resolver._PaceLRU()
 
-        monkeypatch.setattr(pace_api.time, "monotonic", lambda: 1000.0)
-        cache_hit, experiment_id = pace_api._get_cached_experiment_id("expired-exec")
+        monkeypatch.setattr(pace_resolver.time, "monotonic", lambda: 100.0)
+        lru.put("hit", "228920")
+        lru.put("miss", None)
 
-        assert cache_hit is False
-        assert experiment_id is None
-        assert "expired-exec" not in pace_api._PACE_CACHE
+        monkeypatch.setattr(pace_resolver.time, "monotonic", lambda: 200.0)
+        assert lru.get("hit") == (True, "228920")
+        assert lru.get("miss") == (False, None)
 
-    def test_endpoint_rejects_missing_execution_id(self, client) -> None:
-        response = client.get(f"{API_BASE}/pace/resolve")
+        monkeypatch.setattr(pace_resolver.time, "monotonic", lambda: 1000.0)
+        assert lru.get("hit") == (False, None)
+        assert lru._entries == {}
 
-        assert response.status_code == 422
-        assert response.json()["detail"][0]["loc"] == ["query", "execution_id"]
+    def test_evicts_least_recently_used_entry(self, monkeypatch) -> None:
+        monkeypatch.setattr(settings, "pace_cache_max_entries", 2)
+        lru = pace_resolver._PaceLRU()
 
-    @pytest.mark.parametrize("value", ["", "   "])
-    def test_endpoint_rejects_blank_execution_id(self, client, value: str) -> None:
-        response = client.get(
-            f"{API_BASE}/pace/resolve", params={"execution_id": value}
-        )
+        lru.put("a", "1")
+        lru.put("b", "2")
+        assert lru.get("a") == (True, "1")
+        lru.put("c", "3")
 
-        assert response.status_code == 422
-        assert response.json() == {"detail": "execution_id must not be blank"}
+        assert lru.get("a") == (True, "1")
+        assert lru.get("b") == (False, None)
+        assert lru.get("c") == (True, "3")
+
+    def test_extract_experiment_id_returns_none_for_non_dict_first_item(self) -> None:
+        assert pace_resolver._extract_experiment_id(["228920"]) is None
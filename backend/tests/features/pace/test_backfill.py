@@ -0,0 +1,87 @@
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.pace import resolver as pace_resolver
+from app.features.pace.backfill import (
+    PaceBackfillReport,
+    backfill_pace_mappings,
+    select_execution_ids_to_backfill,
+)
+from app.scripts.pace import backfill_pace_mappings as backfill_script
+from tests.conftest import create_simulation, mock_pace
+
+
+@pytest.fixture(autouse=True)
+def _clear_pace_cache():
+    pace_resolver.clear_pace_cache()
+    yield
+    pace_resolver.clear_pace_cache()
+
+
+def _session_factory(db: AsyncSession):
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory
+
+
+class TestBackfillPaceMappings:
+    @pytest.mark.asyncio
+    async def test_resolves_unmapped_executions_and_resumes(
+        self,
+        async_db: AsyncSession,
+        normal_user,
+        admin_user,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        await create_simulation(
+            async_db, normal_user, admin_user, execution_id="backfill-hit"
+        )
+        await create_simulation(
+            async_db,
+            normal_user,
+            admin_user,
+            execution_id="backfill-miss",
+            case_name="backfill_case_2",
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "backfill-hit" in request.url.path:
+                return httpx.Response(200, text=json.dumps([{"expid": "4242"}]))
+            return httpx.Response(200, text="[]")
+
+        captured = mock_pace(monkeypatch, handler)
+        factory = _session_factory(async_db)
+
+        first = await backfill_pace_mappings(batch_size=1, session_factory=factory)
+        pace_resolver.clear_pace_cache()
+        remaining = await select_execution_ids_to_backfill(async_db)
+
+        assert first == PaceBackfillReport(selected=2, resolved=1, unresolved=1)
+        assert len(captured) == 2
+        assert remaining == ["backfill-miss"]
+
+
+class TestBackfillPaceMappingsScript:
+    def test_main_passes_arguments_and_closes_client(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        run = AsyncMock(
+            return_value=PaceBackfillReport(selected=3, resolved=2, unresolved=1)
+        )
+        close = AsyncMock()
+        monkeypatch.setattr(backfill_script, "backfill_pace_mappings", run)
+        monkeypatch.setattr(backfill_script, "close_pace_client", close)
+
+        exit_code = backfill_script.main(["--limit", "10", "--batch-size", "5"])
+
+        assert exit_code == 0
+        run.assert_awaited_once_with(limit=10, batch_size=5)
+        close.assert_awaited_once()
+        assert "Selected 3 execution ID(s)" in capsys.readouterr().out
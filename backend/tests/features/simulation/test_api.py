@@ -8,11 +8,13 @@ import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.version import API_BASE
 from app.common.dependencies import get_database_session
 from app.core.config import settings
+from app.core.query_stats import assert_query_budget
 from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
 from app.features.ingestion.models import Ingestion
 from app.features.machine.models import Machine
@@ -21,12 +23,22 @@ from app.features.simulation.api import (
     update_case,
     update_simulation,
 )
+from app.features.simulation.case_stats import (
+    apply_simulations_to_case_stats,
+    apply_status_change_to_case_stats,
+)
 from app.features.simulation.enums import (
     ExternalLinkKind,
     SimulationStatus,
     SimulationType,
 )
-from app.features.simulation.models import Artifact, Case, ExternalLink, Simulation
+from app.features.simulation.models import (
+    Artifact,
+    Case,
+    CaseStats,
+    ExternalLink,
+    Simulation,
+)
 from app.features.simulation.schemas import (
     CaseUpdate,
     SimulationCreate,
@@ -46,17 +58,25 @@ def use_real_auth(test_func):
 
 
 @pytest.fixture(autouse=True)
-def override_auth_dependency(request, normal_user_sync):
+def override_auth_dependency(request):
     """Auto-login a test user for endpoints requiring authentication."""
     if getattr(request.node.function, "_use_real_auth", False):
         yield
         app.dependency_overrides.clear()
         return
 
+    # Async tests seed through their own connection, so the user must be
+    # created there too.
+    user = request.getfixturevalue(
+        "normal_user"
+        if request.node.get_closest_marker("asyncio")
+        else "normal_user_sync"
+    )
+
     def fake_current_user():
         return User(
-            id=normal_user_sync["id"],
-            email=normal_user_sync["email"],
+            id=user["id"],
+            email=user["email"],
             is_active=True,
             is_verified=True,
             role=UserRole.USER,
@@ -257,66 +277,74 @@ class TestListCases:
         assert res.status_code == 200
         assert res.json() == []
 
-    def test_endpoint_returns_cases_with_nested_simulations(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_cases_with_stats_rollup(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        case = _create_case(db, "test_case_nested")
+            case = _create_case(db, "test_case_nested")
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_case_nested",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=2,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_case_nested",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=2,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        # Create two simulations under the same case
-        sim1 = Simulation(
-            case_id=case.id,
-            execution_id="case-nested-exec-1",
-            case_hash="nested-hash-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        sim2 = Simulation(
-            case_id=case.id,
-            execution_id="case-nested-exec-2",
-            case_hash="nested-hash-2",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-02-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim1)
-        db.flush()
-        db.add(sim2)
-        db.commit()
+            # Create two simulations under the same case
+            sim1 = Simulation(
+                case_id=case.id,
+                execution_id="case-nested-exec-1",
+                case_hash="nested-hash-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            sim2 = Simulation(
+                case_id=case.id,
+                execution_id="case-nested-exec-2",
+                case_hash="nested-hash-2",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-02-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim1)
+            db.flush()
+            db.add(sim2)
+            db.flush()
+            apply_simulations_to_case_stats(db, [sim1, sim2])
+            db.commit()
 
-        res = client.get(f"{API_BASE}/cases")
+            return machine
+
+        machine = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases")
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
@@ -330,30 +358,29 @@ class TestListCases:
         assert "knownIssues" not in case_data
         assert "notesMarkdown" not in case_data
 
-        # Verify nested simulations are SimulationSummaryOut (lightweight)
-        sims = case_data["simulations"]
-        assert len(sims) == 2
-
-        # Each summary should have only lightweight fields
-        for s in sims:
-            assert "id" in s
-            assert "executionId" in s
-            assert "caseHash" in s
-            assert "status" in s
-            assert "simulationStartDate" in s
-            # Must NOT include heavy fields
-            assert "machine" not in s
-            assert "artifacts" not in s
-            assert "links" not in s
-            assert "groupedArtifacts" not in s
-            assert "groupedLinks" not in s
-            assert "runConfigDeltas" not in s
-            assert "createdByUser" not in s
-
-        # Verify case hash and summary payload shape
-        exec_ids = {s["executionId"]: s for s in sims}
-        assert exec_ids["case-nested-exec-1"]["caseHash"] == "nested-hash-1"
-        assert exec_ids["case-nested-exec-2"]["caseHash"] == "nested-hash-2"
+        # Listings read the case_stats rollup instead of nested executions
+        assert "simulations" not in case_data
+        assert case_data["simulationCount"] == 2
+        assert case_data["statusCounts"] == {"created": 2}
+        assert case_data["latestStatus"] == "created"
+        assert case_data["latestCreatedAt"] is not None
+
+    @pytest.mark.asyncio
+    async def test_endpoint_defaults_stats_for_case_without_simulations(
+        self, async_client, async_db: AsyncSession
+    ):
+        def seed(db: Session):
+            _create_case(db, "empty_case")
+            db.commit()
+
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases")
+        assert res.status_code == 200
+        case_data = res.json()[0]
+        assert case_data["simulationCount"] == 0
+        assert case_data["statusCounts"] == {}
+        assert case_data["latestStatus"] is None
 
 
 class TestListCaseNames:
@@ -362,97 +389,111 @@ class TestListCaseNames:
         assert res.status_code == 200
         assert res.json() == []
 
-    def test_endpoint_returns_case_names_sorted_alphabetically(
-        self, client, db: Session
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_case_names_sorted_alphabetically(
+        self, async_client, async_db: AsyncSession
     ):
-        _create_case(db, "zeta_case")
-        _create_case(db, "alpha_case")
-        _create_case(db, "beta_case")
-        db.commit()
+        def seed(db: Session):
+            _create_case(db, "zeta_case")
+            _create_case(db, "alpha_case")
+            _create_case(db, "beta_case")
+            db.commit()
 
-        res = client.get(f"{API_BASE}/cases/names")
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases/names")
         assert res.status_code == 200
         assert res.json() == ["alpha_case", "beta_case", "zeta_case"]
 
-    def test_endpoint_returns_distinct_case_names_when_name_repeats(
-        self, client, db: Session
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_distinct_case_names_when_name_repeats(
+        self, async_client, async_db: AsyncSession
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        _create_case(db, "dup_case")
-        second_machine = Machine(
-            name="dup-case-machine",
-            site="Test Site",
-            architecture="x86_64",
-            scheduler="slurm",
-            gpu=False,
-        )
-        db.add(second_machine)
-        db.flush()
-        db.add(
-            Case(
-                name="dup_case",
-                machine_id=second_machine.id,
-                hpc_username="other-user",
+            _create_case(db, "dup_case")
+            second_machine = Machine(
+                name="dup-case-machine",
+                site="Test Site",
+                architecture="x86_64",
+                scheduler="slurm",
+                gpu=False,
             )
-        )
-        db.commit()
+            db.add(second_machine)
+            db.flush()
+            db.add(
+                Case(
+                    name="dup_case",
+                    machine_id=second_machine.id,
+                    hpc_username="other-user",
+                )
+            )
+            db.commit()
 
-        res = client.get(f"{API_BASE}/cases/names")
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases/names")
         assert res.status_code == 200
         assert res.json() == ["dup_case"]
 
 
 class TestGetCase:
-    def test_endpoint_returns_case_detail_with_metadata(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_case_detail_with_metadata(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        case = _create_case(db, "test_case_detail")
-        case.hpc_username = "case-user"
-        case.description = "Shared case description"
-        case.key_features = "Shared key features"
-        case.known_issues = "Shared known issues"
-        case.notes_markdown = "## Shared notes"
-        db.flush()
-
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_case_detail",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_detail")
+            case.hpc_username = "case-user"
+            case.description = "Shared case description"
+            case.key_features = "Shared key features"
+            case.known_issues = "Shared known issues"
+            case.notes_markdown = "## Shared notes"
+            db.flush()
+
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_case_detail",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="case-detail-exec-1",
-            case_hash="detail-hash-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.flush()
-        db.commit()
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="case-detail-exec-1",
+                case_hash="detail-hash-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.flush()
+            db.commit()
+
+            return machine, case
 
-        res = client.get(f"{API_BASE}/cases/{case.id}")
+        machine, case = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases/{case.id}")
         assert res.status_code == 200
         data = res.json()
         assert data["name"] == "test_case_detail"
@@ -467,57 +508,63 @@ class TestGetCase:
         assert data["simulations"][0]["caseHash"] == "detail-hash-1"
         assert data["links"] == []
 
-    def test_endpoint_includes_case_level_diagnostic_links(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_endpoint_includes_case_level_diagnostic_links(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        case = _create_case(db, "test_case_detail_links")
+            case = _create_case(db, "test_case_detail_links")
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_case_detail_links",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_case_detail_links",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        db.add(
-            Simulation(
-                case_id=case.id,
-                execution_id="case-detail-links-exec-1",
-                case_hash="detail-links-hash-1",
-                compset="AQUAPLANET",
-                compset_alias="QPC4",
-                grid_name="f19_f19",
-                grid_resolution="1.9x2.5",
-                initialization_type="startup",
-                simulation_type="experimental",
-                status="created",
-                simulation_start_date="2023-01-01T00:00:00Z",
-                created_by=normal_user_sync["id"],
-                last_updated_by=admin_user_sync["id"],
-                ingestion_id=ingestion.id,
+            db.add(
+                Simulation(
+                    case_id=case.id,
+                    execution_id="case-detail-links-exec-1",
+                    case_hash="detail-links-hash-1",
+                    compset="AQUAPLANET",
+                    compset_alias="QPC4",
+                    grid_name="f19_f19",
+                    grid_resolution="1.9x2.5",
+                    initialization_type="startup",
+                    simulation_type="experimental",
+                    status="created",
+                    simulation_start_date="2023-01-01T00:00:00Z",
+                    created_by=normal_user["id"],
+                    last_updated_by=admin_user["id"],
+                    ingestion_id=ingestion.id,
+                )
             )
-        )
-        db.flush()
-        db.add(
-            ExternalLink(
-                case_id=case.id,
-                kind=ExternalLinkKind.DIAGNOSTIC,
-                url="https://example.com/case-diagnostic",
-                label="Case diagnostic",
+            db.flush()
+            db.add(
+                ExternalLink(
+                    case_id=case.id,
+                    kind=ExternalLinkKind.DIAGNOSTIC,
+                    url="https://example.com/case-diagnostic",
+                    label="Case diagnostic",
+                )
             )
-        )
-        db.commit()
+            db.commit()
 
-        res = client.get(f"{API_BASE}/cases/{case.id}")
+            return case
+
+        case = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases/{case.id}")
         assert res.status_code == 200
         data = res.json()
         assert data["links"] == [
@@ -538,6 +585,56 @@ class TestGetCase:
         assert res.json() == {"detail": "Case not found"}
 
 
+class TestListCaseStats:
+    def test_endpoint_returns_empty_list(self, client):
+        res = client.get(f"{API_BASE}/cases/stats")
+
+        assert res.status_code == 200
+        assert res.json() == []
+
+    @pytest.mark.asyncio
+    async def test_endpoint_reflects_created_and_updated_simulations(
+        self, async_client, async_db: AsyncSession, normal_user
+    ):
+        def seed(db: Session):
+            case = _create_case(db, "test_case_stats")
+            ingestion = _create_ingestion(
+                db, case.machine_id, normal_user["id"], "test_case_stats"
+            )
+            sims = [
+                _create_simulation_record(
+                    db,
+                    case=case,
+                    ingestion_id=ingestion.id,
+                    created_by=normal_user["id"],
+                    last_updated_by=normal_user["id"],
+                    execution_id=f"stats-exec-{index}",
+                )
+                for index in range(2)
+            ]
+            apply_simulations_to_case_stats(db, sims)
+            sims[0].status = SimulationStatus.COMPLETED
+            db.flush()
+            apply_status_change_to_case_stats(db, sims[0], SimulationStatus.CREATED)
+            db.commit()
+
+            return case
+
+        case = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/cases/stats")
+
+        assert res.status_code == 200
+        data = res.json()
+        assert len(data) == 1
+        assert data[0]["caseId"] == str(case.id)
+        assert data[0]["caseName"] == "test_case_stats"
+        assert data[0]["simulationCount"] == 2
+        assert data[0]["statusCounts"] == {"completed": 1, "created": 1}
+        assert data[0]["compilers"] == ["gcc"]
+        assert data[0]["gitTags"] == ["v1.0"]
+
+
 class TestCreateSimulation:
     def test_endpoint_succeeds_with_valid_payload(
         self, client, db: Session, normal_user_sync
@@ -589,6 +686,12 @@ class TestCreateSimulation:
         assert len(data["artifacts"]) == 1
         assert len(data["links"]) == 1
 
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 1
+        assert stats.latest_simulation_id is not None
+        assert str(stats.latest_simulation_id) == data["id"]
+
     def test_endpoint_returns_400_when_case_not_found(
         self, client, db: Session
     ) -> None:
@@ -1130,8 +1233,11 @@ class TestUpdateCase:
 
         db.query.side_effect = [case_query, sim_query]
 
-        with patch(
-            "app.features.simulation.api.transaction", return_value=nullcontext()
+        with (
+            patch(
+                "app.features.simulation.api.transaction", return_value=nullcontext()
+            ),
+            patch("app.features.simulation.api.apply_simulations_to_case_stats"),
         ):
             with pytest.raises(HTTPException) as exc_info:
                 create_simulation(payload=payload, db=db, user=user)
@@ -1140,56 +1246,100 @@ class TestUpdateCase:
         assert exc_info.value.detail == "Failed to load newly created simulation."
 
 
+# Simulations and their eager-loaded relationships load in a fixed number of
+# statements, however many rows there are. The creator and last updater each
+# selectin-load their OAuth accounts and API tokens, hence the repeats.
+LIST_SIMULATIONS_QUERY_BUDGET = 8
+
+
 class TestListSimulations:
     def test_endpoint_returns_empty_list(self, client):
         res = client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         assert res.json() == []
 
-    def test_endpoint_returns_simulations_with_data(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_endpoint_query_count_does_not_grow_with_rows(
+        self, async_client, async_db: AsyncSession, normal_user
+    ):
+        def seed(db: Session):
+            user_id = normal_user["id"]
+            for case_index in range(3):
+                case = _create_case(db, f"test_case_list_budget_{case_index}")
+                ingestion = _create_ingestion(
+                    db,
+                    case.machine_id,
+                    user_id,
+                    source_reference=f"test_simulation_list_budget_{case_index}",
+                )
+                for sim_index in range(2):
+                    _create_simulation_record(
+                        db,
+                        case=case,
+                        ingestion_id=ingestion.id,
+                        created_by=user_id,
+                        last_updated_by=user_id,
+                        execution_id=f"list-budget-{case_index}-{sim_index}",
+                    )
+
+        await async_db.run_sync(seed)
+
+        with assert_query_budget(LIST_SIMULATIONS_QUERY_BUDGET, max_repeats=2):
+            res = await async_client.get(f"{API_BASE}/simulations")
+
+        assert res.status_code == 200
+        assert len(res.json()) == 6
+        assert res.headers["Server-Timing"].startswith("db;dur=")
+
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_simulations_with_data(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", False)
-        machine = db.query(Machine).first()
-        assert machine is not None, "No machine found in the database"
 
-        case = _create_case(db, "test_case_list")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None, "No machine found in the database"
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_simulation_list",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_list")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="list-test-exec-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            git_tag="v1.0",
-            git_commit_hash="abc123",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.commit()
-        db.refresh(sim)
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_simulation_list",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        res = client.get(f"{API_BASE}/simulations")
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="list-test-exec-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                git_tag="v1.0",
+                git_commit_hash="abc123",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.commit()
+            db.refresh(sim)
+
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
@@ -1200,8 +1350,9 @@ class TestListSimulations:
             "autoGenerateDeterministicOnLoad": True,
         }
 
-    def test_endpoint_reports_deterministic_only_capabilities_when_llm_misconfigured(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_endpoint_reports_deterministic_only_capabilities_when_llm_misconfigured(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", True)
         monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
@@ -1209,43 +1360,47 @@ class TestListSimulations:
         monkeypatch.setattr(
             settings, "assistant_ollama_base_url", "http://localhost:11434"
         )
-        machine = db.query(Machine).first()
-        assert machine is not None, "No machine found in the database"
 
-        case = _create_case(db, "test_case_list_misconfigured")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None, "No machine found in the database"
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_simulation_list_misconfigured",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_list_misconfigured")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="list-test-exec-misconfigured",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.commit()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_simulation_list_misconfigured",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        res = client.get(f"{API_BASE}/simulations")
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="list-test-exec-misconfigured",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.commit()
+
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         data = res.json()
         assert data[0]["summaryCapabilities"] == {
@@ -1253,191 +1408,210 @@ class TestListSimulations:
             "autoGenerateDeterministicOnLoad": True,
         }
 
-    def test_filter_by_case_name(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_filter_by_case_name(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        case_a = _create_case(db, "case_alpha")
-        case_b = _create_case(db, "case_beta")
+            case_a = _create_case(db, "case_alpha")
+            case_b = _create_case(db, "case_beta")
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_filter_case_name",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=2,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_filter_case_name",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=2,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
+
+            for case, exec_id in [(case_a, "exec-a"), (case_b, "exec-b")]:
+                db.add(
+                    Simulation(
+                        case_id=case.id,
+                        execution_id=exec_id,
+                        compset="AQUAPLANET",
+                        compset_alias="QPC4",
+                        grid_name="f19_f19",
+                        grid_resolution="1.9x2.5",
+                        initialization_type="startup",
+                        simulation_type="experimental",
+                        status="created",
+                        simulation_start_date="2023-01-01T00:00:00Z",
+                        created_by=normal_user["id"],
+                        last_updated_by=admin_user["id"],
+                        ingestion_id=ingestion.id,
+                    )
+                )
+            db.commit()
 
-        for case, exec_id in [(case_a, "exec-a"), (case_b, "exec-b")]:
-            db.add(
-                Simulation(
-                    case_id=case.id,
-                    execution_id=exec_id,
-                    compset="AQUAPLANET",
-                    compset_alias="QPC4",
-                    grid_name="f19_f19",
-                    grid_resolution="1.9x2.5",
-                    initialization_type="startup",
-                    simulation_type="experimental",
-                    status="created",
-                    simulation_start_date="2023-01-01T00:00:00Z",
-                    created_by=normal_user_sync["id"],
-                    last_updated_by=admin_user_sync["id"],
-                    ingestion_id=ingestion.id,
-                )
-            )
-        db.commit()
+            # No filter returns both
 
-        # No filter returns both
-        res = client.get(f"{API_BASE}/simulations")
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         assert len(res.json()) == 2
 
         # Filter by case_name=case_alpha returns only one
-        res = client.get(f"{API_BASE}/simulations", params={"case_name": "case_alpha"})
+        res = await async_client.get(
+            f"{API_BASE}/simulations", params={"case_name": "case_alpha"}
+        )
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
         assert data[0]["caseName"] == "case_alpha"
 
         # Non-matching filter returns empty
-        res = client.get(f"{API_BASE}/simulations", params={"case_name": "nonexistent"})
+        res = await async_client.get(
+            f"{API_BASE}/simulations", params={"case_name": "nonexistent"}
+        )
         assert res.status_code == 200
         assert len(res.json()) == 0
 
-    def test_filter_by_case_group(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_filter_by_case_group(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
-
-        case_g1 = _create_case(db, "case_group1")
-        case_g1.case_group = "ensemble_A"
-        case_g2 = _create_case(db, "case_group2")
-        case_g2.case_group = "ensemble_B"
-        db.flush()
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_filter_case_group",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=2,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case_g1 = _create_case(db, "case_group1")
+            case_g1.case_group = "ensemble_A"
+            case_g2 = _create_case(db, "case_group2")
+            case_g2.case_group = "ensemble_B"
+            db.flush()
 
-        for case, exec_id in [(case_g1, "exec-g1"), (case_g2, "exec-g2")]:
-            db.add(
-                Simulation(
-                    case_id=case.id,
-                    execution_id=exec_id,
-                    compset="AQUAPLANET",
-                    compset_alias="QPC4",
-                    grid_name="f19_f19",
-                    grid_resolution="1.9x2.5",
-                    initialization_type="startup",
-                    simulation_type="experimental",
-                    status="created",
-                    simulation_start_date="2023-01-01T00:00:00Z",
-                    created_by=normal_user_sync["id"],
-                    last_updated_by=admin_user_sync["id"],
-                    ingestion_id=ingestion.id,
-                )
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_filter_case_group",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=2,
+                duplicate_count=0,
+                error_count=0,
             )
-        db.commit()
+            db.add(ingestion)
+            db.flush()
+
+            for case, exec_id in [(case_g1, "exec-g1"), (case_g2, "exec-g2")]:
+                db.add(
+                    Simulation(
+                        case_id=case.id,
+                        execution_id=exec_id,
+                        compset="AQUAPLANET",
+                        compset_alias="QPC4",
+                        grid_name="f19_f19",
+                        grid_resolution="1.9x2.5",
+                        initialization_type="startup",
+                        simulation_type="experimental",
+                        status="created",
+                        simulation_start_date="2023-01-01T00:00:00Z",
+                        created_by=normal_user["id"],
+                        last_updated_by=admin_user["id"],
+                        ingestion_id=ingestion.id,
+                    )
+                )
+            db.commit()
+
+        await async_db.run_sync(seed)
 
-        res = client.get(f"{API_BASE}/simulations", params={"case_group": "ensemble_A"})
+        res = await async_client.get(
+            f"{API_BASE}/simulations", params={"case_group": "ensemble_A"}
+        )
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
         assert data[0]["caseGroup"] == "ensemble_A"
 
-    def test_filter_by_case_name_returns_simulations_across_normalized_cases(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_filter_by_case_name_returns_simulations_across_normalized_cases(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        second_machine = Machine(
-            name="normalized-case-machine",
-            site="Test Site",
-            architecture="x86_64",
-            scheduler="slurm",
-            gpu=False,
-        )
-        db.add(second_machine)
-        db.flush()
+            second_machine = Machine(
+                name="normalized-case-machine",
+                site="Test Site",
+                architecture="x86_64",
+                scheduler="slurm",
+                gpu=False,
+            )
+            db.add(second_machine)
+            db.flush()
 
-        first_case = _create_case(db, "normalized_case")
-        second_case = Case(
-            name="normalized_case",
-            machine_id=second_machine.id,
-            hpc_username="other-user",
-        )
-        db.add(second_case)
-        db.flush()
+            first_case = _create_case(db, "normalized_case")
+            second_case = Case(
+                name="normalized_case",
+                machine_id=second_machine.id,
+                hpc_username="other-user",
+            )
+            db.add(second_case)
+            db.flush()
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_filter_normalized_case_name",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=2,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_filter_normalized_case_name",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=2,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
+
+            db.add_all(
+                [
+                    Simulation(
+                        case_id=first_case.id,
+                        execution_id="normalized-exec-1",
+                        compset="AQUAPLANET",
+                        compset_alias="QPC4",
+                        grid_name="f19_f19",
+                        grid_resolution="1.9x2.5",
+                        initialization_type="startup",
+                        simulation_type="experimental",
+                        status="created",
+                        simulation_start_date="2023-01-01T00:00:00Z",
+                        created_by=normal_user["id"],
+                        last_updated_by=admin_user["id"],
+                        ingestion_id=ingestion.id,
+                    ),
+                    Simulation(
+                        case_id=second_case.id,
+                        execution_id="normalized-exec-2",
+                        compset="AQUAPLANET",
+                        compset_alias="QPC4",
+                        grid_name="f19_f19",
+                        grid_resolution="1.9x2.5",
+                        initialization_type="startup",
+                        simulation_type="experimental",
+                        status="created",
+                        simulation_start_date="2023-01-02T00:00:00Z",
+                        created_by=normal_user["id"],
+                        last_updated_by=admin_user["id"],
+                        ingestion_id=ingestion.id,
+                    ),
+                ]
+            )
+            db.commit()
 
-        db.add_all(
-            [
-                Simulation(
-                    case_id=first_case.id,
-                    execution_id="normalized-exec-1",
-                    compset="AQUAPLANET",
-                    compset_alias="QPC4",
-                    grid_name="f19_f19",
-                    grid_resolution="1.9x2.5",
-                    initialization_type="startup",
-                    simulation_type="experimental",
-                    status="created",
-                    simulation_start_date="2023-01-01T00:00:00Z",
-                    created_by=normal_user_sync["id"],
-                    last_updated_by=admin_user_sync["id"],
-                    ingestion_id=ingestion.id,
-                ),
-                Simulation(
-                    case_id=second_case.id,
-                    execution_id="normalized-exec-2",
-                    compset="AQUAPLANET",
-                    compset_alias="QPC4",
-                    grid_name="f19_f19",
-                    grid_resolution="1.9x2.5",
-                    initialization_type="startup",
-                    simulation_type="experimental",
-                    status="created",
-                    simulation_start_date="2023-01-02T00:00:00Z",
-                    created_by=normal_user_sync["id"],
-                    last_updated_by=admin_user_sync["id"],
-                    ingestion_id=ingestion.id,
-                ),
-            ]
-        )
-        db.commit()
+        await async_db.run_sync(seed)
 
-        res = client.get(
+        res = await async_client.get(
             f"{API_BASE}/simulations", params={"case_name": "normalized_case"}
         )
         assert res.status_code == 200
@@ -1446,53 +1620,58 @@ class TestListSimulations:
             "normalized-exec-2",
         }
 
-    def test_filter_by_case_name_and_case_group(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_filter_by_case_name_and_case_group(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
-        machine = db.query(Machine).first()
-        assert machine is not None
-
-        case = _create_case(db, "combo_case")
-        case.case_group = "combo_group"
-        case_other = _create_case(db, "other_case")
-        case_other.case_group = "combo_group"
-        db.flush()
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_filter_combo",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=2,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "combo_case")
+            case.case_group = "combo_group"
+            case_other = _create_case(db, "other_case")
+            case_other.case_group = "combo_group"
+            db.flush()
 
-        for c, exec_id in [(case, "exec-combo"), (case_other, "exec-other")]:
-            db.add(
-                Simulation(
-                    case_id=c.id,
-                    execution_id=exec_id,
-                    compset="AQUAPLANET",
-                    compset_alias="QPC4",
-                    grid_name="f19_f19",
-                    grid_resolution="1.9x2.5",
-                    initialization_type="startup",
-                    simulation_type="experimental",
-                    status="created",
-                    simulation_start_date="2023-01-01T00:00:00Z",
-                    created_by=normal_user_sync["id"],
-                    last_updated_by=admin_user_sync["id"],
-                    ingestion_id=ingestion.id,
-                )
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_filter_combo",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=2,
+                duplicate_count=0,
+                error_count=0,
             )
-        db.commit()
+            db.add(ingestion)
+            db.flush()
+
+            for c, exec_id in [(case, "exec-combo"), (case_other, "exec-other")]:
+                db.add(
+                    Simulation(
+                        case_id=c.id,
+                        execution_id=exec_id,
+                        compset="AQUAPLANET",
+                        compset_alias="QPC4",
+                        grid_name="f19_f19",
+                        grid_resolution="1.9x2.5",
+                        initialization_type="startup",
+                        simulation_type="experimental",
+                        status="created",
+                        simulation_start_date="2023-01-01T00:00:00Z",
+                        created_by=normal_user["id"],
+                        last_updated_by=admin_user["id"],
+                        ingestion_id=ingestion.id,
+                    )
+                )
+            db.commit()
 
-        # Both share same group, but filtering by both narrows to one
-        res = client.get(
+            # Both share same group, but filtering by both narrows to one
+
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(
             f"{API_BASE}/simulations",
             params={"case_name": "combo_case", "case_group": "combo_group"},
         )
@@ -1502,70 +1681,75 @@ class TestListSimulations:
         assert data[0]["caseName"] == "combo_case"
         assert data[0]["caseGroup"] == "combo_group"
 
-    def test_list_merges_case_owned_diagnostic_links_without_duplicates(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_list_merges_case_owned_diagnostic_links_without_duplicates(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", False)
-        machine = db.query(Machine).first()
-        assert machine is not None
 
-        case = _create_case(db, "test_case_list_links")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_case_list_links",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_list_links")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="list-links-exec-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.flush()
-        db.add_all(
-            [
-                ExternalLink(
-                    case_id=case.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/case-only-diagnostic",
-                    label="Case-only diagnostic",
-                ),
-                ExternalLink(
-                    case_id=case.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/shared-diagnostic",
-                    label="Case shared diagnostic",
-                ),
-                ExternalLink(
-                    simulation_id=sim.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/shared-diagnostic",
-                    label="Simulation shared diagnostic",
-                ),
-            ]
-        )
-        db.commit()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_case_list_links",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        res = client.get(f"{API_BASE}/simulations")
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="list-links-exec-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.flush()
+            db.add_all(
+                [
+                    ExternalLink(
+                        case_id=case.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/case-only-diagnostic",
+                        label="Case-only diagnostic",
+                    ),
+                    ExternalLink(
+                        case_id=case.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/shared-diagnostic",
+                        label="Case shared diagnostic",
+                    ),
+                    ExternalLink(
+                        simulation_id=sim.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/shared-diagnostic",
+                        label="Simulation shared diagnostic",
+                    ),
+                ]
+            )
+            db.commit()
+
+        await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
@@ -1591,8 +1775,9 @@ class TestListSimulations:
 
 
 class TestGetSimulation:
-    def test_endpoint_succeeds_with_valid_id(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_endpoint_succeeds_with_valid_id(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", True)
         monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
@@ -1600,47 +1785,53 @@ class TestGetSimulation:
         monkeypatch.setattr(
             settings, "assistant_ollama_base_url", "http://localhost:11434"
         )
-        machine = db.query(Machine).first()
-        assert machine is not None, "No machine found in the database"
 
-        case = _create_case(db, "test_case_get")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None, "No machine found in the database"
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_simulation_get",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_get")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="get-test-exec-1",
-            case_hash="abc123casehash",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            git_tag="v1.0",
-            git_commit_hash="abc123",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.commit()
-        db.refresh(sim)
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_simulation_get",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
+
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="get-test-exec-1",
+                case_hash="abc123casehash",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                git_tag="v1.0",
+                git_commit_hash="abc123",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.commit()
+            db.refresh(sim)
+
+            return sim
+
+        sim = await async_db.run_sync(seed)
 
-        res = client.get(f"{API_BASE}/simulations/{sim.id}")
+        res = await async_client.get(f"{API_BASE}/simulations/{sim.id}")
         assert res.status_code == 200
         data = res.json()
         assert data["caseName"] == "test_case_get"
@@ -1651,8 +1842,9 @@ class TestGetSimulation:
         }
         assert data["caseHash"] == "abc123casehash"
 
-    def test_endpoint_reports_deterministic_only_capabilities_when_llm_misconfigured(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_endpoint_reports_deterministic_only_capabilities_when_llm_misconfigured(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", True)
         monkeypatch.setattr(settings, "assistant_llm_provider", "ollama")
@@ -1660,44 +1852,50 @@ class TestGetSimulation:
         monkeypatch.setattr(
             settings, "assistant_ollama_base_url", "http://localhost:11434"
         )
-        machine = db.query(Machine).first()
-        assert machine is not None, "No machine found in the database"
 
-        case = _create_case(db, "test_case_get_misconfigured")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None, "No machine found in the database"
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_simulation_get_misconfigured",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_get_misconfigured")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="get-test-exec-misconfigured",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.commit()
-        db.refresh(sim)
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_simulation_get_misconfigured",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
+
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="get-test-exec-misconfigured",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.commit()
+            db.refresh(sim)
+
+            return sim
+
+        sim = await async_db.run_sync(seed)
 
-        res = client.get(f"{API_BASE}/simulations/{sim.id}")
+        res = await async_client.get(f"{API_BASE}/simulations/{sim.id}")
         assert res.status_code == 200
         data = res.json()
         assert data["summaryCapabilities"] == {
@@ -1710,71 +1908,78 @@ class TestGetSimulation:
         assert res.status_code == 404
         assert res.json() == {"detail": "Simulation not found"}
 
-    def test_endpoint_merges_case_owned_diagnostic_links_with_simulation_precedence(
-        self, client, db: Session, normal_user_sync, admin_user_sync, monkeypatch
+    @pytest.mark.asyncio
+    async def test_endpoint_merges_case_owned_diagnostic_links_with_simulation_precedence(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user, monkeypatch
     ):
         monkeypatch.setattr(settings, "assistant_llm_enabled", False)
-        machine = db.query(Machine).first()
-        assert machine is not None
 
-        case = _create_case(db, "test_case_get_links")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_simulation_get_links",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_get_links")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="get-links-exec-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.flush()
-        db.add_all(
-            [
-                ExternalLink(
-                    case_id=case.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/case-diagnostic-only",
-                    label="Case diagnostic only",
-                ),
-                ExternalLink(
-                    case_id=case.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/shared-diagnostic-detail",
-                    label="Case duplicate",
-                ),
-                ExternalLink(
-                    simulation_id=sim.id,
-                    kind=ExternalLinkKind.DIAGNOSTIC,
-                    url="https://example.com/shared-diagnostic-detail",
-                    label="Simulation duplicate",
-                ),
-            ]
-        )
-        db.commit()
-        db.refresh(sim)
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_simulation_get_links",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        res = client.get(f"{API_BASE}/simulations/{sim.id}")
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="get-links-exec-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.flush()
+            db.add_all(
+                [
+                    ExternalLink(
+                        case_id=case.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/case-diagnostic-only",
+                        label="Case diagnostic only",
+                    ),
+                    ExternalLink(
+                        case_id=case.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/shared-diagnostic-detail",
+                        label="Case duplicate",
+                    ),
+                    ExternalLink(
+                        simulation_id=sim.id,
+                        kind=ExternalLinkKind.DIAGNOSTIC,
+                        url="https://example.com/shared-diagnostic-detail",
+                        label="Simulation duplicate",
+                    ),
+                ]
+            )
+            db.commit()
+            db.refresh(sim)
+
+            return sim
+
+        sim = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations/{sim.id}")
         assert res.status_code == 200
         data = res.json()
 
@@ -1797,6 +2002,102 @@ class TestGetSimulation:
         )
 
 
+class TestCompareSimulations:
+    def _create_pair(self, db: Session, user) -> tuple[Simulation, ...]:
+        case = _create_case(db, "test_case_compare")
+        ingestion = _create_ingestion(db, case.machine_id, user["id"], "test_compare")
+        sims = tuple(
+            _create_simulation_record(
+                db,
+                case=case,
+                ingestion_id=ingestion.id,
+                created_by=user["id"],
+                last_updated_by=user["id"],
+                execution_id=f"compare-exec-{index}",
+            )
+            for index in range(3)
+        )
+        sims[1].git_commit_hash = "def456"
+        sims[1].extra = {"queue": "debug", "nodes": 4}
+        sims[2].extra = {"queue": "debug"}
+        db.commit()
+
+        return sims
+
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_constant_and_varying_fields(
+        self, async_client, async_db: AsyncSession, normal_user
+    ):
+        sims = await async_db.run_sync(self._create_pair, normal_user)
+
+        res = await async_client.post(
+            f"{API_BASE}/simulations/compare",
+            json={"simulationIds": [str(s.id) for s in sims]},
+        )
+
+        assert res.status_code == 200
+        data = res.json()
+        assert [member["executionId"] for member in data["simulations"]] == [
+            "compare-exec-0",
+            "compare-exec-1",
+            "compare-exec-2",
+        ]
+        assert data["constantFields"]["caseName"] == "test_case_compare"
+        assert data["constantFields"]["compset"] == "AQUAPLANET"
+        assert data["constantFields"]["status"] == "created"
+        assert "executionId" not in data["constantFields"]
+
+        varying = {field["field"]: field["groups"] for field in data["varyingFields"]}
+        assert set(varying) == {"gitCommitHash", "extra.nodes", "extra.queue"}
+        assert varying["gitCommitHash"] == [
+            {"value": "abc123", "simulationIds": [str(sims[0].id), str(sims[2].id)]},
+            {"value": "def456", "simulationIds": [str(sims[1].id)]},
+        ]
+        assert varying["extra.queue"] == [
+            {"value": None, "simulationIds": [str(sims[0].id)]},
+            {"value": "debug", "simulationIds": [str(sims[1].id), str(sims[2].id)]},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_endpoint_ignores_duplicate_ids(
+        self, async_client, async_db: AsyncSession, normal_user
+    ):
+        sims = await async_db.run_sync(self._create_pair, normal_user)
+
+        res = await async_client.post(
+            f"{API_BASE}/simulations/compare",
+            json={"simulationIds": [str(sims[0].id), str(sims[0].id)]},
+        )
+
+        assert res.status_code == 200
+        data = res.json()
+        assert len(data["simulations"]) == 1
+        assert data["varyingFields"] == []
+
+    @pytest.mark.asyncio
+    async def test_endpoint_returns_404_for_unknown_ids(
+        self, async_client, async_db: AsyncSession, normal_user
+    ):
+        sims = await async_db.run_sync(self._create_pair, normal_user)
+        missing_id = uuid4()
+
+        res = await async_client.post(
+            f"{API_BASE}/simulations/compare",
+            json={"simulationIds": [str(sims[0].id), str(missing_id)]},
+        )
+
+        assert res.status_code == 404
+        assert res.json() == {"detail": f"Simulations not found: {missing_id}"}
+
+    def test_endpoint_rejects_fewer_than_two_ids(self, client):
+        res = client.post(
+            f"{API_BASE}/simulations/compare",
+            json={"simulationIds": [str(uuid4())]},
+        )
+
+        assert res.status_code == 422
+
+
 class TestUpdateSimulation:
     def test_endpoint_updates_sparse_metadata_and_audit_fields(
         self, client, db: Session, normal_user_sync, admin_user_sync
@@ -2434,47 +2735,54 @@ class TestUpdateSimulation:
 
 
 class TestSimulationBrowserIncludesCaseMetadata:
-    def test_simulation_list_includes_case_name_and_id(
-        self, client, db: Session, normal_user_sync, admin_user_sync
+    @pytest.mark.asyncio
+    async def test_simulation_list_includes_case_name_and_id(
+        self, async_client, async_db: AsyncSession, normal_user, admin_user
     ):
         """The flat /simulations endpoint includes case metadata on each row."""
-        machine = db.query(Machine).first()
-        assert machine is not None
 
-        case = _create_case(db, "test_case_browser")
+        def seed(db: Session):
+            machine = db.query(Machine).first()
+            assert machine is not None
 
-        ingestion = Ingestion(
-            source_type=IngestionSourceType.BROWSER_UPLOAD,
-            source_reference="test_sim_browser",
-            machine_id=machine.id,
-            triggered_by=normal_user_sync["id"],
-            status=IngestionStatus.SUCCESS,
-            created_count=1,
-            duplicate_count=0,
-            error_count=0,
-        )
-        db.add(ingestion)
-        db.flush()
+            case = _create_case(db, "test_case_browser")
 
-        sim = Simulation(
-            case_id=case.id,
-            execution_id="browser-exec-1",
-            compset="AQUAPLANET",
-            compset_alias="QPC4",
-            grid_name="f19_f19",
-            grid_resolution="1.9x2.5",
-            initialization_type="startup",
-            simulation_type="experimental",
-            status="created",
-            simulation_start_date="2023-01-01T00:00:00Z",
-            created_by=normal_user_sync["id"],
-            last_updated_by=admin_user_sync["id"],
-            ingestion_id=ingestion.id,
-        )
-        db.add(sim)
-        db.commit()
+            ingestion = Ingestion(
+                source_type=IngestionSourceType.BROWSER_UPLOAD,
+                source_reference="test_sim_browser",
+                machine_id=machine.id,
+                triggered_by=normal_user["id"],
+                status=IngestionStatus.SUCCESS,
+                created_count=1,
+                duplicate_count=0,
+                error_count=0,
+            )
+            db.add(ingestion)
+            db.flush()
 
-        res = client.get(f"{API_BASE}/simulations")
+            sim = Simulation(
+                case_id=case.id,
+                execution_id="browser-exec-1",
+                compset="AQUAPLANET",
+                compset_alias="QPC4",
+                grid_name="f19_f19",
+                grid_resolution="1.9x2.5",
+                initialization_type="startup",
+                simulation_type="experimental",
+                status="created",
+                simulation_start_date="2023-01-01T00:00:00Z",
+                created_by=normal_user["id"],
+                last_updated_by=admin_user["id"],
+                ingestion_id=ingestion.id,
+            )
+            db.add(sim)
+            db.commit()
+
+            return case
+
+        case = await async_db.run_sync(seed)
+
+        res = await async_client.get(f"{API_BASE}/simulations")
         assert res.status_code == 200
         data = res.json()
         assert len(data) == 1
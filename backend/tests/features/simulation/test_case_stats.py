@@ -0,0 +1,352 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.features.ingestion.enums import IngestionSourceType, IngestionStatus
+from app.features.ingestion.models import Ingestion
+from app.features.machine.models import Machine
+from app.features.simulation.case_stats import (
+    CaseStatsDelta,
+    apply_simulations_to_case_stats,
+    apply_status_change_to_case_stats,
+    rebuild_case_stats,
+)
+from app.features.simulation.enums import SimulationStatus
+from app.features.simulation.models import Case, CaseStats, Simulation
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _create_case(db: Session, name: str) -> Case:
+    machine = db.query(Machine).first()
+    assert machine is not None
+
+    case = Case(name=name, machine_id=machine.id, hpc_username="stats-user")
+    db.add(case)
+    db.flush()
+
+    return case
+
+
+def _create_ingestion(db: Session, case: Case, user_id) -> Ingestion:
+    ingestion = Ingestion(
+        source_type=IngestionSourceType.BROWSER_UPLOAD,
+        source_reference=f"stats-{case.name}",
+        machine_id=case.machine_id,
+        triggered_by=user_id,
+        status=IngestionStatus.SUCCESS,
+        created_count=1,
+        duplicate_count=0,
+        error_count=0,
+    )
+    db.add(ingestion)
+    db.flush()
+
+    return ingestion
+
+
+def _create_simulation(
+    db: Session,
+    *,
+    case: Case,
+    ingestion: Ingestion,
+    user_id,
+    execution_id: str,
+    offset_days: int,
+    status: SimulationStatus = SimulationStatus.CREATED,
+    compiler: str | None = "gcc",
+    git_tag: str | None = "v1.0",
+) -> Simulation:
+    sim = Simulation(
+        case_id=case.id,
+        execution_id=execution_id,
+        compset="AQUAPLANET",
+        compset_alias="QPC4",
+        grid_name="f19_f19",
+        grid_resolution="1.9x2.5",
+        initialization_type="startup",
+        simulation_type="experimental",
+        status=status,
+        simulation_start_date=BASE_TIME + timedelta(days=offset_days),
+        simulation_end_date=BASE_TIME + timedelta(days=offset_days + 30),
+        compiler=compiler,
+        git_tag=git_tag,
+        created_by=user_id,
+        last_updated_by=user_id,
+        ingestion_id=ingestion.id,
+        created_at=BASE_TIME + timedelta(days=offset_days),
+    )
+    db.add(sim)
+    db.flush()
+
+    return sim
+
+
+class TestApplySimulationsToCaseStats:
+    def test_creates_row_from_existing_simulations(self, db: Session, normal_user_sync):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_new")
+        ingestion = _create_ingestion(db, case, user_id)
+        older = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-new-1",
+            offset_days=0,
+            compiler="intel",
+        )
+        newer = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-new-2",
+            offset_days=10,
+            status=SimulationStatus.RUNNING,
+        )
+
+        # Only the newer simulation is passed in; the older one predates the
+        # stats row and must still be counted.
+        apply_simulations_to_case_stats(db, [newer])
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 2
+        assert stats.status_counts == {"created": 1, "running": 1}
+        assert stats.latest_simulation_id == newer.id
+        assert stats.latest_status == "running"
+        assert stats.earliest_start_date == older.simulation_start_date
+        assert stats.latest_end_date == newer.simulation_end_date
+        assert stats.compilers == ["gcc", "intel"]
+        assert stats.git_tags == ["v1.0"]
+
+    def test_folds_new_simulations_into_existing_row(
+        self, db: Session, normal_user_sync
+    ):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_incremental")
+        ingestion = _create_ingestion(db, case, user_id)
+        first = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-inc-1",
+            offset_days=5,
+        )
+        apply_simulations_to_case_stats(db, [first])
+
+        second = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-inc-2",
+            offset_days=1,
+            status=SimulationStatus.FAILED,
+            compiler=None,
+            git_tag="v2.0",
+        )
+        apply_simulations_to_case_stats(db, [second])
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 2
+        assert stats.status_counts == {"created": 1, "failed": 1}
+        # The second simulation was created earlier, so it is not the latest.
+        assert stats.latest_simulation_id == first.id
+        assert stats.latest_status == "created"
+        assert stats.earliest_start_date == second.simulation_start_date
+        assert stats.latest_end_date == first.simulation_end_date
+        assert stats.compilers == ["gcc"]
+        assert stats.git_tags == ["v1.0", "v2.0"]
+
+    def test_breaks_created_at_ties_on_execution_id(
+        self, db: Session, normal_user_sync
+    ):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_tie")
+        ingestion = _create_ingestion(db, case, user_id)
+        seed = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-tie-0",
+            offset_days=0,
+        )
+        apply_simulations_to_case_stats(db, [seed])
+
+        # A chunk stamps every simulation with the same created_at; the
+        # larger execution_id wins regardless of iteration order.
+        chunk = [
+            _create_simulation(
+                db,
+                case=case,
+                ingestion=ingestion,
+                user_id=user_id,
+                execution_id=execution_id,
+                offset_days=3,
+            )
+            for execution_id in ("stats-tie-2", "stats-tie-1")
+        ]
+        apply_simulations_to_case_stats(db, chunk)
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.latest_simulation_id == chunk[0].id
+
+        rebuild_case_stats(db, [case.id])
+        assert stats.latest_simulation_id == chunk[0].id
+
+    def test_ignores_empty_input(self, db: Session):
+        apply_simulations_to_case_stats(db, [])
+
+        assert db.query(CaseStats).count() == 0
+
+
+class TestCaseStatsDelta:
+    def test_applies_several_chunks_at_once(self, db: Session, normal_user_sync):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_delta")
+        ingestion = _create_ingestion(db, case, user_id)
+
+        def create(execution_id: str, offset_days: int, **kwargs) -> Simulation:
+            return _create_simulation(
+                db,
+                case=case,
+                ingestion=ingestion,
+                user_id=user_id,
+                execution_id=execution_id,
+                offset_days=offset_days,
+                **kwargs,
+            )
+
+        apply_simulations_to_case_stats(db, [create("stats-delta-0", 2)])
+        delta = CaseStatsDelta()
+        delta.add([create("stats-delta-1", 0, status=SimulationStatus.FAILED)])
+        delta.add([create("stats-delta-3", 5), create("stats-delta-2", 5)])
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 1
+
+        delta.apply(db)
+        applied = {
+            column: getattr(stats, column)
+            for column in (
+                "simulation_count",
+                "status_counts",
+                "earliest_start_date",
+                "latest_end_date",
+                "compilers",
+                "git_tags",
+                "latest_simulation_id",
+                "latest_status",
+                "latest_created_at",
+            )
+        }
+        delta.apply(db)
+        rebuild_case_stats(db, [case.id])
+
+        assert applied["simulation_count"] == 4
+        assert applied["status_counts"] == {"created": 3, "failed": 1}
+        assert applied == {column: getattr(stats, column) for column in applied}
+
+
+class TestApplyStatusChangeToCaseStats:
+    def test_moves_simulation_between_status_buckets(
+        self, db: Session, normal_user_sync
+    ):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_status")
+        ingestion = _create_ingestion(db, case, user_id)
+        sims = [
+            _create_simulation(
+                db,
+                case=case,
+                ingestion=ingestion,
+                user_id=user_id,
+                execution_id=f"stats-status-{index}",
+                offset_days=index,
+            )
+            for index in range(2)
+        ]
+        apply_simulations_to_case_stats(db, sims)
+
+        sims[1].status = SimulationStatus.COMPLETED
+        db.flush()
+        apply_status_change_to_case_stats(db, sims[1], SimulationStatus.CREATED)
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 2
+        assert stats.status_counts == {"created": 1, "completed": 1}
+        assert stats.latest_status == "completed"
+
+    def test_is_noop_when_status_is_unchanged(self, db: Session, normal_user_sync):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_unchanged")
+        ingestion = _create_ingestion(db, case, user_id)
+        sim = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-unchanged-1",
+            offset_days=0,
+        )
+
+        apply_status_change_to_case_stats(db, sim, "created")
+
+        assert db.get(CaseStats, case.id) is None
+
+    def test_recomputes_when_stats_row_is_missing(self, db: Session, normal_user_sync):
+        user_id = normal_user_sync["id"]
+        case = _create_case(db, "stats_case_missing")
+        ingestion = _create_ingestion(db, case, user_id)
+        sim = _create_simulation(
+            db,
+            case=case,
+            ingestion=ingestion,
+            user_id=user_id,
+            execution_id="stats-missing-1",
+            offset_days=0,
+            status=SimulationStatus.COMPLETED,
+        )
+
+        apply_status_change_to_case_stats(db, sim, SimulationStatus.RUNNING)
+
+        stats = db.get(CaseStats, case.id)
+        assert stats is not None
+        assert stats.simulation_count == 1
+        assert stats.status_counts == {"completed": 1}
+
+
+class TestRebuildCaseStats:
+    def test_recomputes_stale_and_missing_rows(self, db: Session, normal_user_sync):
+        user_id = normal_user_sync["id"]
+        stale_case = _create_case(db, "stats_case_rebuild_stale")
+        missing_case = _create_case(db, "stats_case_rebuild_missing")
+        for case in (stale_case, missing_case):
+            ingestion = _create_ingestion(db, case, user_id)
+            _create_simulation(
+                db,
+                case=case,
+                ingestion=ingestion,
+                user_id=user_id,
+                execution_id=f"{case.name}-1",
+                offset_days=0,
+                status=SimulationStatus.COMPLETED,
+            )
+        db.add(CaseStats(case_id=stale_case.id, simulation_count=7))
+        db.flush()
+
+        rebuild_case_stats(db, [stale_case.id, missing_case.id])
+
+        for case in (stale_case, missing_case):
+            stats = db.get(CaseStats, case.id)
+            assert stats is not None
+            assert stats.simulation_count == 1
+            assert stats.status_counts == {"completed": 1}
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from app.features.simulation.compare_utils import (
+    COMPARE_FIELDS,
+    build_simulation_comparison,
+)
+from app.features.simulation.enums import SimulationStatus
+
+
+def _row(**overrides):
+    row: dict[str, Any] = {field: None for field in COMPARE_FIELDS}
+    row.update(
+        id=uuid4(),
+        execution_id="exec",
+        extra={},
+        compset="AQUAPLANET",
+        status=SimulationStatus.CREATED,
+        simulation_start_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+    )
+    row.update(overrides)
+
+    return row
+
+
+def test_build_simulation_comparison_normalizes_enum_and_datetime_values() -> None:
+    result = build_simulation_comparison([_row(), _row()])
+
+    assert result["constant_fields"]["status"] == "created"
+    assert result["constant_fields"]["simulationStartDate"] == (
+        "2023-01-01T00:00:00+00:00"
+    )
+    assert result["varying_fields"] == []
+
+
+def test_build_simulation_comparison_groups_nested_extra_values() -> None:
+    first = _row(extra={"pes": {"atm": 64}})
+    second = _row(extra={"pes": {"atm": 128}})
+    third = _row(extra={"pes": {"atm": 64}})
+
+    result = build_simulation_comparison([first, second, third])
+
+    assert result["varying_fields"] == [
+        {
+            "field": "extra.pes",
+            "groups": [
+                {"value": {"atm": 64}, "simulation_ids": [first["id"], third["id"]]},
+                {"value": {"atm": 128}, "simulation_ids": [second["id"]]},
+            ],
+        }
+    ]
@@ -0,0 +1,142 @@
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.version import API_BASE
+from app.scripts.db.seed import seed_synthetic_catalog
+from app.scripts.simulation import load_test
+from app.scripts.simulation.loadtest import (
+    READ_SCENARIOS,
+    LoadTestReport,
+    ScenarioResult,
+    build_read_scenarios,
+    percentile,
+    run_load_test,
+    sample_catalog_ids,
+)
+
+
+class TestPercentile:
+    def test_uses_nearest_rank(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+        assert percentile([], 50) == 0.0
+
+
+class TestBuildReadScenarios:
+    def test_skips_scenarios_without_ids(self) -> None:
+        scenarios = build_read_scenarios([], [], [])
+
+        assert [scenario.name for scenario in scenarios] == [
+            "list_case_names",
+            "list_cases",
+            "list_simulations",
+        ]
+
+    def test_encodes_case_name_filter(self) -> None:
+        (scenario,) = build_read_scenarios(
+            [], ["a b/c"], [], names=["list_simulations_by_case"]
+        )
+
+        assert scenario.paths == (f"{API_BASE}/simulations?case_name=a%20b/c",)
+
+    def test_rejects_unknown_scenarios(self) -> None:
+        with pytest.raises(ValueError, match="Unknown scenario"):
+            build_read_scenarios([], [], [], names=["delete_everything"])
+
+
+class TestRunLoadTest:
+    @pytest.mark.asyncio
+    async def test_measures_every_read_endpoint(
+        self, async_db: AsyncSession, normal_user, async_client: AsyncClient
+    ) -> None:
+        await async_db.run_sync(
+            seed_synthetic_catalog, normal_user["id"], cases=2, simulations_per_case=2
+        )
+        scenarios = build_read_scenarios(
+            *await async_db.run_sync(sample_catalog_ids, limit=5)
+        )
+
+        report = await run_load_test(
+            async_client,
+            scenarios,
+            requests_per_scenario=6,
+            concurrency=3,
+            warmup=1,
+            count_statements=True,
+        )
+
+        assert [result.name for result in report.scenarios] == list(READ_SCENARIOS)
+        for result in report.scenarios:
+            assert result.requests == 6
+            assert result.errors == 0
+            assert result.mean_response_bytes > 0
+            assert result.statements_per_request is not None
+            assert result.statements_per_request >= 1
+            assert result.p50_ms <= result.p95_ms <= result.p99_ms
+
+    @pytest.mark.asyncio
+    async def test_counts_failed_requests_as_errors(
+        self, async_client: AsyncClient
+    ) -> None:
+        scenarios = build_read_scenarios([], [], [uuid4()], names=["get_simulation"])
+
+        report = await run_load_test(
+            async_client, scenarios, requests_per_scenario=2, warmup=0
+        )
+
+        assert report.scenarios[0].errors == 2
+        assert report.scenarios[0].statements_per_request is None
+
+
+class TestLoadTestScript:
+    def test_writes_report_and_fails_on_errors(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        db: Session,
+        normal_user_sync,
+    ) -> None:
+        seed_synthetic_catalog(
+            db, normal_user_sync["id"], cases=1, simulations_per_case=1
+        )
+        result = ScenarioResult(
+            name="get_simulation",
+            requests=10,
+            errors=1,
+            concurrency=2,
+            seconds=0.5,
+            requests_per_second=20.0,
+            p50_ms=10.0,
+            p95_ms=20.0,
+            p99_ms=30.0,
+            mean_response_bytes=512.0,
+            statements_per_request=2.0,
+        )
+        run = AsyncMock(return_value=LoadTestReport(scenarios=[result]))
+        monkeypatch.setattr(load_test, "SessionLocal", lambda: db)
+        monkeypatch.setattr(load_test, "run_load_test", run)
+        output = tmp_path / "report.json"
+
+        exit_code = load_test.main(
+            ["--scenario", "get_simulation", "--output", str(output)]
+        )
+
+        assert exit_code == 1
+        assert run.await_args is not None
+        assert [scenario.name for scenario in run.await_args.args[1]] == [
+            "get_simulation"
+        ]
+        assert json.loads(output.read_text())["scenarios"][0]["p99_ms"] == 30.0
+        assert "get_simulation" in capsys.readouterr().out
@@ -0,0 +1,248 @@
+"""Query-plan regression tests for the hot lookup shapes.
+
+Each test seeds enough rows for the planner to prefer an index over a
+sequential scan, refreshes statistics with ``ANALYZE``, and asserts that
+``EXPLAIN`` for the query shape used by the application reads the expected
+index.
+"""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement
+
+from app.features.ingestion.api import STATEFUL_INGESTION_SOURCE_TYPES
+from app.features.ingestion.models import Ingestion
+from app.features.machine.models import Machine
+from app.features.simulation.models import Case, Simulation
+
+CASE_COUNT = 500
+SIMULATIONS_PER_CASE = 10
+INGESTION_COUNT = 4000
+
+
+@pytest.fixture
+def seeded_db(db: Session, normal_user_sync) -> Session:
+    machine_ids = [m.id for m in db.query(Machine).order_by(Machine.name).all()]
+    params = {"user_id": normal_user_sync["id"], "machine_ids": machine_ids}
+
+    db.execute(
+        text(
+            """
+            INSERT INTO ingestions (
+                id, source_type, source_reference, machine_id, triggered_by,
+                created_at, status, created_count, duplicate_count, error_count
+            )
+            SELECT
+                gen_random_uuid(),
+                (ARRAY['hpc_path', 'hpc_upload', 'browser_upload'])[n % 3 + 1],
+                'case-path-' || (n % 800),
+                (:machine_ids)[n % cardinality(:machine_ids) + 1],
+                :user_id,
+                now() - make_interval(mins => n),
+                'success', 1, 0, 0
+            FROM generate_series(1, :count) AS n
+            """
+        ),
+        {**params, "count": INGESTION_COUNT},
+    )
+    db.execute(
+        text(
+            """
+            INSERT INTO cases (id, name, machine_id, hpc_username)
+            SELECT
+                gen_random_uuid(),
+                'plan-case-' || n,
+                (:machine_ids)[n % cardinality(:machine_ids) + 1],
+                'user-' || (n % 7)
+            FROM generate_series(1, :count) AS n
+            """
+        ),
+        {**params, "count": CASE_COUNT},
+    )
+    db.execute(
+        text(
+            """
+            INSERT INTO simulations (
+                id, case_id, execution_id, case_hash, compset, compset_alias,
+                grid_name, grid_resolution, simulation_type, status,
+                initialization_type, simulation_start_date, created_by,
+                last_updated_by, ingestion_id, extra, created_at
+            )
+            SELECT
+                gen_random_uuid(),
+                c.id,
+                c.name || '.' || s,
+                CASE WHEN s % 2 = 0 THEN md5(c.name) END,
+                'AQUAPLANET', 'QPC4', 'f19_f19', '1.9x2.5',
+                'experimental', 'completed', 'startup',
+                now(), :user_id, :user_id,
+                (SELECT id FROM ingestions LIMIT 1),
+                '{}'::jsonb,
+                now() - make_interval(secs => s * 1000 + length(c.name))
+            FROM cases AS c
+            CROSS JOIN generate_series(1, :per_case) AS s
+            WHERE c.name LIKE 'plan-case-%'
+            """
+        ),
+        {**params, "per_case": SIMULATIONS_PER_CASE},
+    )
+    db.execute(text("ANALYZE ingestions, cases, simulations"))
+
+    return db
+
+
+def _explain(db: Session, stmt: ClauseElement) -> dict[str, Any]:
+    compiled = stmt.compile(
+        dialect=db.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    result = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    )
+
+    return result.scalar_one()[0]["Plan"]
+
+
+def _index_names(plan: dict[str, Any]) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+
+    return names
+
+
+def _node_types(plan: dict[str, Any], relation: str | None = None) -> set[str]:
+    """Return the plan's node types, optionally only those reading ``relation``."""
+    types = (
+        {plan["Node Type"]}
+        if relation is None or plan.get("Relation Name") == relation
+        else set()
+    )
+
+    for child in plan.get("Plans", []):
+        types |= _node_types(child, relation)
+
+    return types
+
+
+def _case(db: Session) -> Case:
+    case = db.query(Case).filter(Case.name == "plan-case-42").one()
+
+    return case
+
+
+class TestHotQueryPlans:
+    def test_execution_id_lookup_uses_unique_index(self, seeded_db: Session):
+        stmt = (
+            seeded_db.query(Simulation)
+            .filter(Simulation.execution_id == "plan-case-42.3")
+            .limit(1)
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        assert "ix_simulations_execution_id" in _index_names(plan)
+
+    def test_first_case_hash_lookup_uses_partial_index(self, seeded_db: Session):
+        case = _case(seeded_db)
+        stmt = (
+            seeded_db.query(Simulation.case_hash)
+            .filter(
+                Simulation.case_id == case.id,
+                Simulation.case_hash.is_not(None),
+            )
+            .order_by(Simulation.created_at.asc())
+            .limit(1)
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        assert "ix_simulations_case_id_created_at_with_case_hash" in (
+            _index_names(plan)
+        )
+        assert "Sort" not in _node_types(plan)
+
+    def test_case_identity_lookup_uses_unique_constraint_index(
+        self, seeded_db: Session
+    ):
+        case = _case(seeded_db)
+        stmt = (
+            seeded_db.query(Case)
+            .filter(
+                Case.name == case.name,
+                Case.machine_id == case.machine_id,
+                Case.hpc_username == case.hpc_username,
+            )
+            .limit(1)
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        assert _index_names(plan) & {
+            "uq_cases_name_machine_id_hpc_username",
+            "ix_cases_name",
+        }
+
+    def test_ingestion_state_lookup_uses_machine_id_index(self, seeded_db: Session):
+        machine = seeded_db.query(Machine).order_by(Machine.name).first()
+        assert machine is not None
+        stmt = (
+            seeded_db.query(
+                Ingestion.id,
+                Ingestion.source_reference,
+                Ingestion.processed_execution_ids,
+            )
+            .filter(
+                Ingestion.source_type.in_(STATEFUL_INGESTION_SOURCE_TYPES),
+                Ingestion.machine_id == machine.id,
+            )
+            .order_by(Ingestion.source_reference.asc(), Ingestion.created_at.asc())
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        # A composite (machine_id, source_type, source_reference, created_at)
+        # index was not chosen over this one even at 80k rows: the query reads
+        # every row for the machine, so sorting them in memory is cheaper.
+        assert "ix_ingestions_machine_id" in _index_names(plan)
+        assert "Seq Scan" not in _node_types(plan)
+
+    def test_latest_simulations_page_uses_created_at_index(self, seeded_db: Session):
+        stmt = (
+            seeded_db.query(Simulation)
+            .order_by(Simulation.created_at.desc())
+            .limit(50)
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        assert "ix_simulations_created_at" in _index_names(plan)
+        assert "Sort" not in _node_types(plan)
+
+    def test_simulations_for_case_use_case_id_index(self, seeded_db: Session):
+        case = _case(seeded_db)
+        stmt = (
+            seeded_db.query(Simulation)
+            .filter(Simulation.case_id == case.id)
+            .order_by(Simulation.created_at.desc())
+            .statement
+        )
+
+        plan = _explain(seeded_db, stmt)
+
+        assert _index_names(plan) & {
+            "ix_simulations_case_id",
+            "ix_simulations_case_id_created_at_with_case_hash",
+        }
+        # The mapper's eager loads join small tables (machines, cases) that the
+        # planner may reasonably seq-scan; only the simulations scan matters.
+        assert "Seq Scan" not in _node_types(plan, "simulations")
@@ -8,6 +8,7 @@ from pydantic import HttpUrl, ValidationError
 
 from app.common.schemas.utils import to_snake_case
 from app.features.machine.schemas import MachineOut
+from app.features.simulation.enums import SimulationStatus
 from app.features.simulation.schemas import (
     ArtifactCreate,
     ArtifactKind,
@@ -816,12 +817,40 @@ class TestSimulationSummaryOutSchema:
 
 
 class TestCaseSchemas:
-    def test_case_summary_out_with_nested_simulations(self):
-        sim_id = uuid4()
+    def test_case_summary_out_with_stats_rollup(self):
         case_out = CaseSummaryOut(
             id=uuid4(),
             name="v3.LR.historical_0121",
             case_group="ensemble_v3",
+            simulation_count=3,
+            status_counts={"completed": 2, "failed": 1},
+            latest_status=SimulationStatus.FAILED,
+            latest_created_at=datetime(2023, 3, 1, 0, 0, 0),
+            machine_names=["chrysalis"],
+            hpc_usernames=["ac.tvo"],
+            links=[],
+            created_at=datetime(2023, 1, 1, 0, 0, 0),
+            updated_at=datetime(2023, 1, 2, 0, 0, 0),
+        )
+        assert case_out.simulation_count == 3
+        assert case_out.status_counts == {"completed": 2, "failed": 1}
+        assert case_out.latest_status == SimulationStatus.FAILED
+        assert "simulations" not in case_out.model_dump()
+
+    def test_case_detail_out_with_nested_simulations(self):
+        sim_id = uuid4()
+        case_out = CaseDetailOut(
+            id=uuid4(),
+            name="v3.LR.historical_0121",
+            case_group="ensemble_v3",
+            simulation_count=2,
+            status_counts={"completed": 2},
+            latest_status=SimulationStatus.COMPLETED,
+            latest_created_at=datetime(2023, 2, 1, 0, 0, 0),
+            description=None,
+            key_features=None,
+            known_issues=None,
+            notes_markdown=None,
             simulations=[
                 SimulationSummaryOut(
                     id=sim_id,
@@ -863,6 +892,10 @@ class TestCaseSchemas:
             key_features="Shared features",
             known_issues="Shared known issues",
             notes_markdown="## Notes",
+            simulation_count=0,
+            status_counts={},
+            latest_status=None,
+            latest_created_at=None,
             simulations=[],
             machine_names=[],
             hpc_usernames=[],
@@ -1,15 +1,37 @@
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.features.machine.models import Machine
-from app.features.simulation.models import Case
+from app.features.simulation.models import (
+    Artifact,
+    Case,
+    CaseStats,
+    ExternalLink,
+    Simulation,
+)
+from app.scripts.db.rollback_seed import rollback_seed
 from app.scripts.db.seed import (
     DEV_HPC_USERNAME,
+    SYNTHETIC_CASE_PREFIX,
     _resolve_seed_case_machine,
     _seed_simulation,
+    seed_synthetic_catalog,
 )
 
 
+def _count_synthetic(db: Session, model) -> int:
+    stmt = select(func.count()).select_from(model)
+    if model is Case:
+        return db.scalar(stmt.where(Case.name.like(f"{SYNTHETIC_CASE_PREFIX}.%"))) or 0
+
+    if model is not Simulation:
+        stmt = stmt.join(Simulation, model.simulation_id == Simulation.id)
+    stmt = stmt.where(Simulation.execution_id.like(f"{SYNTHETIC_CASE_PREFIX}-%"))
+
+    return db.scalar(stmt) or 0
+
+
 class TestResolveSeedCaseMachine:
     def test_returns_machine_for_single_machine_case(self, db: Session) -> None:
         machine = Machine(
@@ -110,3 +132,41 @@ class TestSeedSimulation:
 
         assert simulation.case_id == case.id
         assert simulation.ingestion_id is not None
+
+
+class TestSeedSyntheticCatalog:
+    def test_inserts_catalog_with_case_stats(
+        self, db: Session, normal_user_sync
+    ) -> None:
+        counts = seed_synthetic_catalog(
+            db,
+            normal_user_sync["id"],
+            cases=3,
+            simulations_per_case=4,
+            artifacts_per_simulation=2,
+            links_per_simulation=1,
+        )
+
+        assert counts == (3, 12, 24, 12)
+        assert _count_synthetic(db, Case) == 3
+        assert _count_synthetic(db, Simulation) == 12
+        assert _count_synthetic(db, Artifact) == 24
+        assert _count_synthetic(db, ExternalLink) == 12
+
+        stats = db.scalars(
+            select(CaseStats)
+            .join(Case, Case.id == CaseStats.case_id)
+            .where(Case.name.like(f"{SYNTHETIC_CASE_PREFIX}.%"))
+        ).all()
+        assert [row.simulation_count for row in stats] == [4, 4, 4]
+        assert all(row.latest_simulation_id is not None for row in stats)
+
+    def test_rollback_seed_removes_catalog(self, db: Session, normal_user_sync) -> None:
+        seed_synthetic_catalog(
+            db, normal_user_sync["id"], cases=2, simulations_per_case=2
+        )
+
+        rollback_seed(db)
+
+        assert _count_synthetic(db, Case) == 0
+        assert _count_synthetic(db, Simulation) == 0
@@ -1,16 +1,18 @@
+import uuid
 from collections.abc import Generator
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import pytest
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from fastapi.dependencies.models import Dependant
 from fastapi.responses import RedirectResponse
 from fastapi.routing import APIRoute
 from fastapi_users.exceptions import UserAlreadyExists
 from fastapi_users.router.oauth import STATE_TOKEN_AUDIENCE, decode_jwt
-from httpx import AsyncClient, HTTPError
+from httpx import AsyncClient
 from starlette.requests import Request
 
 from app.api.version import API_BASE
@@ -87,7 +89,7 @@ class TestAuthRoutes:
         with (
             patch.object(
                 oauth,
-                "_fetch_verified_e3sm_membership",
+                "refresh_user_membership",
                 new=AsyncMock(return_value=False),
             ),
             patch.object(
@@ -113,7 +115,7 @@ class TestAuthRoutes:
     ) -> None:
         monkeypatch.setattr(
             oauth,
-            "_fetch_verified_e3sm_membership",
+            "refresh_user_membership",
             AsyncMock(return_value=False),
         )
         monkeypatch.setattr(
@@ -125,6 +127,7 @@ class TestAuthRoutes:
         with pytest.raises(HTTPException) as exc_info:
             await oauth.github_callback(
                 Request({"type": "http", "headers": []}),
+                background_tasks=BackgroundTasks(),
                 access_token_state=({"access_token": "fake_token"}, "valid-state"),
                 user_manager=SimpleNamespace(),
                 strategy=object(),
@@ -139,7 +142,7 @@ class TestAuthRoutes:
         membership_fetch = AsyncMock(return_value=False)
         monkeypatch.setattr(
             oauth,
-            "_fetch_verified_e3sm_membership",
+            "refresh_user_membership",
             membership_fetch,
         )
         monkeypatch.setattr(
@@ -151,6 +154,7 @@ class TestAuthRoutes:
         with pytest.raises(HTTPException) as exc_info:
             await oauth.github_callback(
                 Request({"type": "http", "headers": []}),
+                background_tasks=BackgroundTasks(),
                 access_token_state=({"access_token": "fake_token"}, None),
                 user_manager=SimpleNamespace(),
                 strategy=object(),
@@ -164,7 +168,7 @@ class TestAuthRoutes:
     ) -> None:
         monkeypatch.setattr(
             oauth,
-            "_fetch_verified_e3sm_membership",
+            "refresh_user_membership",
             AsyncMock(return_value=False),
         )
         monkeypatch.setattr(
@@ -181,6 +185,7 @@ class TestAuthRoutes:
         with pytest.raises(HTTPException) as exc_info:
             await oauth.github_callback(
                 Request({"type": "http", "headers": []}),
+                background_tasks=BackgroundTasks(),
                 access_token_state=({"access_token": "fake_token"}, "valid-state"),
                 user_manager=user_manager,
                 strategy=object(),
@@ -195,7 +200,7 @@ class TestAuthRoutes:
         membership_fetch = AsyncMock(return_value=False)
         monkeypatch.setattr(
             oauth,
-            "_fetch_verified_e3sm_membership",
+            "refresh_user_membership",
             membership_fetch,
         )
         monkeypatch.setattr(
@@ -212,6 +217,7 @@ class TestAuthRoutes:
         with pytest.raises(HTTPException) as exc_info:
             await oauth.github_callback(
                 Request({"type": "http", "headers": []}),
+                background_tasks=BackgroundTasks(),
                 access_token_state=({"access_token": "fake_token"}, "valid-state"),
                 user_manager=user_manager,
                 strategy=object(),
@@ -233,25 +239,25 @@ class TestAuthRoutes:
         monkeypatch.setattr(
             oauth, "decode_jwt", lambda *_args, **_kwargs: {"return_to": return_to}
         )
-        monkeypatch.setattr(
-            oauth,
-            "_fetch_verified_e3sm_membership",
-            AsyncMock(return_value=True),
-        )
+        membership_refresh = AsyncMock(return_value=True)
+        monkeypatch.setattr(oauth, "refresh_user_membership", membership_refresh)
         monkeypatch.setattr(
             oauth.GITHUB_OAUTH_BACKEND,
             "login",
             AsyncMock(return_value=RedirectResponse("/", status_code=302)),
         )
-        user = SimpleNamespace(is_active=True)
+        user = SimpleNamespace(
+            id=uuid.uuid4(), is_active=True, github_org_membership_checked_at=None
+        )
         user_manager = SimpleNamespace(
             oauth_callback=AsyncMock(return_value=user),
-            refresh_github_org_membership=AsyncMock(return_value=user),
             on_after_login=AsyncMock(),
         )
+        background_tasks = BackgroundTasks()
 
         response = await oauth.github_callback(
             Request({"type": "http", "headers": []}),
+            background_tasks=background_tasks,
             access_token_state=({"access_token": "fake_token"}, "valid-state"),
             user_manager=user_manager,
             strategy=object(),
@@ -261,10 +267,14 @@ class TestAuthRoutes:
         assert response.headers["location"].endswith(
             "auth/callback?return_to=https%3A%2F%2F127.0.0.1%3A5173%2Fsimulations%2Ftest-run%3Ftab%3Dsummary"
         )
-        user_manager.refresh_github_org_membership.assert_awaited_once()
         user_manager.on_after_login.assert_awaited_once_with(user, ANY, response)
+        # Membership is refreshed after the response, not during login.
+        membership_refresh.assert_not_awaited()
+        assert [(task.func, task.args) for task in background_tasks.tasks] == [
+            (membership_refresh, (user.id, "fake_token"))
+        ]
 
-    async def test_github_oauth_callback_uses_refreshed_user_for_login(
+    async def test_github_oauth_callback_skips_refresh_for_fresh_membership(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         monkeypatch.setattr(
@@ -273,159 +283,32 @@ class TestAuthRoutes:
             AsyncMock(return_value=("mock_account_id", "mockuser@example.com")),
         )
         monkeypatch.setattr(oauth, "decode_jwt", lambda *_args, **_kwargs: {})
-        monkeypatch.setattr(
-            oauth,
-            "_fetch_verified_e3sm_membership",
-            AsyncMock(return_value=True),
-        )
         login_mock = AsyncMock(return_value=RedirectResponse("/", status_code=302))
         monkeypatch.setattr(oauth.GITHUB_OAUTH_BACKEND, "login", login_mock)
-        original_user = SimpleNamespace(is_active=True, role=UserRole.USER)
-        refreshed_user = SimpleNamespace(
+        user = SimpleNamespace(
+            id=uuid.uuid4(),
             is_active=True,
             role=UserRole.USER,
             has_verified_e3sm_membership=True,
+            github_org_membership_checked_at=datetime.now(timezone.utc),
         )
-        user_manager = SimpleNamespace(
-            oauth_callback=AsyncMock(return_value=original_user),
-            refresh_github_org_membership=AsyncMock(return_value=refreshed_user),
-            on_after_login=AsyncMock(),
-        )
-
-        response = await oauth.github_callback(
-            Request({"type": "http", "headers": []}),
-            access_token_state=({"access_token": "fake_token"}, "valid-state"),
-            user_manager=user_manager,
-            strategy=object(),
-        )
-
-        user_manager.refresh_github_org_membership.assert_awaited_once_with(
-            original_user,
-            is_verified_member=True,
-            checked_at=ANY,
-        )
-        login_mock.assert_awaited_once_with(ANY, refreshed_user)
-        user_manager.on_after_login.assert_awaited_once_with(
-            refreshed_user, ANY, response
-        )
-
-    async def test_fetch_verified_e3sm_membership_active_member(self) -> None:
-        response = SimpleNamespace(status_code=200, json=lambda: {"state": "active"})
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.return_value = response
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert result is True
-
-    async def test_fetch_verified_e3sm_membership_non_member(self) -> None:
-        missing_response = SimpleNamespace(status_code=404, json=lambda: {})
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.return_value = missing_response
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            missing_result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert missing_result is False
-
-    async def test_fetch_verified_e3sm_membership_preserves_state_on_api_failure(
-        self,
-    ) -> None:
-        failed_response = SimpleNamespace(status_code=503, json=lambda: {})
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.return_value = failed_response
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert result is None
-
-    async def test_fetch_verified_e3sm_membership_client_error_returns_none(
-        self,
-    ) -> None:
-        failed_response = SimpleNamespace(status_code=403, json=lambda: {})
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.return_value = failed_response
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert result is None
-
-    async def test_fetch_verified_e3sm_membership_request_error_returns_none(
-        self,
-    ) -> None:
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.side_effect = HTTPError("boom")
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert result is None
-
-    async def test_fetch_verified_e3sm_membership_invalid_json_returns_none(
-        self,
-    ) -> None:
-        invalid_json_response = SimpleNamespace(
-            status_code=200,
-            json=lambda: (_ for _ in ()).throw(ValueError("bad json")),
-        )
-        client = AsyncMock()
-        client.__aenter__.return_value = client
-        client.__aexit__.return_value = None
-        client.get.return_value = invalid_json_response
-
-        with patch.object(oauth, "AsyncClient", return_value=client):
-            result = await oauth._fetch_verified_e3sm_membership("token")
-
-        assert result is None
-
-    async def test_github_oauth_callback_does_not_downgrade_membership_on_api_failure(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(
-            oauth.GITHUB_OAUTH_CLIENT,
-            "get_id_email",
-            AsyncMock(return_value=("mock_account_id", "mockuser@example.com")),
-        )
-        monkeypatch.setattr(oauth, "decode_jwt", lambda *_args, **_kwargs: {})
-        monkeypatch.setattr(
-            oauth,
-            "_fetch_verified_e3sm_membership",
-            AsyncMock(return_value=None),
-        )
-        monkeypatch.setattr(
-            oauth.GITHUB_OAUTH_BACKEND,
-            "login",
-            AsyncMock(return_value=RedirectResponse("/", status_code=302)),
-        )
-        user = SimpleNamespace(is_active=True)
         user_manager = SimpleNamespace(
             oauth_callback=AsyncMock(return_value=user),
-            refresh_github_org_membership=AsyncMock(return_value=user),
             on_after_login=AsyncMock(),
         )
+        background_tasks = BackgroundTasks()
 
         response = await oauth.github_callback(
             Request({"type": "http", "headers": []}),
+            background_tasks=background_tasks,
             access_token_state=({"access_token": "fake_token"}, "valid-state"),
             user_manager=user_manager,
             strategy=object(),
         )
 
         assert response.status_code == status.HTTP_302_FOUND
-        user_manager.refresh_github_org_membership.assert_not_awaited()
+        assert background_tasks.tasks == []
+        login_mock.assert_awaited_once_with(ANY, user)
 
 
 class TestLogOutRoute:
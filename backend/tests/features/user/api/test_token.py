@@ -10,7 +10,7 @@ from app.common.models.base import Base
 from app.core.config import settings
 from app.features.user.auth.token import generate_token
 from app.features.user.manager import current_active_user
-from app.features.user.models import ApiToken, User, UserRole
+from app.features.user.models import ApiToken, ApiTokenGeneration, User, UserRole
 from app.main import app
 from tests.conftest import engine
 
@@ -188,6 +188,11 @@ class TestTokenManagementAPI:
             db.expire_all()
             revoked_token = db.query(ApiToken).filter(ApiToken.id == token_id).first()
             assert revoked_token.revoked is True
+
+            # Other workers drop cached verifications when this changes.
+            generation = db.query(ApiTokenGeneration).first()
+            assert generation is not None
+            assert generation.generation >= 1
         finally:
             app.dependency_overrides.clear()
 
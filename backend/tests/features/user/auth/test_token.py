@@ -5,8 +5,28 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
-from app.features.user.auth.token import generate_token, hash_token, validate_token
-from app.features.user.models import ApiToken, User, UserRole
+import pytest
+from sqlalchemy import event, update
+
+from app.common.models.base import Base
+from app.core.config import settings
+from app.features.user.auth import token as token_auth
+from app.features.user.auth.token import (
+    clear_token_cache,
+    commit_token_revocation,
+    generate_token,
+    hash_token,
+    validate_token,
+)
+from app.features.user.models import ApiToken, ApiTokenGeneration, User, UserRole
+from tests.conftest import engine
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
 
 
 class TestGenerateToken:
@@ -215,3 +235,127 @@ class TestValidateToken:
 
         assert result is not None
         assert result.id == user.id
+
+
+def _create_db_token(db, *, expires_at=None) -> tuple[str, ApiToken]:
+    """Persist a SERVICE_ACCOUNT user with one API token."""
+    Base.metadata.create_all(bind=engine)
+    user = _make_service_user()
+    user.email = f"service-{uuid.uuid4().hex[:8]}@example.com"
+    db.add(user)
+    raw_token, token_hash = generate_token()
+    api_token = ApiToken(
+        name="Cached token",
+        token_hash=token_hash,
+        user_id=user.id,
+        created_at=datetime.now(timezone.utc),
+        expires_at=expires_at,
+        revoked=False,
+    )
+    db.add(api_token)
+    db.commit()
+
+    return raw_token, api_token
+
+
+class TestTokenVerificationCache:
+    """Tests for the per-worker API token verification cache."""
+
+    @pytest.fixture(autouse=True)
+    def _poll_rarely(self, monkeypatch):
+        monkeypatch.setattr(settings, "api_token_cache_generation_poll_seconds", 60.0)
+
+    @pytest.fixture
+    def statements(self):
+        """Record SQL statements sent to the test database."""
+        recorded: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            recorded.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        yield recorded
+        event.remove(engine, "before_cursor_execute", record)
+
+    def test_cache_hit_issues_no_queries(self, db, statements):
+        """Test that a repeated validation is served without SQL."""
+        raw_token, api_token = _create_db_token(db)
+        first = validate_token(raw_token, db)
+        statements.clear()
+
+        second = validate_token(raw_token, db)
+
+        assert first is not None
+        assert second is not None
+        assert second.id == api_token.user_id
+        assert second.role == UserRole.SERVICE_ACCOUNT
+        assert second in db
+        assert statements == []
+
+    def test_local_revocation_invalidates_cache(self, db):
+        """Test that revoking on this worker rejects the token immediately."""
+        raw_token, api_token = _create_db_token(db)
+        assert validate_token(raw_token, db) is not None
+
+        api_token.revoked = True
+        commit_token_revocation(db)
+
+        assert validate_token(raw_token, db) is None
+
+    def test_generation_bump_from_another_worker_drops_entries(self, db, monkeypatch):
+        """Test that a revocation elsewhere is seen on the next poll."""
+        raw_token, api_token = _create_db_token(db)
+        assert validate_token(raw_token, db) is not None
+
+        # Simulate another worker: revoke and bump the counter in the DB
+        # without touching this worker's cache.
+        db.execute(
+            update(ApiToken).where(ApiToken.id == api_token.id).values(revoked=True)
+        )
+        generation = token_auth._token_cache.sync_generation(db)
+        db.merge(ApiTokenGeneration(id=1, generation=generation + 1))
+        db.commit()
+
+        assert validate_token(raw_token, db) is not None
+
+        monkeypatch.setattr(settings, "api_token_cache_generation_poll_seconds", 0.0)
+
+        assert validate_token(raw_token, db) is None
+
+    def test_expiration_is_checked_on_cache_hits(self, db, monkeypatch):
+        """Test that a cached token stops validating once it expires."""
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        raw_token, _ = _create_db_token(db, expires_at=expires_at)
+        assert validate_token(raw_token, db) is not None
+
+        class _Later(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return expires_at + timedelta(seconds=1)
+
+        monkeypatch.setattr(token_auth, "datetime", _Later)
+
+        assert validate_token(raw_token, db) is None
+        assert validate_token(raw_token, db, check_expiration=False) is not None
+
+    def test_entries_expire_after_ttl(self, db, monkeypatch, statements):
+        """Test that entries are reloaded once their TTL has passed."""
+        raw_token, _ = _create_db_token(db)
+        monkeypatch.setattr(settings, "api_token_cache_ttl_seconds", 0.0)
+        validate_token(raw_token, db)
+        statements.clear()
+
+        assert validate_token(raw_token, db) is not None
+        assert any("FROM api_tokens" in statement for statement in statements)
+
+    def test_evicts_least_recently_used_entry(self, db, monkeypatch):
+        """Test that the cache is bounded by API_TOKEN_CACHE_MAX_ENTRIES."""
+        monkeypatch.setattr(settings, "api_token_cache_max_entries", 1)
+        first_token, _ = _create_db_token(db)
+        second_token, _ = _create_db_token(db)
+
+        validate_token(first_token, db)
+        validate_token(second_token, db)
+
+        assert token_auth._token_cache.get(hash_token(first_token)) is None
+        assert token_auth._token_cache.get(hash_token(second_token)) is not None
@@ -1,17 +1,20 @@
 import uuid
-from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.user.manager import (
     UserManager,
     can_edit_managed_content,
     current_active_user,
+    get_user_db,
     optional_current_user,
 )
-from app.features.user.models import User, UserRole
+from app.features.user.models import ApiTokenGeneration, User, UserRole
+from app.features.user.schemas import UserUpdate
 
 
 class TestUserManager:
@@ -31,80 +34,58 @@ class TestUserManager:
             "✅ New GitHub user registered: testuser@example.com"
         )
 
-    @pytest.mark.asyncio
-    async def test_refresh_membership_persists_verified_state(self):
-        checked_at = datetime.now(timezone.utc)
-        user = User(
-            id=uuid.uuid4(),
-            email="testuser@example.com",
-            role=UserRole.USER,
-        )
-        user_db = AsyncMock()
-        user_manager = UserManager(user_db=user_db)
 
-        await user_manager.refresh_github_org_membership(
-            user,
-            is_verified_member=True,
-            checked_at=checked_at,
-        )
+class TestTokenCacheInvalidation:
+    """User changes that affect cached API tokens bump the token generation."""
 
-        user_db.update.assert_awaited_once_with(
-            user,
-            {
-                "has_verified_e3sm_membership": True,
-                "github_org_membership_checked_at": checked_at,
-            },
+    async def _generation(self, db: AsyncSession) -> int:
+        generation = await db.scalar(
+            select(ApiTokenGeneration.generation).where(ApiTokenGeneration.id == 1)
         )
 
+        return generation or 0
+
+    async def _manager_and_user(
+        self, db: AsyncSession, normal_user
+    ) -> tuple[UserManager, User]:
+        user = await db.get(User, uuid.UUID(normal_user["id"]))
+        assert user is not None
+
+        return UserManager(await anext(get_user_db(db))), user
+
     @pytest.mark.asyncio
-    async def test_refresh_membership_persists_verified_state_for_admin(self):
-        checked_at = datetime.now(timezone.utc)
-        user = User(
-            id=uuid.uuid4(),
-            email="admin@example.com",
-            role=UserRole.ADMIN,
-        )
-        user_db = AsyncMock()
-        user_manager = UserManager(user_db=user_db)
+    @pytest.mark.parametrize(
+        "update", [UserUpdate(is_active=False), UserUpdate(role=UserRole.ADMIN.value)]
+    )
+    async def test_deactivation_and_role_change_bump_generation(
+        self, async_db: AsyncSession, normal_user, update: UserUpdate
+    ):
+        manager, user = await self._manager_and_user(async_db, normal_user)
+        before = await self._generation(async_db)
 
-        await user_manager.refresh_github_org_membership(
-            user,
-            is_verified_member=True,
-            checked_at=checked_at,
-        )
+        await manager.update(update, user, safe=False)
 
-        user_db.update.assert_awaited_once_with(
-            user,
-            {
-                "has_verified_e3sm_membership": True,
-                "github_org_membership_checked_at": checked_at,
-            },
-        )
+        assert await self._generation(async_db) == before + 1
 
     @pytest.mark.asyncio
-    async def test_refresh_membership_persists_unverified_state(self):
-        checked_at = datetime.now(timezone.utc)
-        user = User(
-            id=uuid.uuid4(),
-            email="user@example.com",
-            role=UserRole.USER,
-        )
-        user_db = AsyncMock()
-        user_manager = UserManager(user_db=user_db)
+    async def test_unrelated_update_keeps_generation(
+        self, async_db: AsyncSession, normal_user
+    ):
+        manager, user = await self._manager_and_user(async_db, normal_user)
+        before = await self._generation(async_db)
 
-        await user_manager.refresh_github_org_membership(
-            user,
-            is_verified_member=False,
-            checked_at=checked_at,
-        )
+        await manager.update(UserUpdate(is_verified=True), user, safe=False)
 
-        user_db.update.assert_awaited_once_with(
-            user,
-            {
-                "has_verified_e3sm_membership": False,
-                "github_org_membership_checked_at": checked_at,
-            },
-        )
+        assert await self._generation(async_db) == before
+
+    @pytest.mark.asyncio
+    async def test_delete_bumps_generation(self, async_db: AsyncSession, normal_user):
+        manager, user = await self._manager_and_user(async_db, normal_user)
+        before = await self._generation(async_db)
+
+        await manager.delete(user)
+
+        assert await self._generation(async_db) == before + 1
 
 
 class TestCurrentActiveUser:
@@ -121,11 +102,28 @@ class TestCurrentActiveUser:
         request = MagicMock()
         db = MagicMock()
 
-        result = await current_active_user(
-            request=request, oauth_user=oauth_user, db=db
-        )
+        with patch(
+            "app.features.user.manager.authorize_profile_request"
+        ) as mock_authorize:
+            result = await current_active_user(
+                request=request, oauth_user=oauth_user, db=db
+            )
 
         assert result is oauth_user
+        mock_authorize.assert_called_once_with(is_admin=False)
+
+    @pytest.mark.asyncio
+    async def test_authorizes_profile_requests_for_admins(self):
+        admin = User(id=uuid.uuid4(), email="admin@example.com", role=UserRole.ADMIN)
+
+        with patch(
+            "app.features.user.manager.authorize_profile_request"
+        ) as mock_authorize:
+            await current_active_user(
+                request=MagicMock(), oauth_user=admin, db=MagicMock()
+            )
+
+        mock_authorize.assert_called_once_with(is_admin=True)
 
     @pytest.mark.asyncio
     async def test_raises_401_when_no_auth_header(self):
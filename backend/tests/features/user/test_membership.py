@@ -0,0 +1,324 @@
+import json
+import threading
+import uuid
+from collections.abc import Generator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.features.user import membership
+from app.features.user.membership import (
+    GitHubMembershipCheck,
+    MembershipRefreshReport,
+    check_e3sm_membership,
+    is_membership_stale,
+    refresh_stale_memberships,
+    refresh_user_membership,
+    select_stale_memberships,
+)
+from app.features.user.models import OAuthAccount, User, UserRole
+from app.scripts.users import refresh_github_memberships
+
+# Stub responses keyed by bearer token: (status, body, headers).
+_StubResponse = tuple[int, str, dict[str, str]]
+
+_ACTIVE: _StubResponse = (200, json.dumps({"state": "active"}), {})
+_PENDING: _StubResponse = (200, json.dumps({"state": "pending"}), {})
+_NOT_MEMBER: _StubResponse = (404, json.dumps({"message": "Not Found"}), {})
+_RATE_LIMITED: _StubResponse = (
+    403,
+    json.dumps({"message": "API rate limit exceeded"}),
+    {"X-RateLimit-Remaining": "0"},
+)
+
+
+class _GitHubStub:
+    """Local stand-in for the GitHub org membership endpoint."""
+
+    def __init__(self) -> None:
+        self.responses: dict[str, _StubResponse] = {}
+        self.requests: list[tuple[str, str]] = []
+
+
+@pytest.fixture
+def github_stub(monkeypatch: pytest.MonkeyPatch) -> Generator[_GitHubStub, None, None]:
+    stub = _GitHubStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+            stub.requests.append((self.path, token))
+            status_code, body, headers = stub.responses.get(token, _NOT_MEMBER)
+
+            self.send_response(status_code)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, *args) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    monkeypatch.setattr(
+        settings, "github_api_base_url", f"http://127.0.0.1:{server.server_port}"
+    )
+
+    yield stub
+
+    server.shutdown()
+    server.server_close()
+
+
+def _session_factory(db: AsyncSession):
+    @asynccontextmanager
+    async def factory():
+        yield db
+
+    return factory
+
+
+async def _create_github_user(
+    db: AsyncSession,
+    access_token: str,
+    *,
+    checked_at: datetime | None = None,
+    is_member: bool = False,
+    role: UserRole = UserRole.USER,
+) -> User:
+    user = User(
+        email=f"{access_token}@example.com",
+        is_active=True,
+        is_verified=True,
+        role=role,
+        has_verified_e3sm_membership=is_member,
+        github_org_membership_checked_at=checked_at,
+    )
+    db.add(user)
+    await db.flush()
+    db.add(
+        OAuthAccount(
+            oauth_name="github",
+            access_token=access_token,
+            account_id=str(uuid.uuid4()),
+            account_email=user.email,
+            user_id=user.id,
+        )
+    )
+    await db.flush()
+
+    return user
+
+
+async def _membership_of(db: AsyncSession, user: User) -> tuple[bool, datetime | None]:
+    row = (
+        await db.execute(
+            select(
+                User.has_verified_e3sm_membership,
+                User.github_org_membership_checked_at,
+            ).where(User.__table__.c.id == user.id)
+        )
+    ).one()
+
+    return row[0], row[1]
+
+
+class TestIsMembershipStale:
+    def test_never_checked_or_old_results_are_stale(self) -> None:
+        now = datetime.now(timezone.utc)
+        max_age = timedelta(seconds=settings.github_org_membership_max_age_seconds)
+
+        assert is_membership_stale(User(github_org_membership_checked_at=None), now)
+        assert is_membership_stale(
+            User(github_org_membership_checked_at=now - max_age), now
+        )
+        assert not is_membership_stale(
+            User(github_org_membership_checked_at=now - max_age / 2), now
+        )
+
+
+class TestCheckE3smMembership:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            (_ACTIVE, GitHubMembershipCheck(state=True)),
+            (_PENDING, GitHubMembershipCheck(state=False)),
+            (_NOT_MEMBER, GitHubMembershipCheck(state=False)),
+            ((503, "{}", {}), GitHubMembershipCheck(state=None)),
+            ((403, "{}", {}), GitHubMembershipCheck(state=None)),
+            ((200, "{not-json", {}), GitHubMembershipCheck(state=None)),
+            (_RATE_LIMITED, GitHubMembershipCheck(state=None, rate_limited=True)),
+            (
+                (403, "{}", {"Retry-After": "60"}),
+                GitHubMembershipCheck(state=None, rate_limited=True),
+            ),
+            ((429, "{}", {}), GitHubMembershipCheck(state=None, rate_limited=True)),
+        ],
+        ids=[
+            "active",
+            "pending",
+            "not-member",
+            "server-error",
+            "forbidden",
+            "invalid-json",
+            "rate-limit",
+            "secondary-rate-limit",
+            "too-many-requests",
+        ],
+    )
+    async def test_maps_github_responses(
+        self, github_stub: _GitHubStub, response, expected
+    ) -> None:
+        github_stub.responses["token"] = response
+
+        async with membership._github_client() as client:
+            result = await check_e3sm_membership(client, "token")
+
+        assert result == expected
+        assert github_stub.requests == [
+            ("/user/memberships/orgs/E3SM-Project", "token")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_error_is_indeterminate(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(settings, "github_api_base_url", "http://127.0.0.1:9")
+
+        async with membership._github_client() as client:
+            result = await check_e3sm_membership(client, "token")
+
+        assert result == GitHubMembershipCheck(state=None)
+
+
+class TestRefreshUserMembership:
+    @pytest.mark.asyncio
+    async def test_stores_result_and_check_time(
+        self, async_db: AsyncSession, github_stub: _GitHubStub
+    ) -> None:
+        user = await _create_github_user(async_db, "login-member")
+        github_stub.responses["login-member"] = _ACTIVE
+
+        state = await refresh_user_membership(
+            user.id, "login-member", session_factory=_session_factory(async_db)
+        )
+
+        is_member, checked_at = await _membership_of(async_db, user)
+        assert state is True
+        assert is_member is True
+        assert checked_at is not None
+
+    @pytest.mark.asyncio
+    async def test_does_not_downgrade_membership_on_api_failure(
+        self, async_db: AsyncSession, github_stub: _GitHubStub
+    ) -> None:
+        user = await _create_github_user(async_db, "login-outage", is_member=True)
+        github_stub.responses["login-outage"] = (503, "{}", {})
+
+        state = await refresh_user_membership(
+            user.id, "login-outage", session_factory=_session_factory(async_db)
+        )
+
+        assert state is None
+        assert await _membership_of(async_db, user) == (True, None)
+
+
+class TestRefreshStaleMemberships:
+    @pytest.mark.asyncio
+    async def test_selects_only_stale_github_users(
+        self, async_db: AsyncSession
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        never = await _create_github_user(async_db, "stale-never")
+        old = await _create_github_user(
+            async_db, "stale-old", checked_at=now - timedelta(days=7)
+        )
+        await _create_github_user(async_db, "stale-fresh", checked_at=now)
+        await _create_github_user(
+            async_db, "stale-service", role=UserRole.SERVICE_ACCOUNT
+        )
+
+        selected = await select_stale_memberships(async_db, now=now)
+
+        assert selected == [(never.id, "stale-never"), (old.id, "stale-old")]
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_batches_and_stops_on_rate_limit(
+        self, async_db: AsyncSession, github_stub: _GitHubStub
+    ) -> None:
+        # Stale check times fix the refresh order (oldest first).
+        long_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        member, former, outage, limited, deferred = [
+            await _create_github_user(
+                async_db,
+                f"batch-{name}",
+                checked_at=long_ago + timedelta(minutes=index),
+                is_member=name in ("former", "outage"),
+            )
+            for index, name in enumerate(
+                ("member", "former", "outage", "limited", "deferred")
+            )
+        ]
+        github_stub.responses.update(
+            {
+                "batch-member": _ACTIVE,
+                "batch-former": _NOT_MEMBER,
+                "batch-outage": (502, "{}", {}),
+                "batch-limited": _RATE_LIMITED,
+                "batch-deferred": _ACTIVE,
+            }
+        )
+
+        report = await refresh_stale_memberships(
+            batch_size=2, concurrency=1, session_factory=_session_factory(async_db)
+        )
+
+        assert report == MembershipRefreshReport(
+            selected=5, verified=1, unverified=1, indeterminate=1, deferred=2
+        )
+        assert [token for _, token in github_stub.requests] == [
+            "batch-member",
+            "batch-former",
+            "batch-outage",
+            "batch-limited",
+        ]
+        assert (await _membership_of(async_db, member))[0] is True
+        assert (await _membership_of(async_db, former))[0] is False
+        # Indeterminate, rate-limited, and deferred users keep their state.
+        for user in (outage, limited, deferred):
+            assert await _membership_of(async_db, user) == (
+                user.has_verified_e3sm_membership,
+                user.github_org_membership_checked_at,
+            )
+
+
+class TestRefreshGithubMembershipsScript:
+    def test_main_passes_arguments(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        run = AsyncMock(
+            return_value=MembershipRefreshReport(selected=3, verified=2, deferred=1)
+        )
+        monkeypatch.setattr(
+            refresh_github_memberships, "refresh_stale_memberships", run
+        )
+
+        exit_code = refresh_github_memberships.main(
+            ["--limit", "10", "--batch-size", "5", "--concurrency", "2"]
+        )
+
+        assert exit_code == 0
+        run.assert_awaited_once_with(limit=10, batch_size=5, concurrency=2)
+        assert "Selected 3 user(s)" in capsys.readouterr().out
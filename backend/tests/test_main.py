@@ -2,6 +2,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api.version import API_BASE
+from app.features.user.manager import current_active_user
+from app.features.user.models import User, UserRole
 from app.main import app
 
 
@@ -17,6 +19,85 @@ class TestApp:
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
+    def test_db_pool_health_endpoint_reports_both_pools(self, client):
+        app.dependency_overrides[current_active_user] = lambda: User(
+            email="admin@example.com", role=UserRole.ADMIN
+        )
+        try:
+            response = client.get(f"{API_BASE}/health/db-pool")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        pools = response.json()["pools"]
+        assert [pool["label"] for pool in pools] == ["sync", "async"]
+        assert {"size", "checkedin", "checkedout", "overflow", "checkouts"} <= set(
+            pools[0]
+        )
+
+    def test_db_pool_health_endpoint_requires_authentication(self, client):
+        response = client.get(f"{API_BASE}/health/db-pool")
+
+        assert response.status_code == 401
+
+    def test_db_pool_health_endpoint_rejects_non_admin(self, client):
+        app.dependency_overrides[current_active_user] = lambda: User(
+            email="user@example.com", role=UserRole.USER
+        )
+        try:
+            response = client.get(f"{API_BASE}/health/db-pool")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 403
+
+    def test_llm_queue_health_endpoint_reports_counters(self, client):
+        app.dependency_overrides[current_active_user] = lambda: User(
+            email="admin@example.com", role=UserRole.ADMIN
+        )
+        try:
+            response = client.get(f"{API_BASE}/health/llm-queue")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "limit",
+            "active",
+            "waiting",
+            "inflight",
+            "coalesced",
+        }
+
+    def test_llm_queue_health_endpoint_requires_authentication(self, client):
+        response = client.get(f"{API_BASE}/health/llm-queue")
+
+        assert response.status_code == 401
+
+    def test_llm_queue_health_endpoint_rejects_non_admin(self, client):
+        app.dependency_overrides[current_active_user] = lambda: User(
+            email="user@example.com", role=UserRole.USER
+        )
+        try:
+            response = client.get(f"{API_BASE}/health/llm-queue")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 403
+
+    def test_metrics_endpoint_reports_prometheus_text(self, client):
+        client.get(f"{API_BASE}/health")
+
+        response = client.get(f"{API_BASE}/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/api/v1/health",status="200"}'
+        ) in response.text
+        assert 'db_pool_connections{engine="sync",state="checked_out"}' in response.text
+
     def test_meta_endpoint(self, client):
         response = client.get(f"{API_BASE}/meta")
 
@@ -12,7 +12,8 @@ import {
   TableRow,
 } from '@/components/ui/table';
 import { TableCellText } from '@/components/ui/table-cell-text';
-import type { Machine, SimulationOut } from '@/types/index';
+import { useCases } from '@/features/simulations/hooks/useCases';
+import type { CaseSummaryOut, Machine, SimulationOut } from '@/types/index';
 
 interface HomePageProps {
   simulations: SimulationOut[];
@@ -20,94 +21,49 @@ interface HomePageProps {
 }
 
 export const HomePage = ({ simulations, machines }: HomePageProps) => {
-  const totalCases = useMemo(
-    () => new Set(simulations.map((simulation) => simulation.caseId)).size,
-    [simulations],
+  const { data: cases } = useCases();
+  const totalCases = cases.length;
+  const totalSimulations = useMemo(
+    () => cases.reduce((count, caseRecord) => count + caseRecord.simulationCount, 0),
+    [cases],
   );
   const latestSubmission = useMemo(
     () =>
-      [...simulations]
-        .map((simulation) => simulation.createdAt)
+      cases
+        .map((caseRecord) => caseRecord.latestCreatedAt)
+        .filter((createdAt): createdAt is string => Boolean(createdAt))
         .sort((left, right) => new Date(right).getTime() - new Date(left).getTime())[0],
-    [simulations],
+    [cases],
   );
   const recentCases = useMemo(() => {
-    const casesById = new Map<
-      string,
-      {
-        id: string;
-        name: string;
-        caseGroup: string | null;
-        machineNames: Set<string>;
-        hpcUsernames: Set<string>;
-        simulationCount: number;
-        lastUpdated: string;
-      }
-    >();
+    const summarizeNames = (values: string[]) => {
+      if (values.length === 0) return '—';
+      if (values.length === 1) return values[0];
 
-    for (const simulation of simulations) {
-      const existing = casesById.get(simulation.caseId);
-      const simulationUpdatedAt = simulation.updatedAt ?? simulation.createdAt;
-
-      if (existing) {
-        existing.simulationCount += 1;
-        if (simulation.machine?.name) {
-          existing.machineNames.add(simulation.machine.name);
-        }
-        if (simulation.hpcUsername) {
-          existing.hpcUsernames.add(simulation.hpcUsername);
-        }
-        if (new Date(simulationUpdatedAt).getTime() > new Date(existing.lastUpdated).getTime()) {
-          existing.lastUpdated = simulationUpdatedAt;
-        }
-        continue;
-      }
-
-      casesById.set(simulation.caseId, {
-        id: simulation.caseId,
-        name: simulation.caseName,
-        caseGroup: simulation.caseGroup ?? null,
-        machineNames: simulation.machine?.name ? new Set([simulation.machine.name]) : new Set(),
-        hpcUsernames: simulation.hpcUsername ? new Set([simulation.hpcUsername]) : new Set(),
-        simulationCount: 1,
-        lastUpdated: simulationUpdatedAt,
-      });
-    }
-
-    const summarizeMachines = (machineNames: Set<string>) => {
-      const names = [...machineNames].sort((left, right) =>
-        left.localeCompare(right, undefined, { sensitivity: 'base' }),
-      );
-
-      if (names.length === 0) return '—';
-      if (names.length === 1) return names[0];
-
-      return `${names[0]} +${names.length - 1}`;
+      return `${values[0]} +${values.length - 1}`;
     };
+    const lastUpdatedOf = ({ latestCreatedAt, updatedAt }: CaseSummaryOut) =>
+      latestCreatedAt && new Date(latestCreatedAt).getTime() > new Date(updatedAt).getTime()
+        ? latestCreatedAt
+        : updatedAt;
 
-    const summarizeUsers = (hpcUsernames: Set<string>) => {
-      const names = [...hpcUsernames].sort((left, right) =>
-        left.localeCompare(right, undefined, { sensitivity: 'base' }),
-      );
-
-      if (names.length === 0) return '—';
-      if (names.length === 1) return names[0];
-
-      return `${names[0]} +${names.length - 1}`;
-    };
-
-    return [...casesById.values()]
+    return cases
+      .filter((caseRecord) => caseRecord.simulationCount > 0)
+      .map((caseRecord) => ({
+        id: caseRecord.id,
+        name: caseRecord.name,
+        caseGroup: caseRecord.caseGroup,
+        simulationCount: caseRecord.simulationCount,
+        lastUpdated: lastUpdatedOf(caseRecord),
+        machineSummary: summarizeNames(caseRecord.machineNames),
+        hpcUsernameSummary: summarizeNames(caseRecord.hpcUsernames),
+      }))
       .sort(
         (left, right) =>
           new Date(right.lastUpdated).getTime() - new Date(left.lastUpdated).getTime(),
       )
-      .slice(0, 6)
-      .map((caseRecord) => ({
-        ...caseRecord,
-        machineSummary: summarizeMachines(caseRecord.machineNames),
-        hpcUsernameSummary: summarizeUsers(caseRecord.hpcUsernames),
-      }));
-  }, [simulations]);
+      .slice(0, 6);
+  }, [cases]);
   const machineSimulationCounts = new Map<Machine['id'], number>();
   for (const simulation of simulations) {
     machineSimulationCounts.set(
@@ -214,7 +170,7 @@ export const HomePage = ({ simulations, machines }: HomePageProps) => {
                 Total Simulations
               </p>
               <p className="mt-auto text-xl font-semibold leading-none text-foreground sm:text-2xl">
-                {simulations.length}
+                {totalSimulations}
               </p>
             </div>
             <div className="flex min-h-28 flex-col gap-4 border-b border-muted px-4 py-4 sm:border-r xl:border-b-0 xl:border-r">
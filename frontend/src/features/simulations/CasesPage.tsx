@@ -37,7 +37,7 @@ import {
 } from '@/features/simulations/caseUtils';
 import { useCases } from '@/features/simulations/hooks/useCases';
 import { cn } from '@/lib/utils';
-import type { CaseSummaryOut, SimulationOut, SimulationSummaryOut } from '@/types';
+import type { CaseSummaryOut, SimulationOut } from '@/types';
 
 type ActiveFilterKey =
   | 'caseName'
@@ -77,8 +77,6 @@ interface ActiveFilterPill {
   value: string;
 }
 
-type CaseSimulationListItem = SimulationOut | SimulationSummaryOut;
-
 const createEmptySimulationFilters = (): CaseSimulationFilters => ({
   hpcUsername: '',
   machineId: '',
@@ -93,7 +91,7 @@ const createEmptySimulationFilters = (): CaseSimulationFilters => ({
 const sortStringValues = (values: string[]) =>
   values.sort((left, right) => left.localeCompare(right, undefined, { sensitivity: 'base' }));
 
-const sortCaseSimulations = (caseSimulations: CaseSimulationListItem[]) =>
+const sortCaseSimulations = (caseSimulations: SimulationOut[]) =>
   [...caseSimulations].sort(
     (left, right) =>
       new Date(right.simulationStartDate).getTime() - new Date(left.simulationStartDate).getTime(),
@@ -453,11 +451,9 @@ export const CasesPage = ({ simulations }: CasesPageProps) => {
           return count + (matchingSimulationsByCaseId.get(caseRecord.id)?.length ?? 0);
         }
 
-        return (
-          count + (simulationsByCaseId.get(caseRecord.id)?.length ?? caseRecord.simulations.length)
-        );
+        return count + caseRecord.simulationCount;
       }, 0),
-    [filteredCases, hasActiveSimulationFilters, matchingSimulationsByCaseId, simulationsByCaseId],
+    [filteredCases, hasActiveSimulationFilters, matchingSimulationsByCaseId],
   );
 
   const columns = useMemo<ColumnDef<CaseSummaryOut>[]>(
@@ -526,13 +522,8 @@ export const CasesPage = ({ simulations }: CasesPageProps) => {
       {
         id: 'simulationCount',
         header: 'Total Simulations',
-        accessorFn: (caseRecord) => caseRecord.simulations.length,
-        cell: ({ row }) => {
-          const totalSimulations =
-            simulationsByCaseId.get(row.original.id)?.length ?? row.original.simulations.length;
-
-          return <Badge variant="secondary">{totalSimulations}</Badge>;
-        },
+        accessorFn: (caseRecord) => caseRecord.simulationCount,
+        cell: ({ row }) => <Badge variant="secondary">{row.original.simulationCount}</Badge>,
       },
       {
         accessorKey: 'caseGroup',
@@ -557,7 +548,7 @@ export const CasesPage = ({ simulations }: CasesPageProps) => {
         ),
       },
     ],
-    [caseHpcUserSummaries, caseMachineSummaries, currentPath, expandedCaseId, simulationsByCaseId],
+    [caseHpcUserSummaries, caseMachineSummaries, currentPath, expandedCaseId],
   );
 
   const table = useReactTable({
@@ -610,18 +601,9 @@ export const CasesPage = ({ simulations }: CasesPageProps) => {
   );
 
   const renderExpandedContent = (caseRecord: CaseSummaryOut) => {
-    const detailedCaseSimulations = simulationsByCaseId.get(caseRecord.id);
-    const summaryCaseSimulations = caseRecord.simulations;
-    const isUsingSummaryFallback =
-      (detailedCaseSimulations == null || detailedCaseSimulations.length === 0) &&
-      summaryCaseSimulations.length > 0;
-    const allCaseSimulations = sortCaseSimulations(
-      detailedCaseSimulations?.length ? detailedCaseSimulations : summaryCaseSimulations,
-    );
+    const allCaseSimulations = sortCaseSimulations(simulationsByCaseId.get(caseRecord.id) ?? []);
     const matchingCaseSimulations = sortCaseSimulations(
-      isUsingSummaryFallback
-        ? summaryCaseSimulations
-        : (matchingSimulationsByCaseId.get(caseRecord.id) ?? []),
+      matchingSimulationsByCaseId.get(caseRecord.id) ?? [],
     );
     const visibleCaseSimulations = hasActiveSimulationFilters
       ? matchingCaseSimulations
@@ -633,11 +615,9 @@ export const CasesPage = ({ simulations }: CasesPageProps) => {
           <div>
             <p className="text-sm font-medium">Simulation Summaries</p>
             <p className="text-xs text-muted-foreground">
-              {isUsingSummaryFallback
-                ? 'Showing case-level run summaries because full simulation details are unavailable.'
-                : hasActiveSimulationFilters
-                  ? `${matchingCaseSimulations.length} of ${allCaseSimulations.length} runs match the current filters.`
-                  : 'Open the case page to organize runs by Case Hash and launch compare.'}
+              {hasActiveSimulationFilters
+                ? `${matchingCaseSimulations.length} of ${caseRecord.simulationCount} runs match the current filters.`
+                : 'Open the case page to organize runs by Case Hash and launch compare.'}
             </p>
           </div>
           <Button variant="outline" size="sm" asChild>
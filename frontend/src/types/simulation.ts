@@ -51,13 +51,16 @@ export interface SimulationSummaryCapabilitiesOut {
 }
 
 /**
- * Lightweight API response model for a Case with nested simulation summaries.
+ * Lightweight API response model for a Case with its precomputed simulation rollup.
  */
 export interface CaseSummaryOut {
   id: string;
   name: string;
   caseGroup: string | null;
-  simulations: SimulationSummaryOut[];
+  simulationCount: number;
+  statusCounts: Partial<Record<SimulationStatusValue, number>>;
+  latestStatus: SimulationStatusValue | null;
+  latestCreatedAt: string | null;
   machineNames: string[];
   hpcUsernames: string[];
   links: ExternalLinkOut[];
@@ -66,6 +69,7 @@ export interface CaseSummaryOut {
 }
 
 export interface CaseDetailOut extends CaseSummaryOut {
+  simulations: SimulationSummaryOut[];
   description: string | null;
   keyFeatures: string | null;
   knownIssues: string | null;